@@ -15,10 +15,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from dgas.data.client import EODHDClient, EODHDConfig
-from dgas.data.ingestion import backfill_intraday, backfill_eod
+from dgas.data.backfill import DEFAULT_BACKFILL_WORKERS, backfill_universe
 from dgas.db import get_connection
-from dgas.settings import get_settings
 
 
 def get_all_active_symbols() -> list[str]:
@@ -34,18 +32,19 @@ def backfill_interval(
     interval: str,
     start_date: str,
     end_date: str,
-    batch_size: int = 50,
-    delay_between_batches: float = 5.0,
+    workers: int = DEFAULT_BACKFILL_WORKERS,
 ) -> dict:
     """Backfill data for a specific interval.
     
+    Symbols are backfilled concurrently and checkpointed per chunk, so
+    rerunning the script resumes where an interrupted run stopped.
+    
     Args:
         symbols: List of symbols to backfill
         interval: Data interval ("5m" or "1d")
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
-        batch_size: Symbols per batch
-        delay_between_batches: Delay between batches in seconds
+        workers: Requests in flight at once
         
     Returns:
         Dictionary with backfill statistics
@@ -55,82 +54,37 @@ def backfill_interval(
     print(f"{'='*80}")
     print(f"Date range: {start_date} to {end_date}")
     print(f"Symbols: {len(symbols)}")
-    print(f"Batch size: {batch_size}, Delay: {delay_between_batches}s")
+    print(f"Workers: {workers}")
     print()
     
-    # Initialize API client
-    settings = get_settings()
-    config = EODHDConfig.from_settings(settings)
-    api = EODHDClient(config)
+    started = time.time()
+    results = backfill_universe(
+        [(symbol, "US") for symbol in symbols],
+        start_date=start_date,
+        end_date=end_date,
+        interval=interval,
+        workers=workers,
+    )
     
-    total_fetched = 0
-    total_stored = 0
     successful = 0
     failed_symbols = []
     skipped_symbols = []
     
-    # Process in batches
-    total_batches = (len(symbols) + batch_size - 1) // batch_size
-    
-    for batch_start in range(0, len(symbols), batch_size):
-        batch_end = min(batch_start + batch_size, len(symbols))
-        batch = symbols[batch_start:batch_end]
-        batch_num = (batch_start // batch_size) + 1
-        
-        print(f"[Batch {batch_num}/{total_batches}] Processing {len(batch)} symbols...")
-        batch_start_time = time.time()
-        batch_stored = 0
-        
-        for symbol in batch:
-            try:
-                if interval == "1d":
-                    # Use EOD backfill for daily data
-                    summary = backfill_eod(
-                        symbol=symbol,
-                        exchange="US",
-                        start_date=start_date,
-                        end_date=end_date,
-                        client=api,
-                    )
-                else:
-                    # Use intraday backfill for 5m data
-                    summary = backfill_intraday(
-                        symbol=symbol,
-                        exchange="US",
-                        start_date=start_date,
-                        end_date=end_date,
-                        interval=interval,
-                        client=api,
-                        use_live_for_today=False,  # Use historical data only
-                    )
-                
-                total_fetched += summary.fetched
-                total_stored += summary.stored
-                batch_stored += summary.stored
-                
-                if summary.stored > 0:
-                    print(f"  ✓ {symbol}: {summary.stored} bars stored")
-                    successful += 1
-                elif summary.fetched > 0:
-                    print(f"  ○ {symbol}: {summary.fetched} fetched, 0 stored (duplicates)")
-                else:
-                    print(f"  ○ {symbol}: No data available from API")
-                    skipped_symbols.append(symbol)
-                    
-            except Exception as e:
-                error_msg = str(e)[:100]
-                print(f"  ✗ {symbol}: ERROR - {error_msg}")
-                failed_symbols.append((symbol, error_msg))
-        
-        batch_elapsed = time.time() - batch_start_time
-        print(f"  Batch {batch_num} completed in {batch_elapsed:.1f}s ({batch_stored} bars stored)")
-        
-        # Rate limiting
-        if batch_end < len(symbols):
-            print(f"  Waiting {delay_between_batches}s before next batch...")
-            time.sleep(delay_between_batches)
-    
-    api.close()
+    for result in results:
+        if not result.ok:
+            error_msg = (result.error or "")[:100]
+            print(f"  ✗ {result.symbol}: ERROR - {error_msg}")
+            failed_symbols.append((result.symbol, error_msg))
+        elif result.bars_stored > 0:
+            print(f"  ✓ {result.symbol}: {result.bars_stored} bars stored")
+            successful += 1
+        elif result.bars_fetched > 0:
+            print(f"  ○ {result.symbol}: {result.bars_fetched} fetched, 0 stored (duplicates)")
+        else:
+            print(f"  ○ {result.symbol}: No data available from API")
+            skipped_symbols.append(result.symbol)
+    
+    print(f"  Completed in {time.time() - started:.1f}s")
     
     return {
         "interval": interval,
@@ -138,8 +92,8 @@ def backfill_interval(
         "successful": successful,
         "skipped": len(skipped_symbols),
         "failed": len(failed_symbols),
-        "total_fetched": total_fetched,
-        "total_stored": total_stored,
+        "total_fetched": sum(result.bars_fetched for result in results),
+        "total_stored": sum(result.bars_stored for result in results),
         "failed_symbols": failed_symbols,
         "skipped_symbols": skipped_symbols,
     }
@@ -223,8 +177,6 @@ def main() -> int:
         interval="5m",
         start_date=start_date_str,
         end_date=end_date_str,
-        batch_size=50,
-        delay_between_batches=5.0,
     )
     
     # Backfill 1d data
@@ -233,8 +185,6 @@ def main() -> int:
         interval="1d",
         start_date=start_date_str,
         end_date=end_date_str,
-        batch_size=50,
-        delay_between_batches=5.0,
     )
     
     # Print summary
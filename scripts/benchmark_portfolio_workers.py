@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Benchmark per-timestep indicator dispatch in the portfolio backtest.
+
+Compares, on a synthetic universe, the ways the per-timestep path can compute
+incremental indicators:
+
+- ``sequential``: every symbol computed in turn in this thread, the baseline
+- ``per-step threads``: a new thread pool per timestep and a list copy of
+  every history (the engine's previous behaviour)
+- ``persistent threads``: one thread pool for the run, histories passed as is
+- ``worker pool``: :class:`SymbolWorkerPool`, histories resident in the
+  workers and only the new bars sent
+
+Per-timestep overhead is a mode's time per timestep minus the sequential
+baseline's. With fewer CPUs than workers the worker pool cannot run in
+parallel, so its overhead is the cost of the process round trips.
+
+Usage:
+    python scripts/benchmark_portfolio_workers.py --symbols 100 --bars 120 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dgas.backtesting.portfolio_indicator_calculator import (
+    HTFDataCache,
+    PortfolioIndicatorCalculator,
+)
+from dgas.backtesting.portfolio_workers import SymbolWorkerPool
+from dgas.data.models import IntervalData
+
+MAX_HISTORY_BARS = 200
+MIN_HISTORY = 5
+
+
+def make_bars(symbol: str, start: datetime, step: timedelta, count: int, interval: str, seed: int) -> list[IntervalData]:
+    rnd = random.Random(seed)
+    price = 100.0
+    bars = []
+    for i in range(count):
+        price = max(1.0, price + rnd.uniform(-0.6, 0.6))
+        close = Decimal(str(round(price, 2)))
+        bars.append(
+            IntervalData(
+                symbol=symbol,
+                timestamp=start + step * i,
+                interval=interval,
+                open=close,
+                high=close + Decimal("0.3"),
+                low=close - Decimal("0.3"),
+                close=close,
+                volume=1000,
+            )
+        )
+    return bars
+
+
+def make_universe(symbol_count: int, bar_count: int):
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    bars_by_symbol = {}
+    htf_cache = {}
+    for seed in range(symbol_count):
+        symbol = f"S{seed:03d}"
+        bars_by_symbol[symbol] = make_bars(symbol, start, timedelta(minutes=30), bar_count, "30m", seed)
+        htf_bars = make_bars(symbol, start - timedelta(days=40), timedelta(days=1), 40 + bar_count // 13, "1d", 10_000 + seed)
+        htf_cache[symbol] = HTFDataCache(
+            symbol=symbol,
+            interval="1d",
+            bars=htf_bars,
+            start_date=htf_bars[0].timestamp,
+            end_date=htf_bars[-1].timestamp,
+        )
+    return bars_by_symbol, htf_cache
+
+
+def make_calculator(htf_cache) -> PortfolioIndicatorCalculator:
+    calculator = PortfolioIndicatorCalculator(htf_interval="1d", trading_interval="30m", incremental=True)
+    calculator.htf_cache.update(htf_cache)
+    return calculator
+
+
+def run_sequential(bars_by_symbol, htf_cache) -> float:
+    calculator = make_calculator(htf_cache)
+    histories = {symbol: deque(maxlen=MAX_HISTORY_BARS) for symbol in bars_by_symbol}
+    bar_count = len(next(iter(bars_by_symbol.values())))
+    started = time.perf_counter()
+    for index in range(bar_count):
+        for symbol, bars in bars_by_symbol.items():
+            history = histories[symbol]
+            history.append(bars[index])
+            if len(history) >= MIN_HISTORY:
+                try:
+                    calculator.calculate_indicators(symbol, bars[index], history)
+                except ValueError:
+                    pass
+    return (time.perf_counter() - started) / bar_count
+
+
+def run_threads(bars_by_symbol, htf_cache, persistent: bool) -> float:
+    calculator = make_calculator(htf_cache)
+    histories = {symbol: deque(maxlen=MAX_HISTORY_BARS) for symbol in bars_by_symbol}
+    workers = min(os.cpu_count() or 4, len(bars_by_symbol))
+    shared_pool = ThreadPoolExecutor(max_workers=workers) if persistent else None
+
+    def calculate(symbol, bar, history):
+        try:
+            return calculator.calculate_indicators(symbol, bar, history if persistent else list(history))
+        except ValueError:
+            return None
+
+    bar_count = len(next(iter(bars_by_symbol.values())))
+    started = time.perf_counter()
+    for index in range(bar_count):
+        eligible = []
+        for symbol, bars in bars_by_symbol.items():
+            history = histories[symbol]
+            history.append(bars[index])
+            if len(history) >= MIN_HISTORY:
+                eligible.append((symbol, bars[index], history))
+
+        executor = shared_pool or ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(calculate, *item) for item in eligible]
+        for future in as_completed(futures):
+            future.result()
+        if shared_pool is None:
+            executor.shutdown(wait=True)
+    elapsed = time.perf_counter() - started
+
+    if shared_pool is not None:
+        shared_pool.shutdown(wait=True)
+    return elapsed / bar_count
+
+
+def run_worker_pool(bars_by_symbol, htf_cache, processes: int) -> float:
+    calculator = make_calculator(htf_cache)
+    bar_count = len(next(iter(bars_by_symbol.values())))
+    with SymbolWorkerPool(
+        calculator,
+        {symbol: len(bars) for symbol, bars in bars_by_symbol.items()},
+        processes=processes,
+        min_history=MIN_HISTORY,
+        max_history_bars=MAX_HISTORY_BARS,
+        indicator_keys=("analysis",),
+    ) as pool:
+        # Let the workers start before timing
+        pool.step([])
+        started = time.perf_counter()
+        for index in range(bar_count):
+            pool.step([(symbol, bars[index]) for symbol, bars in bars_by_symbol.items()])
+        elapsed = time.perf_counter() - started
+    return elapsed / bar_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--bars", type=int, default=120)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    bars_by_symbol, htf_cache = make_universe(args.symbols, args.bars)
+    print(f"{args.symbols} symbols x {args.bars} timesteps, {args.workers} worker processes, {os.cpu_count()} CPUs\n")
+    print(f"{'mode':<20}{'ms/step':>10}{'overhead ms/step':>18}")
+
+    baseline = run_sequential(bars_by_symbol, htf_cache)
+    print(f"{'sequential':<20}{baseline * 1000:>10.1f}{0:>18.1f}")
+    for label, run in (
+        ("per-step threads", lambda: run_threads(bars_by_symbol, htf_cache, persistent=False)),
+        ("persistent threads", lambda: run_threads(bars_by_symbol, htf_cache, persistent=True)),
+        ("worker pool", lambda: run_worker_pool(bars_by_symbol, htf_cache, args.workers)),
+    ):
+        elapsed = run()
+        print(f"{label:<20}{elapsed * 1000:>10.1f}{(elapsed - baseline) * 1000:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from . import get_version
 from .cli import run_analyze_command, run_backtest_command
 from .cli.configure import setup_configure_parser
 from .cli.data import setup_data_parser
+from .cli.indicators import setup_indicators_parser
 from .cli.monitor import setup_monitor_parser
 from .cli.predict import setup_predict_parser
 from .cli.report import setup_report_parser
@@ -38,6 +39,9 @@ def build_parser() -> argparse.ArgumentParser:
     # Data command
     setup_data_parser(subparsers)
 
+    # Indicators command
+    setup_indicators_parser(subparsers)
+
     # Predict command
     setup_predict_parser(subparsers)
 
@@ -190,6 +194,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Limit number of most recent bars (for debugging)",
     )
+    backtest_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing one in-memory copy of the bars (default: 1, in-process)",
+    )
     backtest_parser.add_argument(
         "--config",
         type=Path,
@@ -262,6 +272,7 @@ def main(argv: list[str] | None = None) -> int:
             report_path=args.report,
             json_path=args.json_output,
             limit_bars=args.limit_bars,
+            workers=args.workers,
         )
 
     if args.command == "data-report":
@@ -18,6 +18,7 @@ from .metrics import PerformanceSummary, calculate_performance
 from .persistence import persist_backtest
 from .reporting import build_summary_table, export_json, export_markdown
 from .runner import BacktestRequest, BacktestRunResult, BacktestRunner
+from .parallel_runner import SharedMemoryBacktestRunner
 
 __all__ = [
     "SimulationEngine",
@@ -48,6 +49,7 @@ __all__ = [
     "BacktestRequest",
     "BacktestRunResult",
     "BacktestRunner",
+    "SharedMemoryBacktestRunner",
     "build_summary_table",
     "export_markdown",
     "export_json",
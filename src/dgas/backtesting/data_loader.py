@@ -4,17 +4,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Mapping, MutableMapping, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Sequence, Tuple
 
 from psycopg import Connection
 
 from ..data.models import IntervalData
 from ..data.repository import fetch_market_data
 from ..db import get_connection
-from ..calculations import build_timeframe_data, MultiTimeframeCoordinator, TimeframeType
+from ..calculations import IncrementalTimeframeBuilder, MultiTimeframeCoordinator, TimeframeType
+from ..calculations.cache import CachedCalculator, bar_window, compute_data_hash, get_calculation_cache
 from ..calculations.multi_timeframe import MultiTimeframeAnalysis
 from .indicator_loader import load_indicators_batch
 
+# Bars each timeframe keeps for pattern and zone detection during a replay,
+# matching PortfolioIndicatorCalculator's default window
+DEFAULT_REPLAY_WINDOW = 200
+
 
 @dataclass(frozen=True)
 class BacktestBar:
@@ -185,57 +190,104 @@ def _calculate_missing_indicators(
     """Calculate indicators for timestamps not found in database.
 
     This is the fallback calculation method, used only when database values
-    are unavailable.
+    are unavailable. Every trading bar is replayed so indicator state is
+    continuous, but only the missing timestamps are recorded.
     """
     htf_bars = load_ohlcv(symbol, htf_interval, start=start, end=end, conn=conn)
     if not htf_bars:
         return
 
+    missing_set = set(missing_timestamps)
+    for timestamp, analysis in cached_replay_multi_timeframe_analysis(
+        trading_bars,
+        htf_bars,
+        trading_interval,
+        htf_interval,
+    ):
+        if timestamp in missing_set:
+            indicator_map[timestamp] = {"analysis": analysis}
+
+
+def replay_multi_timeframe_analysis(
+    trading_bars: Sequence[IntervalData],
+    htf_bars: Sequence[IntervalData],
+    trading_interval: str,
+    htf_interval: str,
+    *,
+    max_bars: int | None = DEFAULT_REPLAY_WINDOW,
+) -> Iterator[Tuple[datetime, MultiTimeframeAnalysis]]:
+    """Walk the trading bars once and yield the analysis as of each bar.
+
+    Both timeframes are fed bar by bar into an
+    :class:`~dgas.calculations.IncrementalTimeframeBuilder`, so PLdot,
+    envelopes and market state carry forward in O(1) instead of being
+    rebuilt from the full prefix at every bar. HTF bars are fed once their
+    timestamp is not after the trading bar. Patterns and Drummond zones are
+    detected over the last ``max_bars`` bars of each timeframe (``None``
+    keeps the whole history, at quadratic cost).
+
+    Bars before both timeframes have three bars of history, and bars the
+    coordinator rejects, yield nothing.
+    """
     coordinator = MultiTimeframeCoordinator(htf_interval, trading_interval)
+    trading_builder = IncrementalTimeframeBuilder(trading_interval, TimeframeType.TRADING, max_bars=max_bars)
+    htf_builder = IncrementalTimeframeBuilder(htf_interval, TimeframeType.HIGHER, max_bars=max_bars)
 
-    trading_sorted = sorted(trading_bars, key=lambda bar: bar.timestamp)
     htf_sorted = sorted(htf_bars, key=lambda bar: bar.timestamp)
-
-    accumulated_trading: list[IntervalData] = []
-    accumulated_htf: list[IntervalData] = []
     htf_index = 0
 
-    missing_set = set(missing_timestamps)
-
-    for bar in trading_sorted:
-        # Skip if already loaded from database
-        if bar.timestamp not in missing_set:
-            continue
-
-        accumulated_trading.append(bar)
+    for bar in sorted(trading_bars, key=lambda bar: bar.timestamp):
+        trading_builder.update(bar)
 
         while htf_index < len(htf_sorted) and htf_sorted[htf_index].timestamp <= bar.timestamp:
-            accumulated_htf.append(htf_sorted[htf_index])
+            htf_builder.update(htf_sorted[htf_index])
             htf_index += 1
 
-        if len(accumulated_trading) < 3 or len(accumulated_htf) < 3:
+        if trading_builder.bar_count < 3 or htf_builder.bar_count < 3:
             continue
 
-        trading_data = build_timeframe_data(
-            accumulated_trading,
-            trading_interval,
-            TimeframeType.TRADING,
-        )
-        htf_data = build_timeframe_data(
-            accumulated_htf,
-            htf_interval,
-            TimeframeType.HIGHER,
-        )
-
         try:
-            analysis: MultiTimeframeAnalysis = coordinator.analyze(
-                htf_data,
-                trading_data,
+            analysis = coordinator.analyze(
+                htf_builder.snapshot(),
+                trading_builder.snapshot(),
                 target_timestamp=bar.timestamp,
             )
-            indicator_map[bar.timestamp] = {"analysis": analysis}
         except ValueError:
             continue
+        yield bar.timestamp, analysis
+
+
+def cached_replay_multi_timeframe_analysis(
+    trading_bars: Sequence[IntervalData],
+    htf_bars: Sequence[IntervalData],
+    trading_interval: str,
+    htf_interval: str,
+    *,
+    max_bars: int | None = DEFAULT_REPLAY_WINDOW,
+) -> List[Tuple[datetime, MultiTimeframeAnalysis]]:
+    """:func:`replay_multi_timeframe_analysis` through the calculation cache.
+
+    The whole replay is keyed on the content fingerprints of both bar
+    series, so a repeated backtest over unchanged bars, in this process or,
+    via the disk tier, in a later one, skips indicator computation.
+    """
+    symbol = trading_bars[0].symbol if trading_bars else ""
+    result, _ = CachedCalculator(get_calculation_cache()).get_or_compute(
+        calculation_type="multi_timeframe_replay",
+        symbol=symbol,
+        timeframe=trading_interval,
+        parameters={"htf_interval": htf_interval, "max_bars": max_bars},
+        data=trading_bars,
+        compute_func=lambda data, **params: list(
+            replay_multi_timeframe_analysis(data, htf_bars, trading_interval, htf_interval, max_bars=max_bars)
+        ),
+        data_hash=compute_data_hash([compute_data_hash(trading_bars), compute_data_hash(htf_bars)]),
+        dependencies=[
+            (symbol, trading_interval, bar_window(trading_bars)),
+            (symbol, htf_interval, bar_window(htf_bars)),
+        ],
+    )
+    return result
 
 
 __all__ = [
@@ -245,4 +297,6 @@ __all__ = [
     "load_indicator_snapshots",
     "assemble_bars",
     "load_dataset",
+    "replay_multi_timeframe_analysis",
+    "cached_replay_multi_timeframe_analysis",
 ]
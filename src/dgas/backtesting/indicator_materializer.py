@@ -0,0 +1,424 @@
+"""Batch materialization of multi-timeframe analyses for backtesting.
+
+Fills ``multi_timeframe_analysis`` (and its ``confluence_zones``) for whole
+universes so that :func:`~dgas.backtesting.indicator_loader.load_indicators_batch`
+can serve backtests without recalculating. Each symbol is:
+
+* replayed once through the incremental engine
+  (:func:`~dgas.backtesting.data_loader.replay_multi_timeframe_analysis`),
+  starting ``warmup_bars`` bars before the first bar to fill,
+* written in one transaction: the analyses and zones are COPYed into
+  temporary tables and merged with a single ``INSERT ... SELECT ... ON
+  CONFLICT`` each,
+* marked with a high-water mark (the last trading bar processed) in
+  ``indicator_materialization``, so a rerun only fills the bars after it.
+
+Symbols are spread over worker processes; every worker loads, computes and
+writes its own symbols through its own connection pool.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from psycopg import Connection
+
+from ..calculations.multi_timeframe import MultiTimeframeAnalysis
+from ..data.models import IntervalData
+from ..data.repository import fetch_market_data, fetch_market_data_tail, get_symbol_id
+from ..db import get_connection
+from .data_loader import DEFAULT_REPLAY_WINDOW, replay_multi_timeframe_analysis
+
+logger = logging.getLogger(__name__)
+
+# Columns written per analysis, in COPY order
+ANALYSIS_COLUMNS: Tuple[str, ...] = (
+    "symbol_id",
+    "htf_interval",
+    "trading_interval",
+    "ltf_interval",
+    "timestamp",
+    "htf_trend",
+    "htf_trend_strength",
+    "trading_tf_trend",
+    "alignment_score",
+    "alignment_type",
+    "trade_permitted",
+    "htf_pldot_value",
+    "trading_pldot_value",
+    "pldot_distance_percent",
+    "signal_strength",
+    "risk_level",
+    "recommended_action",
+    "pattern_confluence",
+    "confluence_zones_count",
+)
+
+# Staged zone columns; analysis_timestamp is resolved to analysis_id on merge
+ZONE_COLUMNS: Tuple[str, ...] = (
+    "analysis_timestamp",
+    "level",
+    "upper_bound",
+    "lower_bound",
+    "strength",
+    "timeframes",
+    "zone_type",
+    "first_touch",
+    "last_touch",
+)
+
+_ZONE_TYPES = (
+    "timestamptz",
+    "numeric",
+    "numeric",
+    "numeric",
+    "int4",
+    "text[]",
+    "text",
+    "timestamptz",
+    "timestamptz",
+)
+
+_KEY_COLUMNS = ("symbol_id", "htf_interval", "trading_interval", "timestamp")
+
+
+@dataclass(frozen=True)
+class MaterializationResult:
+    """Outcome of materializing one symbol."""
+
+    symbol: str
+    analyses_written: int = 0
+    bars_processed: int = 0
+    high_water_mark: Optional[datetime] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def analysis_row(
+    symbol_id: int,
+    htf_interval: str,
+    trading_interval: str,
+    analysis: MultiTimeframeAnalysis,
+) -> Tuple[object, ...]:
+    """Return the ``multi_timeframe_analysis`` values of one analysis, in COPY order."""
+    return (
+        symbol_id,
+        htf_interval,
+        trading_interval,
+        analysis.ltf_timeframe,
+        analysis.timestamp,
+        analysis.htf_trend.value,
+        analysis.htf_trend_strength,
+        analysis.trading_tf_trend.value,
+        analysis.alignment.alignment_score,
+        analysis.alignment.alignment_type,
+        analysis.alignment.trade_permitted,
+        analysis.pldot_overlay.htf_pldot_value,
+        analysis.pldot_overlay.ltf_pldot_value,
+        analysis.pldot_overlay.distance_percent,
+        analysis.signal_strength,
+        analysis.risk_level,
+        analysis.recommended_action,
+        analysis.pattern_confluence,
+        len(analysis.confluence_zones),
+    )
+
+
+def zone_rows(analysis: MultiTimeframeAnalysis) -> List[Tuple[object, ...]]:
+    """Return the staged confluence zone values of one analysis, in COPY order."""
+    return [
+        (
+            analysis.timestamp,
+            zone.level,
+            zone.upper_bound,
+            zone.lower_bound,
+            zone.strength,
+            list(zone.timeframes),
+            zone.zone_type,
+            zone.first_touch,
+            zone.last_touch,
+        )
+        for zone in analysis.confluence_zones
+    ]
+
+
+def get_high_water_mark(
+    conn: Connection,
+    symbol_id: int,
+    htf_interval: str,
+    trading_interval: str,
+) -> Optional[datetime]:
+    """Return the last trading bar already materialized, if any."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT high_water_mark
+            FROM indicator_materialization
+            WHERE symbol_id = %s AND htf_interval = %s AND trading_interval = %s
+            """,
+            (symbol_id, htf_interval, trading_interval),
+        )
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def write_analyses(
+    conn: Connection,
+    symbol_id: int,
+    htf_interval: str,
+    trading_interval: str,
+    analyses: Sequence[MultiTimeframeAnalysis],
+    high_water_mark: datetime,
+) -> int:
+    """Bulk upsert analyses and their zones, then advance the high-water mark.
+
+    Existing analyses at the same timestamps are updated and their zones
+    replaced. The caller owns the transaction, so the rows and the
+    high-water mark are committed together.
+
+    Returns:
+        Number of analyses written
+    """
+    columns = ", ".join(ANALYSIS_COLUMNS)
+    updates = ",\n                ".join(
+        f"{column} = EXCLUDED.{column}" for column in ANALYSIS_COLUMNS if column not in _KEY_COLUMNS
+    )
+
+    with conn.cursor() as cur:
+        if analyses:
+            cur.execute(
+                f"""
+                CREATE TEMP TABLE _mta_stage ON COMMIT DROP AS
+                SELECT {columns} FROM multi_timeframe_analysis WITH NO DATA
+                """
+            )
+            with cur.copy(f"COPY _mta_stage ({columns}) FROM STDIN") as copy:
+                for analysis in analyses:
+                    copy.write_row(analysis_row(symbol_id, htf_interval, trading_interval, analysis))
+
+            # Zones of re-materialized analyses are replaced, not appended
+            cur.execute(
+                """
+                DELETE FROM confluence_zones cz
+                USING multi_timeframe_analysis mta, _mta_stage s
+                WHERE cz.analysis_id = mta.analysis_id
+                  AND mta.symbol_id = s.symbol_id
+                  AND mta.htf_interval = s.htf_interval
+                  AND mta.trading_interval = s.trading_interval
+                  AND mta.timestamp = s.timestamp
+                """
+            )
+            cur.execute(
+                f"""
+                INSERT INTO multi_timeframe_analysis ({columns})
+                SELECT {columns} FROM _mta_stage
+                ON CONFLICT (symbol_id, htf_interval, trading_interval, timestamp)
+                DO UPDATE SET
+                {updates}
+                """
+            )
+
+            zones = [row for analysis in analyses for row in zone_rows(analysis)]
+            if zones:
+                cur.execute(
+                    """
+                    CREATE TEMP TABLE _cz_stage (
+                        analysis_timestamp TIMESTAMPTZ,
+                        level NUMERIC,
+                        upper_bound NUMERIC,
+                        lower_bound NUMERIC,
+                        strength INTEGER,
+                        timeframes TEXT[],
+                        zone_type VARCHAR(20),
+                        first_touch TIMESTAMPTZ,
+                        last_touch TIMESTAMPTZ
+                    ) ON COMMIT DROP
+                    """
+                )
+                with cur.copy(f"COPY _cz_stage ({', '.join(ZONE_COLUMNS)}) FROM STDIN") as copy:
+                    copy.set_types(list(_ZONE_TYPES))
+                    for row in zones:
+                        copy.write_row(row)
+                cur.execute(
+                    """
+                    INSERT INTO confluence_zones (
+                        analysis_id, symbol_id, level, upper_bound, lower_bound,
+                        strength, timeframes, zone_type, first_touch, last_touch
+                    )
+                    SELECT
+                        mta.analysis_id, mta.symbol_id, z.level, z.upper_bound, z.lower_bound,
+                        z.strength, z.timeframes, z.zone_type, z.first_touch, z.last_touch
+                    FROM _cz_stage z
+                    JOIN multi_timeframe_analysis mta
+                      ON mta.symbol_id = %s
+                     AND mta.htf_interval = %s
+                     AND mta.trading_interval = %s
+                     AND mta.timestamp = z.analysis_timestamp
+                    """,
+                    (symbol_id, htf_interval, trading_interval),
+                )
+
+        cur.execute(
+            """
+            INSERT INTO indicator_materialization (
+                symbol_id, htf_interval, trading_interval, high_water_mark, analyses_written
+            ) VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (symbol_id, htf_interval, trading_interval)
+            DO UPDATE SET
+                high_water_mark = GREATEST(indicator_materialization.high_water_mark, EXCLUDED.high_water_mark),
+                analyses_written = indicator_materialization.analyses_written + EXCLUDED.analyses_written,
+                updated_at = NOW()
+            """,
+            (symbol_id, htf_interval, trading_interval, high_water_mark, len(analyses)),
+        )
+
+    return len(analyses)
+
+
+def _merge_bars(*batches: Iterable[IntervalData]) -> List[IntervalData]:
+    by_timestamp: Dict[datetime, IntervalData] = {}
+    for batch in batches:
+        for bar in batch:
+            by_timestamp[bar.timestamp] = bar
+    return [by_timestamp[timestamp] for timestamp in sorted(by_timestamp)]
+
+
+def materialize_symbol(
+    symbol: str,
+    htf_interval: str,
+    trading_interval: str,
+    *,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    warmup_bars: int = DEFAULT_REPLAY_WINDOW,
+    full_refresh: bool = False,
+) -> MaterializationResult:
+    """Compute and store the analyses of one symbol that are not stored yet.
+
+    Bars after the symbol's high-water mark and up to ``end`` are filled;
+    ``start`` only applies to symbols without a mark yet, or with
+    ``full_refresh``, which ignores the high-water mark. The
+    ``warmup_bars`` bars before the first bar to fill are replayed but not
+    written, so the incremental state has settled when writing starts.
+    """
+    with get_connection() as conn:
+        symbol_id = get_symbol_id(conn, symbol)
+        if symbol_id is None:
+            return MaterializationResult(symbol=symbol, error="symbol not found")
+
+        high_water_mark = None if full_refresh else get_high_water_mark(
+            conn, symbol_id, htf_interval, trading_interval
+        )
+        # An incremental run always resumes at the mark: starting later would
+        # leave a gap that the advanced mark hides from every later run
+        fill_from = start if high_water_mark is None else high_water_mark
+
+        new_bars = fetch_market_data(conn, symbol, trading_interval, start=fill_from, end=end)
+        if high_water_mark is not None:
+            new_bars = [bar for bar in new_bars if bar.timestamp > high_water_mark]
+        if not new_bars:
+            return MaterializationResult(symbol=symbol, high_water_mark=high_water_mark)
+
+        first_new = new_bars[0].timestamp
+        warmup = fetch_market_data_tail(conn, symbol, trading_interval, warmup_bars, end=first_new)
+        trading_bars = _merge_bars(warmup, new_bars)
+        htf_bars = _merge_bars(
+            fetch_market_data_tail(conn, symbol, htf_interval, warmup_bars, end=trading_bars[0].timestamp),
+            fetch_market_data(conn, symbol, htf_interval, start=trading_bars[0].timestamp, end=end),
+        )
+
+    # Compute without holding a pooled connection
+    analyses = [
+        analysis
+        for timestamp, analysis in replay_multi_timeframe_analysis(
+            trading_bars,
+            htf_bars,
+            trading_interval,
+            htf_interval,
+            max_bars=warmup_bars,
+        )
+        if timestamp >= first_new
+    ]
+    last_bar = new_bars[-1].timestamp
+
+    with get_connection() as conn:
+        written = write_analyses(conn, symbol_id, htf_interval, trading_interval, analyses, last_bar)
+
+    return MaterializationResult(
+        symbol=symbol,
+        analyses_written=written,
+        bars_processed=len(new_bars),
+        high_water_mark=last_bar,
+    )
+
+
+def _materialize_symbol_safe(
+    symbol: str,
+    htf_interval: str,
+    trading_interval: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    warmup_bars: int,
+    full_refresh: bool,
+) -> MaterializationResult:
+    try:
+        return materialize_symbol(
+            symbol,
+            htf_interval,
+            trading_interval,
+            start=start,
+            end=end,
+            warmup_bars=warmup_bars,
+            full_refresh=full_refresh,
+        )
+    except Exception as exc:
+        logger.exception(f"Failed to materialize indicators for {symbol}")
+        return MaterializationResult(symbol=symbol, error=str(exc))
+
+
+def materialize_indicators(
+    symbols: Sequence[str],
+    htf_interval: str,
+    trading_interval: str,
+    *,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    processes: int = 1,
+    warmup_bars: int = DEFAULT_REPLAY_WINDOW,
+    full_refresh: bool = False,
+) -> List[MaterializationResult]:
+    """Materialize analyses for many symbols, one symbol per task.
+
+    With ``processes`` above 1 the symbols are spread over that many worker
+    processes. A failing symbol is reported in its result and does not stop
+    the others.
+
+    Returns:
+        One result per symbol, in the order given
+    """
+    args = (htf_interval, trading_interval, start, end, warmup_bars, full_refresh)
+    if processes <= 1 or len(symbols) <= 1:
+        return [_materialize_symbol_safe(symbol, *args) for symbol in symbols]
+
+    with ProcessPoolExecutor(max_workers=min(processes, len(symbols))) as executor:
+        futures = [executor.submit(_materialize_symbol_safe, symbol, *args) for symbol in symbols]
+        return [future.result() for future in futures]
+
+
+__all__ = [
+    "ANALYSIS_COLUMNS",
+    "MaterializationResult",
+    "analysis_row",
+    "get_high_water_mark",
+    "materialize_indicators",
+    "materialize_symbol",
+    "write_analyses",
+    "zone_rows",
+]
@@ -0,0 +1,185 @@
+"""Multi-process per-symbol backtests over bars held in shared memory.
+
+:class:`SharedMemoryBacktestRunner` is a drop-in for
+:class:`~dgas.backtesting.runner.BacktestRunner` on large symbol lists. The
+parent reads every symbol's trading and HTF bars once, over one connection,
+and packs them into a :class:`~dgas.data.shared_bars.SharedBarStore`. Worker
+processes attach to the store when they start, replay the multi-timeframe
+indicators from the shared bars, run :class:`SimulationEngine` and send back
+only the result and its performance summary. Workers never touch the
+database. Results are persisted from the parent, as in ``BacktestRunner``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..data.bars import BarArray
+from ..data.repository import get_symbol_id
+from ..data.shared_bars import SharedBarHandle, SharedBarStore
+from ..db import get_connection
+from .data_loader import (
+    BacktestDataset,
+    assemble_bars,
+    cached_replay_multi_timeframe_analysis,
+    load_ohlcv,
+)
+from .engine import SimulationEngine
+from .entities import BacktestResult
+from .metrics import PerformanceSummary, calculate_performance
+from .persistence import persist_backtest
+from .runner import BacktestRequest, BacktestRunResult
+from .strategies.registry import instantiate_strategy
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _WorkerState:
+    store: SharedBarStore
+    request: BacktestRequest
+
+
+_worker: Optional[_WorkerState] = None
+
+
+def _init_worker(handle: SharedBarHandle, request: BacktestRequest) -> None:
+    global _worker
+    _worker = _WorkerState(SharedBarStore.attach(handle), request)
+
+
+def _run_symbol_worker(symbol: str) -> Tuple[BacktestResult, PerformanceSummary]:
+    if _worker is None:
+        raise RuntimeError("Backtest worker was not initialized")
+    return run_symbol_backtest(_worker.store, _worker.request, symbol)
+
+
+def run_symbol_backtest(
+    store: SharedBarStore,
+    request: BacktestRequest,
+    symbol: str,
+) -> Tuple[BacktestResult, PerformanceSummary]:
+    """Backtest one symbol from the bars in ``store``.
+
+    Indicators are replayed from the stored HTF bars, as
+    :func:`~dgas.backtesting.data_loader.load_dataset` does for timestamps
+    without materialized analyses, and reused from the calculation cache
+    when the same bars were replayed before.
+    """
+    bars = store.get(symbol, request.interval).to_intervals()
+    indicator_map: Dict[datetime, Mapping[str, Any]] = {}
+    if request.htf_interval:
+        htf_bars = store.get(symbol, request.htf_interval)
+        if len(htf_bars):
+            indicator_map = {
+                timestamp: {"analysis": analysis}
+                for timestamp, analysis in cached_replay_multi_timeframe_analysis(
+                    bars,
+                    htf_bars.to_intervals(),
+                    request.interval,
+                    request.htf_interval,
+                )
+            }
+
+    dataset = BacktestDataset(symbol=symbol, interval=request.interval, bars=assemble_bars(bars, indicator_map))
+    # Fresh strategy instance per symbol, as in BacktestRunner
+    strategy = instantiate_strategy(request.strategy_name, request.strategy_params)
+    result = SimulationEngine(request.simulation_config).run(dataset, strategy)
+    return result, calculate_performance(result, risk_free_rate=request.risk_free_rate)
+
+
+class SharedMemoryBacktestRunner:
+    """Run a :class:`BacktestRequest` on worker processes sharing one copy of the bars.
+
+    ``BacktestRunResult.dataset`` is not sent back from the workers; it
+    holds the symbol and interval with no bars.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def load_bars(self, request: BacktestRequest) -> List[BarArray]:
+        """Read the trading and HTF bars of every requested symbol."""
+        intervals = [request.interval]
+        if request.htf_interval and request.htf_interval != request.interval:
+            intervals.append(request.htf_interval)
+
+        arrays: List[BarArray] = []
+        with get_connection() as conn:
+            for symbol in dict.fromkeys(request.symbols):
+                for interval in intervals:
+                    bars = load_ohlcv(
+                        symbol,
+                        interval,
+                        start=request.start,
+                        end=request.end,
+                        limit=request.limit if interval == request.interval else None,
+                        conn=conn,
+                    )
+                    arrays.append(BarArray.from_intervals(bars, symbol=symbol, interval=interval))
+        return arrays
+
+    def run(self, request: BacktestRequest) -> list[BacktestRunResult]:
+        if not request.symbols:
+            raise ValueError("At least one symbol must be provided for backtesting")
+
+        arrays = self.load_bars(request)
+        bar_counts = {bars.symbol: len(bars) for bars in arrays if bars.interval == request.interval}
+        for symbol in request.symbols:
+            if not bar_counts.get(symbol):
+                raise ValueError(f"No market data found for {symbol} on interval {request.interval}")
+
+        with SharedBarStore.create(arrays) as store:
+            del arrays
+            LOGGER.info(
+                "Backtesting %s symbols on %s workers from %.1f MB of shared bars",
+                len(request.symbols),
+                self.max_workers,
+                store.nbytes / 1e6,
+            )
+            workers = min(self.max_workers, len(request.symbols))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(store.handle, request),
+            ) as executor:
+                # Longest series first so the last tasks to finish are short ones
+                futures = {
+                    symbol: executor.submit(_run_symbol_worker, symbol)
+                    for symbol in sorted(request.symbols, key=lambda symbol: -bar_counts[symbol])
+                }
+                outcomes = {symbol: future.result() for symbol, future in futures.items()}
+
+        results: list[BacktestRunResult] = []
+        for symbol in request.symbols:
+            result, performance = outcomes[symbol]
+            persisted_id: int | None = None
+            if request.persist_results:
+                with get_connection() as conn:
+                    if get_symbol_id(conn, symbol) is None:
+                        raise ValueError(
+                            f"Symbol {symbol} not registered in database. Ingest data before backtesting."
+                        )
+                persisted_id = persist_backtest(result, performance, metadata=request.metadata)
+
+            results.append(
+                BacktestRunResult(
+                    symbol=symbol,
+                    dataset=BacktestDataset(symbol=symbol, interval=request.interval, bars=()),
+                    result=result,
+                    performance=performance,
+                    persisted_id=persisted_id,
+                )
+            )
+        return results
+
+
+__all__ = [
+    "SharedMemoryBacktestRunner",
+    "run_symbol_backtest",
+]
@@ -2,6 +2,17 @@
 
 Coordinates multi-symbol backtesting with shared capital pool,
 ranking signals and managing positions across the entire portfolio.
+
+With ``indicator_processes`` set, the run has two phases: worker processes
+precompute each symbol's indicator stream (see
+:mod:`dgas.backtesting.portfolio_sharding`) while the engine runs the
+sequential ranking, sizing and exit pass over the merged timeline. Results
+are identical to the in-process mode.
+
+With ``indicator_workers`` set instead, indicators are still computed per
+timestep, but by long-lived worker processes that keep each symbol's history
+resident (see :mod:`dgas.backtesting.portfolio_workers`), so only the new
+bars cross the process boundary.
 """
 
 from __future__ import annotations
@@ -11,7 +22,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from ..calculations.timeframe_builder import build_timeframe_data
 from ..calculations.multi_timeframe import MultiTimeframeAnalysis, TimeframeType
@@ -22,6 +33,8 @@ from .indicator_loader import load_indicators_from_db
 from .portfolio_data_loader import PortfolioDataLoader, PortfolioTimestep
 from .portfolio_position_manager import PortfolioPositionManager, PortfolioState
 from .portfolio_indicator_calculator import PortfolioIndicatorCalculator
+from .portfolio_sharding import NOT_PRECOMPUTED, ShardedIndicatorStream
+from .portfolio_workers import SymbolWorkerPool
 from .signal_ranker import RankedSignal, SignalRanker
 from .strategies.base import BaseStrategy, StrategyContext, rolling_history
 from .signal_evaluator import SignalEvaluator
@@ -46,6 +59,17 @@ class PortfolioBacktestConfig:
     # Confidence-based filtering and sizing
     min_signal_confidence: Decimal = Decimal("0.5")  # Minimum confidence to execute signal
     confidence_scaling_enabled: bool = True  # Enable confidence-based position sizing
+    # Stream each new bar into per-symbol incremental builders instead of
+    # rebuilding indicators from the trailing 200-bar window on every timestep
+    incremental_indicators: bool = False
+    # Precompute indicators in this many worker processes (one shard of
+    # symbols each) instead of a per-timestep thread pool; 0 = in-process
+    indicator_processes: int = 0
+    indicator_block_size: int = 32  # Timesteps precomputed per round trip
+    # Compute each timestep's indicators in this many long-lived worker
+    # processes, each owning the histories of a fixed set of symbols; 0 = a
+    # thread pool in this process. Ignored when indicator_processes is set
+    indicator_workers: int = 0
 
 
 @dataclass
@@ -115,6 +139,7 @@ class PortfolioBacktestEngine:
         self.indicator_calculator = PortfolioIndicatorCalculator(
             htf_interval=self.config.htf_interval,
             trading_interval=self.config.trading_interval,
+            incremental=self.config.incremental_indicators,
         )
 
         # State tracking
@@ -128,6 +153,24 @@ class PortfolioBacktestEngine:
         # Signal evaluation tracking
         self.signal_evaluator = SignalEvaluator()
 
+        # Two-phase mode: precomputed indicators plus, per symbol, the index of
+        # the current bar in its series and of the first and last bars skipped
+        # while in a position (histories skip those bars, so precomputed
+        # results assume none were skipped). The series and the symbols whose
+        # in-process incremental builders have been seeded let the fallback
+        # rebuild what those builders would have seen without buffering bars.
+        self.indicator_stream: Optional[ShardedIndicatorStream] = None
+        self._bar_index: Dict[str, int] = {}
+        self._first_skipped: Dict[str, int] = {}
+        self._last_skipped: Dict[str, int] = {}
+        self._series: Dict[str, Sequence[IntervalData]] = {}
+        self._seeded_symbols: Set[str] = set()
+
+        # Per-timestep mode: executors live for the whole run rather than
+        # being created for every timestep
+        self.worker_pool: Optional[SymbolWorkerPool] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
     def run(
         self,
         symbols: List[str],
@@ -196,18 +239,61 @@ class PortfolioBacktestEngine:
         for symbol in symbols:
             self.history_by_symbol[symbol] = rolling_history()
 
+        if self.config.indicator_processes > 0:
+            print(f"Precomputing indicators in {self.config.indicator_processes} worker processes...")
+            self.indicator_stream = ShardedIndicatorStream(
+                timeline,
+                self.indicator_calculator,
+                processes=self.config.indicator_processes,
+                block_size=self.config.indicator_block_size,
+                min_history=self.strategy.config.min_history,
+                max_history_bars=self.max_history_bars,
+                indicator_keys=self.strategy.indicator_keys,
+            )
+            self._series = {symbol: bundle.bars for symbol, bundle in bundles.items()}
+        elif self.config.indicator_workers > 0:
+            print(f"Starting {self.config.indicator_workers} indicator worker processes...")
+            self.worker_pool = SymbolWorkerPool(
+                self.indicator_calculator,
+                {symbol: bundle.bar_count for symbol, bundle in bundles.items()},
+                processes=self.config.indicator_workers,
+                min_history=self.strategy.config.min_history,
+                max_history_bars=self.max_history_bars,
+                indicator_keys=self.strategy.indicator_keys,
+            )
+        else:
+            # Use all CPUs, but no more workers than symbols
+            cpu_count = os.cpu_count() or 4
+            self._thread_pool = ThreadPoolExecutor(max_workers=max(1, min(cpu_count, len(bundles))))
+
         # Main backtest loop
         print(f"Running backtest...\n")
         progress_interval = max(1, len(timeline) // 20)  # Show progress 20 times
 
-        for idx, timestep in enumerate(timeline):
-            # Show progress
-            if idx % progress_interval == 0 or idx == len(timeline) - 1:
-                progress_pct = (idx + 1) / len(timeline) * 100
-                print(f"Progress: {progress_pct:.1f}% ({idx+1:,}/{len(timeline):,} timesteps)", end="\r", flush=True)
-
-            # Process this timestep
-            self._process_timestep(timestep, idx, len(timeline))
+        try:
+            for idx, timestep in enumerate(timeline):
+                # Show progress
+                if idx % progress_interval == 0 or idx == len(timeline) - 1:
+                    progress_pct = (idx + 1) / len(timeline) * 100
+                    print(f"Progress: {progress_pct:.1f}% ({idx+1:,}/{len(timeline):,} timesteps)", end="\r", flush=True)
+
+                if self.indicator_stream is not None:
+                    self.indicator_stream.advance(idx)
+
+                # Process this timestep
+                self._process_timestep(timestep, idx, len(timeline))
+        finally:
+            if self.indicator_stream is not None:
+                self.indicator_stream.close()
+                self.indicator_stream = None
+                self._series = {}
+                self._seeded_symbols = set()
+            if self.worker_pool is not None:
+                self.worker_pool.close()
+                self.worker_pool = None
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=True)
+                self._thread_pool = None
 
         print(f"\n\nBacktest complete!")
 
@@ -335,14 +421,21 @@ class PortfolioBacktestEngine:
 
         # Phase 1: Prepare symbol data (update histories, filter positions)
         eligible_symbols = []
+        appended_bars = []
         for symbol, bar in timestep.bars.items():
+            bar_index = self._bar_index.get(symbol, -1) + 1
+            self._bar_index[symbol] = bar_index
+
             # Skip if already in position
             if portfolio_state.has_position(symbol):
+                self._first_skipped.setdefault(symbol, bar_index)
+                self._last_skipped[symbol] = bar_index
                 continue
 
             # Update history
             history = self.history_by_symbol[symbol]
             history.append(bar)
+            appended_bars.append((symbol, bar))
             
             # Limit history size for performance - only keep recent bars
             # This prevents recalculating indicators on ever-growing history
@@ -358,42 +451,14 @@ class PortfolioBacktestEngine:
             eligible_symbols.append((symbol, bar, history))
 
         # Phase 2: Calculate indicators in parallel
-        indicator_results = {}
-
-        def calculate_indicators_for_symbol(symbol_data):
-            """Helper function to calculate indicators for one symbol."""
-            symbol, bar, history = symbol_data
-            try:
-                indicators = self.indicator_calculator.calculate_indicators(
-                    symbol=symbol,
-                    current_bar=bar,
-                    historical_bars=list(history),
-                )
-                return (symbol, indicators, None)
-            except ValueError as e:
-                return (symbol, None, str(e))
-
-        # Calculate optimal worker count based on CPU cores and symbol count
-        # Use all available CPUs for maximum parallelization
-        cpu_count = os.cpu_count() or 4
-        symbol_count = len(eligible_symbols)
-        # Use all CPUs, but don't exceed symbol count (no point in more workers than symbols)
-        # Remove the cap of 8 to use all available CPUs
-        optimal_workers = min(cpu_count, symbol_count) if symbol_count > 0 else 1
-
-        # Use ThreadPoolExecutor for parallel indicator calculation
-        with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
-            # Submit all indicator calculation tasks
-            futures = {
-                executor.submit(calculate_indicators_for_symbol, symbol_data): symbol_data[0]
-                for symbol_data in eligible_symbols
-            }
-
-            # Collect results as they complete
-            for future in as_completed(futures):
-                symbol, indicators, error = future.result()
-                if indicators is not None:
-                    indicator_results[symbol] = indicators
+        if self.indicator_stream is not None:
+            indicator_results = self._indicators_from_stream(eligible_symbols)
+        elif self.worker_pool is not None:
+            # The workers keep their own copy of each history, so they need
+            # every appended bar, including those still short of min_history
+            indicator_results = self.worker_pool.step(appended_bars)
+        else:
+            indicator_results = self._calculate_indicators_threaded(eligible_symbols)
 
         # Get current prices for position sizing
         current_prices = {
@@ -533,6 +598,125 @@ class PortfolioBacktestEngine:
 
         return signals
 
+    def _calculate_indicators_threaded(
+        self,
+        eligible_symbols: List[Tuple[str, IntervalData, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Calculate indicators for this timestep's symbols in the run's thread pool.
+
+        Args:
+            eligible_symbols: (symbol, bar, history) for symbols needing indicators
+
+        Returns:
+            Indicators by symbol; symbols whose calculation failed are absent
+        """
+        indicator_results = {}
+
+        def calculate_indicators_for_symbol(symbol_data):
+            """Helper function to calculate indicators for one symbol."""
+            symbol, bar, history = symbol_data
+            try:
+                indicators = self.indicator_calculator.calculate_indicators(
+                    symbol=symbol,
+                    current_bar=bar,
+                    historical_bars=history,
+                )
+                return (symbol, indicators, None)
+            except ValueError as e:
+                return (symbol, None, str(e))
+
+        executor = self._thread_pool
+        if executor is None:
+            # Called outside run(); keep the pool for later timesteps
+            executor = self._thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+        # Submit all indicator calculation tasks. The histories are passed
+        # as is: this thread waits for the results before appending again
+        futures = {
+            executor.submit(calculate_indicators_for_symbol, symbol_data): symbol_data[0]
+            for symbol_data in eligible_symbols
+        }
+
+        # Collect results as they complete
+        for future in as_completed(futures):
+            symbol, indicators, error = future.result()
+            if indicators is not None:
+                indicator_results[symbol] = indicators
+
+        return indicator_results
+
+    def _indicators_from_stream(
+        self,
+        eligible_symbols: List[Tuple[str, IntervalData, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Look up precomputed indicators, computing them here where needed.
+
+        A precomputed result assumed the symbol's history never skipped a bar.
+        That still holds when no skipped bar is inside the trailing window the
+        calculator sees; in incremental mode, whose builders carry state from
+        the first bar, only when no bar was ever skipped.
+
+        In incremental mode the first in-process calculation for a symbol
+        seeds its builder with every bar appended so far: the series up to
+        the first skipped bar plus the history since. That replays the
+        symbol's prefix once; later calls only feed the bounded history.
+
+        Args:
+            eligible_symbols: (symbol, bar, history) for symbols needing indicators
+
+        Returns:
+            Indicators by symbol; symbols whose calculation failed are absent
+        """
+        indicator_results = {}
+        for symbol, bar, history in eligible_symbols:
+            bar_index = self._bar_index[symbol]
+            last_skipped = self._last_skipped.get(symbol, -1)
+            if self.config.incremental_indicators:
+                uninterrupted = last_skipped < 0
+            else:
+                window_start = bar_index + 1 - min(bar_index + 1, self.max_history_bars)
+                uninterrupted = last_skipped < window_start
+
+            indicators = NOT_PRECOMPUTED
+            if uninterrupted:
+                indicators = self.indicator_stream.get(symbol, bar.timestamp)
+            if indicators is NOT_PRECOMPUTED:
+                if self.config.incremental_indicators and symbol not in self._seeded_symbols:
+                    historical_bars = self._appended_bars(symbol, history)
+                    if symbol in self._first_skipped:
+                        # Every later bar falls back too, so history keeps the builder fed
+                        self._seeded_symbols.add(symbol)
+                else:
+                    historical_bars = list(history)
+                try:
+                    indicators = self.indicator_calculator.calculate_indicators(
+                        symbol=symbol,
+                        current_bar=bar,
+                        historical_bars=historical_bars,
+                    )
+                except ValueError:
+                    indicators = None
+            if indicators is not None:
+                indicator_results[symbol] = indicators
+
+        return indicator_results
+
+    def _appended_bars(self, symbol: str, history: Any) -> List[IntervalData]:
+        """Every bar appended to ``symbol``'s history so far, oldest first.
+
+        Bars are only skipped while in a position, so they are the series up
+        to the first skipped bar followed by the history bars after it. The
+        fallback runs on the first eligible bar after a skip, before
+        ``history`` could have dropped any of those later bars.
+        """
+        prefix_end = self._first_skipped.get(symbol, self._bar_index[symbol] + 1)
+        series = self._series[symbol]
+        prefix = [series[index] for index in range(prefix_end)]
+        if not prefix:
+            return list(history)
+        cutoff = prefix[-1].timestamp
+        return prefix + [bar for bar in history if bar.timestamp > cutoff]
+
     def _execute_entry_signal(
         self,
         ranked_signal: RankedSignal,
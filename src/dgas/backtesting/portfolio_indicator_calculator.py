@@ -8,14 +8,16 @@ from __future__ import annotations
 
 import bisect
 from dataclasses import dataclass
+from itertools import islice
 from datetime import datetime
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
 
 from ..data.models import IntervalData
 from ..data.repository import fetch_market_data
 from ..db import get_connection
 from ..calculations import build_timeframe_data, MultiTimeframeCoordinator, TimeframeType
-from ..calculations.multi_timeframe import MultiTimeframeAnalysis
+from ..calculations.incremental import IncrementalTimeframeBuilder
+from ..calculations.multi_timeframe import MultiTimeframeAnalysis, TimeframeData
 
 
 @dataclass
@@ -36,20 +38,32 @@ class PortfolioIndicatorCalculator:
         self,
         htf_interval: str = "1d",
         trading_interval: str = "30m",
+        incremental: bool = False,
+        max_bars: int = 200,
     ):
         """Initialize indicator calculator.
 
         Args:
             htf_interval: Higher timeframe interval (e.g., "1d")
             trading_interval: Trading timeframe interval (e.g., "30m")
+            incremental: Keep a streaming builder per symbol instead of rebuilding
+                every series from the trailing window on each bar
+            max_bars: Bars used for calculation (window size, or retained tail
+                in incremental mode)
         """
         self.htf_interval = htf_interval
         self.trading_interval = trading_interval
         self.coordinator = MultiTimeframeCoordinator(htf_interval, trading_interval)
+        self.incremental = incremental
+        self.max_bars = max_bars
 
         # Cache HTF data by symbol
         self.htf_cache: Dict[str, HTFDataCache] = {}
 
+        # Streaming builders by symbol (incremental mode only)
+        self._trading_builders: Dict[str, IncrementalTimeframeBuilder] = {}
+        self._htf_builders: Dict[str, IncrementalTimeframeBuilder] = {}
+
     def load_htf_data_for_symbol(
         self,
         symbol: str,
@@ -112,25 +126,29 @@ class PortfolioIndicatorCalculator:
         if len(htf_bars_up_to_now) < 3:
             raise ValueError(f"Insufficient HTF bars: {len(htf_bars_up_to_now)} < 3")
 
-        # Performance optimization: Limit bars used for calculation
-        # Most indicators only need recent data (e.g., PLdot uses 3-period window)
-        # Limiting to last 200 bars significantly speeds up calculation
-        max_bars_for_calc = 200
-        trading_bars_for_calc = list(historical_bars[-max_bars_for_calc:]) if len(historical_bars) > max_bars_for_calc else list(historical_bars)
-        htf_bars_for_calc = htf_bars_up_to_now[-max_bars_for_calc:] if len(htf_bars_up_to_now) > max_bars_for_calc else htf_bars_up_to_now
-
-        # Build timeframe data
-        trading_data = build_timeframe_data(
-            trading_bars_for_calc,
-            self.trading_interval,
-            TimeframeType.TRADING,
-        )
+        if self.incremental:
+            trading_data, htf_data = self._build_incremental(symbol, historical_bars, htf_bars_up_to_now)
+        else:
+            # Performance optimization: Limit bars used for calculation
+            # Most indicators only need recent data (e.g., PLdot uses 3-period window)
+            # Limiting to last 200 bars significantly speeds up calculation
+            max_bars_for_calc = self.max_bars
+            # islice rather than slicing, so a history deque can be passed as is
+            trading_bars_for_calc = list(islice(historical_bars, max(0, len(historical_bars) - max_bars_for_calc), None))
+            htf_bars_for_calc = htf_bars_up_to_now[-max_bars_for_calc:] if len(htf_bars_up_to_now) > max_bars_for_calc else htf_bars_up_to_now
+
+            # Build timeframe data
+            trading_data = build_timeframe_data(
+                trading_bars_for_calc,
+                self.trading_interval,
+                TimeframeType.TRADING,
+            )
 
-        htf_data = build_timeframe_data(
-            htf_bars_for_calc,
-            self.htf_interval,
-            TimeframeType.HIGHER,
-        )
+            htf_data = build_timeframe_data(
+                htf_bars_for_calc,
+                self.htf_interval,
+                TimeframeType.HIGHER,
+            )
 
         # Run multi-timeframe analysis
         analysis: MultiTimeframeAnalysis = self.coordinator.analyze(
@@ -145,6 +163,51 @@ class PortfolioIndicatorCalculator:
             "trading_tf_data": trading_data,
         }
 
+    def _build_incremental(
+        self,
+        symbol: str,
+        historical_bars: Sequence[IntervalData],
+        htf_bars_up_to_now: List[IntervalData],
+    ) -> Tuple[TimeframeData, TimeframeData]:
+        """Advance the symbol's streaming builders and return their snapshots.
+
+        Only bars newer than what each builder has already seen are fed, so
+        the per-bar cost no longer grows with the history window. Market
+        states carry over from the first bar seen instead of restarting at
+        the start of a trailing window.
+        """
+        trading_builder = self._trading_builders.get(symbol)
+        if trading_builder is None:
+            trading_builder = IncrementalTimeframeBuilder(
+                self.trading_interval,
+                TimeframeType.TRADING,
+                max_bars=self.max_bars,
+            )
+            self._trading_builders[symbol] = trading_builder
+
+        last_seen = trading_builder.last_timestamp
+        new_bars: List[IntervalData] = []
+        for bar in reversed(historical_bars):
+            if last_seen is not None and bar.timestamp <= last_seen:
+                break
+            new_bars.append(bar)
+        trading_builder.extend(reversed(new_bars))
+
+        htf_builder = self._htf_builders.get(symbol)
+        if htf_builder is None:
+            htf_builder = IncrementalTimeframeBuilder(
+                self.htf_interval,
+                TimeframeType.HIGHER,
+                max_bars=self.max_bars,
+            )
+            self._htf_builders[symbol] = htf_builder
+
+        # HTF bars come from a fixed, sorted cache, so the builder's bar count
+        # is the index of the next unseen bar.
+        htf_builder.extend(htf_bars_up_to_now[htf_builder.bar_count:])
+
+        return trading_builder.snapshot(), htf_builder.snapshot()
+
     def _get_htf_bars_up_to(
         self,
         symbol: str,
@@ -0,0 +1,262 @@
+"""Process-parallel indicator precomputation for portfolio backtests.
+
+The indicator math behind :class:`PortfolioBacktestEngine` is pure Python and
+holds the GIL, so computing a timestep's symbols in a thread pool adds
+overhead without adding throughput. :class:`ShardedIndicatorStream` moves that
+work into worker processes instead:
+
+* The symbols are split into one shard per worker, balanced by bar count.
+* Each worker walks its shard's bars in timeline order with an uninterrupted
+  history, exactly as the engine would for a symbol that is never in a
+  position, and computes the indicators for every bar.
+* Results are returned in blocks of timesteps. The next block is computed
+  while the engine runs its sequential allocation pass over the current one,
+  so memory stays bounded by the block size rather than the backtest length.
+
+The engine stops feeding a symbol's history while it holds a position, so a
+precomputed result is only valid while the engine's history for that symbol
+is still uninterrupted; the engine checks this and computes the rest itself.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..data.models import IntervalData
+from .portfolio_data_loader import PortfolioTimestep
+from .portfolio_indicator_calculator import HTFDataCache, PortfolioIndicatorCalculator
+
+# Indicators computed for one shard block: symbol -> timestamp -> indicators,
+# where None records a bar the calculator rejected (ValueError)
+ShardBlock = Dict[str, Dict[datetime, Optional[Mapping[str, Any]]]]
+
+#: Returned by :meth:`ShardedIndicatorStream.get` for bars that were not precomputed
+NOT_PRECOMPUTED = object()
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """Everything a worker needs to replay one shard of symbols."""
+
+    bars: Dict[str, List[IntervalData]]
+    htf_cache: Dict[str, HTFDataCache]
+    htf_interval: str
+    trading_interval: str
+    incremental: bool
+    max_bars: int
+    min_history: int
+    max_history_bars: int
+    indicator_keys: Optional[Tuple[str, ...]] = None
+
+
+class _ShardWorker:
+    """Per-process state: an indicator calculator and one history per symbol."""
+
+    def __init__(self, spec: ShardSpec) -> None:
+        self.spec = spec
+        self.calculator = PortfolioIndicatorCalculator(
+            htf_interval=spec.htf_interval,
+            trading_interval=spec.trading_interval,
+            incremental=spec.incremental,
+            max_bars=spec.max_bars,
+        )
+        self.calculator.htf_cache.update(spec.htf_cache)
+        self.next_index: Dict[str, int] = {symbol: 0 for symbol in spec.bars}
+        self.histories: Dict[str, Deque[IntervalData]] = {symbol: deque() for symbol in spec.bars}
+
+    def advance(self, until: datetime) -> ShardBlock:
+        """Compute indicators for every bar up to and including ``until``."""
+        spec = self.spec
+        block: ShardBlock = {}
+        for symbol, bars in spec.bars.items():
+            index = self.next_index[symbol]
+            history = self.histories[symbol]
+            results: Dict[datetime, Optional[Mapping[str, Any]]] = {}
+
+            while index < len(bars) and bars[index].timestamp <= until:
+                bar = bars[index]
+                index += 1
+                history.append(bar)
+                if len(history) > spec.max_history_bars:
+                    history.popleft()
+                if len(history) < spec.min_history:
+                    continue
+
+                try:
+                    indicators = self.calculator.calculate_indicators(
+                        symbol=symbol,
+                        current_bar=bar,
+                        historical_bars=list(history),
+                    )
+                except ValueError:
+                    results[bar.timestamp] = None
+                    continue
+
+                if spec.indicator_keys is not None:
+                    indicators = {key: indicators[key] for key in spec.indicator_keys if key in indicators}
+                results[bar.timestamp] = indicators
+
+            self.next_index[symbol] = index
+            if results:
+                block[symbol] = results
+        return block
+
+
+_worker: Optional[_ShardWorker] = None
+
+
+def _init_worker(spec: ShardSpec) -> None:
+    global _worker
+    _worker = _ShardWorker(spec)
+
+
+def _advance_worker(until: datetime) -> ShardBlock:
+    if _worker is None:
+        raise RuntimeError("Shard worker was not initialized")
+    return _worker.advance(until)
+
+
+def assign_shards(bar_counts: Mapping[str, int], shard_count: int) -> List[List[str]]:
+    """Split symbols into ``shard_count`` shards with similar total bar counts.
+
+    Symbols are placed largest first onto the lightest shard, ties broken by
+    symbol and shard index, so the assignment is deterministic.
+    """
+    shard_count = max(1, min(shard_count, len(bar_counts)))
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    heap = [(0, index) for index in range(shard_count)]
+    for symbol in sorted(bar_counts, key=lambda name: (-bar_counts[name], name)):
+        load, index = heapq.heappop(heap)
+        shards[index].append(symbol)
+        heapq.heappush(heap, (load + bar_counts[symbol], index))
+    return [shard for shard in shards if shard]
+
+
+class ShardedIndicatorStream:
+    """Indicators for a portfolio timeline, precomputed in worker processes.
+
+    Call :meth:`advance` with each timestep index before reading that
+    timestep's results with :meth:`get`. Use as a context manager (or call
+    :meth:`close`) to shut the workers down.
+    """
+
+    def __init__(
+        self,
+        timeline: Sequence[PortfolioTimestep],
+        calculator: PortfolioIndicatorCalculator,
+        *,
+        processes: int,
+        block_size: int,
+        min_history: int,
+        max_history_bars: int,
+        indicator_keys: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+
+        self.timeline = timeline
+        self.block_size = block_size
+
+        bars_by_symbol: Dict[str, List[IntervalData]] = {}
+        for timestep in timeline:
+            for symbol, bar in timestep.bars.items():
+                bars_by_symbol.setdefault(symbol, []).append(bar)
+
+        shards = assign_shards({symbol: len(bars) for symbol, bars in bars_by_symbol.items()}, processes)
+        self._executors: List[ProcessPoolExecutor] = []
+        for shard in shards:
+            spec = ShardSpec(
+                bars={symbol: bars_by_symbol[symbol] for symbol in shard},
+                htf_cache={
+                    symbol: calculator.htf_cache[symbol] for symbol in shard if symbol in calculator.htf_cache
+                },
+                htf_interval=calculator.htf_interval,
+                trading_interval=calculator.trading_interval,
+                incremental=calculator.incremental,
+                max_bars=calculator.max_bars,
+                min_history=min_history,
+                max_history_bars=max_history_bars,
+                indicator_keys=indicator_keys,
+            )
+            # One single-process pool per shard keeps each shard's state in
+            # the same worker for the whole run
+            self._executors.append(
+                ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(spec,))
+            )
+
+        self._block_index = -1
+        self._results: ShardBlock = {}
+        self._pending: Dict[int, List[Future[ShardBlock]]] = {}
+        self._submit(0)
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._executors)
+
+    def _block_end(self, block_index: int) -> Optional[datetime]:
+        start = block_index * self.block_size
+        if start >= len(self.timeline):
+            return None
+        end = min(start + self.block_size, len(self.timeline)) - 1
+        return self.timeline[end].timestamp
+
+    def _submit(self, block_index: int) -> None:
+        until = self._block_end(block_index)
+        if until is None or block_index in self._pending:
+            return
+        self._pending[block_index] = [
+            executor.submit(_advance_worker, until) for executor in self._executors
+        ]
+
+    def advance(self, timestep_index: int) -> None:
+        """Make the results for ``timeline[timestep_index]`` available."""
+        block_index = timestep_index // self.block_size
+        if block_index == self._block_index:
+            return
+        if block_index < self._block_index:
+            raise ValueError("Timesteps must be consumed in order")
+
+        # Workers advance monotonically, so every block up to the requested
+        # one has to be collected in turn
+        while self._block_index < block_index:
+            next_index = self._block_index + 1
+            self._submit(next_index)
+            results: ShardBlock = {}
+            for future in self._pending.pop(next_index):
+                results.update(future.result())
+            self._results = results
+            self._block_index = next_index
+            # Keep the workers busy while the caller consumes this block
+            self._submit(next_index + 1)
+
+    def get(self, symbol: str, timestamp: datetime) -> Any:
+        """Precomputed indicators (``None`` if rejected) or :data:`NOT_PRECOMPUTED`."""
+        return self._results.get(symbol, {}).get(timestamp, NOT_PRECOMPUTED)
+
+    def close(self) -> None:
+        for executor in self._executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._executors = []
+        self._pending.clear()
+        self._results = {}
+
+    def __enter__(self) -> "ShardedIndicatorStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+__all__ = [
+    "NOT_PRECOMPUTED",
+    "ShardSpec",
+    "ShardedIndicatorStream",
+    "assign_shards",
+]
@@ -0,0 +1,183 @@
+"""Persistent indicator workers for the per-timestep portfolio backtest path.
+
+:class:`SymbolWorkerPool` is started once per backtest run. Every symbol is
+pinned to one worker process, and its trading history and indicator state
+stay in that worker for the whole run. On each timestep the engine sends
+only the bars it appended to its histories. Each worker appends them,
+computes indicators for the symbols with enough history, and returns them.
+
+The worker sees exactly the bars that were appended to the engine's history,
+including none while the symbol is in a position. Its results are therefore
+the same as computing in-process.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..data.models import IntervalData
+from .portfolio_indicator_calculator import HTFDataCache, PortfolioIndicatorCalculator
+from .portfolio_sharding import assign_shards
+
+
+@dataclass(frozen=True)
+class WorkerSpec:
+    """Configuration a worker process is started with."""
+
+    symbols: Tuple[str, ...]
+    htf_cache: Dict[str, HTFDataCache]
+    htf_interval: str
+    trading_interval: str
+    incremental: bool
+    max_bars: int
+    min_history: int
+    max_history_bars: int
+    indicator_keys: Optional[Tuple[str, ...]] = None
+
+
+class _SymbolWorker:
+    """Per-process state: an indicator calculator and one history per symbol."""
+
+    def __init__(self, spec: WorkerSpec) -> None:
+        self.spec = spec
+        self.calculator = PortfolioIndicatorCalculator(
+            htf_interval=spec.htf_interval,
+            trading_interval=spec.trading_interval,
+            incremental=spec.incremental,
+            max_bars=spec.max_bars,
+        )
+        self.calculator.htf_cache.update(spec.htf_cache)
+        self.histories: Dict[str, Deque[IntervalData]] = {
+            symbol: deque(maxlen=spec.max_history_bars) for symbol in spec.symbols
+        }
+
+    def step(self, bars: Sequence[Tuple[str, IntervalData]]) -> Dict[str, Mapping[str, Any]]:
+        """Append one bar per symbol and return the indicators that could be computed."""
+        spec = self.spec
+        results: Dict[str, Mapping[str, Any]] = {}
+        for symbol, bar in bars:
+            history = self.histories[symbol]
+            history.append(bar)
+            if len(history) < spec.min_history:
+                continue
+
+            try:
+                indicators = self.calculator.calculate_indicators(
+                    symbol=symbol,
+                    current_bar=bar,
+                    historical_bars=history,
+                )
+            except ValueError:
+                continue
+
+            if spec.indicator_keys is not None:
+                indicators = {key: indicators[key] for key in spec.indicator_keys if key in indicators}
+            results[symbol] = indicators
+        return results
+
+
+_worker: Optional[_SymbolWorker] = None
+
+
+def _init_worker(spec: WorkerSpec) -> None:
+    global _worker
+    _worker = _SymbolWorker(spec)
+
+
+def _step_worker(bars: Sequence[Tuple[str, IntervalData]]) -> Dict[str, Mapping[str, Any]]:
+    if _worker is None:
+        raise RuntimeError("Symbol worker was not initialized")
+    return _worker.step(bars)
+
+
+class SymbolWorkerPool:
+    """Long-lived indicator workers with per-symbol affinity.
+
+    Symbols are assigned to workers once, balanced by ``bar_counts``. Call
+    :meth:`step` with the bars appended on each timestep, and use the pool as
+    a context manager (or call :meth:`close`) to shut the workers down.
+    """
+
+    def __init__(
+        self,
+        calculator: PortfolioIndicatorCalculator,
+        bar_counts: Mapping[str, int],
+        *,
+        processes: int,
+        min_history: int,
+        max_history_bars: int,
+        indicator_keys: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+
+        self._executors: List[ProcessPoolExecutor] = []
+        self._worker_by_symbol: Dict[str, int] = {}
+        for worker_index, symbols in enumerate(assign_shards(bar_counts, processes)):
+            spec = WorkerSpec(
+                symbols=tuple(symbols),
+                htf_cache={
+                    symbol: calculator.htf_cache[symbol] for symbol in symbols if symbol in calculator.htf_cache
+                },
+                htf_interval=calculator.htf_interval,
+                trading_interval=calculator.trading_interval,
+                incremental=calculator.incremental,
+                max_bars=calculator.max_bars,
+                min_history=min_history,
+                max_history_bars=max_history_bars,
+                indicator_keys=indicator_keys,
+            )
+            # A single-process pool per worker keeps each symbol's state in
+            # the same process for the whole run
+            self._executors.append(
+                ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(spec,))
+            )
+            for symbol in symbols:
+                self._worker_by_symbol[symbol] = worker_index
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._executors)
+
+    def step(self, bars: Sequence[Tuple[str, IntervalData]]) -> Dict[str, Mapping[str, Any]]:
+        """Send this timestep's appended bars and collect the indicators.
+
+        Args:
+            bars: (symbol, bar) for every bar appended to a history this timestep
+
+        Returns:
+            Indicators by symbol; symbols still short of ``min_history`` or
+            whose calculation failed are absent
+        """
+        batches: Dict[int, List[Tuple[str, IntervalData]]] = {}
+        for symbol, bar in bars:
+            batches.setdefault(self._worker_by_symbol[symbol], []).append((symbol, bar))
+
+        futures = [
+            self._executors[worker_index].submit(_step_worker, batch)
+            for worker_index, batch in sorted(batches.items())
+        ]
+        results: Dict[str, Mapping[str, Any]] = {}
+        for future in futures:
+            results.update(future.result())
+        return results
+
+    def close(self) -> None:
+        for executor in self._executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._executors = []
+
+    def __enter__(self) -> "SymbolWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+__all__ = [
+    "SymbolWorkerPool",
+    "WorkerSpec",
+]
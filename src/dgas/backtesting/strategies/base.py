@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Deque, Iterable, Mapping, Sequence
+from typing import Deque, Iterable, Mapping, Sequence, Tuple
 
 from pydantic import BaseModel
 
@@ -45,6 +45,9 @@ class BaseStrategy:
     """Interface that all backtesting strategies must implement."""
 
     config_model = StrategyConfig
+    # Indicator keys on_bar reads; engines that compute indicators out of
+    # process only ship these (None = every key)
+    indicator_keys: Tuple[str, ...] | None = None
 
     def __init__(self, config: StrategyConfig | None = None) -> None:
         self.config = config or self.config_model()
@@ -27,6 +27,7 @@ class MultiTimeframeStrategyConfig(StrategyConfig):
 
 class MultiTimeframeStrategy(BaseStrategy):
     config_model = MultiTimeframeStrategyConfig
+    indicator_keys = ("analysis",)
 
     def __init__(self, config: MultiTimeframeStrategyConfig | None = None) -> None:
         super().__init__(config or MultiTimeframeStrategyConfig())
@@ -1,17 +1,19 @@
 """Core Drummond Geometry calculation modules."""
 
-from .drummond_lines import DrummondLine, DrummondLineCalculator, DrummondZone, aggregate_zones
-from .envelopes import EnvelopeCalculator, EnvelopeSeries
+from .drummond_lines import DrummondLine, DrummondLineCalculator, DrummondLineWindow, DrummondZone, aggregate_zones
+from .envelopes import EnvelopeArrays, EnvelopeCalculator, EnvelopeSeries
 from .patterns import (
     PatternEvent,
+    PatternInputs,
     PatternType,
     detect_c_wave,
     detect_congestion_oscillation,
     detect_exhaust,
     detect_pldot_push,
+    detect_patterns,
     detect_pldot_refresh,
 )
-from .pldot import PLDotCalculator, PLDotSeries
+from .pldot import PLDotArrays, PLDotCalculator, PLDotSeries
 from .states import MarketState, MarketStateClassifier, StateSeries, TrendDirection
 from .multi_timeframe import (
     ConfluenceZone,
@@ -23,13 +25,17 @@ from .multi_timeframe import (
     TimeframeType,
 )
 from .timeframe_builder import build_timeframe_data
+from .incremental import IncrementalTimeframeBuilder, TimeframeUpdate
 
 __all__ = [
     "PLDotCalculator",
     "PLDotSeries",
+    "PLDotArrays",
     "EnvelopeCalculator",
     "EnvelopeSeries",
+    "EnvelopeArrays",
     "DrummondLineCalculator",
+    "DrummondLineWindow",
     "DrummondLine",
     "DrummondZone",
     "aggregate_zones",
@@ -39,11 +45,13 @@ __all__ = [
     "TrendDirection",
     "PatternType",
     "PatternEvent",
+    "PatternInputs",
     "detect_pldot_push",
     "detect_pldot_refresh",
     "detect_exhaust",
     "detect_c_wave",
     "detect_congestion_oscillation",
+    "detect_patterns",
     "MultiTimeframeCoordinator",
     "MultiTimeframeAnalysis",
     "TimeframeData",
@@ -52,4 +60,6 @@ __all__ = [
     "PLDotOverlay",
     "ConfluenceZone",
     "build_timeframe_data",
+    "IncrementalTimeframeBuilder",
+    "TimeframeUpdate",
 ]
@@ -9,18 +9,32 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from ..data.bars import BarArray, BarSource, fingerprint_bars
+from ..data.events import MarketDataChange, subscribe_market_data_changes
 from ..data.models import IntervalData
+from ..utils.lru_cache import LRUCache
+from .disk_cache import DiskCache, get_disk_cache
 from .envelopes import EnvelopeSeries
 from .pldot import PLDotSeries
 
 logger = logging.getLogger(__name__)
 
+# Memory budget of the calculation cache
+DEFAULT_CALCULATION_CACHE_BYTES = 256 * 1024 * 1024
+
+BarWindow = Optional[Tuple[datetime, datetime]]
+"""First and last timestamp of the bars a result was computed from (None if unknown)."""
+
+CacheDependency = Tuple[str, str, BarWindow]
+"""``(symbol, interval, window)`` of one bar series a cached result depends on."""
+
 
 @dataclass(frozen=True)
 class CacheKey:
@@ -69,13 +83,26 @@ class CalculationCache:
     Specialized cache for Drummond geometry calculations.
 
     Provides fast, memory-efficient caching of calculation results with
-    automatic invalidation and performance tracking.
+    automatic invalidation and performance tracking. Entries live in a
+    thread-safe :class:`~dgas.utils.lru_cache.LRUCache`, bounded by entry count
+    and by a memory budget, and are evicted least recently used first.
+
+    With a ``disk_cache`` the in-memory cache is L1 and the disk cache L2:
+    results are written to both, and L1 misses are served from L2 (and
+    promoted back into L1), so other processes and later runs reuse them.
+
+    Every in-memory entry is indexed by the ``(symbol, interval)`` series it
+    was computed from, with the time window of those bars, so
+    :meth:`invalidate` touches only the affected entries. Disk entries are
+    content-addressed and need no invalidation: changed bars produce new keys.
     """
 
     def __init__(
         self,
         max_size: int = 2000,
         default_ttl_seconds: int = 300,  # 5 minutes
+        max_bytes: Optional[int] = DEFAULT_CALCULATION_CACHE_BYTES,
+        disk_cache: Optional[DiskCache] = None,
     ):
         """
         Initialize calculation cache.
@@ -83,13 +110,21 @@ class CalculationCache:
         Args:
             max_size: Maximum number of cache entries
             default_ttl_seconds: Default time-to-live in seconds
+            max_bytes: Memory budget for cached results in bytes (None for no limit)
+            disk_cache: Optional persistent second tier
         """
-        self._cache: dict[str, CachedResult] = {}
+        self._cache = LRUCache(
+            max_entries=max_size,
+            max_bytes=max_bytes,
+            default_ttl_seconds=default_ttl_seconds,
+        )
         self._max_size = max_size
         self._default_ttl = default_ttl_seconds
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+        self.disk_cache = disk_cache
+        # (symbol, interval) -> {cache key: (calculation type, bar window)}
+        self._index: Dict[Tuple[str, str], Dict[str, Tuple[str, BarWindow]]] = {}
+        self._index_size = 0
+        self._index_lock = threading.Lock()
 
     def get(
         self,
@@ -104,24 +139,13 @@ class CalculationCache:
         Returns:
             Cached result if available and not expired, None otherwise
         """
-        key_str = cache_key.to_string()
-        entry = self._cache.get(key_str)
-
-        if entry is None:
-            self._misses += 1
-            return None
-
-        if entry.is_expired:
-            # Remove expired entry
-            del self._cache[key_str]
-            self._misses += 1
-            return None
-
-        # Update hit count
-        entry.hit_count += 1
-        self._hits += 1
-
-        return entry.result
+        key = cache_key.to_string()
+        result = self._cache.get(key)
+        if result is None and self.disk_cache is not None:
+            result = self.disk_cache.get(key)
+            if result is not None:
+                self._cache.set(key, result)
+        return result
 
     def set(
         self,
@@ -129,6 +153,7 @@ class CalculationCache:
         result: Any,
         ttl_seconds: Optional[int] = None,
         computation_time_ms: float = 0.0,
+        dependencies: Optional[Iterable[CacheDependency]] = None,
     ) -> None:
         """
         Cache a calculation result.
@@ -138,49 +163,116 @@ class CalculationCache:
             result: Calculation result to cache
             ttl_seconds: Time-to-live for this cache entry (uses default if None)
             computation_time_ms: Time taken to compute result
+            dependencies: Bar series the result was computed from
+                (default: the key's symbol and timeframe, window unknown)
         """
-        key_str = cache_key.to_string()
-        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-
-        # Evict entries if cache is full
-        if len(self._cache) >= self._max_size and key_str not in self._cache:
-            self._evict_lru()
-
-        self._cache[key_str] = CachedResult(
-            result=result,
-            timestamp=time.time(),
-            ttl_seconds=ttl,
-            hit_count=0,
-            computation_time_ms=computation_time_ms,
+        key = cache_key.to_string()
+        stored = self._cache.set(
+            key,
+            result,
+            ttl_seconds=ttl_seconds,
+            cost_ms=computation_time_ms,
         )
+        if stored:
+            if dependencies is None:
+                dependencies = [(cache_key.symbol, cache_key.timeframe, None)]
+            self._add_to_index(key, cache_key.calculation_type, dependencies)
+        if self.disk_cache is not None:
+            # L2 keeps entries for its own, longer TTL
+            self.disk_cache.set(key, result)
+
+    def _add_to_index(self, key: str, calculation_type: str, dependencies: Iterable[CacheDependency]) -> None:
+        with self._index_lock:
+            for symbol, interval, window in dependencies:
+                entries = self._index.setdefault((symbol, interval), {})
+                if key not in entries:
+                    self._index_size += 1
+                entries[key] = (calculation_type, window)
+            # Entries evicted or expired from the LRU stay indexed until this sweep
+            if self._index_size > 2 * self._max_size:
+                self._prune_index()
+
+    def _prune_index(self) -> None:
+        live = set(self._cache.keys())
+        self._index_size = 0
+        for group in list(self._index):
+            entries = {key: value for key, value in self._index[group].items() if key in live}
+            if entries:
+                self._index[group] = entries
+                self._index_size += len(entries)
+            else:
+                del self._index[group]
+
+    def invalidate(
+        self,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        calculation_type: Optional[str] = None,
+    ) -> int:
+        """
+        Drop in-memory results computed from bars of ``symbol``/``interval`` in ``[start, end]``.
 
-    def _evict_lru(self) -> None:
-        """Evict least recently used cache entry."""
-        if not self._cache:
-            return
+        Only entries indexed under the matching series are visited. Entries
+        whose bar window ends before ``start`` or begins after ``end`` are
+        kept; entries with an unknown window are always dropped.
 
-        # Find entry with minimum hit count and oldest timestamp
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: (self._cache[k].hit_count, self._cache[k].timestamp),
-        )
-        del self._cache[oldest_key]
-        self._evictions += 1
+        Args:
+            symbol: Market symbol (all symbols if None)
+            interval: Bar interval (all intervals if None)
+            start: Earliest changed bar (unbounded if None)
+            end: Latest changed bar (unbounded if None)
+            calculation_type: Only drop this type of calculation
+
+        Returns:
+            Number of entries invalidated
+        """
+        victims = set()
+        with self._index_lock:
+            if symbol is not None and interval is not None:
+                groups = [(symbol, interval)] if (symbol, interval) in self._index else []
+            else:
+                groups = [
+                    group
+                    for group in self._index
+                    if (symbol is None or group[0] == symbol) and (interval is None or group[1] == interval)
+                ]
+            for group in groups:
+                entries = self._index[group]
+                for key, (entry_type, window) in list(entries.items()):
+                    if calculation_type is not None and entry_type != calculation_type:
+                        continue
+                    if window is not None and (
+                        (start is not None and window[1] < start) or (end is not None and window[0] > end)
+                    ):
+                        continue
+                    del entries[key]
+                    self._index_size -= 1
+                    victims.add(key)
+                if not entries:
+                    del self._index[group]
+        return sum(1 for key in victims if self._cache.delete(key))
+
+    def on_market_data_change(self, change: MarketDataChange) -> int:
+        """Invalidate results over the changed bars; subscribed to ingestion by the global cache."""
+        return self.invalidate(change.symbol, change.interval, start=change.start, end=change.end)
 
     def invalidate_by_pattern(self, pattern: str) -> int:
         """
         Invalidate cache entries matching a pattern.
 
+        Keys are hashes, so this only matches (parts of) full keys; use
+        :meth:`invalidate` to drop results by symbol, interval and time range.
+
         Args:
             pattern: String pattern to match in cache keys
 
         Returns:
             Number of entries invalidated
         """
-        keys_to_delete = [k for k in self._cache.keys() if pattern in k]
-        for key in keys_to_delete:
-            del self._cache[key]
-        return len(keys_to_delete)
+        return self._cache.discard_where(lambda key: pattern in key)
 
     def clear_expired(self) -> int:
         """
@@ -189,12 +281,7 @@ class CalculationCache:
         Returns:
             Number of entries cleared
         """
-        keys_to_delete = [
-            k for k, v in self._cache.items() if v.is_expired
-        ]
-        for key in keys_to_delete:
-            del self._cache[key]
-        return len(keys_to_delete)
+        return self._cache.clear_expired()
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -203,60 +290,56 @@ class CalculationCache:
         Returns:
             Dictionary with cache statistics
         """
-        total_requests = self._hits + self._misses
-        hit_rate = (
-            (self._hits / total_requests * 100) if total_requests > 0 else 0
-        )
+        stats = self._cache.stats().as_dict()
+        stats["expired_entries"] = self._cache.count_expired()
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        return stats
 
-        # Calculate average computation time saved
-        total_time_saved = sum(
-            entry.computation_time_ms * entry.hit_count
-            for entry in self._cache.values()
-        )
+    def clear(self) -> int:
+        """Clear all in-memory cache entries (the disk cache is left as is).
+
+        Returns:
+            Number of entries cleared
+        """
+        with self._index_lock:
+            self._index.clear()
+            self._index_size = 0
+        return self._cache.clear()
 
-        return {
-            "size": len(self._cache),
-            "max_size": self._max_size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate_percent": hit_rate,
-            "evictions": self._evictions,
-            "total_time_saved_ms": total_time_saved,
-            "expired_entries": sum(1 for v in self._cache.values() if v.is_expired),
-        }
 
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+def bar_window(data: Any) -> BarWindow:
+    """First and last timestamp of ``data`` if it is a non-empty bar series, else None."""
+    if isinstance(data, BarArray):
+        return data.time_range
+    if not data or not all(isinstance(bar, IntervalData) for bar in data):
+        return None
+    timestamps = [bar.timestamp for bar in data]
+    return min(timestamps), max(timestamps)
 
 
-def compute_data_hash(intervals: List[IntervalData]) -> str:
+def compute_data_hash(intervals: BarSource | Sequence[Any]) -> str:
     """
-    Compute a hash of input data for cache key generation.
+    Compute a content fingerprint of input data for cache key generation.
+
+    Every bar is hashed, so correcting any bar (not only the first or last)
+    yields a new key. ``BarArray`` inputs reuse the fingerprint computed once
+    per array; other inputs (e.g. derived series) are hashed by their repr.
 
     Args:
-        intervals: List of IntervalData
+        intervals: Bars as IntervalData or BarArray, or a sequence of derived values
 
     Returns:
-        SHA256 hash of the data
+        Hex digest of the data
     """
-    if not intervals:
-        return "empty"
-
-    # Use a subset of data for hashing (first, last, and count)
-    # This is much faster than hashing all data
-    hash_data = {
-        "count": len(intervals),
-        "start": intervals[0].timestamp.isoformat() if intervals else None,
-        "end": intervals[-1].timestamp.isoformat() if intervals else None,
-        "symbol": intervals[0].symbol if intervals else None,
-    }
+    if isinstance(intervals, BarArray) or all(isinstance(item, IntervalData) for item in intervals):
+        return fingerprint_bars(intervals)
 
-    hash_str = json.dumps(hash_data, sort_keys=True, default=str)
-    return hashlib.sha256(hash_str.encode()).hexdigest()
+    digest = hashlib.blake2b(digest_size=16)
+    for item in intervals:
+        digest.update(repr(item).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 class CachedCalculator:
@@ -281,9 +364,11 @@ class CachedCalculator:
         symbol: str,
         timeframe: str,
         parameters: Dict[str, Any],
-        data: List[IntervalData],
+        data: BarSource,
         compute_func: callable,
         ttl_seconds: Optional[int] = None,
+        data_hash: Optional[str] = None,
+        dependencies: Optional[Sequence[CacheDependency]] = None,
     ) -> Tuple[Any, bool]:
         """
         Get cached result or compute and cache.
@@ -296,11 +381,15 @@ class CachedCalculator:
             data: Input data for calculation
             compute_func: Function to compute result if not cached
             ttl_seconds: Time-to-live for cache entry
+            data_hash: Precomputed fingerprint of ``data`` (computed if None)
+            dependencies: Bar series the result depends on, for invalidation
+                (default: ``data`` as the symbol/timeframe series)
 
         Returns:
             Tuple of (result, is_cached)
         """
-        data_hash = compute_data_hash(data)
+        if data_hash is None:
+            data_hash = compute_data_hash(data)
         cache_key = CacheKey(
             calculation_type=calculation_type,
             symbol=symbol,
@@ -321,11 +410,14 @@ class CachedCalculator:
             computation_time_ms = (time.time() - start_time) * 1000
 
             # Cache result
+            if dependencies is None:
+                dependencies = [(symbol, timeframe, bar_window(data))]
             self.cache.set(
                 cache_key,
                 result,
                 ttl_seconds=ttl_seconds,
                 computation_time_ms=computation_time_ms,
+                dependencies=dependencies,
             )
 
             return (result, False)
@@ -342,6 +434,9 @@ def get_calculation_cache() -> CalculationCache:
     """
     Get the global calculation cache instance.
 
+    The instance is subscribed to market data changes, so bars stored by any
+    ingestion path invalidate the results computed over them.
+
     Returns:
         CalculationCache instance
     """
@@ -350,7 +445,9 @@ def get_calculation_cache() -> CalculationCache:
         _calculation_cache = CalculationCache(
             max_size=2000,
             default_ttl_seconds=300,  # 5 minutes
+            disk_cache=get_disk_cache(),
         )
+        subscribe_market_data_changes(_calculation_cache.on_market_data_change)
     return _calculation_cache
 
 
@@ -377,7 +474,7 @@ class CachedPLDotCalculator:
         self,
         symbol: str,
         timeframe: str,
-        intervals: List[IntervalData],
+        intervals: BarSource,
         use_cache: bool = True,
         ttl_seconds: int = 300,
     ) -> List[PLDotSeries]:
@@ -387,7 +484,7 @@ class CachedPLDotCalculator:
         Args:
             symbol: Market symbol
             timeframe: Timeframe string
-            intervals: List of IntervalData
+            intervals: Bars as IntervalData or BarArray
             use_cache: Whether to use cache
             ttl_seconds: Cache TTL in seconds
 
@@ -452,7 +549,7 @@ class CachedEnvelopeCalculator:
         self,
         symbol: str,
         timeframe: str,
-        intervals: List[IntervalData],
+        intervals: BarSource,
         pldot: List[PLDotSeries],
         use_cache: bool = True,
         ttl_seconds: int = 300,
@@ -463,7 +560,7 @@ class CachedEnvelopeCalculator:
         Args:
             symbol: Market symbol
             timeframe: Timeframe string
-            intervals: List of IntervalData
+            intervals: Bars as IntervalData or BarArray
             pldot: List of PLDotSeries
             use_cache: Whether to use cache
             ttl_seconds: Cache TTL in seconds
@@ -474,8 +571,8 @@ class CachedEnvelopeCalculator:
         if not use_cache:
             return self.calculator.from_intervals(intervals, pldot)
 
-        # Combine intervals and pldot for data hash
-        combined_data = intervals + pldot
+        # Key on both the bars and the PLdot series the envelope is built from
+        data_hash = compute_data_hash([compute_data_hash(intervals), compute_data_hash(pldot)])
         parameters = {
             "method": self.method,
             "period": self.period,
@@ -488,15 +585,84 @@ class CachedEnvelopeCalculator:
             symbol=symbol,
             timeframe=timeframe,
             parameters=parameters,
-            data=combined_data,
+            data=intervals,
             compute_func=lambda data, **params: self.calculator.from_intervals(intervals, pldot),
             ttl_seconds=ttl_seconds,
+            data_hash=data_hash,
         )
 
         return result
 
 
+class CachedTimeframeBuilder:
+    """Cached :func:`~dgas.calculations.timeframe_builder.build_timeframe_data`.
+
+    Keyed on the bars' content fingerprint, so through the global cache's
+    disk tier a scheduler restart or a repeated run reuses indicators
+    computed earlier for the same bars.
+    """
+
+    def __init__(self, cache: Optional[CalculationCache] = None):
+        """
+        Initialize cached timeframe builder.
+
+        Args:
+            cache: CalculationCache to use (global cache if None)
+        """
+        self.cache = cache if cache is not None else get_calculation_cache()
+
+    def build(
+        self,
+        intervals: BarSource,
+        timeframe: str,
+        classification: Any,  # TimeframeType
+        use_cache: bool = True,
+        ttl_seconds: int = 300,
+    ) -> Any:
+        """
+        Build TimeframeData with caching.
+
+        Args:
+            intervals: Bars as IntervalData or BarArray
+            timeframe: Timeframe label
+            classification: TimeframeType classification
+            use_cache: Whether to use cache
+            ttl_seconds: In-memory cache TTL in seconds
+
+        Returns:
+            TimeframeData
+        """
+        from .timeframe_builder import build_timeframe_data
+
+        if not use_cache:
+            return build_timeframe_data(intervals, timeframe, classification)
+
+        if isinstance(intervals, BarArray):
+            symbol = intervals.symbol
+        else:
+            symbol = intervals[0].symbol if intervals else ""
+        result, _ = CachedCalculator(self.cache).get_or_compute(
+            calculation_type="timeframe_data",
+            symbol=symbol,
+            timeframe=timeframe,
+            parameters={"classification": classification.value},
+            data=intervals,
+            compute_func=lambda data, **params: build_timeframe_data(data, timeframe, classification),
+            ttl_seconds=ttl_seconds,
+        )
+        return result
+
+
+def build_timeframe_data_cached(intervals: BarSource, timeframe: str, classification: Any) -> Any:
+    """:func:`~dgas.calculations.timeframe_builder.build_timeframe_data` through the global cache."""
+    return CachedTimeframeBuilder().build(intervals, timeframe, classification)
+
+
 __all__ = [
+    "DEFAULT_CALCULATION_CACHE_BYTES",
+    "BarWindow",
+    "CacheDependency",
+    "bar_window",
     "CacheKey",
     "CachedResult",
     "CalculationCache",
@@ -505,4 +671,6 @@ __all__ = [
     "compute_data_hash",
     "CachedPLDotCalculator",
     "CachedEnvelopeCalculator",
+    "CachedTimeframeBuilder",
+    "build_timeframe_data_cached",
 ]
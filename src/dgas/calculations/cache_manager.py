@@ -10,8 +10,9 @@ import logging
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional
 
+from ..data.events import MarketDataChange, subscribe_market_data_changes
 from .cache import CalculationCache, get_calculation_cache
 
 logger = logging.getLogger(__name__)
@@ -153,14 +154,10 @@ class CacheInvalidationManager:
         for rule in self.rules:
             if rule.trigger == "data_change" and rule.max_entries:
                 if len(self.cache._cache) > rule.max_entries:
-                    # Remove oldest entries
+                    # Remove least recently used entries
                     excess = len(self.cache._cache) - rule.max_entries
-                    sorted_entries = sorted(
-                        self.cache._cache.items(),
-                        key=lambda x: (x[1].hit_count, x[1].timestamp),
-                    )
-                    for key, _ in sorted_entries[:excess]:
-                        del self.cache._cache[key]
+                    for key in self.cache._cache.keys()[:excess]:
+                        self.cache._cache.delete(key)
                     stats["evicted_by_limit"] = excess
 
         self._last_cleanup = current_time
@@ -195,19 +192,31 @@ class CacheInvalidationManager:
 
         return False
 
-    def register_data_update(self, symbol: str, timeframe: str) -> None:
+    def register_data_update(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
         """
         Register that data has been updated for a symbol/timeframe.
 
-        This should be called when new market data is ingested.
+        Drops the cached results whose input bars overlap ``[start, end]``
+        (the whole series when the range is not given).
 
         Args:
             symbol: Market symbol
             timeframe: Timeframe string
+            start: Earliest changed bar
+            end: Latest changed bar
+
+        Returns:
+            Number of entries invalidated
         """
-        pattern = f"{symbol}_{timeframe}"
-        count = self.invalidate_by_pattern(pattern)
+        count = self.cache.invalidate(symbol, timeframe, start=start, end=end)
         logger.debug(f"Data updated for {symbol} {timeframe}, invalidated {count} cache entries")
+        return count
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -264,6 +273,8 @@ class DataUpdateListener:
     Listener for data updates that triggers cache invalidation.
 
     Automatically invalidates related cache entries when new data arrives.
+    Call :meth:`subscribe` to receive the changes published by ingestion;
+    the global calculation cache is subscribed on its own.
     """
 
     def __init__(self, invalidation_manager: Optional[CacheInvalidationManager] = None):
@@ -275,12 +286,21 @@ class DataUpdateListener:
         """
         self.manager = invalidation_manager if invalidation_manager is not None else get_invalidation_manager()
 
+    def subscribe(self) -> Callable[[], None]:
+        """Receive every published market data change; returns a function that unsubscribes."""
+        return subscribe_market_data_changes(self.on_market_data_change)
+
+    def on_market_data_change(self, change: MarketDataChange) -> None:
+        """Called for each batch of bars stored by ingestion."""
+        self.on_data_ingested(change.symbol, change.interval, change.bars, change.end, earliest_timestamp=change.start)
+
     def on_data_ingested(
         self,
         symbol: str,
         timeframe: str,
         bars_count: int,
         latest_timestamp: datetime,
+        earliest_timestamp: Optional[datetime] = None,
     ) -> None:
         """
         Called when new market data is ingested.
@@ -290,18 +310,16 @@ class DataUpdateListener:
             timeframe: Timeframe of ingested data
             bars_count: Number of bars ingested
             latest_timestamp: Timestamp of latest bar
+            earliest_timestamp: Timestamp of earliest bar (whole series if None)
         """
-        logger.info(
+        logger.debug(
             f"Data ingested: {symbol} {timeframe} "
             f"({bars_count} bars, latest: {latest_timestamp})"
         )
 
-        # Invalidate related cache entries
-        self.manager.register_data_update(symbol, timeframe)
-
-        # Also invalidate multi-timeframe caches that might use this data
-        pattern = f"multi_timeframe.*_{symbol}"
-        self.manager.invalidate_by_pattern(pattern)
+        # Multi-timeframe results are indexed under every series they use,
+        # so this also reaches analyses where this is the other timeframe
+        self.manager.register_data_update(symbol, timeframe, start=earliest_timestamp, end=latest_timestamp)
 
 
 # Convenience functions
@@ -315,7 +333,7 @@ def invalidate_calculation_cache(
     Invalidate calculation cache for specific type/symbol/timeframe.
 
     Args:
-        calculation_type: Type of calculation ('pldot', 'envelope', 'pattern', 'multi_timeframe')
+        calculation_type: Type of calculation ('pldot', 'envelope', 'timeframe_data', 'multi_timeframe_replay')
         symbol: Optional market symbol
         timeframe: Optional timeframe
 
@@ -323,15 +341,7 @@ def invalidate_calculation_cache(
         Number of entries invalidated
     """
     manager = get_invalidation_manager()
-
-    if symbol and timeframe:
-        pattern = f"{calculation_type}_{symbol}_{timeframe}"
-    elif symbol:
-        pattern = f"{calculation_type}_{symbol}"
-    else:
-        pattern = calculation_type
-
-    return manager.invalidate_by_pattern(pattern)
+    return manager.cache.invalidate(symbol, timeframe, calculation_type=calculation_type)
 
 
 def invalidate_all_caches() -> int:
@@ -0,0 +1,314 @@
+"""Persistent calculation cache shared by processes and restarts.
+
+:class:`DiskCache` is the second tier behind the in-memory
+:class:`~dgas.calculations.cache.CalculationCache`. Entries live in one SQLite
+file under ``Settings.data_dir`` in WAL mode, so the scheduler, CLI commands
+and backtest workers read and write the same store concurrently, and results
+survive restarts.
+
+Keys are content-addressed (see
+:func:`~dgas.calculations.cache.compute_data_hash`), so an entry never goes
+stale when bars change; a corrected bar simply produces a new key. Keys are
+namespaced by :data:`CACHE_FORMAT_VERSION` and the package version so results
+computed by older code are not served after an upgrade. TTL and the byte
+budget only bound disk use: expired entries are dropped on read, and once the
+file holds more than ``max_bytes`` of values the least recently used entries
+are evicted. Triggers keep the running byte total in a ``meta`` row as entries
+change, so a write checks the budget without summing the table.
+
+Values are pickled and zlib-compressed. Store errors are logged and treated
+as misses, so the cache never fails a calculation.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .. import get_version
+from ..settings import get_settings
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DISK_CACHE_BYTES = 512 * 1024 * 1024
+DEFAULT_DISK_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Bump when the output of a cached calculation changes without a package release
+CACHE_FORMAT_VERSION = 1
+
+# Reads refresh an entry's recency at most this often, to keep hits read-only
+_TOUCH_INTERVAL_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at, size);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value)
+    SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert_size AFTER INSERT ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update_size AFTER UPDATE OF size ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete_size AFTER DELETE ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE name = 'total_bytes';
+END;
+"""
+
+# An upsert rather than INSERT OR REPLACE: rows removed by REPLACE skip delete triggers
+_UPSERT = """
+INSERT INTO entries (key, size, expires_at, accessed_at, value) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    size = excluded.size,
+    expires_at = excluded.expires_at,
+    accessed_at = excluded.accessed_at,
+    value = excluded.value
+"""
+
+
+class DiskCache:
+    """SQLite-backed key/value store for pickled calculation results.
+
+    Safe to share between threads of one process; each process (including
+    forked workers) opens its own connection on first use.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        max_bytes: Optional[int] = DEFAULT_DISK_CACHE_BYTES,
+        default_ttl_seconds: Optional[float] = DEFAULT_DISK_CACHE_TTL_SECONDS,
+        namespace: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self.namespace = namespace or f"{CACHE_FORMAT_VERSION}:{get_version()}"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            # A connection inherited through fork must not be used by the child
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._pid = pid
+        return self._conn
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing, expired or unreadable."""
+        now = time.time()
+        stored_key = self._key(key)
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?",
+                    (stored_key,),
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+                blob, expires_at, accessed_at = row
+                if expires_at is not None and expires_at <= now:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (stored_key,))
+                    self._misses += 1
+                    return None
+                if now - accessed_at >= _TOUCH_INTERVAL_SECONDS:
+                    conn.execute(
+                        "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, stored_key)
+                    )
+                self._hits += 1
+            return pickle.loads(zlib.decompress(blob))
+        except (sqlite3.Error, pickle.UnpicklingError, zlib.error, AttributeError, EOFError) as exc:
+            LOGGER.warning("Disk cache read failed for %s: %s", self.path, exc)
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> bool:
+        """Store ``value``; returns False if it could not be stored.
+
+        Values larger than the whole byte budget are not stored.
+        """
+        try:
+            blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            LOGGER.debug("Value for %s is not picklable: %s", key, exc)
+            return False
+        if self.max_bytes is not None and len(blob) > self.max_bytes:
+            return False
+
+        now = time.time()
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = now + ttl if ttl else None
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(_UPSERT, (self._key(key), len(blob), expires_at, now, blob))
+                self._writes += 1
+                if self.max_bytes is not None:
+                    self._evict(conn, now, self.max_bytes)
+            return True
+        except sqlite3.Error as exc:
+            LOGGER.warning("Disk cache write failed for %s: %s", self.path, exc)
+            return False
+
+    def _evict(self, conn: sqlite3.Connection, now: float, max_bytes: int) -> None:
+        excess = self._total_bytes(conn) - max_bytes
+        if excess <= 0:
+            return
+        cursor = conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        self._evictions += cursor.rowcount
+        excess = self._total_bytes(conn) - max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for stored_key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            victims.append((stored_key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._evictions += len(victims)
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()
+        return int(row[0])
+
+    def delete(self, key: str) -> bool:
+        """Remove one entry; returns whether it existed."""
+        try:
+            with self._lock:
+                cursor = self._connection().execute(
+                    "DELETE FROM entries WHERE key = ?", (self._key(key),)
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error as exc:
+            LOGGER.warning("Disk cache delete failed for %s: %s", self.path, exc)
+            return False
+
+    def clear_expired(self) -> int:
+        """Remove expired entries and return how many were removed."""
+        try:
+            with self._lock:
+                cursor = self._connection().execute(
+                    "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time.time(),),
+                )
+            return cursor.rowcount
+        except sqlite3.Error as exc:
+            LOGGER.warning("Disk cache cleanup failed for %s: %s", self.path, exc)
+            return 0
+
+    def clear(self) -> int:
+        """Remove every entry (of every namespace) and return how many were removed."""
+        try:
+            with self._lock:
+                cursor = self._connection().execute("DELETE FROM entries")
+            return cursor.rowcount
+        except sqlite3.Error as exc:
+            LOGGER.warning("Disk cache clear failed for %s: %s", self.path, exc)
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and size of the store plus this process's hit counters."""
+        entries = 0
+        total = 0
+        try:
+            with self._lock:
+                entries, total = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()
+        except sqlite3.Error as exc:
+            LOGGER.warning("Disk cache stats failed for %s: %s", self.path, exc)
+        lookups = self._hits + self._misses
+        return {
+            "path": str(self.path),
+            "size": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate_percent": self._hits / lookups * 100 if lookups else 0.0,
+            "writes": self._writes,
+            "evictions": self._evictions,
+        }
+
+    def close(self) -> None:
+        """Close this process's connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
+
+
+# Global disk cache instance
+_disk_cache: Optional[DiskCache] = None
+_disk_cache_loaded = False
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    Get the global disk cache, configured from settings.
+
+    Returns:
+        DiskCache under ``<data_dir>/cache``, or None when disabled
+        (``DGAS_CALC_CACHE_DISK_MB=0``)
+    """
+    global _disk_cache, _disk_cache_loaded
+    if not _disk_cache_loaded:
+        settings = get_settings()
+        if settings.calc_cache_disk_mb > 0:
+            _disk_cache = DiskCache(
+                settings.data_dir / "cache" / "calculations.sqlite3",
+                max_bytes=settings.calc_cache_disk_mb * 1024 * 1024,
+                default_ttl_seconds=settings.calc_cache_disk_ttl_hours * 3600,
+            )
+        _disk_cache_loaded = True
+    return _disk_cache
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "DEFAULT_DISK_CACHE_BYTES",
+    "DEFAULT_DISK_CACHE_TTL_SECONDS",
+    "DiskCache",
+    "get_disk_cache",
+]
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterable, List, Sequence
+from typing import Deque, Iterable, List, Optional, Sequence, Tuple
 
-from ..data.models import IntervalData
+from ..data.bars import BarArray, BarSource
 
 
 @dataclass(frozen=True)
@@ -39,36 +41,41 @@ class DrummondLineCalculator:
             raise ValueError("projection_gap must be positive")
         self.projection_gap = projection_gap
 
-    def from_intervals(self, intervals: Sequence[IntervalData]) -> List[DrummondLine]:
+    def from_intervals(self, intervals: BarSource) -> List[DrummondLine]:
         if len(intervals) < 2:
             return []
 
+        if isinstance(intervals, BarArray):
+            timestamps = intervals.datetimes()
+            highs = intervals.decimals("high")
+            lows = intervals.decimals("low")
+        else:
+            timestamps = [bar.timestamp for bar in intervals]
+            highs = [bar.high for bar in intervals]
+            lows = [bar.low for bar in intervals]
+
         lines: List[DrummondLine] = []
         for i in range(1, len(intervals)):
-            prev_bar = intervals[i - 1]
-            curr_bar = intervals[i]
-
             project_index = min(i + self.projection_gap, len(intervals) - 1)
-            projected_bar = intervals[project_index]
 
             # Resistance line through highs
             resistance_line = self._build_line(
-                prev_bar.timestamp,
-                curr_bar.timestamp,
-                prev_bar.high,
-                curr_bar.high,
-                projected_bar.timestamp,
+                timestamps[i - 1],
+                timestamps[i],
+                highs[i - 1],
+                highs[i],
+                timestamps[project_index],
                 "resistance",
             )
             lines.append(resistance_line)
 
             # Support line through lows
             support_line = self._build_line(
-                prev_bar.timestamp,
-                curr_bar.timestamp,
-                prev_bar.low,
-                curr_bar.low,
-                projected_bar.timestamp,
+                timestamps[i - 1],
+                timestamps[i],
+                lows[i - 1],
+                lows[i],
+                timestamps[project_index],
                 "support",
             )
             lines.append(support_line)
@@ -103,31 +110,133 @@ class DrummondLineCalculator:
         )
 
 
+class DrummondLineWindow:
+    """Two-bar lines over the most recent ``lookback`` bars, kept sorted by projected price.
+
+    :meth:`DrummondLineCalculator.from_intervals` followed by
+    :func:`aggregate_zones` regenerates and re-sorts every line on each call.
+    The window instead keeps one sort key per line in a list ordered by
+    projected price: appending a bar inserts its resistance and support keys
+    and, once ``lookback`` bars are held, evicts the two keys of the pair that
+    fell out. :meth:`lines` and :meth:`zones` return exactly what the one-shot
+    functions produce for the retained bars.
+    """
+
+    def __init__(self, lookback: Optional[int] = None, projection_gap: int = 1) -> None:
+        if lookback is not None and lookback < 2:
+            raise ValueError("lookback must be at least 2")
+        self.lookback = lookback
+        self._calculator = DrummondLineCalculator(projection_gap=projection_gap)
+        self._bars: Deque[Tuple[datetime, Decimal, Decimal]] = deque()
+        # Per retained bar pair: the (price, sequence, line_type) keys of its two lines
+        self._pair_keys: Deque[Tuple[Tuple[float, int, str], Tuple[float, int, str]]] = deque()
+        # Sorted by projected price; the sequence keeps ties in from_intervals order
+        self._sorted: List[Tuple[float, int, str]] = []
+        self._next_sequence = 0
+
+    @classmethod
+    def from_intervals(
+        cls,
+        intervals: BarSource,
+        lookback: Optional[int] = None,
+        projection_gap: int = 1,
+    ) -> "DrummondLineWindow":
+        window = cls(lookback=lookback, projection_gap=projection_gap)
+        window.extend(intervals)
+        return window
+
+    def __len__(self) -> int:
+        """Number of lines currently in the window."""
+        return len(self._sorted)
+
+    def append(self, timestamp: datetime, high: Decimal, low: Decimal) -> None:
+        """Add one bar; bars must arrive in chronological order."""
+        if self.lookback is not None and len(self._bars) == self.lookback:
+            self._bars.popleft()
+            for key in self._pair_keys.popleft():
+                del self._sorted[bisect_left(self._sorted, key)]
+
+        if self._bars:
+            _, prev_high, prev_low = self._bars[-1]
+            resistance = (_projected_price(prev_high, high), self._next_sequence, "resistance")
+            support = (_projected_price(prev_low, low), self._next_sequence + 1, "support")
+            self._next_sequence += 2
+            insort(self._sorted, resistance)
+            insort(self._sorted, support)
+            self._pair_keys.append((resistance, support))
+
+        self._bars.append((timestamp, high, low))
+
+    def extend(self, intervals: BarSource) -> None:
+        if isinstance(intervals, BarArray):
+            rows = zip(
+                intervals.datetimes(),
+                intervals.decimals("high"),
+                intervals.decimals("low"),
+                strict=True,
+            )
+        else:
+            rows = ((bar.timestamp, bar.high, bar.low) for bar in intervals)
+        for timestamp, high, low in rows:
+            self.append(timestamp, high, low)
+
+    def lines(self) -> List[DrummondLine]:
+        """Lines for the retained bars, in :meth:`DrummondLineCalculator.from_intervals` order."""
+        bars = list(self._bars)
+        lines: List[DrummondLine] = []
+        for i in range(1, len(bars)):
+            (start_ts, start_high, start_low), (end_ts, end_high, end_low) = bars[i - 1], bars[i]
+            # Projections of the newest pairs are clipped to the last bar and move as bars arrive
+            projected_ts = bars[min(i + self._calculator.projection_gap, len(bars) - 1)][0]
+            lines.append(
+                self._calculator._build_line(start_ts, end_ts, start_high, end_high, projected_ts, "resistance")
+            )
+            lines.append(
+                self._calculator._build_line(start_ts, end_ts, start_low, end_low, projected_ts, "support")
+            )
+        return lines
+
+    def zones(self, tolerance: float = 0.5) -> List[DrummondZone]:
+        """Same result as ``aggregate_zones(self.lines(), tolerance)`` without re-sorting."""
+        return _group_zones(((price, line_type) for price, _, line_type in self._sorted), tolerance)
+
+
 def aggregate_zones(lines: Iterable[DrummondLine], tolerance: float = 0.5) -> List[DrummondZone]:
-    grouped: List[DrummondZone] = []
     sorted_lines = sorted(lines, key=lambda line: float(line.projected_price))
+    return _group_zones(((float(line.projected_price), line.line_type) for line in sorted_lines), tolerance)
 
-    current_group: List[DrummondLine] = []
-    for line in sorted_lines:
-        if not current_group:
-            current_group.append(line)
+
+def _group_zones(entries: Iterable[Tuple[float, str]], tolerance: float) -> List[DrummondZone]:
+    """Group ``(projected_price, line_type)`` pairs already sorted by price into zones."""
+    grouped: List[DrummondZone] = []
+    current_prices: List[float] = []
+    current_type = ""
+    for price, line_type in entries:
+        if not current_prices:
+            current_prices.append(price)
+            current_type = line_type
             continue
 
-        last_price = float(current_group[-1].projected_price)
-        if abs(float(line.projected_price) - last_price) <= tolerance and line.line_type == current_group[-1].line_type:
-            current_group.append(line)
+        if abs(price - current_prices[-1]) <= tolerance and line_type == current_type:
+            current_prices.append(price)
         else:
-            grouped.append(_build_zone(current_group))
-            current_group = [line]
+            grouped.append(_build_zone(current_prices, current_type))
+            current_prices = [price]
+            current_type = line_type
 
-    if current_group:
-        grouped.append(_build_zone(current_group))
+    if current_prices:
+        grouped.append(_build_zone(current_prices, current_type))
 
     return grouped
 
 
-def _build_zone(lines: List[DrummondLine]) -> DrummondZone:
-    prices = [float(line.projected_price) for line in lines]
+def _projected_price(start_price: Decimal, end_price: Decimal) -> float:
+    """Projected price of a two-bar line as computed by ``_build_line``, as a float."""
+    end_price_dec = Decimal(str(end_price))
+    return float(end_price_dec + (end_price_dec - Decimal(str(start_price))))
+
+
+def _build_zone(prices: Sequence[float], line_type: str) -> DrummondZone:
     lower = min(prices)
     upper = max(prices)
     center = (lower + upper) / 2
@@ -135,9 +244,9 @@ def _build_zone(lines: List[DrummondLine]) -> DrummondZone:
         center_price=Decimal(str(round(center, 6))),
         lower_price=Decimal(str(round(lower, 6))),
         upper_price=Decimal(str(round(upper, 6))),
-        line_type=lines[0].line_type,
-        strength=len(lines),
+        line_type=line_type,
+        strength=len(prices),
     )
 
 
-__all__ = ["DrummondLineCalculator", "DrummondLine", "DrummondZone", "aggregate_zones"]
+__all__ = ["DrummondLineCalculator", "DrummondLine", "DrummondLineWindow", "DrummondZone", "aggregate_zones"]
@@ -5,12 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterable, List, Sequence
+from typing import Dict, List, Sequence
 
+import numpy as np
 import pandas as pd
 
-from ..data.models import IntervalData
-from .pldot import PLDotSeries
+from ..data.bars import BarSource, ohlc_frame
+from .lazy import LazySeries, python_datetimes
+from .pldot import PLDotArrays, PLDotSeries
 
 
 @dataclass(frozen=True)
@@ -65,39 +67,39 @@ class EnvelopeCalculator:
         self.multiplier = multiplier
         self.percent = percent
 
-    def from_intervals(self, intervals: Sequence[IntervalData], pldot: Sequence[PLDotSeries]) -> List[EnvelopeSeries]:
+    def from_intervals(self, intervals: BarSource, pldot: Sequence[PLDotSeries]) -> List[EnvelopeSeries]:
+        return self.compute_arrays(intervals, pldot).to_list()
+
+    def compute_arrays(self, intervals: BarSource, pldot: Sequence[PLDotSeries]) -> EnvelopeArrays:
+        """Compute the envelope columns without building per-row dataclasses.
+
+        ``pldot`` may be a list of :class:`PLDotSeries` or the
+        :class:`~dgas.calculations.pldot.PLDotArrays` returned by
+        ``PLDotCalculator.compute_arrays``, which skips the Decimal round trip.
+        """
         if not intervals or not pldot:
-            return []
-
-        df = pd.DataFrame(
-            {
-                "timestamp": [row.timestamp for row in intervals],
-                "high": [float(row.high) for row in intervals],
-                "low": [float(row.low) for row in intervals],
-                "close": [float(row.close) for row in intervals],
-            }
-        ).sort_values("timestamp")
-
-        df.set_index("timestamp", inplace=True)
-
-        pldot_df = pd.DataFrame(
-            {
-                "timestamp": [row.timestamp for row in pldot],
-                "value": [float(row.value) for row in pldot],
-            }
-        ).set_index("timestamp")
+            return EnvelopeArrays.empty(self.method)
+
+        df = ohlc_frame(intervals)
+
+        if isinstance(pldot, PLDotArrays):
+            pldot_df = pd.DataFrame({"value": pldot.rounded_values()}, index=pldot.timestamp)
+        else:
+            pldot_df = pd.DataFrame(
+                {
+                    "timestamp": [row.timestamp for row in pldot],
+                    "value": [float(row.value) for row in pldot],
+                }
+            ).set_index("timestamp")
 
         df = df.join(pldot_df, how="inner")
         if df.empty:
-            return []
+            return EnvelopeArrays.empty(self.method)
 
         if self.method == "pldot_range":
             # DRUMMOND METHOD: 3-period standard deviation of PLdot values
             # This is the correct Drummond Geometry envelope calculation
-            pldot_volatility = df["value"].rolling(
-                window=self.period,
-                min_periods=self.period
-            ).std()
+            pldot_volatility = rolling_sample_std(df["value"], self.period)
             offset = pldot_volatility * self.multiplier
 
         elif self.method == "hlc_range":
@@ -139,28 +141,100 @@ class EnvelopeCalculator:
         close = df["close"]
         position = ((close - lower) / width).clip(lower=0.0, upper=1.0)
 
-        results: List[EnvelopeSeries] = []
-        for timestamp, center, upper_val, lower_val, width_val, position_val in zip(
-            df.index,
-            df["value"],
-            upper,
-            lower,
-            width,
-            position,
-        ):
-            results.append(
-                EnvelopeSeries(
-                    timestamp=timestamp.to_pydatetime(),
-                    center=Decimal(str(round(center, 6))),
-                    upper=Decimal(str(round(upper_val, 6))),
-                    lower=Decimal(str(round(lower_val, 6))),
-                    width=Decimal(str(round(width_val, 6))),
-                    position=Decimal(str(round(position_val, 6))),
-                    method=self.method,
-                )
-            )
-
-        return results
-
-
-__all__ = ["EnvelopeCalculator", "EnvelopeSeries"]
+        return EnvelopeArrays(
+            timestamp=df.index,
+            center=df["value"].to_numpy(),
+            upper=upper.to_numpy(),
+            lower=lower.to_numpy(),
+            width=width.to_numpy(),
+            position=position.to_numpy(),
+            method=self.method,
+        )
+
+
+class EnvelopeArrays(LazySeries[EnvelopeSeries]):
+    """Column form of an envelope series; rows are built on access.
+
+    All price columns are unrounded float64 arrays aligned with ``timestamp``.
+    """
+
+    def __init__(
+        self,
+        timestamp: pd.DatetimeIndex,
+        center: np.ndarray,
+        upper: np.ndarray,
+        lower: np.ndarray,
+        width: np.ndarray,
+        position: np.ndarray,
+        method: str,
+    ) -> None:
+        super().__init__(len(center))
+        self.timestamp = timestamp
+        self.center = center
+        self.upper = upper
+        self.lower = lower
+        self.width = width
+        self.position = position
+        self.method = method
+        self._datetimes: List[datetime] | None = None
+        self._rounded: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def empty(cls, method: str) -> "EnvelopeArrays":
+        empty = np.empty(0, dtype=np.float64)
+        return cls(pd.DatetimeIndex([], tz="UTC"), empty, empty, empty, empty, empty, method)
+
+    def datetimes(self) -> List[datetime]:
+        """Envelope timestamps as ``datetime`` objects."""
+        if self._datetimes is None:
+            self._datetimes = python_datetimes(self.timestamp)
+        return self._datetimes
+
+    def rounded(self, column: str) -> np.ndarray:
+        """A column rounded to 6 places, i.e. ``float()`` of the matching ``EnvelopeSeries`` field."""
+        if column not in self._rounded:
+            values = getattr(self, column).tolist()
+            self._rounded[column] = np.array([round(value, 6) for value in values], dtype=np.float64)
+        return self._rounded[column]
+
+    def _build(self, index: int) -> EnvelopeSeries:
+        return EnvelopeSeries(
+            timestamp=self.datetimes()[index],
+            center=Decimal(str(round(self.center[index].item(), 6))),
+            upper=Decimal(str(round(self.upper[index].item(), 6))),
+            lower=Decimal(str(round(self.lower[index].item(), 6))),
+            width=Decimal(str(round(self.width[index].item(), 6))),
+            position=Decimal(str(round(self.position[index].item(), 6))),
+            method=self.method,
+        )
+
+
+def rolling_sample_std(values: pd.Series, period: int) -> pd.Series:
+    """Sample standard deviation of each trailing ``period``-value window.
+
+    Each window is evaluated on its own with a two-pass formula (constant
+    windows give exactly zero), so results do not drift with series length or
+    pandas version and match the incremental builder bit for bit.
+    """
+    if period < 2:
+        return pd.Series(np.nan, index=values.index)
+
+    window = [values.shift(period - 1 - k) for k in range(period)]
+    total = window[0]
+    for column in window[1:]:
+        total = total + column
+    mean = total / period
+
+    deviation = window[0] - mean
+    squares = deviation * deviation
+    constant = pd.Series(True, index=values.index)
+    for column in window[1:]:
+        deviation = column - mean
+        squares = squares + deviation * deviation
+        constant &= column == window[0]
+
+    variance = (squares / (period - 1)).mask(constant, 0.0)
+    return np.sqrt(variance)
+
+
+__all__ = ["EnvelopeArrays", "EnvelopeCalculator", "EnvelopeSeries", "rolling_sample_std"]
@@ -0,0 +1,292 @@
+"""Incremental (streaming) timeframe analysis.
+
+:func:`~dgas.calculations.timeframe_builder.build_timeframe_data` recomputes
+every series from scratch over the whole window it is given. Backtests and the
+prediction loop call it once per bar, so most of that work is redundant: the
+PLdot is a three-bar moving average, the ``pldot_range`` envelope is a
+three-sample standard deviation over the PLdot and the market state machine
+only looks at the previous bar.
+
+:class:`IncrementalTimeframeBuilder` keeps that state between bars. Feeding it
+a new bar updates the PLdot, envelope and state series in O(1) and returns the
+entries that became final with that bar. :meth:`IncrementalTimeframeBuilder.snapshot`
+produces the same :class:`TimeframeData` that ``build_timeframe_data`` would
+return for every bar fed so far (or for the retained tail when ``max_bars`` is
+set).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Deque, Iterable, List, Optional, Tuple
+
+from ..data.bars import BarFingerprint
+from ..data.models import IntervalData
+from .drummond_lines import DrummondLineWindow
+from .envelopes import EnvelopeSeries
+from .multi_timeframe import TimeframeData, TimeframeType
+from .pldot import PLDotSeries
+from .states import MarketStateClassifier, StateSeries, StateTracker
+from .timeframe_builder import detect_patterns_and_zones
+
+
+@dataclass(frozen=True)
+class TimeframeUpdate:
+    """Series entries finalized by a single :meth:`IncrementalTimeframeBuilder.update`.
+
+    PLdot values are only emitted once their projection bar exists, so the
+    entries lag the incoming bar by the PLdot displacement. All three fields are
+    ``None`` during warm-up.
+    """
+    timestamp: datetime
+    pldot: PLDotSeries | None = None
+    envelope: EnvelopeSeries | None = None
+    state: StateSeries | None = None
+
+
+@dataclass
+class _PendingPLDot:
+    """Bar waiting for its displacement bar before its PLdot can be emitted."""
+    bar: IntervalData
+    value: float | None
+    slope: float | None
+
+
+class IncrementalTimeframeBuilder:
+    """Maintain Drummond Geometry series for one symbol/timeframe bar by bar.
+
+    The builder mirrors the parameters used by ``build_timeframe_data``
+    (displacement 1, ``pldot_range`` envelope with a 3-bar period and 1.5x
+    multiplier, 0.0001 slope threshold). Bars must arrive in strictly increasing
+    timestamp order.
+
+    ``max_bars`` bounds memory: only the most recent ``max_bars`` bars and
+    series entries are retained for :meth:`snapshot`, while the PLdot,
+    envelope and state machine keep carrying their state across the whole
+    stream. Snapshots carry a ``source_fingerprint`` over every bar fed since
+    the last reset, extended as each bar arrives.
+    """
+
+    def __init__(
+        self,
+        timeframe: str,
+        classification: TimeframeType,
+        max_bars: Optional[int] = None,
+        displacement: int = 1,
+        envelope_period: int = 3,
+        envelope_multiplier: float = 1.5,
+        slope_threshold: float = 0.0001,
+    ) -> None:
+        if max_bars is not None and max_bars < 3:
+            raise ValueError("max_bars must be at least 3")
+        if displacement < 1:
+            raise ValueError("PLdot displacement must be >= 1")
+        if envelope_period <= 0:
+            raise ValueError("envelope_period must be positive")
+        if envelope_multiplier <= 0:
+            raise ValueError("envelope_multiplier must be positive")
+
+        self.timeframe = timeframe
+        self.classification = classification
+        self.max_bars = max_bars
+        self.displacement = displacement
+        self.envelope_period = envelope_period
+        self.envelope_multiplier = envelope_multiplier
+        self._derivation = (
+            f"incremental:{max_bars}:{displacement}:{envelope_period}:{envelope_multiplier}:{slope_threshold}"
+        )
+        self._classifier = MarketStateClassifier(slope_threshold=slope_threshold)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every bar and start a fresh stream."""
+        self._bars: Deque[IntervalData] = deque(maxlen=self.max_bars)
+        self._pldot: Deque[PLDotSeries] = deque(maxlen=self.max_bars)
+        self._envelopes: Deque[EnvelopeSeries] = deque(maxlen=self.max_bars)
+        self._states: Deque[StateSeries] = deque(maxlen=self.max_bars)
+        self._lines = DrummondLineWindow(lookback=self.max_bars)
+
+        self._bar_count = 0
+        self._last_timestamp: datetime | None = None
+        self._hlc_window: Deque[float] = deque(maxlen=3)
+        self._prev_pldot_value: float | None = None
+        self._pending: Deque[_PendingPLDot] = deque()
+        self._center_window: Deque[float] = deque(maxlen=self.envelope_period)
+        self._tracker = StateTracker()
+        self._snapshot: TimeframeData | None = None
+        self._fingerprint = BarFingerprint()
+
+    @property
+    def bar_count(self) -> int:
+        """Total number of bars fed since the last reset."""
+        return self._bar_count
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        """Timestamp of the most recent bar, or ``None`` before the first bar."""
+        return self._last_timestamp
+
+    @property
+    def bars(self) -> Tuple[IntervalData, ...]:
+        """Retained bars, oldest first."""
+        return tuple(self._bars)
+
+    def update(self, bar: IntervalData) -> TimeframeUpdate:
+        """Feed one bar and return the series entries it finalized."""
+        if self._last_timestamp is not None and bar.timestamp <= self._last_timestamp:
+            raise ValueError(
+                f"Bars must be fed in increasing timestamp order: "
+                f"{bar.timestamp} <= {self._last_timestamp}"
+            )
+
+        self._bars.append(bar)
+        self._lines.append(bar.timestamp, bar.high, bar.low)
+        self._bar_count += 1
+        self._last_timestamp = bar.timestamp
+        self._snapshot = None
+        self._fingerprint.update_bar(bar)
+
+        # Three-bar mean of the HLC average, summed in the same order as PLDotCalculator
+        self._hlc_window.append((float(bar.high) + float(bar.low) + float(bar.close)) / 3.0)
+        value: float | None = None
+        slope: float | None = None
+        if len(self._hlc_window) == 3:
+            value = sum(self._hlc_window) / 3.0
+            if self._prev_pldot_value is not None:
+                slope = value - self._prev_pldot_value
+            self._prev_pldot_value = value
+        self._pending.append(_PendingPLDot(bar=bar, value=value, slope=slope))
+
+        if len(self._pending) <= self.displacement:
+            return TimeframeUpdate(timestamp=bar.timestamp)
+
+        source = self._pending.popleft()
+        if source.value is None:
+            return TimeframeUpdate(timestamp=bar.timestamp)
+
+        pldot = PLDotSeries(
+            timestamp=source.bar.timestamp,
+            value=Decimal(str(round(source.value, 6))),
+            projected_timestamp=bar.timestamp,
+            projected_value=Decimal(str(round(source.value, 6))),
+            slope=Decimal(str(round(source.slope, 6))) if source.slope is not None else Decimal("0"),
+            displacement=self.displacement,
+        )
+        envelope = self._next_envelope(source.bar, pldot)
+        state = self._classifier.advance(
+            self._tracker,
+            pldot.timestamp,
+            source.bar.close,
+            pldot.value,
+            pldot.slope,
+        )
+
+        self._pldot.append(pldot)
+        self._envelopes.append(envelope)
+        self._states.append(state)
+
+        return TimeframeUpdate(timestamp=bar.timestamp, pldot=pldot, envelope=envelope, state=state)
+
+    def extend(self, bars: Iterable[IntervalData]) -> List[TimeframeUpdate]:
+        """Feed several bars in order and return one update per bar."""
+        return [self.update(bar) for bar in bars]
+
+    def snapshot(self) -> TimeframeData:
+        """Return the :class:`TimeframeData` for the retained window.
+
+        PLdot, envelope and state series come straight from the incremental
+        state; patterns are derived from them over the retained window and
+        Drummond zones from the line window kept sorted across updates. The
+        result is cached until the next update.
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+
+        if self._bar_count == 0:
+            self._snapshot = TimeframeData(
+                timeframe=self.timeframe,
+                classification=self.classification,
+                pldot_series=[],
+                envelope_series=[],
+                state_series=[],
+                pattern_events=[],
+                drummond_zones=(),
+                source_fingerprint=self._source_fingerprint(),
+            )
+            return self._snapshot
+
+        if self._bar_count < 3:
+            raise ValueError("At least 3 intervals are required to compute PLdot")
+
+        intervals = list(self._bars)
+        pldot_series = list(self._pldot)
+        envelope_series = list(self._envelopes)
+        patterns, drummond_zones = detect_patterns_and_zones(
+            intervals, pldot_series, envelope_series, line_window=self._lines
+        )
+
+        self._snapshot = TimeframeData(
+            timeframe=self.timeframe,
+            classification=self.classification,
+            pldot_series=pldot_series,
+            envelope_series=envelope_series,
+            state_series=list(self._states),
+            pattern_events=patterns,
+            drummond_zones=drummond_zones,
+            source_fingerprint=self._source_fingerprint(),
+        )
+        return self._snapshot
+
+    def _source_fingerprint(self) -> str:
+        return f"{self._derivation}:{self._fingerprint.hexdigest()}"
+
+    def _next_envelope(self, bar: IntervalData, pldot: PLDotSeries) -> EnvelopeSeries:
+        """Compute the ``pldot_range`` envelope for the newest PLdot value."""
+        center = float(pldot.value)
+        self._center_window.append(center)
+        offset = _window_sample_std(self._center_window, self.envelope_period) * self.envelope_multiplier
+
+        upper = center + offset
+        lower = center - offset
+        width = upper - lower
+        position = _clipped_position(float(bar.close) - lower, width)
+
+        return EnvelopeSeries(
+            timestamp=pldot.timestamp,
+            center=Decimal(str(round(center, 6))),
+            upper=Decimal(str(round(upper, 6))),
+            lower=Decimal(str(round(lower, 6))),
+            width=Decimal(str(round(width, 6))),
+            position=Decimal(str(round(position, 6))),
+            method="pldot_range",
+        )
+
+
+def _window_sample_std(window: Deque[float], period: int) -> float:
+    """Scalar counterpart of :func:`~dgas.calculations.envelopes.rolling_sample_std`."""
+    if period < 2 or len(window) < period:
+        return math.nan
+    first = window[0]
+    if all(value == first for value in window):
+        return 0.0
+    mean = sum(window) / period
+    squares = sum((value - mean) * (value - mean) for value in window)
+    return math.sqrt(squares / (period - 1))
+
+
+def _clipped_position(distance: float, width: float) -> float:
+    """Envelope position clipped to [0, 1] with pandas division semantics."""
+    if math.isnan(distance) or math.isnan(width):
+        return math.nan
+    if width == 0:
+        if distance == 0:
+            return math.nan
+        return 1.0 if distance > 0 else 0.0
+    return min(max(distance / width, 0.0), 1.0)
+
+
+__all__ = ["IncrementalTimeframeBuilder", "TimeframeUpdate"]
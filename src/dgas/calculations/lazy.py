@@ -0,0 +1,74 @@
+"""Array-backed series that build their dataclass rows on demand."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Generic, Iterator, List, Optional, TypeVar, overload
+
+import pandas as pd
+
+T = TypeVar("T")
+
+
+class LazySeries(Sequence[T], Generic[T]):
+    """Read-only sequence over column arrays that materializes rows lazily.
+
+    Subclasses hold the computed columns and implement :meth:`_build` to turn
+    one row into its frozen dataclass. Rows are built on first access and
+    cached, so consumers that only look at the tail (``series[-1]``) or work on
+    the columns directly never pay for the full ``Decimal`` conversion.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._rows: List[Optional[T]] = [None] * size
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | List[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("series index out of range")
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = self._build(index)
+        return row
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, LazySeries)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows)"
+
+    def to_list(self) -> List[T]:
+        """Materialize every row."""
+        return list(self)
+
+    def _build(self, index: int) -> T:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+
+def python_datetimes(index: pd.DatetimeIndex) -> List[datetime]:
+    """Convert a ``DatetimeIndex`` to ``datetime`` objects, keeping its timezone."""
+    return list(index.to_pydatetime())
+
+
+__all__ = ["LazySeries", "python_datetimes"]
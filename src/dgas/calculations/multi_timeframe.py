@@ -13,6 +13,7 @@ Key concepts:
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -43,6 +44,9 @@ class TimeframeData:
     state_series: Sequence[StateSeries]
     pattern_events: Sequence[PatternEvent]
     drummond_zones: Sequence[DrummondZone] = field(default_factory=tuple)
+    # Content fingerprint of the bars (and derivation) this analysis was built
+    # from; None when unknown, in which case results built on it are not cached
+    source_fingerprint: Optional[str] = field(default=None, compare=False)
 
 
 @dataclass(frozen=True)
@@ -581,26 +585,45 @@ class MultiTimeframeCoordinator:
 
         precision = Decimal("0.000001")
 
+        # Entries only ever cluster with later entries of the same zone type
+        # lying within the widest tolerance of that type, so candidates are
+        # looked up in a price-sorted index instead of scanning every entry
+        prices = [Decimal(entry["price"]) for entry in level_entries]
+        tolerances = [Decimal(entry["tolerance"]) for entry in level_entries]
+        indices_by_type: Dict[object, List[int]] = {}
+        for idx, entry in enumerate(level_entries):
+            indices_by_type.setdefault(entry["zone_type"], []).append(idx)
+        price_index: Dict[object, Tuple[List[Decimal], List[int], Decimal]] = {}
+        for zone_type, indices in indices_by_type.items():
+            by_price = sorted(indices, key=prices.__getitem__)
+            price_index[zone_type] = (
+                [prices[i] for i in by_price],
+                by_price,
+                max(tolerances[i] for i in indices),
+            )
+
         for idx, entry in enumerate(level_entries):
             if idx in used_indices:
                 continue
 
             cluster = [entry]
             cluster_indices = {idx}
+            price = prices[idx]
+            entry_tolerance = tolerances[idx]
 
-            for jdx, candidate in enumerate(level_entries):
+            sorted_prices, by_price, widest_tolerance = price_index[entry["zone_type"]]
+            reach = max(entry_tolerance, widest_tolerance)
+            lo = bisect.bisect_left(sorted_prices, price - reach)
+            hi = bisect.bisect_right(sorted_prices, price + reach)
+
+            for jdx in sorted(by_price[lo:hi]):
                 if jdx <= idx or jdx in used_indices:
                     continue
-                if candidate["zone_type"] != entry["zone_type"]:
-                    continue
 
-                price_diff = abs(Decimal(candidate["price"]) - Decimal(entry["price"]))
-                tolerance = max(
-                    Decimal(entry["tolerance"]),
-                    Decimal(candidate["tolerance"]),
-                )
+                price_diff = abs(prices[jdx] - price)
+                tolerance = max(entry_tolerance, tolerances[jdx])
                 if price_diff <= tolerance:
-                    cluster.append(candidate)
+                    cluster.append(level_entries[jdx])
                     cluster_indices.add(jdx)
 
             unique_timeframes = {str(item["timeframe"]) for item in cluster}
@@ -16,6 +16,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Sequence, Tuple
 
+from ..utils.lru_cache import LRUCache
 from .drummond_lines import DrummondZone
 from .envelopes import EnvelopeSeries, EnvelopeCalculator
 from .multi_timeframe import (
@@ -101,19 +102,20 @@ class OptimizedMultiTimeframeCoordinator(MultiTimeframeCoordinator):
     - Early termination of unnecessary calculations
     """
 
-    def __init__(self, *args, enable_cache: bool = True, **kwargs):
+    def __init__(self, *args, enable_cache: bool = True, cache_size: int = 512, **kwargs):
         """
         Initialize optimized coordinator.
 
         Args:
             *args: Arguments for parent class
             enable_cache: Whether to enable result caching
+            cache_size: Maximum number of cached analyses
             **kwargs: Keyword arguments for parent class
         """
         super().__init__(*args, **kwargs)
         self.enable_cache = enable_cache
         self.profiler = get_calculation_profiler()
-        self._cache: Dict[str, any] = {}
+        self._cache = LRUCache(max_entries=cache_size)
 
     def analyze(
         self,
@@ -145,24 +147,28 @@ class OptimizedMultiTimeframeCoordinator(MultiTimeframeCoordinator):
             ltf_data = OptimizedTimeframeData(**ltf_data.__dict__)
 
         # Check cache
-        cache_key = self._make_cache_key(htf_data, trading_tf_data, ltf_data, target_timestamp)
-        if self.enable_cache and cache_key in self._cache:
-            self.profiler.record_calculation(
-                calculation_type="multi_timeframe_coordinator",
-                symbol="unknown",
-                timeframe="multi",
-                execution_time_ms=(time.time() - start_time) * 1000,
-                success=True,
-                cache_hit=True,
-            )
-            return self._cache[cache_key]
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._make_cache_key(htf_data, trading_tf_data, ltf_data, target_timestamp)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self.profiler.record_calculation(
+                    calculation_type="multi_timeframe_coordinator",
+                    symbol="unknown",
+                    timeframe="multi",
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                    success=True,
+                    cache_hit=True,
+                )
+                return cached
 
         # Use parent's analyze method (which is already optimized)
         result = super().analyze(htf_data, trading_tf_data, ltf_data, target_timestamp)
 
         # Cache result
-        if self.enable_cache:
-            self._cache[cache_key] = result
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
 
         # Record metrics
         execution_time_ms = (time.time() - start_time) * 1000
@@ -183,9 +189,21 @@ class OptimizedMultiTimeframeCoordinator(MultiTimeframeCoordinator):
         trading_tf_data: OptimizedTimeframeData,
         ltf_data: Optional[OptimizedTimeframeData],
         target_timestamp: Optional[datetime],
-    ) -> str:
-        """Create cache key for this analysis."""
-        return f"{id(htf_data)}_{id(trading_tf_data)}_{id(ltf_data)}_{target_timestamp}"
+    ) -> Optional[str]:
+        """Create cache key for this analysis from the inputs' content fingerprints.
+
+        Returns None (do not cache) when any input has no ``source_fingerprint``.
+        """
+        parts = []
+        for data in (htf_data, trading_tf_data, ltf_data):
+            if data is None:
+                parts.append("-")
+                continue
+            if data.source_fingerprint is None:
+                return None
+            parts.append(f"{data.timeframe}/{data.classification.value}/{data.source_fingerprint}")
+        target = target_timestamp.isoformat() if target_timestamp is not None else "latest"
+        return "|".join([*parts, target])
 
     def clear_cache(self) -> None:
         """Clear the analysis cache."""
@@ -282,6 +300,8 @@ class OptimizedMultiTimeframeCoordinator(MultiTimeframeCoordinator):
             # Process envelopes
             for env in recent_envelopes:
                 width = Decimal(env.width)
+                if width.is_nan():
+                    width = Decimal("0")
                 vol_measure = width if width > 0 else Decimal("0.01")
 
                 # Upper envelope (resistance)
@@ -340,6 +360,8 @@ class OptimizedMultiTimeframeCoordinator(MultiTimeframeCoordinator):
                     "volatility": vol_measure,
                 })
 
+        # Envelope warm-up rows carry NaN levels, as skipped by the parent's add_entry
+        level_entries = [entry for entry in level_entries if not entry["price"].is_nan()]
         if not level_entries:
             return []
 
@@ -6,13 +6,16 @@ from dataclasses import dataclass, replace
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+import math
 import statistics
 from typing import Callable, List, Sequence
 
-from .envelopes import EnvelopeSeries
-from .pldot import PLDotSeries
+import numpy as np
+
+from .envelopes import EnvelopeArrays, EnvelopeSeries
+from .pldot import PLDotArrays, PLDotSeries
 from .drummond_lines import DrummondZone
-from ..data.models import IntervalData
+from ..data.bars import BarArray, BarSource
 
 
 class PatternType(Enum):
@@ -88,145 +91,343 @@ class TerminationConfig:
     momentum_fade_threshold: float = 0.0
 
 
-def detect_pldot_push(intervals: Sequence[IntervalData], pldot: Sequence[PLDotSeries]) -> List[PatternEvent]:
-    close_map = {bar.timestamp: bar.close for bar in intervals}
-    ordered = sorted(pldot, key=lambda s: s.timestamp)
+@dataclass(frozen=True, eq=False)
+class PatternInputs:
+    """Bars, PLdot and envelopes aligned once for the pattern kernels.
 
-    events: List[PatternEvent] = []
-    streak: List[PLDotSeries] = []
-    direction = 0
+    Every detector used to rebuild its own timestamp lookups, re-sort the
+    PLdot and envelope lists and redo ``Decimal`` math per bar. ``build``
+    does that work once per timeframe and exposes float columns in three
+    chronological alignments: per bar, per PLdot entry and per envelope
+    entry. Missing cross-references (a PLdot without a bar at the same
+    timestamp, for instance) are ``NaN`` or ``-1``.
+    """
 
-    for series in ordered:
-        close_price = close_map.get(series.timestamp)
-        if close_price is None:
-            continue
+    bar_timestamps: List[datetime]
+    bar_high: np.ndarray
+    bar_low: np.ndarray
+    bar_volume: np.ndarray
+    bar_slope: np.ndarray
+    pldot_timestamps: List[datetime]
+    pldot_value: np.ndarray
+    pldot_slope: np.ndarray
+    pldot_close_diff: np.ndarray
+    envelope_timestamps: List[datetime]
+    envelope_upper: np.ndarray
+    envelope_lower: np.ndarray
+    envelope_width: np.ndarray
+    envelope_position: np.ndarray
+    envelope_close: np.ndarray
+    envelope_slope: np.ndarray
+    envelope_bar_index: np.ndarray
+
+    @property
+    def has_bars(self) -> bool:
+        return bool(self.bar_timestamps)
+
+    @property
+    def has_pldot(self) -> bool:
+        return bool(self.pldot_timestamps)
+
+    @classmethod
+    def build(
+        cls,
+        intervals: BarSource | None = None,
+        pldot: Sequence[PLDotSeries] | None = None,
+        envelopes: Sequence[EnvelopeSeries] | None = None,
+    ) -> "PatternInputs":
+        """Align whichever of bars, PLdot and envelopes are given.
+
+        ``pldot`` and ``envelopes`` may also be the column forms returned by
+        ``compute_arrays``, which avoids materializing their rows.
+        """
+        bar_timestamps: List[datetime] = []
+        bar_close_decimals: List[Decimal] = []
+        bar_high = bar_low = bar_close = _EMPTY
+        bar_volume = np.empty(0, dtype=np.int64)
+        if intervals:
+            if isinstance(intervals, BarArray):
+                bars = intervals.sorted()
+                bar_timestamps = bars.datetimes()
+                bar_close_decimals = bars.decimals("close")
+                bar_high, bar_low, bar_close, bar_volume = bars.high, bars.low, bars.close, bars.volume
+            else:
+                ordered_bars = sorted(intervals, key=lambda bar: bar.timestamp)
+                bar_timestamps = [bar.timestamp for bar in ordered_bars]
+                bar_close_decimals = [bar.close for bar in ordered_bars]
+                bar_high = np.array([float(bar.high) for bar in ordered_bars], dtype=np.float64)
+                bar_low = np.array([float(bar.low) for bar in ordered_bars], dtype=np.float64)
+                bar_close = np.array([float(close) for close in bar_close_decimals], dtype=np.float64)
+                bar_volume = np.array([int(bar.volume) for bar in ordered_bars], dtype=np.int64)
+        # Later duplicates win, as with the dict lookups the detectors used before
+        bar_index = {timestamp: idx for idx, timestamp in enumerate(bar_timestamps)}
+
+        pldot_timestamps: List[datetime] = []
+        pldot_decimals: List[Decimal] = []
+        pldot_value = pldot_slope = _EMPTY
+        if pldot:
+            if isinstance(pldot, PLDotArrays):
+                pldot_timestamps = pldot.datetimes()
+                pldot_value = pldot.rounded_values()
+                pldot_slope = pldot.rounded_slopes()
+            else:
+                ordered_pldot = sorted(pldot, key=lambda s: s.timestamp)
+                pldot_timestamps = [series.timestamp for series in ordered_pldot]
+                pldot_decimals = [series.value for series in ordered_pldot]
+                pldot_value = np.array([float(value) for value in pldot_decimals], dtype=np.float64)
+                pldot_slope = np.array([float(series.slope) for series in ordered_pldot], dtype=np.float64)
+        pldot_index = {timestamp: idx for idx, timestamp in enumerate(pldot_timestamps)}
+
+        # Close minus PLdot in exact Decimal arithmetic, done once for all detectors
+        pldot_close_diff = np.full(len(pldot_timestamps), np.nan)
+        for idx, timestamp in enumerate(pldot_timestamps):
+            bar_idx = bar_index.get(timestamp)
+            if bar_idx is None:
+                continue
+            value = pldot_decimals[idx] if pldot_decimals else Decimal(str(pldot_value[idx].item()))
+            pldot_close_diff[idx] = float(bar_close_decimals[bar_idx] - value)
+
+        envelope_timestamps: List[datetime] = []
+        envelope_upper = envelope_lower = envelope_width = envelope_position = _EMPTY
+        if envelopes:
+            if isinstance(envelopes, EnvelopeArrays):
+                envelope_timestamps = envelopes.datetimes()
+                envelope_upper = envelopes.rounded("upper")
+                envelope_lower = envelopes.rounded("lower")
+                envelope_width = envelopes.rounded("width")
+                envelope_position = envelopes.rounded("position")
+            else:
+                ordered_envelopes = sorted(envelopes, key=lambda e: e.timestamp)
+                envelope_timestamps = [entry.timestamp for entry in ordered_envelopes]
+                envelope_upper = np.array([float(e.upper) for e in ordered_envelopes], dtype=np.float64)
+                envelope_lower = np.array([float(e.lower) for e in ordered_envelopes], dtype=np.float64)
+                envelope_width = np.array([float(e.width) for e in ordered_envelopes], dtype=np.float64)
+                envelope_position = np.array([float(e.position) for e in ordered_envelopes], dtype=np.float64)
+
+        envelope_bar_index = np.array(
+            [bar_index.get(timestamp, -1) for timestamp in envelope_timestamps], dtype=np.int64
+        )
+        envelope_close = _take_or_nan(bar_close, envelope_bar_index)
+        envelope_slope = _take_or_nan(
+            pldot_slope,
+            np.array([pldot_index.get(timestamp, -1) for timestamp in envelope_timestamps], dtype=np.int64),
+        )
+        bar_slope = _take_or_nan(
+            pldot_slope,
+            np.array([pldot_index.get(timestamp, -1) for timestamp in bar_timestamps], dtype=np.int64),
+        )
+
+        return cls(
+            bar_timestamps=bar_timestamps,
+            bar_high=bar_high,
+            bar_low=bar_low,
+            bar_volume=bar_volume,
+            bar_slope=bar_slope,
+            pldot_timestamps=pldot_timestamps,
+            pldot_value=pldot_value,
+            pldot_slope=pldot_slope,
+            pldot_close_diff=pldot_close_diff,
+            envelope_timestamps=envelope_timestamps,
+            envelope_upper=envelope_upper,
+            envelope_lower=envelope_lower,
+            envelope_width=envelope_width,
+            envelope_position=envelope_position,
+            envelope_close=envelope_close,
+            envelope_slope=envelope_slope,
+            envelope_bar_index=envelope_bar_index,
+        )
+
+
+_EMPTY = np.empty(0, dtype=np.float64)
+
+
+def _take_or_nan(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+    """``values[index]`` with ``NaN`` wherever ``index`` is -1."""
+    result = np.full(len(index), np.nan)
+    present = index >= 0
+    result[present] = values[index[present]]
+    return result
+
+
+def _runs(key: np.ndarray, min_length: int = 1) -> List[tuple[int, int, int]]:
+    """Maximal runs of equal non-zero values as ``(start, stop, value)``."""
+    if len(key) == 0:
+        return []
+    change = np.flatnonzero(key[1:] != key[:-1]) + 1
+    starts = np.concatenate(([0], change))
+    stops = np.concatenate((change, [len(key)]))
+    values = key[starts]
+    keep = (values != 0) & (stops - starts >= min_length)
+    return list(
+        zip(starts[keep].tolist(), stops[keep].tolist(), values[keep].tolist(), strict=True)
+    )
 
-        side = _compare(close_price, series.value)
-        slope_sign = _sign(series.slope)
 
-        if side != 0 and side == slope_sign:
-            if direction == side or direction == 0:
-                streak.append(series)
-                direction = side
-            else:
-                if len(streak) >= 3:
-                    events.append(_build_event(PatternType.PLDOT_PUSH, streak, direction))
-                streak = [series]
-                direction = side
-        else:
-            if len(streak) >= 3:
-                events.append(_build_event(PatternType.PLDOT_PUSH, streak, direction))
-            streak = []
-            direction = 0
+def detect_pldot_push(intervals: BarSource, pldot: Sequence[PLDotSeries]) -> List[PatternEvent]:
+    return pldot_push_kernel(PatternInputs.build(intervals, pldot=pldot))
 
-    if len(streak) >= 3:
-        events.append(_build_event(PatternType.PLDOT_PUSH, streak, direction))
 
-    return events
+def pldot_push_kernel(inputs: PatternInputs) -> List[PatternEvent]:
+    """Runs of 3+ closes on the side of PLdot its slope points to."""
+    rows = np.flatnonzero(~np.isnan(inputs.pldot_close_diff))
+    side = np.sign(inputs.pldot_close_diff[rows])
+    slope_sign = np.sign(inputs.pldot_slope[rows])
+    key = np.where((side != 0) & (side == slope_sign), side, 0).astype(np.int8)
+
+    timestamps = inputs.pldot_timestamps
+    return [
+        PatternEvent(
+            pattern_type=PatternType.PLDOT_PUSH,
+            direction=direction,
+            start_timestamp=timestamps[rows[start]],
+            end_timestamp=timestamps[rows[stop - 1]],
+            strength=stop - start,
+        )
+        for start, stop, direction in _runs(key, min_length=3)
+    ]
 
 
 def detect_pldot_refresh(
-    intervals: Sequence[IntervalData],
+    intervals: BarSource,
     pldot: Sequence[PLDotSeries],
     tolerance: float | None = None,
     config: PLDotRefreshConfig | None = None,
 ) -> List[PatternEvent]:
-    close_map = {bar.timestamp: bar.close for bar in intervals}
-    ordered = sorted(pldot, key=lambda s: s.timestamp)
+    return pldot_refresh_kernel(PatternInputs.build(intervals, pldot=pldot), tolerance=tolerance, config=config)
+
 
+def pldot_refresh_kernel(
+    inputs: PatternInputs,
+    tolerance: float | None = None,
+    config: PLDotRefreshConfig | None = None,
+) -> List[PatternEvent]:
+    """Price stretching away from PLdot for a few bars and snapping back."""
     cfg = config or PLDotRefreshConfig()
     if tolerance is not None:
         cfg = replace(cfg, base_tolerance=tolerance)
 
     max_return_bars = max(cfg.max_return_bars, cfg.min_far_bars)
+    use_volatility = cfg.volatility_multiplier > 0 and cfg.volatility_lookback > 1
+
+    timestamps = inputs.pldot_timestamps
+    values = inputs.pldot_value.tolist()
+    diffs = inputs.pldot_close_diff.tolist()
 
-    far_sequence: List[tuple[PLDotSeries, float]] = []
+    # Rolling population std in floats; the exact statistics.pstdev is only
+    # needed when a bar sits right at the resulting tolerance
+    approx_std: List[float] = []
+    if use_volatility and len(values) >= cfg.volatility_lookback:
+        windows = np.lib.stride_tricks.sliding_window_view(inputs.pldot_value, cfg.volatility_lookback)
+        approx_std = windows.std(axis=1).tolist()
+
+    far_start = -1
+    far_count = 0
     direction = 0
     max_diff = 0.0
     events: List[PatternEvent] = []
 
-    for idx, series in enumerate(ordered):
-        close_price = close_map.get(series.timestamp)
-        if close_price is None:
+    for idx, signed_diff in enumerate(diffs):
+        if math.isnan(signed_diff):
             continue
 
-        dynamic_tolerance = cfg.base_tolerance
-        if cfg.volatility_multiplier > 0 and cfg.volatility_lookback > 1:
-            window_start = max(0, idx - cfg.volatility_lookback + 1)
-            window = [float(entry.value) for entry in ordered[window_start : idx + 1]]
-            if len(window) >= cfg.volatility_lookback:
-                volatility = statistics.pstdev(window[-cfg.volatility_lookback :])
-                dynamic_tolerance += volatility * cfg.volatility_multiplier
+        diff = abs(signed_diff)
+        side = (signed_diff > 0) - (signed_diff < 0)
 
-        diff = abs(float(close_price - series.value))
-        side = _compare(close_price, series.value)
+        dynamic_tolerance = cfg.base_tolerance
+        # The volatility term only ever widens the tolerance, so it can only
+        # matter for bars already beyond the base tolerance
+        if use_volatility and diff > dynamic_tolerance and idx + 1 >= cfg.volatility_lookback:
+            approx = dynamic_tolerance + approx_std[idx + 1 - cfg.volatility_lookback] * cfg.volatility_multiplier
+            if abs(diff - approx) > 1e-9 * max(1.0, diff):
+                dynamic_tolerance = approx
+            else:
+                window = values[idx + 1 - cfg.volatility_lookback : idx + 1]
+                dynamic_tolerance += statistics.pstdev(window) * cfg.volatility_multiplier
 
         if diff > dynamic_tolerance and side != 0:
-            if far_sequence and side != direction:
-                far_sequence = []
+            if far_count and side != direction:
+                far_count = 0
                 max_diff = 0.0
-            far_sequence.append((series, diff))
+            if far_count == 0:
+                far_start = idx
+            far_count += 1
             direction = side
             max_diff = max(max_diff, diff)
             continue
 
-        if far_sequence and direction != 0:
-            bars_away = len(far_sequence)
-            if (
-                bars_away >= cfg.min_far_bars
-                and bars_away <= max_return_bars
-                and max_diff >= cfg.min_extension
-            ):
-                event_direction = -direction
-                if cfg.confirmation is None or cfg.confirmation(series.timestamp, event_direction):
-                    streak = [entry for entry, _ in far_sequence] + [series]
-                    events.append(_build_event(PatternType.PLDOT_REFRESH, streak, event_direction))
-            far_sequence = []
-            direction = 0
-            max_diff = 0.0
-        else:
-            far_sequence = []
-            direction = 0
-            max_diff = 0.0
+        if (
+            far_count
+            and direction != 0
+            and cfg.min_far_bars <= far_count <= max_return_bars
+            and max_diff >= cfg.min_extension
+        ):
+            event_direction = -direction
+            if cfg.confirmation is None or cfg.confirmation(timestamps[idx], event_direction):
+                events.append(
+                    PatternEvent(
+                        pattern_type=PatternType.PLDOT_REFRESH,
+                        direction=event_direction,
+                        start_timestamp=timestamps[far_start],
+                        end_timestamp=timestamps[idx],
+                        strength=far_count + 1,
+                    )
+                )
+        far_count = 0
+        direction = 0
+        max_diff = 0.0
 
     return events
 
 
 def detect_exhaust(
-    intervals: Sequence[IntervalData],
+    intervals: BarSource,
     pldot: Sequence[PLDotSeries],
     envelopes: Sequence[EnvelopeSeries],
     extension_threshold: float = 2.0,
     config: ExhaustConfig | None = None,
 ) -> List[PatternEvent]:
+    return exhaust_kernel(
+        PatternInputs.build(intervals, pldot=pldot, envelopes=envelopes),
+        extension_threshold=extension_threshold,
+        config=config,
+    )
+
+
+def exhaust_kernel(
+    inputs: PatternInputs,
+    extension_threshold: float = 2.0,
+    config: ExhaustConfig | None = None,
+) -> List[PatternEvent]:
+    """Closes far outside the envelope that snap back inside within a few bars."""
     cfg = config or ExhaustConfig()
     if extension_threshold != cfg.extension_threshold:
         cfg = replace(cfg, extension_threshold=extension_threshold)
 
-    close_map = {bar.timestamp: bar.close for bar in intervals}
-    slope_map = {p.timestamp: p.slope for p in pldot}
-    ordered_envelopes = sorted(envelopes, key=lambda e: e.timestamp)
+    timestamps = inputs.envelope_timestamps
+    closes = inputs.envelope_close.tolist()
+    uppers = inputs.envelope_upper.tolist()
+    lowers = inputs.envelope_lower.tolist()
+    widths = inputs.envelope_width.tolist()
+    slopes = inputs.envelope_slope.tolist()
 
     events: List[PatternEvent] = []
-    extension_bars: List[tuple[datetime, Decimal, Decimal | None, EnvelopeSeries]] = []
+    extension_rows: List[int] = []
     direction = 0
     recovery_counter = 0
 
-    for envelope in ordered_envelopes:
-        close_price = close_map.get(envelope.timestamp)
-        if close_price is None:
+    for row, close_f in enumerate(closes):
+        if math.isnan(close_f):
             continue
 
-        width = float(envelope.width)
+        width = widths[row]
         if width <= 0:
-            extension_bars = []
+            extension_rows = []
             direction = 0
             recovery_counter = 0
             continue
 
-        upper = float(envelope.upper)
-        lower = float(envelope.lower)
-        close_f = float(close_price)
+        upper = uppers[row]
+        lower = lowers[row]
 
         side = 0
         extension_ratio = 0.0
@@ -239,8 +440,8 @@ def detect_exhaust(
 
         if side != 0 and extension_ratio >= cfg.extension_threshold:
             if direction not in (0, side):
-                extension_bars = []
-            extension_bars.append((envelope.timestamp, close_price, slope_map.get(envelope.timestamp), envelope))
+                extension_rows = []
+            extension_rows.append(row)
             direction = side
             recovery_counter = 0
             continue
@@ -250,58 +451,52 @@ def detect_exhaust(
             is_inside = (direction == 1 and close_f <= upper) or (direction == -1 and close_f >= lower)
             if (
                 is_inside
-                and len(extension_bars) >= cfg.min_extension_bars
+                and len(extension_rows) >= cfg.min_extension_bars
                 and recovery_counter <= cfg.max_recovery_bars
-                and _passes_exhaust_filters(
-                    extension_bars,
-                    close_price,
-                    envelope,
-                    slope_map.get(envelope.timestamp),
-                    direction,
-                    cfg,
-                )
+                and _passes_exhaust_filters(extension_rows, row, closes, widths, slopes, direction, cfg)
             ):
                 events.append(
                     PatternEvent(
                         pattern_type=PatternType.EXHAUST,
                         direction=-direction,
-                        start_timestamp=extension_bars[0][0],
-                        end_timestamp=envelope.timestamp,
-                        strength=len(extension_bars),
+                        start_timestamp=timestamps[extension_rows[0]],
+                        end_timestamp=timestamps[row],
+                        strength=len(extension_rows),
                     )
                 )
-                extension_bars = []
+                extension_rows = []
                 direction = 0
                 recovery_counter = 0
             elif recovery_counter > cfg.max_recovery_bars:
-                extension_bars = []
+                extension_rows = []
                 direction = 0
                 recovery_counter = 0
         else:
-            extension_bars = []
+            extension_rows = []
             recovery_counter = 0
 
     return events
 
 
 def _passes_exhaust_filters(
-    extension_bars: Sequence[tuple[datetime, Decimal, Decimal | None, EnvelopeSeries]],
-    reentry_close: Decimal,
-    reentry_envelope: EnvelopeSeries,
-    reentry_slope: Decimal | None,
+    extension_rows: Sequence[int],
+    reentry_row: int,
+    closes: Sequence[float],
+    widths: Sequence[float],
+    slopes: Sequence[float],
     direction: int,
     config: ExhaustConfig,
 ) -> bool:
-    if not extension_bars:
+    if not extension_rows:
         return False
 
-    width = float(reentry_envelope.width)
+    width = widths[reentry_row]
     if width <= 0:
         return False
 
-    closes = [float(close) for _, close, _, _ in extension_bars]
-    extreme = max(closes) if direction == 1 else min(closes)
-    reentry_close_f = float(reentry_close)
+    extension_closes = [closes[row] for row in extension_rows]
+    extreme = max(extension_closes) if direction == 1 else min(extension_closes)
+    reentry_close_f = closes[reentry_row]
     if direction == 1:
         reversion = (extreme - reentry_close_f) / width
     else:
@@ -311,11 +506,12 @@ def _passes_exhaust_filters(
 
     slope_limit = config.slope_reversal_limit
     if slope_limit is not None:
-        last_slope = extension_bars[-1][2]
-        if last_slope is not None and float(last_slope) * direction <= slope_limit:
+        last_slope = slopes[extension_rows[-1]]
+        if not math.isnan(last_slope) and last_slope * direction <= slope_limit:
             # Extension should show momentum in its direction
             return False
-        if reentry_slope is not None and float(reentry_slope) * direction > slope_limit:
+        reentry_slope = slopes[reentry_row]
+        if not math.isnan(reentry_slope) and reentry_slope * direction > slope_limit:
             # Reentry slope must fade or reverse
             return False
 
@@ -326,75 +522,54 @@ def detect_c_wave(
     envelopes: Sequence[EnvelopeSeries],
     config: CWaveConfig | None = None,
     pldot: Sequence[PLDotSeries] | None = None,
-    intervals: Sequence[IntervalData] | None = None,
+    intervals: BarSource | None = None,
 ) -> List[PatternEvent]:
-    cfg = config or CWaveConfig()
-
-    slope_map: dict[datetime, float] = {}
-    if pldot:
-        slope_map = {series.timestamp: float(series.slope) for series in pldot}
-
-    ordered_intervals: List[IntervalData] | None = None
-    volume_index: dict[datetime, int] | None = None
-    if intervals:
-        ordered_intervals = sorted(intervals, key=lambda bar: bar.timestamp)
-        volume_index = {bar.timestamp: idx for idx, bar in enumerate(ordered_intervals)}
-
-    ordered = sorted(envelopes, key=lambda e: e.timestamp)
-    events: List[PatternEvent] = []
-    streak: List[EnvelopeSeries] = []
-    direction = 0
-
-    for entry in ordered:
-        position = float(entry.position)
-        if position >= cfg.upper_position_threshold:
-            curr_dir = 1
-        elif position <= cfg.lower_position_threshold:
-            curr_dir = -1
-        else:
-            curr_dir = 0
+    return c_wave_kernel(PatternInputs.build(intervals, pldot=pldot, envelopes=envelopes), config=config)
 
-        if curr_dir != 0:
-            if direction in (0, curr_dir):
-                streak.append(entry)
-                direction = curr_dir
-            else:
-                if _qualifies_c_wave(streak, direction, cfg, slope_map, ordered_intervals, volume_index):
-                    events.append(_build_envelope_event(PatternType.C_WAVE, streak, direction))
-                streak = [entry]
-                direction = curr_dir
-        else:
-            if _qualifies_c_wave(streak, direction, cfg, slope_map, ordered_intervals, volume_index):
-                events.append(_build_envelope_event(PatternType.C_WAVE, streak, direction))
-            streak = []
-            direction = 0
 
-    if _qualifies_c_wave(streak, direction, cfg, slope_map, ordered_intervals, volume_index):
-        events.append(_build_envelope_event(PatternType.C_WAVE, streak, direction))
+def c_wave_kernel(inputs: PatternInputs, config: CWaveConfig | None = None) -> List[PatternEvent]:
+    """Runs of envelope positions pinned to one band edge."""
+    cfg = config or CWaveConfig()
 
-    return events
+    position = inputs.envelope_position
+    key = np.where(
+        position >= cfg.upper_position_threshold,
+        1,
+        np.where(position <= cfg.lower_position_threshold, -1, 0),
+    ).astype(np.int8)
+
+    timestamps = inputs.envelope_timestamps
+    return [
+        PatternEvent(
+            pattern_type=PatternType.C_WAVE,
+            direction=direction,
+            start_timestamp=timestamps[start],
+            end_timestamp=timestamps[stop - 1],
+            strength=stop - start,
+        )
+        for start, stop, direction in _runs(key)
+        if _qualifies_c_wave(inputs, start, stop, direction, cfg)
+    ]
 
 
 def _qualifies_c_wave(
-    streak: Sequence[EnvelopeSeries],
+    inputs: PatternInputs,
+    start: int,
+    stop: int,
     direction: int,
     config: CWaveConfig,
-    slope_map: dict[datetime, float],
-    ordered_intervals: Sequence[IntervalData] | None,
-    volume_index: dict[datetime, int] | None,
 ) -> bool:
-    if not streak or direction == 0:
-        return False
-    if len(streak) < config.min_bars:
+    if stop - start < config.min_bars:
         return False
 
     slopes_required = config.min_slope > 0 or config.min_slope_acceleration > 0
-    if slopes_required and not slope_map:
+    if slopes_required and not inputs.has_pldot:
         return False
 
-    if slope_map:
-        slope_values = [slope_map.get(entry.timestamp) for entry in streak if entry.timestamp in slope_map]
-        if slopes_required and len(slope_values) < len(streak):
+    if inputs.has_pldot:
+        streak_slopes = inputs.envelope_slope[start:stop]
+        slope_values = streak_slopes[~np.isnan(streak_slopes)].tolist()
+        if slopes_required and len(slope_values) < stop - start:
             return False
         if slope_values:
             avg_slope = sum(slope_values) / len(slope_values)
@@ -403,38 +578,33 @@ def _qualifies_c_wave(
             acceleration = (slope_values[-1] - slope_values[0]) * direction
             if acceleration < config.min_slope_acceleration:
                 return False
-    elif slopes_required:
-        return False
 
-    widths = [float(entry.width) for entry in streak]
-    if not widths or widths[0] <= 0:
+    first_width = inputs.envelope_width[start].item()
+    if first_width <= 0:
         if config.min_envelope_expansion > 0:
             return False
         expansion_ratio = 0.0
     else:
-        expansion_ratio = (widths[-1] - widths[0]) / widths[0]
+        expansion_ratio = (inputs.envelope_width[stop - 1].item() - first_width) / first_width
     if expansion_ratio < config.min_envelope_expansion:
         return False
 
     if config.require_volume_confirmation:
-        if ordered_intervals is None or volume_index is None:
+        if not inputs.has_bars:
             return False
-        first_index = volume_index.get(streak[0].timestamp)
-        if first_index is None:
+        streak_indices = inputs.envelope_bar_index[start:stop]
+        first_index = int(streak_indices[0])
+        if first_index < 0:
             return False
         lookback_start = max(0, first_index - config.volume_lookback)
-        pre_slice = ordered_intervals[lookback_start:first_index]
+        pre_slice = inputs.bar_volume[lookback_start:first_index].tolist()
         if not pre_slice:
             return False
-        pre_avg = sum(int(bar.volume) for bar in pre_slice) / len(pre_slice)
+        pre_avg = sum(pre_slice) / len(pre_slice)
 
-        streak_indices = [volume_index.get(entry.timestamp) for entry in streak]
-        if any(idx is None for idx in streak_indices):
-            return False
-        assert streak_indices  # for type checker
-        streak_volumes = [int(ordered_intervals[idx].volume) for idx in streak_indices if idx is not None]
-        if not streak_volumes:
+        if (streak_indices < 0).any():
             return False
+        streak_volumes = inputs.bar_volume[streak_indices].tolist()
         streak_avg = sum(streak_volumes) / len(streak_volumes)
         if pre_avg > 0 and streak_avg < pre_avg * config.volume_multiplier:
             return False
@@ -443,41 +613,34 @@ def _qualifies_c_wave(
 
 
 def detect_congestion_oscillation(envelopes: Sequence[EnvelopeSeries]) -> List[PatternEvent]:
-    ordered = sorted(envelopes, key=lambda e: e.timestamp)
-    events: List[PatternEvent] = []
-    streak: List[EnvelopeSeries] = []
-    last_position = None
-
-    for entry in ordered:
-        position = float(entry.position)
-        if 0.2 <= position <= 0.8:
-            prev_position = last_position
-            if streak:
-                prev_entry_position = float(streak[-1].position)
-            else:
-                prev_entry_position = 0.5
+    return congestion_oscillation_kernel(PatternInputs.build(envelopes=envelopes))
 
-            if prev_position is None or (position - prev_position) * (prev_entry_position - 0.5) <= 0:
-                streak.append(entry)
-            else:
-                if len(streak) >= 4:
-                    events.append(_build_envelope_event(PatternType.CONGESTION_OSCILLATION, streak, 0))
-                streak = [entry]
-        else:
-            if len(streak) >= 4:
-                events.append(_build_envelope_event(PatternType.CONGESTION_OSCILLATION, streak, 0))
-            streak = []
 
-        last_position = position
+def congestion_oscillation_kernel(inputs: PatternInputs) -> List[PatternEvent]:
+    """Runs of 4+ in-band envelope positions that keep swinging back toward the centre."""
+    position = inputs.envelope_position
+    in_band = (position >= 0.2) & (position <= 0.8)
 
-    if len(streak) >= 4:
-        events.append(_build_envelope_event(PatternType.CONGESTION_OSCILLATION, streak, 0))
+    # A streak restarts at the first in-band bar, or when the move continues away from the centre
+    starts = in_band.copy()
+    starts[1:] &= ~in_band[:-1] | ((position[1:] - position[:-1]) * (position[:-1] - 0.5) > 0)
+    key = np.where(in_band, np.cumsum(starts), 0)
 
-    return events
+    timestamps = inputs.envelope_timestamps
+    return [
+        PatternEvent(
+            pattern_type=PatternType.CONGESTION_OSCILLATION,
+            direction=0,
+            start_timestamp=timestamps[start],
+            end_timestamp=timestamps[stop - 1],
+            strength=stop - start,
+        )
+        for start, stop, _ in _runs(key, min_length=4)
+    ]
 
 
 def detect_termination_events(
-    intervals: Sequence[IntervalData],
+    intervals: BarSource,
     zones: Sequence[DrummondZone],
     pldot: Sequence[PLDotSeries] | None = None,
     config: TerminationConfig | None = None,
@@ -498,152 +661,161 @@ def detect_termination_events(
     Returns:
         List of PatternEvent for TERMINATION_APPROACH and TERMINATION_TOUCH patterns
     """
-    cfg = config or TerminationConfig()
-    
     if not intervals or not zones:
         return []
-    
-    # Filter zones by minimum strength
-    significant_zones = [z for z in zones if z.strength >= cfg.min_zone_strength]
-    if not significant_zones:
-        return []
-    
-    # Build slope map for momentum fade detection
-    slope_map: dict[datetime, Decimal] = {}
-    if pldot:
-        slope_map = {series.timestamp: series.slope for series in pldot}
-    
-    ordered_bars = sorted(intervals, key=lambda bar: bar.timestamp)
-    events: List[PatternEvent] = []
-    
-    # Track active approaches to avoid duplicate events
-    active_approaches: dict[tuple[str, float], datetime] = {}  # (zone_type, center_price) -> start_timestamp
-    
-    for i, bar in enumerate(ordered_bars):
-        close_f = float(bar.close)
-        high_f = float(bar.high)
-        low_f = float(bar.low)
-        
-        for zone in significant_zones:
-            zone_center = float(zone.center_price)
-            zone_upper = float(zone.upper_price)
-            zone_lower = float(zone.lower_price)
-            zone_width = zone_upper - zone_lower if zone_upper > zone_lower else 0.01
-            
-            # Calculate approach threshold based on zone center
-            approach_dist = abs(zone_center) * (cfg.approach_threshold_pct / 100.0)
-            touch_dist = abs(zone_center) * (cfg.touch_threshold_pct / 100.0)
-            
-            # Ensure minimum thresholds for low-priced instruments
-            approach_dist = max(approach_dist, zone_width * 2)
-            touch_dist = max(touch_dist, zone_width * 0.5)
-            
-            zone_key = (zone.line_type, zone_center)
-            
-            # Check if price is approaching or touching the zone
-            # For resistance zones: price approaching from below
-            # For support zones: price approaching from above
-            
-            if zone.line_type == "resistance":
-                # Price approaching resistance from below
-                distance_to_zone = zone_lower - high_f
-                is_approaching = 0 < distance_to_zone <= approach_dist
-                is_touching = high_f >= zone_lower - touch_dist and high_f <= zone_upper + touch_dist
-                direction = 1  # Bullish approach to resistance (potential reversal down)
-                
-            else:  # support
-                # Price approaching support from above
-                distance_to_zone = low_f - zone_upper
-                is_approaching = 0 < distance_to_zone <= approach_dist
-                is_touching = low_f <= zone_upper + touch_dist and low_f >= zone_lower - touch_dist
-                direction = -1  # Bearish approach to support (potential reversal up)
-            
-            # Check momentum fade if required
-            momentum_ok = True
-            if cfg.require_momentum_fade and slope_map and i > 0:
-                current_slope = slope_map.get(bar.timestamp)
-                prev_slope = slope_map.get(ordered_bars[i-1].timestamp)
-                
-                if current_slope is not None and prev_slope is not None:
-                    slope_change = float(current_slope) - float(prev_slope)
-                    # For resistance approach (bullish), momentum should be fading (slope decreasing)
-                    # For support approach (bearish), momentum should be fading (slope increasing/less negative)
-                    if direction == 1:  # Approaching resistance
-                        momentum_ok = slope_change <= cfg.momentum_fade_threshold
-                    else:  # Approaching support
-                        momentum_ok = slope_change >= -cfg.momentum_fade_threshold
-            
-            if not momentum_ok:
-                continue
-            
-            # Generate events
-            if is_touching:
-                # TERMINATION_TOUCH - price has reached the zone
-                # Clear any active approach for this zone
-                if zone_key in active_approaches:
-                    del active_approaches[zone_key]
-                
-                events.append(PatternEvent(
-                    pattern_type=PatternType.TERMINATION_TOUCH,
-                    direction=-direction,  # Reversal direction (opposite to approach)
-                    start_timestamp=bar.timestamp,
-                    end_timestamp=bar.timestamp,
-                    strength=zone.strength,
-                ))
-                
-            elif is_approaching:
-                # TERMINATION_APPROACH - price is getting close
-                if zone_key not in active_approaches:
-                    active_approaches[zone_key] = bar.timestamp
-                    events.append(PatternEvent(
-                        pattern_type=PatternType.TERMINATION_APPROACH,
-                        direction=direction,  # Direction of approach
-                        start_timestamp=bar.timestamp,
-                        end_timestamp=bar.timestamp,
-                        strength=zone.strength,
-                    ))
-            else:
-                # Price moved away - clear active approach
-                if zone_key in active_approaches:
-                    del active_approaches[zone_key]
-    
-    return events
+    return termination_kernel(PatternInputs.build(intervals, pldot=pldot), zones, config=config)
 
 
-def _build_event(pattern_type: PatternType, streak: List[PLDotSeries], direction: int) -> PatternEvent:
-    return PatternEvent(
-        pattern_type=pattern_type,
-        direction=direction,
-        start_timestamp=streak[0].timestamp,
-        end_timestamp=streak[-1].timestamp,
-        strength=len(streak),
-    )
+def termination_kernel(
+    inputs: PatternInputs,
+    zones: Sequence[DrummondZone],
+    config: TerminationConfig | None = None,
+) -> List[PatternEvent]:
+    """Kernel behind :func:`detect_termination_events` over pre-aligned bars."""
+    cfg = config or TerminationConfig()
 
+    if not inputs.has_bars or not zones:
+        return []
+
+    # Filter zones by minimum strength and precompute their thresholds once
+    zone_params = []
+    for zone in zones:
+        if zone.strength < cfg.min_zone_strength:
+            continue
+        zone_center = float(zone.center_price)
+        zone_upper = float(zone.upper_price)
+        zone_lower = float(zone.lower_price)
+        zone_width = zone_upper - zone_lower if zone_upper > zone_lower else 0.01
+
+        # Ensure minimum thresholds for low-priced instruments
+        approach_dist = max(abs(zone_center) * (cfg.approach_threshold_pct / 100.0), zone_width * 2)
+        touch_dist = max(abs(zone_center) * (cfg.touch_threshold_pct / 100.0), zone_width * 0.5)
+
+        # Resistance is approached from below (bullish approach, reversal down),
+        # support from above (bearish approach, reversal up)
+        direction = 1 if zone.line_type == "resistance" else -1
+        zone_params.append(
+            (zone, (zone.line_type, zone_center), direction, zone_upper, zone_lower, approach_dist, touch_dist)
+        )
+    if not zone_params:
+        return []
 
-def _build_envelope_event(pattern_type: PatternType, streak: List[EnvelopeSeries], direction: int) -> PatternEvent:
-    return PatternEvent(
-        pattern_type=pattern_type,
-        direction=direction,
-        start_timestamp=streak[0].timestamp,
-        end_timestamp=streak[-1].timestamp,
-        strength=len(streak),
+    # Classify every (bar, zone) pair at once instead of bar by bar
+    _, zone_keys, directions, uppers, lowers, approach_dists, touch_dists = (
+        list(column) for column in zip(*zone_params, strict=True)
     )
+    resistance = np.array(directions) == 1
+    upper_arr = np.array(uppers)
+    lower_arr = np.array(lowers)
+    touch_arr = np.array(touch_dists)
+    highs = inputs.bar_high[:, None]
+    lows = inputs.bar_low[:, None]
+
+    with np.errstate(invalid="ignore"):
+        distance = np.where(resistance, lower_arr - highs, lows - upper_arr)
+        touching = np.where(
+            resistance,
+            (highs >= lower_arr - touch_arr) & (highs <= upper_arr + touch_arr),
+            (lows <= upper_arr + touch_arr) & (lows >= lower_arr - touch_arr),
+        )
+        approaching = (distance > 0) & (distance <= np.array(approach_dists))
+
+        skipped = np.zeros_like(touching)
+        if cfg.require_momentum_fade and inputs.has_pldot and len(inputs.bar_slope) > 1:
+            # Momentum should fade: slope decreasing into resistance, increasing into support
+            slopes = inputs.bar_slope
+            slope_change = np.full(len(slopes), np.nan)
+            slope_change[1:] = slopes[1:] - slopes[:-1]
+            valid = ~np.isnan(slope_change)[:, None]
+            momentum_ok = np.where(
+                resistance,
+                slope_change[:, None] <= cfg.momentum_fade_threshold,
+                slope_change[:, None] >= -cfg.momentum_fade_threshold,
+            )
+            skipped = valid & ~momentum_ok
+
+    # Per bar and zone: 3 touch, 2 approach, 1 away, 0 skipped (momentum)
+    status = np.where(touching, 3, np.where(approaching, 2, 1)).astype(np.int8)
+    status[skipped] = 0
+
+    # Approaches are tracked per (zone type, center) key. Walking each key's
+    # (bar, zone) pairs in order, a touch always fires and an approach fires
+    # unless the previous non-skipped pair of that key was already approaching.
+    key_ids: dict[tuple[str, float], int] = {}
+    zone_key_ids = [key_ids.setdefault(key, len(key_ids)) for key in zone_keys]
+    zones_by_key: list[list[int]] = [[] for _ in key_ids]
+    for zone_index, key_id in enumerate(zone_key_ids):
+        zones_by_key[key_id].append(zone_index)
+
+    event_rows = []
+    event_zones = []
+    for key_zones in zones_by_key:
+        sequence = status[:, key_zones].ravel()
+        positions = np.flatnonzero(sequence)
+        if not len(positions):
+            continue
+        codes = sequence[positions]
+        previous = np.empty_like(codes)
+        previous[0] = 1
+        previous[1:] = codes[:-1]
+        fired = positions[(codes == 3) | ((codes == 2) & (previous != 2))]
+        event_rows.append(fired // len(key_zones))
+        event_zones.append(np.asarray(key_zones)[fired % len(key_zones)])
+
+    if not event_rows:
+        return []
+    rows = np.concatenate(event_rows)
+    columns = np.concatenate(event_zones)
+    order = np.lexsort((columns, rows))
+    rows = rows[order]
+    columns = columns[order]
 
+    timestamps = inputs.bar_timestamps
+    events: List[PatternEvent] = []
+    # Zones of equal strength touched on the same bar yield equal (frozen)
+    # events, so each distinct event is only built once
+    built: dict[tuple[int, int, int, int], PatternEvent] = {}
+    for i, z, code in zip(
+        rows.tolist(), columns.tolist(), status[rows, columns].tolist(), strict=True
+    ):
+        zone = zone_params[z][0]
+        # Touches point in the reversal direction (opposite to the approach)
+        direction = -directions[z] if code == 3 else directions[z]
+        event_key = (i, code, direction, zone.strength)
+        event = built.get(event_key)
+        if event is None:
+            event = PatternEvent(
+                pattern_type=PatternType.TERMINATION_TOUCH if code == 3 else PatternType.TERMINATION_APPROACH,
+                direction=direction,
+                start_timestamp=timestamps[i],
+                end_timestamp=timestamps[i],
+                strength=zone.strength,
+            )
+            built[event_key] = event
+        events.append(event)
 
-def _compare(a: Decimal, b: Decimal) -> int:
-    if a > b:
-        return 1
-    if a < b:
-        return -1
-    return 0
+    return events
 
 
-def _sign(value: Decimal) -> int:
-    if value > 0:
-        return 1
-    if value < 0:
-        return -1
-    return 0
+def detect_patterns(
+    inputs: PatternInputs,
+    zones: Sequence[DrummondZone] | None = None,
+) -> List[PatternEvent]:
+    """Run every detector with its default settings over one aligned bundle.
+
+    Events are returned in the order :func:`build_timeframe_data` has always
+    produced them: push, refresh, exhaust, C-wave, congestion oscillation and,
+    when ``zones`` are given, termination.
+    """
+    patterns: List[PatternEvent] = []
+    patterns.extend(pldot_push_kernel(inputs))
+    patterns.extend(pldot_refresh_kernel(inputs))
+    patterns.extend(exhaust_kernel(inputs))
+    patterns.extend(c_wave_kernel(inputs))
+    patterns.extend(congestion_oscillation_kernel(inputs))
+    if zones:
+        patterns.extend(termination_kernel(inputs, zones))
+    return patterns
 
 
 __all__ = [
@@ -659,4 +831,12 @@ __all__ = [
     "detect_c_wave",
     "detect_congestion_oscillation",
     "detect_termination_events",
+    "PatternInputs",
+    "detect_patterns",
+    "pldot_push_kernel",
+    "pldot_refresh_kernel",
+    "exhaust_kernel",
+    "c_wave_kernel",
+    "congestion_oscillation_kernel",
+    "termination_kernel",
 ]
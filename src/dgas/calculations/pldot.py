@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Iterable, List, Sequence
 
+import numpy as np
 import pandas as pd
 
-from ..data.models import IntervalData
+from ..data.bars import BarSource, ohlc_frame
+from .lazy import LazySeries, python_datetimes
 
 
 @dataclass(frozen=True)
@@ -30,53 +33,105 @@ class PLDotCalculator:
             raise ValueError("PLdot displacement must be >= 1")
         self.displacement = displacement
 
-    def from_intervals(self, intervals: Sequence[IntervalData]) -> List[PLDotSeries]:
+    def from_intervals(self, intervals: BarSource) -> List[PLDotSeries]:
+        return self.compute_arrays(intervals).to_list()
+
+    def compute_arrays(self, intervals: BarSource) -> PLDotArrays:
+        """Compute the PLdot columns without building per-row dataclasses.
+
+        The returned :class:`PLDotArrays` is a sequence of :class:`PLDotSeries`
+        whose rows are only materialized when accessed.
+        """
         if len(intervals) < 3:
             raise ValueError("At least 3 intervals are required to compute PLdot")
 
-        df = pd.DataFrame(
-            {
-                "timestamp": [row.timestamp for row in intervals],
-                "high": [float(row.high) for row in intervals],
-                "low": [float(row.low) for row in intervals],
-                "close": [float(row.close) for row in intervals],
-            }
+        df = ohlc_frame(intervals)
+
+        avg = ((df["high"] + df["low"] + df["close"]) / 3.0).to_numpy()
+        # Sum each three-bar window explicitly instead of using pandas' streaming
+        # rolling mean, so every value depends only on its own window and the
+        # incremental builder can reproduce it exactly.
+        rolling = np.full(len(avg), np.nan)
+        rolling[2:] = (avg[:-2] + avg[1:-1] + avg[2:]) / 3.0
+        slopes = np.full(len(avg), np.nan)
+        slopes[1:] = rolling[1:] - rolling[:-1]
+
+        # A PLdot is only emitted once the bar it is projected onto exists
+        emitted = np.flatnonzero(~np.isnan(rolling[: max(len(avg) - self.displacement, 0)]))
+        return PLDotArrays(
+            timestamp=df.index[emitted],
+            projected_timestamp=df.index[emitted + self.displacement],
+            value=rolling[emitted],
+            slope=slopes[emitted],
+            displacement=self.displacement,
         )
 
-        df.sort_values("timestamp", inplace=True)
-        df.set_index("timestamp", inplace=True)
-
-        avg = (df["high"] + df["low"] + df["close"]) / 3.0
-        rolling = avg.rolling(window=3, min_periods=3).mean()
-
-        results: List[PLDotSeries] = []
-        timestamps = df.index.to_series().reset_index(drop=True)
-        pl_values = rolling.reset_index(drop=True)
-        slopes = pl_values.diff()
-
-        for idx, value in pl_values.items():
-            if pd.isna(value):
-                continue
-            target_idx = idx + self.displacement
-            if target_idx >= len(timestamps):
-                break
-            projected_timestamp = timestamps.iloc[target_idx].to_pydatetime()
-            current_timestamp = timestamps.iloc[idx].to_pydatetime()
-            slope_value = slopes.iloc[idx]
-            slope_decimal = Decimal(str(round(slope_value, 6))) if pd.notna(slope_value) else Decimal("0")
-            projected_value = Decimal(str(round(value, 6)))
-            results.append(
-                PLDotSeries(
-                    timestamp=current_timestamp,
-                    value=Decimal(str(round(value, 6))),
-                    projected_timestamp=projected_timestamp,
-                    projected_value=projected_value,
-                    slope=slope_decimal,
-                    displacement=self.displacement,
-                )
-            )
 
-        return results
+class PLDotArrays(LazySeries[PLDotSeries]):
+    """Column form of a PLdot series.
+
+    Attributes:
+        timestamp: Bar timestamp of each PLdot value.
+        projected_timestamp: Timestamp of the bar each value is projected onto.
+        value: Unrounded PLdot values.
+        slope: Change from the previous value (NaN for the first one).
+        displacement: Projection distance in bars.
+    """
+
+    def __init__(
+        self,
+        timestamp: pd.DatetimeIndex,
+        projected_timestamp: pd.DatetimeIndex,
+        value: np.ndarray,
+        slope: np.ndarray,
+        displacement: int,
+    ) -> None:
+        super().__init__(len(value))
+        self.timestamp = timestamp
+        self.projected_timestamp = projected_timestamp
+        self.value = value
+        self.slope = slope
+        self.displacement = displacement
+        self._datetimes: List[datetime] | None = None
+        self._projected_datetimes: List[datetime] | None = None
+        self._rounded: np.ndarray | None = None
+        self._rounded_slopes: np.ndarray | None = None
+
+    def datetimes(self) -> List[datetime]:
+        """PLdot timestamps as ``datetime`` objects."""
+        if self._datetimes is None:
+            self._datetimes = python_datetimes(self.timestamp)
+        return self._datetimes
+
+    def rounded_values(self) -> np.ndarray:
+        """Values rounded to 6 places, i.e. ``float(PLDotSeries.value)`` for each row."""
+        if self._rounded is None:
+            self._rounded = np.array([round(value, 6) for value in self.value.tolist()], dtype=np.float64)
+        return self._rounded
+
+    def rounded_slopes(self) -> np.ndarray:
+        """Slopes as stored in ``PLDotSeries.slope`` (rounded, the leading NaN as 0)."""
+        if self._rounded_slopes is None:
+            self._rounded_slopes = np.array(
+                [0.0 if math.isnan(slope) else round(slope, 6) for slope in self.slope.tolist()],
+                dtype=np.float64,
+            )
+        return self._rounded_slopes
+
+    def _build(self, index: int) -> PLDotSeries:
+        if self._projected_datetimes is None:
+            self._projected_datetimes = python_datetimes(self.projected_timestamp)
+
+        value = Decimal(str(round(self.value[index].item(), 6)))
+        slope_value = self.slope[index].item()
+        return PLDotSeries(
+            timestamp=self.datetimes()[index],
+            value=value,
+            projected_timestamp=self._projected_datetimes[index],
+            projected_value=value,
+            slope=Decimal(str(round(slope_value, 6))) if not math.isnan(slope_value) else Decimal("0"),
+            displacement=self.displacement,
+        )
 
 
-__all__ = ["PLDotCalculator", "PLDotSeries"]
+__all__ = ["PLDotArrays", "PLDotCalculator", "PLDotSeries"]
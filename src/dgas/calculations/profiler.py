@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
 
 from ..db.query_cache import get_cache_manager
+from .cache import get_calculation_cache
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +125,23 @@ class CalculationProfiler:
             "avg_time_ms": avg_time,
             "cache_hit_rate": cache_hit_rate,
             "by_type": by_type,
+            "caches": self.get_cache_stats(),
+        }
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hit, miss, eviction and memory statistics of the shared caches.
+
+        Returns:
+            Dictionary mapping cache name ('calculations', 'calculations:disk'
+            when the disk tier is enabled, and each query cache) to its statistics
+        """
+        calculation_stats = get_calculation_cache().get_stats()
+        disk_stats = calculation_stats.pop("disk", None)
+        return {
+            "calculations": calculation_stats,
+            **({"calculations:disk": disk_stats} if disk_stats is not None else {}),
+            **{f"query:{name}": stats for name, stats in get_cache_manager().get_all_stats().items()},
         }
 
     def clear(self) -> None:
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Iterable, List, Sequence
+from typing import List, Sequence, Tuple
 
-from .pldot import PLDotSeries
-from ..data.models import IntervalData
+import numpy as np
+
+from .lazy import LazySeries
+from .pldot import PLDotArrays, PLDotSeries
+from ..data.bars import BarSource, close_map as build_close_map
 
 
 class MarketState(Enum):
@@ -46,6 +49,19 @@ class StateSeries:
     bars_in_congestion: int = 0
 
 
+@dataclass
+class StateTracker:
+    """Mutable state carried between bars by :meth:`MarketStateClassifier.advance`."""
+    prev_state: MarketState | None = None
+    bars_in_state: int = 0
+    last_trend_direction: TrendDirection | None = None
+    # Trend at congestion entrance - preserved through entire congestion phase
+    trend_at_congestion_entrance: TrendDirection | None = None
+    bars_in_congestion: int = 0
+    # Position tracking for 3-bar rule (last 3 positions relative to PLdot)
+    recent_positions: List[int] = field(default_factory=list)
+
+
 class MarketStateClassifier:
     """
     Classify market states using the Drummond 3-bar rule.
@@ -67,121 +83,139 @@ class MarketStateClassifier:
         """
         self.slope_threshold = slope_threshold
 
-    def classify(self, intervals: Sequence[IntervalData], pldot_series: Sequence[PLDotSeries]) -> List[StateSeries]:
+    def classify(self, intervals: BarSource, pldot_series: Sequence[PLDotSeries]) -> List[StateSeries]:
         """
         Classify market state for each bar based on PLdot relationship.
 
         Returns:
             List of state classifications, one per valid bar
         """
-        if not intervals or not pldot_series:
-            return []
+        return self.classify_arrays(intervals, pldot_series).to_list()
 
-        # Create lookup map for closes
-        close_map = {bar.timestamp: bar.close for bar in intervals}
-        ordered_pldot = sorted(pldot_series, key=lambda s: s.timestamp)
-
-        results: List[StateSeries] = []
-
-        # State tracking variables
-        prev_state: MarketState | None = None
-        bars_in_state = 0
-        last_trend_direction: TrendDirection | None = None
+    def classify_arrays(self, intervals: BarSource, pldot_series: Sequence[PLDotSeries]) -> StateArrays:
+        """
+        Classify the whole series at once and return integer state arrays.
 
-        # NEW: Track trend at congestion entrance - preserved through entire congestion phase
-        trend_at_congestion_entrance: TrendDirection | None = None
-        bars_in_congestion = 0
+        Close-vs-PLdot positions, three-bar runs and slope classes are computed
+        as arrays; only the state transitions themselves run sequentially, in a
+        loop over integer codes (see :func:`_state_kernel`). The result is a
+        sequence of :class:`StateSeries` identical to feeding every bar through
+        :meth:`advance`, with rows materialized on access.
+        """
+        if not intervals or not pldot_series:
+            return StateArrays.empty()
 
-        # Position tracking for 3-bar rule
-        recent_positions: List[int] = []  # Track last 3 positions relative to PLdot
+        timestamps, positions, slopes = _aligned_state_inputs(intervals, pldot_series)
 
-        for i, series in enumerate(ordered_pldot):
-            close_price = close_map.get(series.timestamp)
-            if close_price is None:
-                continue
+        # Three consecutive closes on the same side of PLdot (0 when mixed or on PLdot)
+        uniform = np.zeros(len(positions), dtype=bool)
+        uniform[2:] = (positions[2:] == positions[1:-1]) & (positions[1:-1] == positions[:-2])
+        run_sign = np.where(uniform, positions, 0).astype(np.int8)
 
-            # Determine position: 1=above, -1=below, 0=on PLdot
-            position = _compare(close_price, series.value)
-            recent_positions.append(position)
-            if len(recent_positions) > 3:
-                recent_positions.pop(0)
+        slope_class = np.where(
+            np.abs(slopes) < self.slope_threshold,
+            0,
+            np.where(slopes > 0, 1, -1),
+        ).astype(np.int8)
 
-            # Classify PLdot slope
-            pldot_slope_trend = self._classify_pldot_slope(series.slope)
+        return StateArrays(timestamps, slope_class, uniform, *_state_kernel(run_sign))
 
-            # Determine current state - now passing trend_at_congestion_entrance
-            state, direction, reason = self._apply_state_rules(
-                recent_positions,
-                prev_state,
-                last_trend_direction,
-                bars_in_state,
-                pldot_slope_trend,
-                trend_at_congestion_entrance,  # NEW: Pass preserved trend
-            )
+    def advance(
+        self,
+        tracker: StateTracker,
+        timestamp: datetime,
+        close_price: Decimal,
+        pldot_value: Decimal,
+        pldot_slope: Decimal,
+    ) -> StateSeries:
+        """
+        Classify a single bar and advance ``tracker`` past it.
 
-            # Update tracking
-            if state == prev_state:
-                bars_in_state += 1
-                reason = None  # No state change
-            else:
-                bars_in_state = 1
-
-            # Update trend tracking
-            if state == MarketState.TREND:
-                last_trend_direction = direction
-            elif state == MarketState.REVERSAL:
-                last_trend_direction = direction
-
-            # NEW: Track congestion entrance and duration
-            # Only track congestion that follows a confirmed trend
-            if state == MarketState.CONGESTION_ENTRANCE and prev_state == MarketState.TREND:
-                # Entering congestion from a trend - capture the trend direction
-                trend_at_congestion_entrance = last_trend_direction
-                bars_in_congestion = 1
-            elif state in [MarketState.CONGESTION_ACTION, MarketState.CONGESTION_ENTRANCE]:
-                # Only increment if we're in "real" congestion (after a trend)
-                if trend_at_congestion_entrance is not None:
-                    bars_in_congestion += 1
-                # If trend_at_congestion_entrance is None, we're in early indeterminate state
-                # Don't track bars_in_congestion for these early states
-            elif state in [MarketState.TREND, MarketState.REVERSAL, MarketState.CONGESTION_EXIT]:
-                # Exiting congestion or in trend
-                # Don't reset yet - we need the values for CONGESTION_EXIT classification
-                pass
-
-            # Calculate confidence
-            confidence = self._calculate_confidence(
-                state,
-                bars_in_state,
-                pldot_slope_trend,
-                recent_positions,
-                direction
-            )
+        ``classify`` is a loop over this method, so feeding bars one at a time
+        through a long-lived tracker yields exactly the same series.
+        """
+        # Determine position: 1=above, -1=below, 0=on PLdot
+        position = _compare(close_price, pldot_value)
+        recent_positions = tracker.recent_positions
+        recent_positions.append(position)
+        if len(recent_positions) > 3:
+            recent_positions.pop(0)
+
+        prev_state = tracker.prev_state
+
+        # Classify PLdot slope
+        pldot_slope_trend = self._classify_pldot_slope(pldot_slope)
+
+        # Determine current state - now passing trend_at_congestion_entrance
+        state, direction, reason = self._apply_state_rules(
+            recent_positions,
+            prev_state,
+            tracker.last_trend_direction,
+            tracker.bars_in_state,
+            pldot_slope_trend,
+            tracker.trend_at_congestion_entrance,  # NEW: Pass preserved trend
+        )
 
-            # Create state point with new fields
-            results.append(
-                StateSeries(
-                    timestamp=series.timestamp,
-                    state=state,
-                    trend_direction=direction,
-                    bars_in_state=bars_in_state,
-                    previous_state=prev_state if state != prev_state else None,
-                    pldot_slope_trend=pldot_slope_trend,
-                    confidence=confidence,
-                    state_change_reason=reason if state != prev_state else None,
-                    trend_at_congestion_entrance=trend_at_congestion_entrance,  # NEW
-                    bars_in_congestion=bars_in_congestion,  # NEW
-                )
-            )
+        # Update tracking
+        if state == prev_state:
+            tracker.bars_in_state += 1
+            reason = None  # No state change
+        else:
+            tracker.bars_in_state = 1
+
+        # Update trend tracking
+        if state == MarketState.TREND:
+            tracker.last_trend_direction = direction
+        elif state == MarketState.REVERSAL:
+            tracker.last_trend_direction = direction
+
+        # NEW: Track congestion entrance and duration
+        # Only track congestion that follows a confirmed trend
+        if state == MarketState.CONGESTION_ENTRANCE and prev_state == MarketState.TREND:
+            # Entering congestion from a trend - capture the trend direction
+            tracker.trend_at_congestion_entrance = tracker.last_trend_direction
+            tracker.bars_in_congestion = 1
+        elif state in [MarketState.CONGESTION_ACTION, MarketState.CONGESTION_ENTRANCE]:
+            # Only increment if we're in "real" congestion (after a trend)
+            if tracker.trend_at_congestion_entrance is not None:
+                tracker.bars_in_congestion += 1
+            # If trend_at_congestion_entrance is None, we're in early indeterminate state
+            # Don't track bars_in_congestion for these early states
+        elif state in [MarketState.TREND, MarketState.REVERSAL, MarketState.CONGESTION_EXIT]:
+            # Exiting congestion or in trend
+            # Don't reset yet - we need the values for CONGESTION_EXIT classification
+            pass
+
+        # Calculate confidence
+        confidence = self._calculate_confidence(
+            state,
+            tracker.bars_in_state,
+            pldot_slope_trend,
+            recent_positions,
+            direction
+        )
 
-            # Reset congestion tracking after recording the exit bar
-            if state in [MarketState.TREND, MarketState.REVERSAL]:
-                trend_at_congestion_entrance = None
-                bars_in_congestion = 0
+        # Create state point with new fields
+        point = StateSeries(
+            timestamp=timestamp,
+            state=state,
+            trend_direction=direction,
+            bars_in_state=tracker.bars_in_state,
+            previous_state=prev_state if state != prev_state else None,
+            pldot_slope_trend=pldot_slope_trend,
+            confidence=confidence,
+            state_change_reason=reason if state != prev_state else None,
+            trend_at_congestion_entrance=tracker.trend_at_congestion_entrance,  # NEW
+            bars_in_congestion=tracker.bars_in_congestion,  # NEW
+        )
 
-            prev_state = state
+        # Reset congestion tracking after recording the exit bar
+        if state in [MarketState.TREND, MarketState.REVERSAL]:
+            tracker.trend_at_congestion_entrance = None
+            tracker.bars_in_congestion = 0
 
-        return results
+        tracker.prev_state = state
+        return point
 
     def _classify_pldot_slope(self, slope: Decimal) -> str:
         """Classify PLdot slope as rising, falling, or horizontal."""
@@ -297,29 +331,272 @@ class MarketStateClassifier:
         - PLdot slope aligns with trend state
         - Consistent positioning vs PLdot
         """
-        confidence = Decimal("0.5")  # Base confidence
+        has_three = len(recent_positions) >= 3
+        consistent = has_three and len(set(recent_positions[-3:])) == 1
+        return _confidence(state, bars_in_state, pldot_slope, direction, has_three, consistent)
+
+
+def _confidence(
+    state: MarketState,
+    bars_in_state: int,
+    pldot_slope: str,
+    direction: TrendDirection,
+    has_three: bool,
+    consistent: bool,
+) -> Decimal:
+    """Confidence score shared by the per-bar and batch classifiers."""
+    confidence = Decimal("0.5")  # Base confidence
+
+    # Increase confidence with duration in state
+    duration_bonus = min(bars_in_state * 0.05, 0.3)
+    confidence += Decimal(str(duration_bonus))
+
+    # Trend confidence: PLdot slope should match
+    if state == MarketState.TREND and has_three:
+        if (direction == TrendDirection.UP and pldot_slope == "rising") or \
+           (direction == TrendDirection.DOWN and pldot_slope == "falling"):
+            confidence += Decimal("0.2")
+
+    # Congestion confidence: PLdot should be horizontal
+    if state in [MarketState.CONGESTION_ACTION, MarketState.CONGESTION_ENTRANCE]:
+        if pldot_slope == "horizontal":
+            confidence += Decimal("0.15")
+
+    # Consistency bonus: all recent positions same side
+    if consistent:
+        confidence += Decimal("0.1")
+
+    return min(confidence, Decimal("1.0"))
+
+
+# Integer codes used by the batch classifier; -1 stands for ``None``
+STATE_CODES: Tuple[MarketState, ...] = (
+    MarketState.TREND,
+    MarketState.CONGESTION_ENTRANCE,
+    MarketState.CONGESTION_ACTION,
+    MarketState.CONGESTION_EXIT,
+    MarketState.REVERSAL,
+)
+DIRECTION_CODES: Tuple[TrendDirection, ...] = (TrendDirection.UP, TrendDirection.DOWN, TrendDirection.NEUTRAL)
+SLOPE_TRENDS: Tuple[str, ...] = ("falling", "horizontal", "rising")  # indexed by slope class + 1
+STATE_REASONS: Tuple[str, ...] = (
+    "Insufficient bars",
+    "Trend continuation",
+    "Congestion exit to uptrend",
+    "Reversal to uptrend",
+    "New uptrend from congestion",
+    "New uptrend established",
+    "Congestion exit to downtrend",
+    "Reversal to downtrend",
+    "New downtrend from congestion",
+    "New downtrend established",
+    "First opposite close ends trend",
+    "Alternating closes indicate congestion",
+    "Indeterminate - defaulting to congestion",
+)
+
+_NONE = -1
+_TREND, _ENTRANCE, _ACTION, _EXIT, _REVERSAL = range(5)
+_UP, _DOWN, _NEUTRAL = range(3)
+
+
+class StateArrays(LazySeries[StateSeries]):
+    """Integer-coded output of :meth:`MarketStateClassifier.classify_arrays`.
+
+    ``state``, ``trend_direction``, ``previous_state`` and
+    ``trend_at_congestion_entrance`` index :data:`STATE_CODES` /
+    :data:`DIRECTION_CODES` (-1 for ``None``), ``reason`` indexes
+    :data:`STATE_REASONS` and ``slope_class`` is -1/0/1 for
+    falling/horizontal/rising.
+    """
+
+    def __init__(
+        self,
+        timestamps: List[datetime],
+        slope_class: np.ndarray,
+        uniform_positions: np.ndarray,
+        state: np.ndarray,
+        trend_direction: np.ndarray,
+        bars_in_state: np.ndarray,
+        previous_state: np.ndarray,
+        reason: np.ndarray,
+        trend_at_congestion_entrance: np.ndarray,
+        bars_in_congestion: np.ndarray,
+    ) -> None:
+        super().__init__(len(state))
+        self.timestamps = timestamps
+        self.slope_class = slope_class
+        self.uniform_positions = uniform_positions
+        self.state = state
+        self.trend_direction = trend_direction
+        self.bars_in_state = bars_in_state
+        self.previous_state = previous_state
+        self.reason = reason
+        self.trend_at_congestion_entrance = trend_at_congestion_entrance
+        self.bars_in_congestion = bars_in_congestion
+
+    @classmethod
+    def empty(cls) -> "StateArrays":
+        codes = np.empty(0, dtype=np.int8)
+        counts = np.empty(0, dtype=np.int64)
+        return cls([], codes, np.empty(0, dtype=bool), codes, codes, counts, codes, codes, codes, counts)
+
+    def _build(self, index: int) -> StateSeries:
+        state = STATE_CODES[self.state[index]]
+        direction = DIRECTION_CODES[self.trend_direction[index]]
+        bars_in_state = int(self.bars_in_state[index])
+        slope_trend = SLOPE_TRENDS[self.slope_class[index] + 1]
+        previous = self.previous_state[index]
+        reason = self.reason[index]
+        entrance = self.trend_at_congestion_entrance[index]
+        return StateSeries(
+            timestamp=self.timestamps[index],
+            state=state,
+            trend_direction=direction,
+            bars_in_state=bars_in_state,
+            previous_state=STATE_CODES[previous] if previous != _NONE else None,
+            pldot_slope_trend=slope_trend,
+            confidence=_confidence(
+                state,
+                bars_in_state,
+                slope_trend,
+                direction,
+                index >= 2,
+                bool(self.uniform_positions[index]),
+            ),
+            state_change_reason=STATE_REASONS[reason] if reason != _NONE else None,
+            trend_at_congestion_entrance=DIRECTION_CODES[entrance] if entrance != _NONE else None,
+            bars_in_congestion=int(self.bars_in_congestion[index]),
+        )
+
+
+def _aligned_state_inputs(
+    intervals: BarSource,
+    pldot_series: Sequence[PLDotSeries],
+) -> Tuple[List[datetime], np.ndarray, np.ndarray]:
+    """Return chronological PLdot timestamps that have a close, with positions and slopes.
+
+    Positions are compared in float; because Decimal-to-float conversion is
+    monotonic, only exact float ties can disagree with the Decimal comparison
+    used by :meth:`MarketStateClassifier.advance`, and those are re-checked
+    in Decimal.
+    """
+    closes = build_close_map(intervals)
+
+    pldot_decimals: List[Decimal] | None = None
+    if isinstance(pldot_series, PLDotArrays):
+        all_timestamps = pldot_series.datetimes()
+        keep = np.flatnonzero([timestamp in closes for timestamp in all_timestamps])
+        timestamps = [all_timestamps[i] for i in keep]
+        values = pldot_series.rounded_values()[keep]
+        slopes = pldot_series.rounded_slopes()[keep]
+    else:
+        ordered = [s for s in sorted(pldot_series, key=lambda s: s.timestamp) if s.timestamp in closes]
+        timestamps = [s.timestamp for s in ordered]
+        pldot_decimals = [s.value for s in ordered]
+        values = np.array([float(value) for value in pldot_decimals], dtype=np.float64)
+        slopes = np.array([float(s.slope) for s in ordered], dtype=np.float64)
+
+    close_decimals = [closes[timestamp] for timestamp in timestamps]
+    close_values = np.array([float(close) for close in close_decimals], dtype=np.float64)
+
+    positions = (close_values > values).astype(np.int8) - (close_values < values).astype(np.int8)
+    for i in np.flatnonzero(close_values == values).tolist():
+        pldot_value = pldot_decimals[i] if pldot_decimals is not None else Decimal(str(values[i].item()))
+        positions[i] = _compare(close_decimals[i], pldot_value)
+
+    return timestamps, positions, slopes
+
+
+def _state_kernel(run_sign: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Run the Drummond state transitions over three-bar run signs.
+
+    ``run_sign[i]`` is 1/-1 when bars ``i-2..i`` all closed above/below PLdot
+    and 0 otherwise. This is :meth:`MarketStateClassifier._apply_state_rules`
+    plus the bookkeeping in :meth:`MarketStateClassifier.advance`, expressed on
+    integer codes only so it stays cheap in CPython and can be JIT-compiled
+    unchanged.
+
+    Returns:
+        (state, trend_direction, bars_in_state, previous_state, reason,
+        trend_at_congestion_entrance, bars_in_congestion) arrays.
+    """
+    n = len(run_sign)
+    states = np.empty(n, dtype=np.int8)
+    directions = np.empty(n, dtype=np.int8)
+    bars_in_state_out = np.empty(n, dtype=np.int64)
+    previous_out = np.empty(n, dtype=np.int8)
+    reasons = np.empty(n, dtype=np.int8)
+    entrance_out = np.empty(n, dtype=np.int8)
+    congestion_out = np.empty(n, dtype=np.int64)
+
+    prev_state = _NONE
+    bars_in_state = 0
+    last_trend = _NONE
+    trend_at_entrance = _NONE
+    bars_in_congestion = 0
+
+    for i in range(n):
+        sign = run_sign[i]
+        effective_trend = trend_at_entrance if trend_at_entrance != _NONE else last_trend
+        in_congestion = prev_state == _ACTION or prev_state == _ENTRANCE
+
+        if i < 2:
+            state, direction, reason = _ACTION, _NEUTRAL, 0
+        elif sign != 0:
+            up = sign > 0
+            same, opposite = (_UP, _DOWN) if up else (_DOWN, _UP)
+            offset = 0 if up else 4
+            if prev_state == _TREND and last_trend == same:
+                state, direction, reason = _TREND, same, 1
+            elif in_congestion:
+                if effective_trend == same:
+                    state, direction, reason = _EXIT, same, 2 + offset
+                elif effective_trend == opposite:
+                    state, direction, reason = _REVERSAL, same, 3 + offset
+                else:
+                    state, direction, reason = _TREND, same, 4 + offset
+            else:
+                state, direction, reason = _TREND, same, 5 + offset
+        elif prev_state == _TREND:
+            state, direction, reason = _ENTRANCE, (last_trend if last_trend != _NONE else _NEUTRAL), 10
+        elif in_congestion or prev_state == _NONE:
+            state, direction, reason = _ACTION, (effective_trend if effective_trend != _NONE else _NEUTRAL), 11
+        else:
+            state, direction, reason = _ACTION, _NEUTRAL, 12
+
+        if state == prev_state:
+            bars_in_state += 1
+            reason = _NONE
+            previous_out[i] = _NONE
+        else:
+            bars_in_state = 1
+            previous_out[i] = prev_state
+
+        if state == _TREND or state == _REVERSAL:
+            last_trend = direction
 
-        # Increase confidence with duration in state
-        duration_bonus = min(bars_in_state * 0.05, 0.3)
-        confidence += Decimal(str(duration_bonus))
+        if state == _ENTRANCE and prev_state == _TREND:
+            trend_at_entrance = last_trend
+            bars_in_congestion = 1
+        elif state == _ACTION or state == _ENTRANCE:
+            if trend_at_entrance != _NONE:
+                bars_in_congestion += 1
 
-        # Trend confidence: PLdot slope should match
-        if state == MarketState.TREND and len(recent_positions) >= 3:
-            last_position = recent_positions[-1]
-            if (direction == TrendDirection.UP and pldot_slope == "rising") or \
-               (direction == TrendDirection.DOWN and pldot_slope == "falling"):
-                confidence += Decimal("0.2")
+        states[i] = state
+        directions[i] = direction
+        bars_in_state_out[i] = bars_in_state
+        reasons[i] = reason
+        entrance_out[i] = trend_at_entrance
+        congestion_out[i] = bars_in_congestion
 
-        # Congestion confidence: PLdot should be horizontal
-        if state in [MarketState.CONGESTION_ACTION, MarketState.CONGESTION_ENTRANCE]:
-            if pldot_slope == "horizontal":
-                confidence += Decimal("0.15")
+        if state == _TREND or state == _REVERSAL:
+            trend_at_entrance = _NONE
+            bars_in_congestion = 0
 
-        # Consistency bonus: all recent positions same side
-        if len(recent_positions) >= 3 and len(set(recent_positions[-3:])) == 1:
-            confidence += Decimal("0.1")
+        prev_state = state
 
-        return min(confidence, Decimal("1.0"))
+    return states, directions, bars_in_state_out, previous_out, reasons, entrance_out, congestion_out
 
 
 def _compare(a: Decimal, b: Decimal) -> int:
@@ -338,4 +615,15 @@ def _sign(value: Decimal) -> int:
     return 0
 
 
-__all__ = ["MarketStateClassifier", "MarketState", "TrendDirection", "StateSeries"]
+__all__ = [
+    "MarketStateClassifier",
+    "MarketState",
+    "TrendDirection",
+    "StateSeries",
+    "StateTracker",
+    "StateArrays",
+    "STATE_CODES",
+    "DIRECTION_CODES",
+    "SLOPE_TRENDS",
+    "STATE_REASONS",
+]
@@ -2,27 +2,19 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Sequence
+from typing import List, Optional, Sequence, Tuple
 
-from ..data.models import IntervalData
-from .drummond_lines import DrummondLineCalculator, aggregate_zones
-from .envelopes import EnvelopeCalculator
+from ..data.bars import BarArray, BarSource, fingerprint_bars
+from .drummond_lines import DrummondLine, DrummondLineCalculator, DrummondLineWindow, DrummondZone, aggregate_zones
+from .envelopes import EnvelopeCalculator, EnvelopeSeries
 from .multi_timeframe import TimeframeData, TimeframeType
-from .patterns import (
-    detect_c_wave,
-    detect_congestion_oscillation,
-    detect_exhaust,
-    detect_pldot_push,
-    detect_pldot_refresh,
-    detect_termination_events,
-)
-from .pldot import PLDotCalculator
+from .patterns import PatternEvent, PatternInputs, detect_patterns, termination_kernel
+from .pldot import PLDotCalculator, PLDotSeries
 from .states import MarketStateClassifier
 
 
 def build_timeframe_data(
-    intervals: Sequence[IntervalData],
+    intervals: BarSource,
     timeframe: str,
     classification: TimeframeType,
 ) -> TimeframeData:
@@ -37,51 +29,77 @@ def build_timeframe_data(
             state_series=[],
             pattern_events=[],
             drummond_zones=(),
+            source_fingerprint=fingerprint_bars(intervals),
         )
 
     pldot_calc = PLDotCalculator(displacement=1)
-    pldot_series = pldot_calc.from_intervals(intervals)
+    pldot_arrays = pldot_calc.compute_arrays(intervals)
 
     envelope_calc = EnvelopeCalculator(method="pldot_range", period=3, multiplier=1.5)
-    envelope_series = envelope_calc.from_intervals(intervals, pldot_series)
+    envelope_arrays = envelope_calc.compute_arrays(intervals, pldot_arrays)
 
     state_classifier = MarketStateClassifier(slope_threshold=0.0001)
-    state_series = state_classifier.classify(intervals, pldot_series)
-
-    patterns = []
-    patterns.extend(detect_pldot_push(intervals, pldot_series))
-    patterns.extend(detect_pldot_refresh(intervals, pldot_series))
-    patterns.extend(detect_exhaust(intervals, pldot_series, envelope_series))
-    patterns.extend(detect_c_wave(envelope_series, pldot=pldot_series, intervals=intervals))
-    patterns.extend(detect_congestion_oscillation(envelope_series))
-
-    drummond_zones = ()
-    line_calc = DrummondLineCalculator()
-    drummond_lines = line_calc.from_intervals(intervals)
-    if drummond_lines:
-        avg_range = sum(float((bar.high - bar.low)) for bar in intervals) / len(intervals)
-        envelope_width = float(envelope_series[-1].width) if envelope_series else 0.0
-        tolerance = max(avg_range * 0.3, envelope_width * 0.25, 0.05)
-        zones = aggregate_zones(drummond_lines, tolerance=tolerance)
-        drummond_zones = tuple(zones)
-        
-        # Detect termination events when price approaches projected Drummond line zones
-        termination_events = detect_termination_events(
-            intervals=intervals,
-            zones=zones,
-            pldot=pldot_series,
-        )
-        patterns.extend(termination_events)
+    state_series = state_classifier.classify_arrays(intervals, pldot_arrays).to_list()
+
+    patterns, drummond_zones = detect_patterns_and_zones(intervals, pldot_arrays, envelope_arrays)
 
     return TimeframeData(
         timeframe=timeframe,
         classification=classification,
-        pldot_series=pldot_series,
-        envelope_series=envelope_series,
+        pldot_series=pldot_arrays.to_list(),
+        envelope_series=envelope_arrays.to_list(),
         state_series=state_series,
         pattern_events=patterns,
         drummond_zones=drummond_zones,
+        source_fingerprint=fingerprint_bars(intervals),
     )
 
 
-__all__ = ["build_timeframe_data"]
+def detect_patterns_and_zones(
+    intervals: BarSource,
+    pldot_series: Sequence[PLDotSeries],
+    envelope_series: Sequence[EnvelopeSeries],
+    line_window: Optional[DrummondLineWindow] = None,
+) -> Tuple[List[PatternEvent], Tuple[DrummondZone, ...]]:
+    """Run the pattern detectors and Drummond zone aggregation for one timeframe.
+
+    Shared by :func:`build_timeframe_data` and the incremental builder so both
+    derive patterns and zones from the PLdot/envelope series in the same way.
+    The series may be lists or the column forms from ``compute_arrays``; bars,
+    PLdot and envelopes are aligned once and shared by every detector.
+
+    ``line_window`` supplies Drummond lines kept sorted across calls for the
+    same bars; without it the lines are generated and sorted from ``intervals``.
+    """
+    inputs = PatternInputs.build(intervals, pldot=pldot_series, envelopes=envelope_series)
+    patterns = detect_patterns(inputs)
+
+    drummond_zones: Tuple[DrummondZone, ...] = ()
+    drummond_lines: List[DrummondLine] = []
+    if line_window is None:
+        drummond_lines = DrummondLineCalculator().from_intervals(intervals)
+    if drummond_lines or (line_window is not None and len(line_window) > 0):
+        avg_range = _average_range(intervals)
+        envelope_width = float(envelope_series[-1].width) if envelope_series else 0.0
+        tolerance = max(avg_range * 0.3, envelope_width * 0.25, 0.05)
+        if line_window is not None:
+            zones = line_window.zones(tolerance=tolerance)
+        else:
+            zones = aggregate_zones(drummond_lines, tolerance=tolerance)
+        drummond_zones = tuple(zones)
+
+        # Detect termination events when price approaches projected Drummond line zones
+        patterns.extend(termination_kernel(inputs, zones))
+
+    return patterns, drummond_zones
+
+
+def _average_range(intervals: BarSource) -> float:
+    """Mean high-low range, with each range taken in Decimal as for ``IntervalData``."""
+    if isinstance(intervals, BarArray):
+        ranges = zip(intervals.decimals("high"), intervals.decimals("low"), strict=True)
+        return sum(float(high - low) for high, low in ranges) / len(intervals)
+    return sum(float((bar.high - bar.low)) for bar in intervals) / len(intervals)
+
+
+__all__ = ["build_timeframe_data", "detect_patterns_and_zones"]
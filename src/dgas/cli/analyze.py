@@ -412,7 +412,7 @@ def run_analyze_command(
 
                             console.print(f"[green]✓ Results saved (Analysis ID: {analysis_id})[/green]")
                     except ImportError:
-                        console.print("[yellow]⚠ Database persistence not available (psycopg2 not installed)[/yellow]")
+                        console.print("[yellow]⚠ Database persistence not available[/yellow]")
                     except Exception as e:
                         console.print(f"[red]✗ Failed to save to database: {e}[/red]")
 
@@ -13,6 +13,7 @@ from rich.panel import Panel
 
 from ..backtesting import SimulationConfig
 from ..backtesting.reporting import build_summary_table, export_json, export_markdown
+from ..backtesting.parallel_runner import SharedMemoryBacktestRunner
 from ..backtesting.runner import BacktestRequest, BacktestRunner
 
 console = Console()
@@ -36,6 +37,7 @@ def run_backtest_command(
     report_path: Path | None,
     json_path: Path | None,
     limit_bars: int | None,
+    workers: int = 1,
 ) -> int:
     try:
         request = BacktestRequest(
@@ -56,7 +58,7 @@ def run_backtest_command(
             limit=limit_bars,
         )
 
-        runner = BacktestRunner()
+        runner = SharedMemoryBacktestRunner(workers) if workers > 1 and len(symbols) > 1 else BacktestRunner()
         results = runner.run(request)
 
         if output_format in {"summary", "detailed"}:
@@ -16,6 +16,7 @@ from rich.console import Console
 from rich.table import Table
 
 from dgas.config import load_settings
+from dgas.data.backfill import DEFAULT_BACKFILL_WORKERS, backfill_universe
 from dgas.data.ingestion import (
     IngestionSummary,
     backfill_intraday,
@@ -87,6 +88,66 @@ def setup_data_parser(subparsers: Any) -> ArgumentParser:
     )
     ingest_parser.set_defaults(func=_ingest_command)
 
+    # Backfill command
+    backfill_parser = data_subparsers.add_parser(
+        "backfill",
+        help="Resumable parallel backfill of historical data",
+    )
+    backfill_parser.add_argument(
+        "symbols",
+        nargs="*",
+        help="Symbols to backfill (default: all active symbols)",
+    )
+    backfill_parser.add_argument(
+        "--exchange",
+        default="US",
+        help="Exchange code (default: US)",
+    )
+    backfill_parser.add_argument(
+        "--interval",
+        default="5m",
+        help="Data interval: 1m, 5m, 1h or 1d (default: 5m)",
+    )
+    backfill_parser.add_argument(
+        "--start-date",
+        help="Start date (YYYY-MM-DD, default: --days before the end date)",
+    )
+    backfill_parser.add_argument(
+        "--end-date",
+        help="End date (YYYY-MM-DD, default: today)",
+    )
+    backfill_parser.add_argument(
+        "--days",
+        type=int,
+        default=90,
+        help="Days to backfill when --start-date is not given (default: 90)",
+    )
+    backfill_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BACKFILL_WORKERS,
+        help=(
+            "Requests in flight at once, within the API rate limit "
+            f"(default: {DEFAULT_BACKFILL_WORKERS})"
+        ),
+    )
+    backfill_parser.add_argument(
+        "--chunk-days",
+        type=int,
+        help="Days per API request (default: the longest range EODHD serves for the interval)",
+    )
+    backfill_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore checkpoints from earlier runs and backfill every chunk",
+    )
+    backfill_parser.add_argument(
+        "--config",
+        type=Path,
+        help="Path to configuration file (default: auto-detect)",
+    )
+    backfill_parser.set_defaults(func=_backfill_command)
+
     # List command
     list_parser = data_subparsers.add_parser(
         "list",
@@ -268,6 +329,89 @@ def _ingest_command(args: Namespace) -> int:
         return 1
 
 
+def _backfill_command(args: Namespace) -> int:
+    """
+    Execute the data backfill command.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    console = Console()
+
+    try:
+        end_date = args.end_date or datetime.now().date().isoformat()
+        start_date = args.start_date or (
+            datetime.fromisoformat(end_date).date() - timedelta(days=args.days)
+        ).isoformat()
+
+        symbols = [symbol.upper() for symbol in args.symbols]
+        if not symbols:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT symbol FROM market_symbols WHERE is_active = true ORDER BY symbol"
+                    )
+                    symbols = [row[0] for row in cur.fetchall()]
+        if not symbols:
+            console.print("[yellow]No symbols to backfill[/yellow]")
+            return 0
+
+        console.print(
+            f"[cyan]Backfilling {args.interval} data for {len(symbols)} symbols "
+            f"from {start_date} to {end_date} with {args.workers} workers...[/cyan]\n"
+        )
+
+        results = backfill_universe(
+            [(symbol, args.exchange) for symbol in symbols],
+            start_date=start_date,
+            end_date=end_date,
+            interval=args.interval,
+            workers=args.workers,
+            chunk_days=args.chunk_days,
+            resume=not args.restart,
+        )
+
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Symbol")
+        table.add_column("Chunks", justify="right")
+        table.add_column("Fetched", justify="right")
+        table.add_column("Stored", justify="right")
+        table.add_column("Status")
+
+        for result in results:
+            table.add_row(
+                result.symbol,
+                f"{result.chunks_done + result.chunks_skipped}/{result.chunks_total}",
+                str(result.bars_fetched),
+                str(result.bars_stored),
+                (
+                    f"[green]{result.status}[/green]"
+                    if result.ok
+                    else f"[red]{result.status}: {result.error}[/red]"
+                ),
+            )
+
+        console.print(table)
+
+        failed = [result for result in results if not result.ok]
+        total_stored = sum(result.bars_stored for result in results)
+        console.print(f"\n[green]Total bars stored: {total_stored:,}[/green]")
+        if failed:
+            console.print(
+                f"[red]{len(failed)} symbols incomplete; rerun the same command to resume[/red]"
+            )
+            return 1
+        return 0
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        logger.exception("Backfill command failed")
+        return 1
+
+
 def _list_command(args: Namespace) -> int:
     """
     Execute the data list command.
@@ -0,0 +1,190 @@
+"""
+Indicator management command for DGAS CLI.
+
+Provides the batch job that materializes multi-timeframe analyses into the
+database for backtesting.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import Any, List
+
+from rich.console import Console
+from rich.table import Table
+
+from dgas.backtesting.data_loader import DEFAULT_REPLAY_WINDOW
+from dgas.backtesting.indicator_materializer import materialize_indicators
+from dgas.db import get_connection
+
+from .backtest import _parse_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def setup_indicators_parser(subparsers: Any) -> ArgumentParser:
+    """
+    Set up the indicators subcommand parser.
+
+    Args:
+        subparsers: The subparsers object from argparse
+
+    Returns:
+        The indicators subparser
+    """
+    parser = subparsers.add_parser(
+        "indicators",
+        help="Manage precomputed indicators",
+        description="Materialize multi-timeframe analyses for backtesting",
+    )
+
+    indicators_subparsers = parser.add_subparsers(dest="indicators_command")
+
+    # Materialize command
+    materialize_parser = indicators_subparsers.add_parser(
+        "materialize",
+        help="Compute and store multi-timeframe analyses for a universe",
+    )
+    materialize_parser.add_argument(
+        "symbols",
+        nargs="*",
+        help="Symbols to materialize (default: all active symbols with trading-interval data)",
+    )
+    materialize_parser.add_argument(
+        "--htf",
+        "--htf-interval",
+        dest="htf_interval",
+        default="1d",
+        help="Higher timeframe interval (default: 1d)",
+    )
+    materialize_parser.add_argument(
+        "--trading",
+        "--trading-interval",
+        dest="trading_interval",
+        default="30m",
+        help="Trading timeframe interval (default: 30m)",
+    )
+    materialize_parser.add_argument(
+        "--start",
+        help="Start date (YYYY-MM-DD) or ISO timestamp; symbols with a high-water mark resume from it "
+        "unless --full-refresh is given",
+        default=None,
+    )
+    materialize_parser.add_argument("--end", help="End date (YYYY-MM-DD) or ISO timestamp", default=None)
+    materialize_parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes, one symbol at a time each (default: CPU count)",
+    )
+    materialize_parser.add_argument(
+        "--warmup-bars",
+        type=int,
+        default=DEFAULT_REPLAY_WINDOW,
+        help=f"Bars replayed before the first bar written (default: {DEFAULT_REPLAY_WINDOW})",
+    )
+    materialize_parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore the stored high-water marks and recompute the whole range",
+    )
+    materialize_parser.add_argument(
+        "--config",
+        type=Path,
+        help="Path to configuration file (default: auto-detect)",
+    )
+    materialize_parser.set_defaults(func=_materialize_command)
+
+    return parser
+
+
+def _universe_symbols(trading_interval: str) -> List[str]:
+    """Return active symbols that have bars at the trading interval."""
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT s.symbol
+                FROM market_symbols s
+                WHERE s.is_active
+                  AND EXISTS (
+                      SELECT 1 FROM market_data md
+                      WHERE md.symbol_id = s.symbol_id AND md.interval_type = %s
+                  )
+                ORDER BY s.symbol
+                """,
+                (trading_interval,),
+            )
+            return [row[0] for row in cur.fetchall()]
+
+
+def _materialize_command(args: Namespace) -> int:
+    """
+    Execute the indicators materialize command.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    console = Console()
+
+    try:
+        symbols = [symbol.upper() for symbol in args.symbols] or _universe_symbols(args.trading_interval)
+        if not symbols:
+            console.print("[yellow]No symbols to materialize[/yellow]")
+            return 0
+
+        console.print(
+            f"[cyan]Materializing {args.htf_interval}/{args.trading_interval} analyses "
+            f"for {len(symbols)} symbols with {args.processes} processes...[/cyan]\n"
+        )
+
+        started = time.perf_counter()
+        results = materialize_indicators(
+            symbols,
+            args.htf_interval,
+            args.trading_interval,
+            start=_parse_datetime(args.start),
+            end=_parse_datetime(args.end),
+            processes=args.processes,
+            warmup_bars=args.warmup_bars,
+            full_refresh=args.full_refresh,
+        )
+        elapsed = time.perf_counter() - started
+
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Symbol")
+        table.add_column("Bars", justify="right")
+        table.add_column("Analyses", justify="right")
+        table.add_column("High-Water Mark")
+        table.add_column("Status")
+
+        for result in results:
+            table.add_row(
+                result.symbol,
+                str(result.bars_processed),
+                str(result.analyses_written),
+                result.high_water_mark.isoformat() if result.high_water_mark else "",
+                "[green]ok[/green]" if result.ok else f"[red]{result.error}[/red]",
+            )
+
+        console.print(table)
+
+        failed = [result for result in results if not result.ok]
+        total_written = sum(result.analyses_written for result in results)
+        console.print(f"\n[green]Analyses written: {total_written:,} in {elapsed:.1f}s[/green]")
+        if failed:
+            console.print(f"[red]Failed symbols: {len(failed)}[/red]")
+            return 1
+        return 0
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        logger.exception("Indicators materialize command failed")
+        return 1
@@ -21,7 +21,9 @@ from rich.console import Console
 from rich.table import Table
 
 from dgas.config import load_settings
+from dgas.db import configure_pool
 from dgas.prediction import (
+    ExecutionConfig,
     MarketHoursManager,
     PredictionEngine,
     PredictionPersistence,
@@ -161,11 +163,20 @@ def _start_scheduler(args: Namespace) -> int:
 
         # Load unified settings
         unified_settings = load_settings(config_file=args.config)
+        configure_pool(max_size=unified_settings.database_pool_size)
 
         # Initialize components (using legacy Settings for now)
         legacy_settings = Settings()
         persistence = PredictionPersistence(legacy_settings)
-        engine = PredictionEngine(legacy_settings)
+        engine = PredictionEngine(
+            legacy_settings,
+            execution=ExecutionConfig(
+                backend=unified_settings.prediction_execution_backend,
+                max_workers=unified_settings.prediction_max_workers,
+                symbol_timeout_seconds=unified_settings.prediction_symbol_timeout_seconds,
+                load_batch_size=unified_settings.prediction_load_batch_size,
+            ),
+        )
         performance_tracker = PerformanceTracker(persistence)
 
         # Load symbols - if empty in config, load all active symbols from database
@@ -19,7 +19,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from dgas.config import load_settings
-from dgas.db import get_connection
+from dgas.db import get_connection, get_pool_stats
 from dgas.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -147,7 +147,9 @@ def _gather_status_info(settings: Any) -> Dict[str, Any]:
 
                 # Connection test
                 info["database"]["status"] = "connected"
-                info["database"]["connection_count"] = "N/A (requires pg_stat_activity)"
+                pool_stats = get_pool_stats()
+                info["database"]["pool"] = pool_stats
+                info["database"]["connection_count"] = pool_stats.get("pool_size", "N/A")
     except Exception as e:
         info["database"]["status"] = f"error: {e}"
 
@@ -367,7 +369,8 @@ def _display_dashboard(console: Console, info: Dict[str, Any]) -> None:
             f"Status: {db_info.get('status', 'unknown')}\n"
             f"Symbols: {db_info.get('total_symbols', 0):,}\n"
             f"Data bars: {db_info.get('total_data_bars', 0):,}\n"
-            f"Size: {db_info.get('size', 'unknown')}",
+            f"Size: {db_info.get('size', 'unknown')}\n"
+            f"Pool connections: {db_info.get('connection_count', 'N/A')}",
             title="[bold]Database[/bold]",
             border_style="green" if "connected" in db_info.get("status", "") else "red",
         )
@@ -195,6 +195,34 @@ class UnifiedSettings:
             return self._dgas_config.prediction.freshness_threshold_minutes
         return 15  # Default
 
+    @property
+    def prediction_execution_backend(self) -> str:
+        """Get execution backend for the per-symbol prediction work."""
+        if self._dgas_config:
+            return self._dgas_config.prediction.execution_backend
+        return "thread"  # Default
+
+    @property
+    def prediction_max_workers(self) -> Optional[int]:
+        """Get maximum number of symbols processed concurrently."""
+        if self._dgas_config:
+            return self._dgas_config.prediction.max_workers
+        return None  # Default: one per CPU core
+
+    @property
+    def prediction_symbol_timeout_seconds(self) -> Optional[float]:
+        """Get per-symbol timeout in seconds."""
+        if self._dgas_config:
+            return self._dgas_config.prediction.symbol_timeout_seconds
+        return 60.0  # Default
+
+    @property
+    def prediction_load_batch_size(self) -> Optional[int]:
+        """Get number of symbols loaded per bulk market data query."""
+        if self._dgas_config:
+            return self._dgas_config.prediction.load_batch_size
+        return 500  # Default
+
     # Notification properties
     @property
     def notifications_discord_enabled(self) -> bool:
@@ -316,6 +344,10 @@ class UnifiedSettings:
                 "min_signal_strength": self.prediction_min_signal_strength,
                 "stop_loss_atr_multiplier": self.prediction_stop_loss_atr_multiplier,
                 "target_atr_multiplier": self.prediction_target_atr_multiplier,
+                "execution_backend": self.prediction_execution_backend,
+                "max_workers": self.prediction_max_workers,
+                "symbol_timeout_seconds": self.prediction_symbol_timeout_seconds,
+                "load_batch_size": self.prediction_load_batch_size,
             },
             "notifications": {
                 "discord": {
@@ -100,6 +100,28 @@ class PredictionConfig(BaseModel):
         le=60,
         description="Maximum data age to consider fresh (minutes)",
     )
+    execution_backend: str = Field(
+        default="thread",
+        pattern="^(serial|thread|process)$",
+        description="How symbols run within a cycle: serial, thread (I/O bound) or process (CPU bound)",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Maximum symbols processed concurrently (None = one per CPU core)",
+    )
+    symbol_timeout_seconds: Optional[float] = Field(
+        default=60.0,
+        gt=0.0,
+        description="Give up on a symbol that takes longer than this (None = no timeout)",
+    )
+    load_batch_size: Optional[int] = Field(
+        default=500,
+        ge=1,
+        le=5000,
+        description="Symbols per bulk market data query (None = one query per symbol)",
+    )
 
 
 class DiscordConfig(BaseModel):
@@ -215,6 +237,12 @@ class DataCollectionConfig(BaseModel):
         le=5,
         description="Maximum concurrent batches (1 = sequential)",
     )
+    fetch_workers: int = Field(
+        default=4,
+        ge=1,
+        le=10,
+        description="Concurrent API fetches while results are written (1 = sequential batches)",
+    )
     delay_between_batches: float = Field(
         default=2.0,
         ge=0.0,
@@ -1,73 +1,38 @@
-"""Database connection pool for optimized resource usage."""
+"""Database connection pool for optimized resource usage.
+
+Kept for backward compatibility: connections come from the shared pool in
+:mod:`dgas.db.connection_pool`, so code using this module and code using
+``dgas.db.get_connection`` draw from the same set of connections.
+"""
 
 from __future__ import annotations
 
-import os
-import queue
-import threading
-from typing import Optional
 from contextlib import contextmanager
+from typing import Optional
 
-try:
-    import psycopg2
-    from psycopg2 import pool as pg_pool
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    PSYCOPG2_AVAILABLE = False
-
-# Get database connection parameters from environment
-DB_HOST = os.getenv('DB_HOST', 'localhost')
-DB_PORT = os.getenv('DB_PORT', '5432')
-DB_NAME = os.getenv('DB_NAME', 'drummond_geometry')
-DB_USER = os.getenv('DB_USER', 'postgres')
-DB_PASSWORD = os.getenv('DB_PASSWORD', '')
+from ..db.connection_pool import get_pool_manager
 
 
 class DatabaseConnectionPool:
-    """Simple connection pool using queue."""
+    """View of the shared connection pool with the historical interface."""
 
     def __init__(self, pool_size: int = 10):
         """Initialize connection pool.
 
         Args:
-            pool_size: Maximum number of connections in pool
+            pool_size: Maximum number of connections in the shared pool
         """
         self.pool_size = pool_size
-        self._connection_queue = queue.Queue(maxsize=pool_size)
-        self._lock = threading.Lock()
         self._initialized = False
 
     def initialize(self):
-        """Initialize the connection pool with connections."""
+        """Open the shared pool with ``pool_size`` as its maximum size."""
         if self._initialized:
             return
-
-        with self._lock:
-            if self._initialized:
-                return
-
-            # Create initial connections
-            for _ in range(min(self.pool_size, 5)):
-                conn = self._create_connection()
-                if conn:
-                    self._connection_queue.put(conn)
-
-            self._initialized = True
-
-    def _create_connection(self):
-        """Create a new database connection."""
-        try:
-            import psycopg2
-            return psycopg2.connect(
-                host=DB_HOST,
-                port=DB_PORT,
-                dbname=DB_NAME,
-                user=DB_USER,
-                password=DB_PASSWORD,
-            )
-        except Exception as e:
-            print(f"Warning: Could not create database connection: {e}")
-            return None
+        manager = get_pool_manager()
+        if manager.get_stats().get("status") == "not_initialized":
+            manager.initialize_pool(max_size=self.pool_size)
+        self._initialized = True
 
     @contextmanager
     def get_connection(self, timeout: float = 30.0):
@@ -79,37 +44,13 @@ class DatabaseConnectionPool:
         Yields:
             Database connection
         """
-        conn = None
-        try:
-            # Try to get from pool
-            try:
-                conn = self._connection_queue.get(timeout=timeout)
-            except queue.Empty:
-                # Pool exhausted, create new connection
-                conn = self._create_connection()
-                if conn is None:
-                    raise RuntimeError("Could not create database connection")
-
+        with get_pool_manager().get_pool().connection(timeout=timeout) as conn:
             yield conn
 
-        finally:
-            if conn:
-                try:
-                    # Return to pool
-                    if not self._connection_queue.full():
-                        self._connection_queue.put(conn)
-                except Exception:
-                    # Connection broken, discard
-                    pass
-
     def close_all(self):
         """Close all connections in the pool."""
-        while not self._connection_queue.empty():
-            try:
-                conn = self._connection_queue.get_nowait()
-                conn.close()
-            except Exception:
-                pass
+        get_pool_manager().close_pool()
+        self._initialized = False
 
 
 # Global connection pool instance
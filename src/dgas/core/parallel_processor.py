@@ -127,6 +127,11 @@ def run_backtest_batch_subprocess(
     This is the worker function that runs in a separate process.
     It uses subprocess to call the dgas CLI command.
 
+    Each batch re-imports the package and re-reads its bars from the
+    database. :class:`dgas.backtesting.SharedMemoryBacktestRunner` (or
+    ``dgas backtest --workers N``) runs the same backtests in-process from one
+    shared copy of the bars instead.
+
     Args:
         batch_num: Batch number (1-indexed)
         symbols: List of symbols to process
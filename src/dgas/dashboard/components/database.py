@@ -436,8 +436,8 @@ def fetch_system_status() -> Dict[str, Any]:
             
             settings = load_settings()
             if settings.data_collection and settings.data_collection.use_websocket:
-                service = DataCollectionService(settings.data_collection)
-                ws_status = service.get_websocket_status()
+                with DataCollectionService(settings.data_collection) as service:
+                    ws_status = service.get_websocket_status()
                 if ws_status:
                     status["websocket"] = {
                         "enabled": True,
@@ -13,6 +13,8 @@ from typing import Any, Callable, Dict, Optional
 
 import streamlit as st
 
+from dgas.calculations.profiler import get_calculation_profiler
+
 logger = logging.getLogger(__name__)
 
 
@@ -459,6 +461,25 @@ def render_performance_panel() -> None:
     with col3:
         st.metric("Utilization", f"{cache_stats['utilization']*100:.1f}%")
 
+    # Calculation and query caches
+    st.markdown("**Calculation & Query Caches**")
+    st.dataframe(
+        [
+            {
+                "Cache": name,
+                "Entries": stats["size"],
+                "Hits": stats["hits"],
+                "Misses": stats["misses"],
+                "Hit Rate": f"{stats['hit_rate_percent']:.1f}%",
+                "Evictions": stats["evictions"],
+                "Memory (MB)": round(stats["bytes"] / 1e6, 2),
+                "Budget (MB)": round(stats["max_bytes"] / 1e6, 1) if stats["max_bytes"] else None,
+            }
+            for name, stats in get_calculation_profiler().get_cache_stats().items()
+        ],
+        use_container_width=True,
+    )
+
     # Cache actions
     if st.button("Clear Cache"):
         cache.clear()
@@ -1,11 +1,13 @@
 """Data access utilities for EODHD and local storage."""
 
+from .bars import BarArray
 from .client import EODHDClient, EODHDConfig
 from .ingestion import IngestionSummary, backfill_intraday, backfill_many, incremental_update_intraday
 from .models import IntervalData
 from .quality import DataQualityReport, analyze_intervals
 
 __all__ = [
+    "BarArray",
     "EODHDClient",
     "EODHDConfig",
     "IntervalData",
@@ -0,0 +1,350 @@
+"""Asyncio client for the EODHD API.
+
+:class:`AsyncEODHDClient` mirrors the fetch methods of
+:class:`~dgas.data.client.EODHDClient` but never blocks the calling thread:
+
+- requests go through an ``httpx.AsyncClient``, which keeps connections
+  alive and handles proxies from the environment, redirects, compression
+  and chunked bodies; install it with the ``async`` extra
+  (``pip install drummond-geometry[async]``);
+- an :class:`~dgas.data.rate_limiter.AsyncRateLimiter` spaces requests to the
+  per-minute budget and ``max_in_flight`` bounds concurrent requests, which
+  is also the number of pooled connections;
+- response bodies are capped at ``max_response_bytes`` and parsed straight
+  into :class:`~dgas.data.bars.BarArray` columns, without building an
+  ``IntervalData`` model per bar.
+
+Many symbols can be fetched at once with :meth:`AsyncEODHDClient.fetch_intraday_many`;
+synchronous callers (the collection service, backfill scripts) can drive it
+with ``asyncio.run``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+from urllib.parse import quote
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    # httpx not installed; AsyncEODHDClient raises when constructed
+    httpx = None  # type: ignore[assignment]
+    HTTPX_AVAILABLE = False
+
+from .bars import BarArray
+from .client import (
+    LIVE_BULK_MAX_SYMBOLS,
+    EODHDConfig,
+    _api_symbol,
+    _coerce_date_param,
+    _coerce_time_param,
+    _group_live_records,
+)
+from .errors import (
+    EODHDAuthError,
+    EODHDError,
+    EODHDParsingError,
+    EODHDRateLimitError,
+    EODHDRequestError,
+)
+from .rate_limiter import AsyncRateLimiter
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 8
+# A full 50,000-bar intraday response is a few MB of JSON
+DEFAULT_MAX_RESPONSE_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class _Response:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.body)
+        except ValueError as exc:
+            raise EODHDParsingError(f"invalid JSON in EODHD response: {exc}") from exc
+
+
+def _check_native_interval(interval: str) -> None:
+    if interval not in ["1m", "5m", "1h"]:
+        raise ValueError(
+            f"Unsupported interval: {interval}. EODHD API only supports 1m, 5m, and 1h. "
+            f"For 30m intervals, fetch 5m data and aggregate at the consumption layer."
+        )
+
+
+class AsyncEODHDClient:
+    """Asyncio client for retrieving data from EODHD as columnar bars.
+
+    Use as an async context manager, or call :meth:`aclose` when done. The
+    connection pool and semaphore bind to the event loop of first use, so one
+    instance serves one loop.
+    """
+
+    def __init__(
+        self,
+        config: EODHDConfig,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        rate_limiter: AsyncRateLimiter | None = None,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    ) -> None:
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "AsyncEODHDClient requires httpx; install drummond-geometry[async]"
+            )
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        if max_response_bytes <= 0:
+            raise ValueError("max_response_bytes must be positive")
+        self._config = config
+        self._max_response_bytes = max_response_bytes
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._http = httpx.AsyncClient(
+            base_url=config.base_url.rstrip("/") + "/",
+            headers={"Accept": "application/json"},
+            timeout=config.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_in_flight, max_keepalive_connections=max_in_flight
+            ),
+        )
+        self._rate_limiter = rate_limiter or AsyncRateLimiter(config.requests_per_minute, 60.0)
+
+    async def __aenter__(self) -> "AsyncEODHDClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def fetch_intraday(
+        self,
+        symbol: str,
+        start: str | None = None,
+        end: str | None = None,
+        interval: str = "5m",
+        limit: int = 50000,
+        exchange: str = "US",
+    ) -> BarArray:
+        """Fetch intraday bars (1m, 5m or 1h) like :meth:`EODHDClient.fetch_intraday`."""
+        _check_native_interval(interval)
+        params: Dict[str, Any] = {
+            "api_token": self._config.api_token,
+            "fmt": "json",
+            "interval": interval,
+            "limit": limit,
+        }
+        if start is not None:
+            params["from"] = _coerce_time_param(start)
+        if end is not None:
+            params["to"] = _coerce_time_param(end)
+
+        payload = await self._request(f"intraday/{_api_symbol(symbol, exchange)}", params)
+        if not isinstance(payload, list):
+            raise EODHDParsingError("unexpected response format from intraday endpoint")
+        return BarArray.from_api_records(payload, symbol=symbol, interval=interval)
+
+    async def fetch_eod(
+        self,
+        symbol: str,
+        start: str | None = None,
+        end: str | None = None,
+        exchange: str = "US",
+    ) -> BarArray:
+        """Fetch daily bars like :meth:`EODHDClient.fetch_eod`."""
+        params: Dict[str, Any] = {
+            "api_token": self._config.api_token,
+            "fmt": "json",
+        }
+        if start is not None:
+            params["from"] = _coerce_date_param(start)
+        if end is not None:
+            params["to"] = _coerce_date_param(end)
+
+        payload = await self._request(f"eod/{_api_symbol(symbol, exchange)}", params)
+        if not isinstance(payload, list):
+            raise EODHDParsingError("unexpected response format from eod endpoint")
+        return BarArray.from_api_records(payload, symbol=symbol, interval="1d")
+
+    async def fetch_live_ohlcv(
+        self,
+        symbol: str,
+        interval: str = "5m",
+        exchange: str = "US",
+    ) -> BarArray:
+        """Fetch today's realtime bars like :meth:`EODHDClient.fetch_live_ohlcv`."""
+        _check_native_interval(interval)
+        params: Dict[str, Any] = {
+            "api_token": self._config.api_token,
+            "fmt": "json",
+            "interval": interval,
+        }
+
+        payload = await self._request(f"real-time/{_api_symbol(symbol, exchange)}", params)
+        # Realtime endpoint may return single object or list
+        if isinstance(payload, dict):
+            payload = [payload]
+        elif not isinstance(payload, list):
+            raise EODHDParsingError("unexpected response format from realtime endpoint")
+        return BarArray.from_api_records(payload, symbol=symbol, interval=interval)
+
+    async def fetch_live_ohlcv_bulk(
+        self,
+        symbols: Sequence[str],
+        interval: str = "5m",
+        exchange: str = "US",
+    ) -> Dict[str, BarArray]:
+        """Fetch realtime bars for up to ``LIVE_BULK_MAX_SYMBOLS`` symbols in one request.
+
+        See :meth:`EODHDClient.fetch_live_ohlcv_bulk`.
+        """
+        _check_native_interval(interval)
+        if not symbols:
+            return {}
+        if len(symbols) > LIVE_BULK_MAX_SYMBOLS:
+            raise ValueError(
+                f"At most {LIVE_BULK_MAX_SYMBOLS} symbols per bulk realtime request, "
+                f"got {len(symbols)}"
+            )
+
+        api_symbols = {_api_symbol(symbol, exchange).upper(): symbol for symbol in symbols}
+        first, *others = api_symbols
+        params: Dict[str, Any] = {
+            "api_token": self._config.api_token,
+            "fmt": "json",
+            "interval": interval,
+        }
+        if others:
+            params["s"] = ",".join(others)
+
+        payload = await self._request(f"real-time/{first}", params)
+        return {
+            symbol: BarArray.from_api_records(records, symbol=symbol, interval=interval)
+            for symbol, records in _group_live_records(payload, api_symbols).items()
+        }
+
+    async def fetch_intraday_many(
+        self,
+        symbols: Sequence[str],
+        start: str | None = None,
+        end: str | None = None,
+        interval: str = "5m",
+        exchange: str = "US",
+    ) -> Dict[str, BarArray | EODHDError]:
+        """Fetch intraday bars for many symbols concurrently.
+
+        Requests run up to ``max_in_flight`` at a time within the rate limit.
+        A symbol whose request fails maps to its :class:`EODHDError` instead of
+        failing the whole call.
+        """
+
+        async def fetch(symbol: str) -> Tuple[str, BarArray | EODHDError]:
+            try:
+                bars = await self.fetch_intraday(symbol, start, end, interval, exchange=exchange)
+            except EODHDError as exc:
+                return symbol, exc
+            return symbol, bars
+
+        return dict(await asyncio.gather(*(fetch(symbol) for symbol in symbols)))
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> _Response:
+        """Send one GET, reading at most ``max_response_bytes`` of decoded body."""
+        async with self._slots:
+            async with self._http.stream("GET", url, params=params) as response:
+                declared = response.headers.get("content-length")
+                if declared is not None and declared.isdigit():
+                    self._check_size(int(declared))
+                parts: List[bytes] = []
+                size = 0
+                async for part in response.aiter_bytes():
+                    size += len(part)
+                    self._check_size(size)
+                    parts.append(part)
+                return _Response(
+                    status=response.status_code,
+                    headers=dict(response.headers),
+                    body=b"".join(parts),
+                )
+
+    def _check_size(self, size: int) -> None:
+        if size > self._max_response_bytes:
+            raise EODHDRequestError(
+                f"EODHD response exceeds the {self._max_response_bytes} byte limit"
+            )
+
+    async def _request(self, path: str, params: Dict[str, Any]) -> Any:
+        url = quote(path.lstrip("/"))
+        backoff = 1.0
+
+        for attempt in range(1, self._config.max_retries + 1):
+            await self._rate_limiter.acquire()
+            try:
+                response = await self._get(url, params)
+            except httpx.TransportError as exc:
+                LOGGER.warning(
+                    "Network error contacting EODHD (attempt %s/%s): %r",
+                    attempt,
+                    self._config.max_retries,
+                    exc,
+                )
+                if attempt == self._config.max_retries:
+                    raise EODHDRequestError(f"request failed after retries: {exc!r}") from exc
+                await asyncio.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if response.status == 200:
+                return response.json()
+
+            if response.status == 401:
+                raise EODHDAuthError("EODHD API authentication failed")
+
+            if response.status == 429:
+                retry_after = response.headers.get("retry-after")
+                wait_seconds = float(retry_after) if retry_after else backoff
+                LOGGER.warning("Rate limited by EODHD, sleeping for %.2f seconds", wait_seconds)
+                if attempt == self._config.max_retries:
+                    raise EODHDRateLimitError("rate limited after maximum retries")
+                await asyncio.sleep(wait_seconds)
+                backoff = min(backoff * 2, 60)
+                continue
+
+            if 500 <= response.status < 600:
+                if attempt == self._config.max_retries:
+                    raise EODHDRequestError(f"EODHD server error ({response.status}) after retries")
+                LOGGER.warning(
+                    "EODHD server error %s on %s (attempt %s/%s)",
+                    response.status,
+                    path,
+                    attempt,
+                    self._config.max_retries,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+
+            raise EODHDRequestError(
+                f"Unexpected EODHD response: {response.status} - {response.text[:200]}"
+            )
+
+        raise EODHDError("Exhausted retries without success")
+
+
+__all__ = ["AsyncEODHDClient", "DEFAULT_MAX_IN_FLIGHT", "DEFAULT_MAX_RESPONSE_BYTES"]
@@ -0,0 +1,370 @@
+"""Parallel, resumable historical backfill.
+
+:func:`backfill_universe` backfills many symbols over one date range:
+
+* each symbol's range is split into chunks no longer than one EODHD request
+  may span (:data:`DEFAULT_CHUNK_DAYS`),
+* chunks of all symbols run on worker threads that share one client, so the
+  client's rate limiter keeps the whole run inside the per-minute budget,
+* every finished chunk is stored and checkpointed in ``backfill_status``:
+  ``completed_through`` is the end of the contiguous run of finished chunks
+  from the start of the range, so a rerun over the same range skips them.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import requests
+from psycopg import Connection
+from requests.adapters import HTTPAdapter
+
+from ..db import get_connection
+from .client import EODHDClient, EODHDConfig
+from .errors import EODHDRequestError
+from .ingestion import fetch_intraday_backfill
+from .repository import bulk_upsert_market_data, ensure_symbols_bulk
+
+LOGGER = logging.getLogger(__name__)
+
+# Longest range EODHD serves in one intraday request, per interval
+DEFAULT_CHUNK_DAYS: Dict[str, int] = {
+    "1m": 120,
+    "5m": 600,
+    "1h": 7200,
+}
+
+DEFAULT_BACKFILL_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class BackfillCheckpoint:
+    """A symbol's row in ``backfill_status``."""
+
+    status: str
+    start_date: Optional[date]
+    end_date: Optional[date]
+    completed_through: Optional[date]
+    bars_fetched: int = 0
+    bars_stored: int = 0
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of backfilling one symbol."""
+
+    symbol: str
+    interval: str
+    status: str = "pending"
+    chunks_total: int = 0
+    chunks_done: int = 0
+    chunks_skipped: int = 0
+    bars_fetched: int = 0
+    bars_stored: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("completed", "skipped")
+
+
+def plan_chunks(start: date, end: date, chunk_days: int) -> List[Tuple[date, date]]:
+    """Split ``start..end`` (inclusive) into consecutive ranges of at most ``chunk_days`` days."""
+    if chunk_days <= 0:
+        raise ValueError("chunk_days must be positive")
+    chunks: List[Tuple[date, date]] = []
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def load_backfill_checkpoints(
+    conn: Connection,
+    symbols: Sequence[str],
+    interval: str,
+) -> Dict[str, BackfillCheckpoint]:
+    """Return the ``backfill_status`` rows of ``symbols`` at ``interval``."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT symbol, status, start_date, end_date, completed_through,
+                   bars_fetched, bars_stored
+            FROM backfill_status
+            WHERE interval = %s AND symbol = ANY(%s);
+            """,
+            (interval, list(symbols)),
+        )
+        rows = cur.fetchall()
+    return {
+        symbol: BackfillCheckpoint(status, start, end, through, fetched or 0, stored or 0)
+        for symbol, status, start, end, through, fetched, stored in rows
+    }
+
+
+def save_backfill_checkpoint(
+    conn: Connection,
+    symbol: str,
+    interval: str,
+    checkpoint: BackfillCheckpoint,
+    *,
+    error_message: Optional[str] = None,
+) -> None:
+    """Insert or replace a symbol's ``backfill_status`` row."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO backfill_status (
+                symbol, interval, status, start_date, end_date, completed_through,
+                bars_fetched, bars_stored, error_message, last_attempt, completed_at
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(),
+                    CASE WHEN %s = 'completed' THEN NOW() END)
+            ON CONFLICT (symbol, interval) DO UPDATE SET
+                status = EXCLUDED.status,
+                start_date = EXCLUDED.start_date,
+                end_date = EXCLUDED.end_date,
+                completed_through = EXCLUDED.completed_through,
+                bars_fetched = EXCLUDED.bars_fetched,
+                bars_stored = EXCLUDED.bars_stored,
+                error_message = EXCLUDED.error_message,
+                last_attempt = EXCLUDED.last_attempt,
+                completed_at = EXCLUDED.completed_at,
+                updated_at = NOW();
+            """,
+            (
+                symbol,
+                interval,
+                checkpoint.status,
+                checkpoint.start_date,
+                checkpoint.end_date,
+                checkpoint.completed_through,
+                checkpoint.bars_fetched,
+                checkpoint.bars_stored,
+                error_message,
+                checkpoint.status,
+            ),
+        )
+
+
+def _make_client(workers: int) -> EODHDClient:
+    """Client whose session keeps one pooled connection per worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return EODHDClient(replace(EODHDConfig.from_settings(), session=session))
+
+
+def _backfill_chunk(
+    api: EODHDClient,
+    symbol: str,
+    symbol_id: int,
+    exchange: str,
+    interval: str,
+    start: date,
+    end: date,
+) -> Tuple[int, int]:
+    """Fetch and store one chunk; returns ``(fetched, stored)``."""
+    if interval == "1d":
+        bars = api.fetch_eod(
+            symbol, start=start.isoformat(), end=end.isoformat(), exchange=exchange
+        )
+    else:
+        bars = fetch_intraday_backfill(
+            symbol,
+            exchange=exchange,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            interval=interval,
+            api=api,
+            use_live_for_today=False,
+        )
+    stored = 0
+    if bars:
+        with get_connection() as conn:
+            stored = bulk_upsert_market_data(conn, symbol_id, interval, bars)
+    return len(bars), stored
+
+
+def backfill_universe(
+    symbols: Sequence[Tuple[str, str]],
+    *,
+    start_date: str,
+    end_date: str,
+    interval: str = "5m",
+    workers: int = DEFAULT_BACKFILL_WORKERS,
+    chunk_days: Optional[int] = None,
+    resume: bool = True,
+    client: EODHDClient | None = None,
+) -> List[BackfillResult]:
+    """
+    Backfill ``(symbol, exchange)`` pairs over ``start_date..end_date`` concurrently.
+
+    Args:
+        symbols: Symbols to backfill with their exchange codes
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD, inclusive)
+        interval: Native API interval (1m, 5m, 1h) or 1d for end-of-day bars
+        workers: Chunks in flight at once
+        chunk_days: Days per request (default: :data:`DEFAULT_CHUNK_DAYS`, whole range for 1d)
+        resume: Skip chunks checkpointed by an earlier run over the same range
+        client: Optional EODHD client; its rate limiter is shared by all workers
+
+    Returns:
+        One :class:`BackfillResult` per symbol, in input order. Failures are
+        reported per symbol instead of aborting the run.
+    """
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    if chunk_days is None:
+        chunk_days = DEFAULT_CHUNK_DAYS.get(interval, (end - start).days + 1)
+    chunks = plan_chunks(start, end, chunk_days)
+    exchanges = dict(symbols)
+
+    results = {
+        symbol: BackfillResult(symbol, interval, chunks_total=len(chunks))
+        for symbol in exchanges
+    }
+    if not results or not chunks:
+        return list(results.values())
+
+    with get_connection() as conn:
+        checkpoints = load_backfill_checkpoints(conn, list(exchanges), interval) if resume else {}
+        symbol_ids = ensure_symbols_bulk(conn, exchanges.items())
+
+    # Finished chunk indexes per symbol, and how many of them run unbroken from the first chunk
+    done: Dict[str, Set[int]] = {symbol: set() for symbol in results}
+    contiguous: Dict[str, int] = {symbol: 0 for symbol in results}
+    pending: List[Tuple[str, int]] = []
+    for symbol, result in results.items():
+        saved = checkpoints.get(symbol)
+        if saved is not None and (saved.start_date, saved.end_date) == (start, end):
+            if saved.completed_through is not None:
+                contiguous[symbol] = sum(
+                    1 for _, chunk_end in chunks if chunk_end <= saved.completed_through
+                )
+                result.bars_fetched = saved.bars_fetched
+                result.bars_stored = saved.bars_stored
+            if saved.status in ("completed", "skipped") or contiguous[symbol] == len(chunks):
+                result.status = "skipped" if saved.status == "skipped" else "completed"
+                result.chunks_skipped = len(chunks)
+                continue
+            result.chunks_skipped = contiguous[symbol]
+        result.status = "in_progress"
+        pending.extend((symbol, index) for index in range(contiguous[symbol], len(chunks)))
+
+    LOGGER.info(
+        "Backfilling %s symbols (%s): %s chunks of up to %s days, %s already done, %s workers",
+        len(results),
+        interval,
+        len(pending),
+        chunk_days,
+        sum(result.chunks_skipped for result in results.values()),
+        workers,
+    )
+
+    def save_progress(result: BackfillResult, error_message: Optional[str] = None) -> None:
+        finished = contiguous[result.symbol]
+        through = chunks[finished - 1][1] if finished else None
+        with get_connection() as conn:
+            save_backfill_checkpoint(
+                conn,
+                result.symbol,
+                interval,
+                BackfillCheckpoint(
+                    status=result.status,
+                    start_date=start,
+                    end_date=end,
+                    completed_through=through,
+                    bars_fetched=result.bars_fetched,
+                    bars_stored=result.bars_stored,
+                ),
+                error_message=error_message,
+            )
+
+    owned_client = client is None
+    api = client or _make_client(workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures: Dict[Future[Tuple[int, int]], Tuple[str, int]] = {
+                executor.submit(
+                    _backfill_chunk,
+                    api,
+                    symbol,
+                    symbol_ids[symbol],
+                    exchanges[symbol],
+                    interval,
+                    *chunks[index],
+                ): (symbol, index)
+                for symbol, index in pending
+            }
+
+            def cancel_chunks(symbol: str) -> None:
+                for other, (other_symbol, _) in futures.items():
+                    if other_symbol == symbol:
+                        other.cancel()
+
+            for future in as_completed(futures):
+                symbol, index = futures[future]
+                result = results[symbol]
+                if result.status in ("skipped", "failed"):
+                    continue
+                try:
+                    fetched, stored = future.result()
+                except EODHDRequestError as exc:
+                    if "404" in str(exc) or "Ticker Not Found" in str(exc):
+                        LOGGER.warning("%s: invalid ticker (404), skipping", symbol)
+                        result.status = "skipped"
+                    else:
+                        LOGGER.error("%s: chunk %s failed: %s", symbol, chunks[index], exc)
+                        result.status = "failed"
+                    # Stop spending API budget on the symbol's remaining chunks
+                    cancel_chunks(symbol)
+                    result.error = str(exc)
+                    save_progress(result, result.error)
+                    continue
+                except Exception as exc:
+                    LOGGER.error(
+                        "%s: chunk %s failed: %s", symbol, chunks[index], exc, exc_info=True
+                    )
+                    result.status = "failed"
+                    cancel_chunks(symbol)
+                    result.error = str(exc)
+                    save_progress(result, result.error)
+                    continue
+
+                result.chunks_done += 1
+                result.bars_fetched += fetched
+                result.bars_stored += stored
+                done[symbol].add(index)
+                while contiguous[symbol] in done[symbol]:
+                    contiguous[symbol] += 1
+                if contiguous[symbol] == len(chunks):
+                    result.status = "completed"
+                save_progress(result, result.error)
+    finally:
+        if owned_client:
+            api.close()
+
+    completed = sum(1 for result in results.values() if result.status == "completed")
+    LOGGER.info("Backfill finished: %s/%s symbols completed", completed, len(results))
+    return list(results.values())
+
+
+__all__ = [
+    "DEFAULT_BACKFILL_WORKERS",
+    "DEFAULT_CHUNK_DAYS",
+    "BackfillCheckpoint",
+    "BackfillResult",
+    "backfill_universe",
+    "load_backfill_checkpoints",
+    "plan_chunks",
+    "save_backfill_checkpoint",
+]
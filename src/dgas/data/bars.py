@@ -0,0 +1,431 @@
+"""Columnar OHLCV container for the calculation hot path.
+
+:class:`~dgas.data.models.IntervalData` is convenient at the API and database
+boundary, but every calculator converts lists of these pydantic models back
+into floats or a DataFrame on each call. :class:`BarArray` stores the same bars
+as contiguous NumPy columns (``float64`` prices, ``int64`` volume and
+``datetime64[us]`` UTC timestamps) so calculators can work on them directly.
+
+Prices are held as binary floats. Where a calculation needs the original
+``Decimal`` values (state and pattern comparisons against PLdot), they are
+rebuilt with ``Decimal(str(value))``, which round-trips any price stored with
+up to 15 significant digits.
+
+Every array carries a content :attr:`BarArray.fingerprint` (see
+:class:`BarFingerprint`) that calculation caches use as part of their keys.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union, overload
+
+import numpy as np
+import pandas as pd
+
+from .models import IntervalData
+
+LOGGER = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+
+# One hashed row: epoch microseconds, open, high, low, close, volume
+_ROW_STRUCT = struct.Struct("<qddddq")
+_ROW_DTYPE = np.dtype(
+    [("timestamp", "<i8"), ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"), ("volume", "<i8")]
+)
+_FINGERPRINT_DIGEST_SIZE = 16
+
+
+def _to_epoch_us(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class BarFingerprint:
+    """Rolling content hash of a chronological bar stream.
+
+    Rows are fed to BLAKE2b as packed little-endian ``(timestamp, open, high,
+    low, close, volume)`` records, so appending bars only hashes the new rows
+    and the same bars give the same digest whether they arrive as a
+    :class:`BarArray` or one :class:`IntervalData` at a time. Any change to
+    any bar, including one in the middle of the window, changes the digest.
+    Symbol and interval are not part of the hash.
+    """
+
+    __slots__ = ("_hash", "count")
+
+    def __init__(self) -> None:
+        self._hash = hashlib.blake2b(digest_size=_FINGERPRINT_DIGEST_SIZE)
+        self.count = 0
+
+    def copy(self) -> "BarFingerprint":
+        clone = BarFingerprint.__new__(BarFingerprint)
+        clone._hash = self._hash.copy()
+        clone.count = self.count
+        return clone
+
+    def update(self, bars: "BarSource") -> None:
+        """Append ``bars`` to the hashed stream."""
+        if isinstance(bars, BarArray):
+            self._hash.update(bars._packed_rows())
+            self.count += len(bars)
+            return
+        for bar in bars:
+            self.update_bar(bar)
+
+    def update_bar(self, bar: IntervalData) -> None:
+        """Append one bar to the hashed stream."""
+        self._hash.update(
+            _ROW_STRUCT.pack(
+                _to_epoch_us(bar.timestamp),
+                float(bar.open),
+                float(bar.high),
+                float(bar.low),
+                float(bar.close),
+                int(bar.volume or 0),
+            )
+        )
+        self.count += 1
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+@dataclass(frozen=True, eq=False)
+class BarArray:
+    """Chronological OHLCV bars for one symbol and interval stored column-wise.
+
+    Indexing with an integer returns an :class:`IntervalData` view of that row,
+    slicing returns another ``BarArray`` and iterating yields ``IntervalData``
+    rows, so code that has not been ported yet keeps working unchanged.
+    """
+
+    symbol: str
+    interval: str
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "timestamp", np.ascontiguousarray(self.timestamp, dtype="datetime64[us]"))
+        for name in _PRICE_COLUMNS:
+            object.__setattr__(self, name, np.ascontiguousarray(getattr(self, name), dtype=np.float64))
+        object.__setattr__(self, "volume", np.ascontiguousarray(self.volume, dtype=np.int64))
+
+        size = len(self.timestamp)
+        for name in (*_PRICE_COLUMNS, "volume"):
+            if len(getattr(self, name)) != size:
+                raise ValueError(f"column '{name}' has {len(getattr(self, name))} rows, expected {size}")
+
+    @classmethod
+    def empty(cls, symbol: str, interval: str) -> "BarArray":
+        """Return a zero-length array."""
+        return cls.from_rows([], symbol=symbol, interval=interval)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Sequence[Any]],
+        *,
+        symbol: str,
+        interval: str,
+    ) -> "BarArray":
+        """Build an array from ``(timestamp, open, high, low, close, volume)`` rows.
+
+        Prices may be ``Decimal``, ``float`` or anything ``float()`` accepts;
+        ``None`` volumes are stored as zero.
+        """
+        size = len(rows)
+        return cls(
+            symbol=symbol,
+            interval=interval,
+            timestamp=np.fromiter((_to_epoch_us(row[0]) for row in rows), dtype=np.int64, count=size).view(
+                "datetime64[us]"
+            ),
+            open=np.fromiter((float(row[1]) for row in rows), dtype=np.float64, count=size),
+            high=np.fromiter((float(row[2]) for row in rows), dtype=np.float64, count=size),
+            low=np.fromiter((float(row[3]) for row in rows), dtype=np.float64, count=size),
+            close=np.fromiter((float(row[4]) for row in rows), dtype=np.float64, count=size),
+            volume=np.fromiter((int(row[5] or 0) for row in rows), dtype=np.int64, count=size),
+        )
+
+    @classmethod
+    def from_intervals(
+        cls,
+        intervals: Iterable[IntervalData],
+        *,
+        symbol: str | None = None,
+        interval: str | None = None,
+    ) -> "BarArray":
+        """Convert ``IntervalData`` rows, keeping their order.
+
+        ``symbol`` and ``interval`` default to those of the first row.
+        """
+        bars = list(intervals)
+        if symbol is None:
+            symbol = bars[0].symbol if bars else ""
+        if interval is None:
+            interval = bars[0].interval if bars else ""
+        rows = [(bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume) for bar in bars]
+        return cls.from_rows(rows, symbol=symbol, interval=interval)
+
+    @classmethod
+    def from_api_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        *,
+        symbol: str,
+        interval: str,
+    ) -> "BarArray":
+        """Parse EODHD JSON records straight into columns.
+
+        Accepts the same records as :meth:`IntervalData.from_api_list` and
+        skips the same ones (missing or non-numeric OHLC), without building a
+        pydantic model per bar. Epoch timestamps (seconds or milliseconds) are
+        converted exactly; date strings go through the model's parser, so
+        naive strings are read as Europe/Prague time.
+        """
+        timestamps: List[int] = []
+        columns: tuple[List[float], ...] = ([], [], [], [])
+        volumes: List[int] = []
+        skipped = 0
+
+        for record in records:
+            raw = record.get("timestamp") or record.get("datetime") or record.get("date")
+            try:
+                prices = [float(record[name]) for name in _PRICE_COLUMNS if record.get(name) is not None]
+                if len(prices) != len(_PRICE_COLUMNS):
+                    raise ValueError("missing required OHLC")
+                volume = int(record.get("volume") or 0)
+                if isinstance(raw, int):
+                    micros = raw * 1000 if raw > 10**12 else raw * 1_000_000
+                else:
+                    micros = _to_epoch_us(IntervalData._parse_timestamp_to_utc(raw))
+            except (TypeError, ValueError):
+                skipped += 1
+                continue
+            timestamps.append(micros)
+            for column, price in zip(columns, prices, strict=True):
+                column.append(price)
+            volumes.append(volume)
+
+        if skipped:
+            LOGGER.debug("Skipped %s of %s API records for %s", skipped, len(timestamps) + skipped, symbol)
+
+        return cls(
+            symbol=symbol,
+            interval=interval,
+            timestamp=np.array(timestamps, dtype=np.int64).view("datetime64[us]"),
+            open=np.asarray(columns[0], dtype=np.float64),
+            high=np.asarray(columns[1], dtype=np.float64),
+            low=np.asarray(columns[2], dtype=np.float64),
+            close=np.asarray(columns[3], dtype=np.float64),
+            volume=np.asarray(volumes, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @overload
+    def __getitem__(self, index: int) -> IntervalData: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BarArray": ...
+
+    def __getitem__(self, index: int | slice) -> IntervalData | "BarArray":
+        if isinstance(index, slice):
+            return self._take(index)
+        return self.to_intervals()[index]
+
+    def __iter__(self) -> Iterator[IntervalData]:
+        return iter(self.to_intervals())
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether timestamps are in strictly increasing order."""
+        if "is_sorted" not in self._cache:
+            self._cache["is_sorted"] = bool(np.all(self.timestamp[1:] > self.timestamp[:-1]))
+        return self._cache["is_sorted"]
+
+    @property
+    def time_range(self) -> Tuple[datetime, datetime] | None:
+        """Earliest and latest timestamps, or None for an empty array."""
+        if not len(self):
+            return None
+        micros = self.timestamp.view(np.int64)
+        return (
+            _EPOCH + timedelta(microseconds=int(micros.min())),
+            _EPOCH + timedelta(microseconds=int(micros.max())),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Hex digest of the bars' contents, computed once per array."""
+        return self._fingerprint_state().hexdigest()
+
+    def _fingerprint_state(self) -> BarFingerprint:
+        if "fingerprint" not in self._cache:
+            state = BarFingerprint()
+            state.update(self)
+            self._cache["fingerprint"] = state
+        return self._cache["fingerprint"]
+
+    def _packed_rows(self) -> bytes:
+        rows = np.empty(len(self), dtype=_ROW_DTYPE)
+        rows["timestamp"] = self.timestamp.view(np.int64)
+        for name in (*_PRICE_COLUMNS, "volume"):
+            rows[name] = getattr(self, name)
+        return rows.tobytes()
+
+    def concat(self, other: "BarArray") -> "BarArray":
+        """Return a new array with ``other``'s bars appended.
+
+        If this array's fingerprint has already been computed, the new
+        array's fingerprint is extended from it by hashing only ``other``.
+        """
+        combined = BarArray(
+            symbol=self.symbol,
+            interval=self.interval,
+            timestamp=np.concatenate([self.timestamp, other.timestamp]),
+            open=np.concatenate([self.open, other.open]),
+            high=np.concatenate([self.high, other.high]),
+            low=np.concatenate([self.low, other.low]),
+            close=np.concatenate([self.close, other.close]),
+            volume=np.concatenate([self.volume, other.volume]),
+        )
+        if "fingerprint" in self._cache:
+            state = self._cache["fingerprint"].copy()
+            state.update(other)
+            combined._cache["fingerprint"] = state
+        return combined
+
+    def sorted(self) -> "BarArray":
+        """Return the bars in chronological order (``self`` if already sorted)."""
+        if self.is_sorted:
+            return self
+        return self._take(np.argsort(self.timestamp, kind="stable"))
+
+    def datetimes(self) -> List[datetime]:
+        """Timestamps as timezone-aware UTC ``datetime`` objects."""
+        if "datetimes" not in self._cache:
+            micros = self.timestamp.view(np.int64).tolist()
+            self._cache["datetimes"] = [_EPOCH + timedelta(microseconds=value) for value in micros]
+        return self._cache["datetimes"]
+
+    def decimals(self, column: str) -> List[Decimal]:
+        """Values of a price column as ``Decimal`` (``"open"``, ``"high"``, ``"low"`` or ``"close"``)."""
+        if column not in _PRICE_COLUMNS:
+            raise ValueError(f"column must be one of {_PRICE_COLUMNS}")
+        key = f"decimal:{column}"
+        if key not in self._cache:
+            self._cache[key] = [Decimal(str(value)) for value in getattr(self, column).tolist()]
+        return self._cache[key]
+
+    def to_intervals(self) -> List[IntervalData]:
+        """Materialize the rows as ``IntervalData`` (cached)."""
+        if "intervals" not in self._cache:
+            closes = self.decimals("close")
+            self._cache["intervals"] = [
+                IntervalData.model_construct(
+                    symbol=self.symbol,
+                    exchange=None,
+                    timestamp=timestamp,
+                    interval=self.interval,
+                    open=open_price,
+                    high=high,
+                    low=low,
+                    close=close,
+                    adjusted_close=close,
+                    volume=volume,
+                )
+                for timestamp, open_price, high, low, close, volume in zip(
+                    self.datetimes(),
+                    self.decimals("open"),
+                    self.decimals("high"),
+                    self.decimals("low"),
+                    closes,
+                    self.volume.tolist(),
+                    strict=True,
+                )
+            ]
+        return self._cache["intervals"]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the columns as a DataFrame indexed by a UTC ``DatetimeIndex``."""
+        index = pd.DatetimeIndex(self.timestamp, name="timestamp").tz_localize("UTC")
+        return pd.DataFrame(
+            {
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            },
+            index=index,
+        )
+
+    def _take(self, index: slice | np.ndarray) -> "BarArray":
+        return BarArray(
+            symbol=self.symbol,
+            interval=self.interval,
+            timestamp=self.timestamp[index],
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+        )
+
+
+BarSource = Union[Sequence[IntervalData], BarArray]
+"""Anything the calculators accept as bar input."""
+
+
+def ohlc_frame(bars: BarSource) -> pd.DataFrame:
+    """Return ``high``/``low``/``close`` columns indexed and sorted by timestamp."""
+    if isinstance(bars, BarArray):
+        return bars.sorted().to_frame()[["high", "low", "close"]]
+
+    df = pd.DataFrame(
+        {
+            "timestamp": [row.timestamp for row in bars],
+            "high": [float(row.high) for row in bars],
+            "low": [float(row.low) for row in bars],
+            "close": [float(row.close) for row in bars],
+        }
+    )
+    df.sort_values("timestamp", inplace=True)
+    df.set_index("timestamp", inplace=True)
+    return df
+
+
+def fingerprint_bars(bars: BarSource) -> str:
+    """Content fingerprint of ``bars`` (cached on ``BarArray`` inputs)."""
+    if isinstance(bars, BarArray):
+        return bars.fingerprint
+    state = BarFingerprint()
+    state.update(bars)
+    return state.hexdigest()
+
+
+def close_map(bars: BarSource) -> Dict[datetime, Decimal]:
+    """Map each bar timestamp to its ``Decimal`` close."""
+    if isinstance(bars, BarArray):
+        return dict(zip(bars.datetimes(), bars.decimals("close"), strict=True))
+    return {bar.timestamp: bar.close for bar in bars}
+
+
+__all__ = ["BarArray", "BarFingerprint", "BarSource", "close_map", "fingerprint_bars", "ohlc_frame"]
@@ -6,7 +6,7 @@ import logging
 import time
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import requests
 
@@ -23,6 +23,9 @@ from .rate_limiter import RateLimiter
 
 LOGGER = logging.getLogger(__name__)
 
+# Most tickers EODHD recommends per multi-ticker real-time request (first in the path, rest in ``s=``)
+LIVE_BULK_MAX_SYMBOLS = 20
+
 
 @dataclass(frozen=True)
 class EODHDConfig:
@@ -32,6 +35,8 @@ class EODHDConfig:
     timeout: float = 30.0
     max_retries: int = 3
     session: Optional[requests.Session] = None
+    # Shared limiter so several clients draw on one per-minute budget
+    rate_limiter: Optional[RateLimiter] = None
 
     @classmethod
     def from_settings(cls, settings: Settings | None = None) -> "EODHDConfig":
@@ -50,7 +55,7 @@ class EODHDClient:
     def __init__(self, config: EODHDConfig) -> None:
         self._config = config
         self._session = config.session or requests.Session()
-        self._rate_limiter = RateLimiter(config.requests_per_minute, 60.0)
+        self._rate_limiter = config.rate_limiter or RateLimiter(config.requests_per_minute, 60.0)
 
     def close(self) -> None:
         self._session.close()
@@ -206,6 +211,52 @@ class EODHDClient:
         
         return IntervalData.from_api_list(payload, interval, symbol_override=symbol)
 
+    def fetch_live_ohlcv_bulk(
+        self,
+        symbols: Sequence[str],
+        interval: str = "5m",
+        exchange: str = "US",
+    ) -> Dict[str, List[IntervalData]]:
+        """
+        Fetch live/realtime OHLCV data for several symbols in one request.
+
+        Uses the multi-ticker form of the realtime endpoint: the first ticker
+        goes in the path and the others in the comma-separated ``s`` parameter.
+
+        Args:
+            symbols: Up to ``LIVE_BULK_MAX_SYMBOLS`` stock symbols
+            interval: Data interval (1m, 5m, 1h) - default 5m
+            exchange: Exchange code (default: "US")
+
+        Returns:
+            Mapping of every requested symbol to its bars (empty if the response had none)
+        """
+        if interval not in ["1m", "5m", "1h"]:
+            raise ValueError(
+                f"Unsupported interval: {interval}. EODHD API only supports 1m, 5m, and 1h. "
+                f"For 30m intervals, fetch 5m data and aggregate at the consumption layer."
+            )
+        if not symbols:
+            return {}
+        if len(symbols) > LIVE_BULK_MAX_SYMBOLS:
+            raise ValueError(f"At most {LIVE_BULK_MAX_SYMBOLS} symbols per bulk realtime request, got {len(symbols)}")
+
+        api_symbols = {_api_symbol(symbol, exchange).upper(): symbol for symbol in symbols}
+        first, *others = api_symbols
+        params: Dict[str, Any] = {
+            "api_token": self._config.api_token,
+            "fmt": "json",
+            "interval": interval,
+        }
+        if others:
+            params["s"] = ",".join(others)
+
+        payload = self._request(f"real-time/{first}", params)
+        return {
+            symbol: IntervalData.from_api_list(records, interval, symbol_override=symbol)
+            for symbol, records in _group_live_records(payload, api_symbols).items()
+        }
+
     def list_exchange_symbols(self, exchange: str = "US") -> List[Dict[str, Any]]:
         params: Dict[str, Any] = {
             "api_token": self._config.api_token,
@@ -294,6 +345,35 @@ class EODHDClient:
         raise EODHDError("Exhausted retries without success")
 
 
+def _api_symbol(symbol: str, exchange: str) -> str:
+    """Return the ``{SYMBOL}.{EXCHANGE}`` form EODHD expects for US stocks."""
+
+    if exchange == "US" and not symbol.endswith(".US"):
+        return f"{symbol}.US"
+    return symbol
+
+
+def _group_live_records(payload: Any, api_symbols: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Fan a (multi-ticker) realtime response out to the requested symbols by ``code``."""
+
+    # A single-ticker request returns one object instead of a list
+    if isinstance(payload, dict):
+        payload = [payload]
+    elif not isinstance(payload, list):
+        raise EODHDParsingError("unexpected response format from realtime endpoint")
+
+    grouped: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in api_symbols.values()}
+    only_symbol = next(iter(grouped)) if len(grouped) == 1 else None
+    for record in payload:
+        code = str(record.get("code") or "").upper()
+        symbol = api_symbols.get(code) or (only_symbol if not code else None)
+        if symbol is None:
+            LOGGER.debug("Ignoring realtime record for unrequested ticker %s", code)
+            continue
+        grouped[symbol].append(record)
+    return grouped
+
+
 def _coerce_time_param(value: Any) -> int:
     """Convert various input types to epoch seconds for intraday requests."""
 
@@ -327,4 +407,4 @@ def _coerce_date_param(value: Any) -> str:
     raise TypeError(f"Unsupported date parameter type: {type(value)!r}")
 
 
-__all__ = ["EODHDClient", "EODHDConfig"]
+__all__ = ["EODHDClient", "EODHDConfig", "LIVE_BULK_MAX_SYMBOLS"]
@@ -4,19 +4,40 @@ from __future__ import annotations
 
 import logging
 import time
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from ..config.schema import DataCollectionConfig
 from ..db import get_connection
 from ..settings import get_settings
-from .client import EODHDClient, EODHDConfig
+from .client import LIVE_BULK_MAX_SYMBOLS, EODHDClient, EODHDConfig
 from .errors import EODHDError, EODHDRateLimitError, EODHDRequestError
-from .ingestion import IngestionSummary, incremental_update_intraday, backfill_intraday
-from .repository import get_latest_timestamp
+from .ingestion import (
+    IngestionSummary,
+    backfill_intraday,
+    fetch_intraday_backfill,
+    fetch_intraday_update,
+    incremental_update_intraday,
+)
+from .models import IntervalData
+from .quality import DataQualityReport, analyze_intervals
+from .rate_limiter import RateLimiter
+from .repository import (
+    bulk_upsert_market_data,
+    ensure_market_symbol,
+    get_latest_timestamp,
+    get_latest_timestamps_bulk,
+)
 from .websocket_manager import WebSocketManager
 
+# Days fetched for a symbol without stored bars
+INITIAL_BACKFILL_DAYS = 90
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,9 +77,13 @@ class DataCollectionService:
         """
         self.config = config
         self._client = client
+        self._owned_client: Optional[EODHDClient] = None
         self._effective_rate_limit = int(
             config.requests_per_minute * (1.0 - config.rate_limit_buffer)
         )
+        # One per-minute budget for every request made by this service's own client,
+        # however many fetch workers share it
+        self._rate_limiter = RateLimiter(max(1, self._effective_rate_limit), 60.0)
 
         # WebSocket manager for real-time data
         self._websocket_manager: Optional[WebSocketManager] = None
@@ -74,11 +99,77 @@ class DataCollectionService:
                 )
 
     def _get_client(self) -> EODHDClient:
-        """Get or create EODHD client."""
+        """
+        Get the injected EODHD client, or the service's own shared client.
+
+        The own client is created once, draws on the service rate limiter and
+        keeps one pooled connection per fetch worker. An injected client's
+        limiter is thread-safe, so concurrent workers share its budget too.
+        """
         if self._client is not None:
             return self._client
-        eodhd_config = EODHDConfig.from_settings()
-        return EODHDClient(eodhd_config)
+        if self._owned_client is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=self.config.fetch_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            eodhd_config = replace(
+                EODHDConfig.from_settings(),
+                session=session,
+                rate_limiter=self._rate_limiter,
+            )
+            self._owned_client = EODHDClient(eodhd_config)
+        return self._owned_client
+
+    @staticmethod
+    def _fetch_live_bulk(
+        client: EODHDClient,
+        symbols: List[str],
+        interval: str,
+        exchange: str,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Dict[str, List[IntervalData]]:
+        """
+        Fetch realtime bars for symbols with one request per ``LIVE_BULK_MAX_SYMBOLS`` symbols.
+
+        Symbols of a failed request are left out, so their updates fall back
+        to a per-symbol live request.
+        """
+
+        def fetch(batch: List[str]) -> Dict[str, List[IntervalData]]:
+            try:
+                return client.fetch_live_ohlcv_bulk(batch, interval=interval, exchange=exchange)
+            except Exception as e:
+                logger.warning(f"Bulk live request for {len(batch)} symbols failed: {e}")
+                return {}
+
+        batches = [
+            symbols[i : i + LIVE_BULK_MAX_SYMBOLS] for i in range(0, len(symbols), LIVE_BULK_MAX_SYMBOLS)
+        ]
+        live: Dict[str, List[IntervalData]] = {}
+        for result in (executor.map(fetch, batches) if executor is not None else map(fetch, batches)):
+            live.update(result)
+        logger.debug(f"Fetched live bars for {len(live)}/{len(symbols)} symbols in {len(batches)} requests")
+        return live
+
+    @staticmethod
+    def _error_summary(symbol: str, interval: str, note: str) -> IngestionSummary:
+        """Summary with zero results recording why a symbol was not collected."""
+        return IngestionSummary(
+            symbol=symbol,
+            interval=interval,
+            fetched=0,
+            stored=0,
+            quality=DataQualityReport(
+                symbol=symbol,
+                interval=interval,
+                total_bars=0,
+                duplicate_count=0,
+                gap_count=0,
+                is_chronological=True,
+                notes=[note],
+            ),
+        )
 
     def collect_for_symbol(
         self,
@@ -193,6 +284,7 @@ class DataCollectionService:
         client = self._get_client()
         
         logger.info(f"Starting batch collection: {len(symbols)} symbols, interval={interval}")
+        live = self._fetch_live_bulk(client, symbols, interval, exchange)
 
         for i, symbol in enumerate(symbols):
             symbol_start_time = time.time()
@@ -238,6 +330,7 @@ class DataCollectionService:
                         buffer_days=2,
                         client=client,
                         use_live_data=True,  # Use live OHLCV for today's data
+                        live_bars=live.get(symbol),
                     )
                     logger.info(f"{symbol}: Incremental update complete - fetched={summary.fetched}, stored={summary.stored}")
                 
@@ -267,65 +360,17 @@ class DataCollectionService:
                 else:
                     # Other API errors - log and track
                     logger.error(f"Failed to collect {symbol}: {e}", exc_info=True)
-                    # Create a summary with zero results
-                    from .quality import DataQualityReport
-                    error_summary = IngestionSummary(
-                        symbol=symbol,
-                        interval=interval,
-                        fetched=0,
-                        stored=0,
-                        quality=DataQualityReport(
-                            symbol=symbol,
-                            interval=interval,
-                            total_bars=0,
-                            duplicate_count=0,
-                            gap_count=0,
-                            is_chronological=True,
-                            notes=[str(e)],
-                        ),
-                    )
+                    error_summary = self._error_summary(symbol, interval, str(e))
                     summaries.append(error_summary)
             except ValueError as e:
                 # Handle case where symbol has no existing data
                 if "No existing data" in str(e):
                     logger.warning(f"{symbol}: No existing data, skipping incremental update (needs initial backfill)")
-                    # Create a summary with zero results
-                    from .quality import DataQualityReport
-                    error_summary = IngestionSummary(
-                        symbol=symbol,
-                        interval=interval,
-                        fetched=0,
-                        stored=0,
-                        quality=DataQualityReport(
-                            symbol=symbol,
-                            interval=interval,
-                            total_bars=0,
-                            duplicate_count=0,
-                            gap_count=0,
-                            is_chronological=True,
-                            notes=["no existing data"],
-                        ),
-                    )
+                    error_summary = self._error_summary(symbol, interval, "no existing data")
                     summaries.append(error_summary)
                 else:
                     logger.error(f"Failed to collect {symbol}: {e}", exc_info=True)
-                    # Create a summary with zero results
-                    from .quality import DataQualityReport
-                    error_summary = IngestionSummary(
-                        symbol=symbol,
-                        interval=interval,
-                        fetched=0,
-                        stored=0,
-                        quality=DataQualityReport(
-                            symbol=symbol,
-                            interval=interval,
-                            total_bars=0,
-                            duplicate_count=0,
-                            gap_count=0,
-                            is_chronological=True,
-                            notes=[str(e)],
-                        ),
-                    )
+                    error_summary = self._error_summary(symbol, interval, str(e))
                     summaries.append(error_summary)
             except Exception as e:
                 symbol_duration = time.time() - symbol_start_time
@@ -333,76 +378,147 @@ class DataCollectionService:
                     f"{symbol}: Unexpected error after {symbol_duration:.2f}s: {e}", 
                     exc_info=True
                 )
-                # Continue with other symbols even if one fails
-                # Create a summary with zero results to track the failure
-                from .quality import DataQualityReport
-                error_summary = IngestionSummary(
-                    symbol=symbol,
-                    interval=interval,
-                    fetched=0,
-                    stored=0,
-                    quality=DataQualityReport(
-                        symbol=symbol,
-                        interval=interval,
-                        total_bars=0,
-                        duplicate_count=0,
-                        gap_count=0,
-                        is_chronological=True,
-                        notes=[str(e)],
-                    ),
-                )
+                # Continue with other symbols even if one fails, tracking the failure
+                error_summary = self._error_summary(symbol, interval, str(e))
                 summaries.append(error_summary)
 
         return summaries
 
-    def collect_all_symbols(
+    def _fetch_symbol(
+        self,
+        client: EODHDClient,
+        symbol: str,
+        interval: str,
+        exchange: str,
+        latest_ts: Optional[datetime],
+        live_bars: Optional[List[IntervalData]] = None,
+    ) -> tuple[List[IntervalData], int]:
+        """Fetch new bars for one symbol (worker thread side of :meth:`collect_concurrent`)."""
+        if latest_ts is None:
+            today = datetime.now(timezone.utc).date()
+            bars = fetch_intraday_backfill(
+                symbol,
+                exchange=exchange,
+                start_date=(today - timedelta(days=INITIAL_BACKFILL_DAYS)).isoformat(),
+                end_date=today.isoformat(),
+                interval=interval,
+                api=client,
+                use_live_for_today=True,
+            )
+            return bars, len(bars)
+        return fetch_intraday_update(
+            symbol,
+            latest_ts,
+            exchange=exchange,
+            interval=interval,
+            api=client,
+            buffer_days=2,
+            use_live_data=True,
+            live_bars=live_bars,
+        )
+
+    def collect_concurrent(
         self,
         symbols: List[str],
         interval: str,
         exchange: str = "US",
-    ) -> CollectionResult:
+    ) -> List[IngestionSummary]:
         """
-        Collect data for all symbols using batch processing.
+        Collect data for symbols with API fetches overlapped with database writes.
+
+        Symbol IDs and latest timestamps are loaded in one query up front.
+        ``fetch_workers`` threads then fetch symbols through one client, whose
+        rate limiter holds the per-minute budget for all of them, while this
+        thread stores each fetch as it completes. Realtime bars for symbols
+        with stored data are fetched first in multi-ticker requests.
 
         Args:
-            symbols: List of all symbols to collect
+            symbols: List of stock symbols
             interval: Data interval
             exchange: Exchange code
 
         Returns:
-            CollectionResult with overall statistics
+            List of IngestionSummary results in completion order (invalid tickers skipped)
         """
-        # Filter out invalid symbols (evaluation symbols, etc.)
-        # These typically end with _EVAL or are synthetic symbols
-        valid_symbols = [
-            s for s in symbols
-            if not (s.endswith("_EVAL") or s.startswith("SP500_") or s.startswith("NASDAQ_"))
-        ]
-        skipped_count = len(symbols) - len(valid_symbols)
-        if skipped_count > 0:
-            skipped = [s for s in symbols if s not in valid_symbols]
-            logger.info(
-                f"Filtered out {skipped_count} invalid symbols: {', '.join(skipped[:5])}"
-                + (f" and {len(skipped) - 5} more" if len(skipped) > 5 else "")
-            )
-        
-        start_time = time.time()
+        if not symbols:
+            return []
+
+        with get_connection() as conn:
+            known = get_latest_timestamps_bulk(conn, symbols, interval)
+            for symbol in symbols:
+                if symbol not in known:
+                    known[symbol] = (ensure_market_symbol(conn, symbol, exchange), None)
+
+        client = self._get_client()
+        summaries: List[IngestionSummary] = []
+        logger.info(
+            f"Starting concurrent collection: {len(symbols)} symbols, interval={interval}, "
+            f"workers={self.config.fetch_workers}"
+        )
+
+        with ThreadPoolExecutor(max_workers=self.config.fetch_workers) as executor:
+            incremental = [symbol for symbol in symbols if known[symbol][1] is not None]
+            live = self._fetch_live_bulk(client, incremental, interval, exchange, executor)
+            futures = {
+                executor.submit(
+                    self._fetch_symbol, client, symbol, interval, exchange, known[symbol][1], live.get(symbol)
+                ): symbol
+                for symbol in symbols
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                symbol = futures[future]
+                try:
+                    bars, fetched = future.result()
+                    quality = analyze_intervals(bars)
+                    stored = 0
+                    if bars:
+                        with get_connection() as conn:
+                            stored = bulk_upsert_market_data(conn, known[symbol][0], interval, bars)
+                    summaries.append(
+                        IngestionSummary(
+                            symbol=symbol,
+                            interval=interval,
+                            fetched=fetched,
+                            stored=stored,
+                            quality=quality,
+                        )
+                    )
+                    if self.config.log_collection_stats:
+                        logger.debug(
+                            f"Progress: {done}/{len(symbols)} - {symbol}: fetched={fetched}, stored={stored}"
+                        )
+                except EODHDRequestError as e:
+                    error_msg = str(e)
+                    if "404" in error_msg or "Ticker Not Found" in error_msg:
+                        # Invalid symbol - skip gracefully, don't count as failure
+                        logger.warning(f"{symbol}: Invalid ticker (404) - skipping")
+                        continue
+                    logger.error(f"Failed to collect {symbol}: {e}")
+                    summaries.append(self._error_summary(symbol, interval, error_msg))
+                except Exception as e:
+                    logger.error(f"Failed to collect {symbol}: {e}", exc_info=True)
+                    summaries.append(self._error_summary(symbol, interval, str(e)))
+
+        return summaries
+
+    def _collect_batches(
+        self,
+        symbols: List[str],
+        interval: str,
+        exchange: str,
+        errors: List[str],
+    ) -> List[IngestionSummary]:
+        """Collect symbols one batch at a time with :meth:`collect_batch`."""
         all_summaries: List[IngestionSummary] = []
-        errors: List[str] = []
 
         # Split into batches
         batch_size = self.config.batch_size
         batches = [
-            valid_symbols[i : i + batch_size] for i in range(0, len(valid_symbols), batch_size)
+            symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)
         ]
 
-        logger.info(
-            f"Starting data collection: {len(valid_symbols)} symbols "
-            f"({len(symbols)} total, {skipped_count} filtered), "
-            f"{len(batches)} batches (size={batch_size}), interval={interval}"
-        )
+        logger.info(f"Collecting in {len(batches)} batches (size={batch_size}), interval={interval}")
 
-        # Process batches sequentially (for now, concurrent batches can be added later)
         batch_start_time = time.time()
         for batch_num, batch in enumerate(batches, 1):
             try:
@@ -431,10 +547,10 @@ class DataCollectionService:
                 # Log overall progress
                 total_elapsed = time.time() - batch_start_time
                 total_processed = sum(len(batches[i]) for i in range(batch_num))
-                total_remaining = len(valid_symbols) - total_processed
+                total_remaining = len(symbols) - total_processed
                 logger.info(
-                    f"Overall progress: {total_processed}/{len(valid_symbols)} symbols processed "
-                    f"({total_processed/len(valid_symbols)*100:.1f}%), "
+                    f"Overall progress: {total_processed}/{len(symbols)} symbols processed "
+                    f"({total_processed/len(symbols)*100:.1f}%), "
                     f"{total_remaining} remaining, {total_elapsed/60:.1f} minutes elapsed"
                 )
 
@@ -449,6 +565,61 @@ class DataCollectionService:
                 errors.append(error_msg)
                 # Continue with next batch
 
+        return all_summaries
+
+    def collect_all_symbols(
+        self,
+        symbols: List[str],
+        interval: str,
+        exchange: str = "US",
+    ) -> CollectionResult:
+        """
+        Collect data for all symbols.
+
+        Uses :meth:`collect_concurrent` when ``fetch_workers`` > 1, otherwise
+        sequential batches of ``batch_size`` symbols.
+
+        Args:
+            symbols: List of all symbols to collect
+            interval: Data interval
+            exchange: Exchange code
+
+        Returns:
+            CollectionResult with overall statistics
+        """
+        # Filter out invalid symbols (evaluation symbols, etc.)
+        # These typically end with _EVAL or are synthetic symbols
+        valid_symbols = [
+            s for s in symbols
+            if not (s.endswith("_EVAL") or s.startswith("SP500_") or s.startswith("NASDAQ_"))
+        ]
+        skipped_count = len(symbols) - len(valid_symbols)
+        if skipped_count > 0:
+            skipped = [s for s in symbols if s not in valid_symbols]
+            logger.info(
+                f"Filtered out {skipped_count} invalid symbols: {', '.join(skipped[:5])}"
+                + (f" and {len(skipped) - 5} more" if len(skipped) > 5 else "")
+            )
+        
+        start_time = time.time()
+        errors: List[str] = []
+
+        logger.info(
+            f"Starting data collection: {len(valid_symbols)} symbols "
+            f"({len(symbols)} total, {skipped_count} filtered), interval={interval}"
+        )
+
+        if self.config.fetch_workers > 1:
+            try:
+                all_summaries = self.collect_concurrent(valid_symbols, interval, exchange)
+            except Exception as e:
+                error_msg = f"Concurrent collection failed: {e}"
+                logger.error(error_msg, exc_info=True)
+                errors.append(error_msg)
+                all_summaries = []
+        else:
+            all_summaries = self._collect_batches(valid_symbols, interval, exchange, errors)
+
         # Calculate statistics
         execution_time_ms = int((time.time() - start_time) * 1000)
         symbols_updated = sum(1 for s in all_summaries if s.stored > 0)
@@ -489,6 +660,7 @@ class DataCollectionService:
         return {
             "enabled": self.config.enabled,
             "batch_size": self.config.batch_size,
+            "fetch_workers": self.config.fetch_workers,
             "rate_limit": self._effective_rate_limit,
             "max_retries": self.config.max_retries,
         }
@@ -622,14 +794,28 @@ class DataCollectionService:
 
         return self._websocket_manager.get_status()
 
+    def __enter__(self) -> "DataCollectionService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def close(self) -> None:
-        """Close resources (client connection and WebSocket)."""
+        """Close resources (client connections and WebSocket).
+
+        The service's own client and its pooled session are released too, so
+        callers that never injected a client must still call this (or use the
+        service as a context manager).
+        """
         # Stop WebSocket collection
         self.stop_websocket_collection()
 
         # Close REST client
         if self._client is not None:
             self._client.close()
+        if self._owned_client is not None:
+            self._owned_client.close()
+            self._owned_client = None
 
 
 __all__ = ["DataCollectionService", "CollectionResult"]
@@ -0,0 +1,126 @@
+"""In-process notifications of stored market data changes.
+
+:func:`~dgas.data.repository.upsert_market_data` announces a
+:class:`MarketDataChange` for every batch it writes, so every ingestion path
+(backfill, incremental updates, the collection service and the WebSocket
+managers) announces which ``(symbol, interval)`` changed and over which time
+range. Caches subscribe with :func:`subscribe_market_data_changes` and drop
+only the results whose input window overlaps that range.
+
+Changes are only announced once the bars are committed, so a listener that
+recomputes from the database reads the new rows. Writers queue a change on
+their connection with :func:`queue_market_data_change`;
+:func:`dgas.db.get_connection` publishes the queue after it commits and drops
+it on rollback. Code that commits a connection of its own calls
+:func:`flush_market_data_changes` after the commit.
+
+Listeners run synchronously in the publishing thread and must be cheap;
+exceptions they raise are logged and never reach the ingestion path.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Sequence
+
+from psycopg.pq import TransactionStatus
+
+from .models import IntervalData
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MarketDataChange:
+    """Bars of one symbol and interval were inserted or updated in ``[start, end]``."""
+
+    symbol: str
+    interval: str
+    start: datetime
+    end: datetime
+    bars: int
+
+    @classmethod
+    def from_bars(cls, symbol: str, interval: str, bars: Sequence[IntervalData]) -> "MarketDataChange":
+        """Describe a non-empty batch of stored bars."""
+        timestamps = [bar.timestamp for bar in bars]
+        return cls(symbol=symbol, interval=interval, start=min(timestamps), end=max(timestamps), bars=len(bars))
+
+
+MarketDataListener = Callable[[MarketDataChange], object]
+
+_listeners: List[MarketDataListener] = []
+_listeners_lock = threading.Lock()
+
+
+def subscribe_market_data_changes(listener: MarketDataListener) -> Callable[[], None]:
+    """Call ``listener`` for every published change; returns a function that unsubscribes it."""
+    with _listeners_lock:
+        _listeners.append(listener)
+
+    def unsubscribe() -> None:
+        with _listeners_lock:
+            if listener in _listeners:
+                _listeners.remove(listener)
+
+    return unsubscribe
+
+
+def publish_market_data_change(change: MarketDataChange) -> None:
+    """Notify every subscribed listener of ``change``."""
+    with _listeners_lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(change)
+        except Exception:
+            LOGGER.exception("Market data listener %r failed for %s %s", listener, change.symbol, change.interval)
+
+
+# Changes written inside a still-open transaction, per connection
+_pending: "weakref.WeakKeyDictionary[object, List[MarketDataChange]]" = weakref.WeakKeyDictionary()
+_pending_lock = threading.Lock()
+
+
+def queue_market_data_change(conn: object, change: MarketDataChange) -> None:
+    """Publish ``change`` once ``conn`` commits the transaction that wrote it.
+
+    The change is published right away when ``conn`` has no open transaction,
+    i.e. the write was already committed by autocommit.
+    """
+    info = getattr(conn, "info", None)
+    if getattr(info, "transaction_status", None) == TransactionStatus.IDLE:
+        publish_market_data_change(change)
+        return
+    with _pending_lock:
+        _pending.setdefault(conn, []).append(change)
+
+
+def flush_market_data_changes(conn: object) -> int:
+    """Publish the changes queued on ``conn`` after a commit; returns how many."""
+    with _pending_lock:
+        changes = _pending.pop(conn, [])
+    for change in changes:
+        publish_market_data_change(change)
+    return len(changes)
+
+
+def discard_market_data_changes(conn: object) -> int:
+    """Drop the changes queued on ``conn`` after a rollback; returns how many."""
+    with _pending_lock:
+        return len(_pending.pop(conn, []))
+
+
+__all__ = [
+    "MarketDataChange",
+    "MarketDataListener",
+    "discard_market_data_changes",
+    "flush_market_data_changes",
+    "publish_market_data_change",
+    "queue_market_data_change",
+    "subscribe_market_data_changes",
+]
@@ -1,11 +1,12 @@
-"""Simple token-bucket style rate limiter for synchronous clients."""
+"""Simple sliding-window rate limiters for synchronous and asyncio clients."""
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections import deque
 from threading import Lock
-from typing import Callable, Deque
+from typing import Awaitable, Callable, Deque
 
 
 class RateLimiter:
@@ -54,4 +55,45 @@ class RateLimiter:
                 continue
 
 
-__all__ = ["RateLimiter"]
+class AsyncRateLimiter:
+    """Permit at most ``max_calls`` within ``period`` seconds across asyncio tasks.
+
+    Waiting tasks sleep on the event loop instead of blocking the thread.
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: float,
+        now_func: Callable[[], float] | None = None,
+        sleep_func: Callable[[float], Awaitable[None]] | None = None,
+    ) -> None:
+        if max_calls <= 0:
+            raise ValueError("max_calls must be positive")
+        if period <= 0:
+            raise ValueError("period must be positive")
+
+        self._max_calls = max_calls
+        self._period = period
+        self._now = now_func or time.monotonic
+        self._sleep = sleep_func or asyncio.sleep
+        self._events: Deque[float] = deque()
+
+    async def acquire(self) -> None:
+        """Wait until a new call is permitted."""
+
+        while True:
+            # No await between reading and updating the window, so no lock is needed
+            now = self._now()
+
+            while self._events and now - self._events[0] >= self._period:
+                self._events.popleft()
+
+            if len(self._events) < self._max_calls:
+                self._events.append(now)
+                return
+
+            await self._sleep(self._period - (now - self._events[0]))
+
+
+__all__ = ["RateLimiter", "AsyncRateLimiter"]
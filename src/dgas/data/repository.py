@@ -3,89 +3,132 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
 from typing import Iterable, Sequence
 
+import numpy as np
 import psycopg
 from psycopg import Connection
 
+from ..settings import get_settings
+from .bars import BarArray
+from .events import MarketDataChange, queue_market_data_change
 from .models import IntervalData
 
 LOGGER = logging.getLogger(__name__)
 
 
-def _normalize_ohlc(bar: IntervalData) -> IntervalData:
+# market_data columns written by upserts, in record order
+_MARKET_DATA_COLUMNS = (
+    "symbol_id",
+    "timestamp",
+    "interval_type",
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+    "vwap",
+    "true_range",
+)
+
+_MARKET_DATA_UPSERT_CONFLICT = """
+        ON CONFLICT (symbol_id, timestamp, interval_type) DO UPDATE SET
+            open_price = EXCLUDED.open_price,
+            high_price = EXCLUDED.high_price,
+            low_price = EXCLUDED.low_price,
+            close_price = EXCLUDED.close_price,
+            volume = EXCLUDED.volume,
+            vwap = EXCLUDED.vwap,
+            true_range = EXCLUDED.true_range
+        RETURNING (xmax = 0) AS inserted
+"""
+
+
+@dataclass(frozen=True)
+class UpsertResult:
+    """Outcome of a market data upsert."""
+
+    inserted: int
+    updated: int
+    method: str  # "copy" or "executemany"
+
+    @property
+    def stored(self) -> int:
+        return self.inserted + self.updated
+
+
+def _normalized_records(
+    symbol_id: int,
+    interval: str,
+    data: Sequence[IntervalData],
+) -> list[tuple]:
     """
-    Normalize OHLC values to satisfy database constraints.
-    
+    Build ``market_data`` records with OHLC values that satisfy the database constraints.
+
     During market hours, live data may contain incomplete bars where:
     - close > high (price moved up but high hasn't updated yet)
     - close < low (price moved down but low hasn't updated yet)
-    
-    This function adjusts high/low to accommodate the close price,
-    ensuring the bar satisfies the chk_ohlc_relationships constraint.
-    
-    Args:
-        bar: IntervalData bar that may have invalid OHLC relationships
-        
-    Returns:
-        Normalized IntervalData with valid OHLC relationships
+
+    High is raised to ``max(open, high, close)`` and low lowered to
+    ``min(open, low, close)``, which also makes the range at least as wide
+    as the open-close move (chk_ohlc_relationships). The check runs on
+    float arrays and only the flagged rows are fixed, exactly, in Decimal.
+    For duplicate timestamps the last bar wins.
     """
-    open_price = bar.open
-    high_price = bar.high
-    low_price = bar.low
-    close_price = bar.close
-    
-    original_high = high_price
-    original_low = low_price
-    normalized = False
-    
-    # Adjust high to be at least as high as open and close
-    if high_price < open_price or high_price < close_price:
-        high_price = max(high_price, open_price, close_price)
-        normalized = True
-    
-    # Adjust low to be at least as low as open and close
-    if low_price > open_price or low_price > close_price:
-        low_price = min(low_price, open_price, close_price)
-        normalized = True
-    
-    # Ensure high - low >= |open - close| (range constraint)
-    # This constraint ensures the bar's range is at least as wide as the open-close movement
-    price_range = abs(open_price - close_price)
-    current_range = high_price - low_price
-    if current_range < price_range:
-        # Expand the range symmetrically around the midpoint of open and close
-        # This ensures we maintain high >= max(open, close) and low <= min(open, close)
-        midpoint = (open_price + close_price) / 2
-        half_range = price_range / 2
-        high_price = max(high_price, midpoint + half_range)
-        low_price = min(low_price, midpoint - half_range)
-        normalized = True
-    
-    # Log normalization if it occurred (debug level to avoid spam)
+    bars = list({bar.timestamp: bar for bar in data}.values())
+    opens = [bar.open for bar in bars]
+    highs = [bar.high for bar in bars]
+    lows = [bar.low for bar in bars]
+    closes = [bar.close for bar in bars]
+
+    open_f = np.array(opens, dtype=np.float64)
+    close_f = np.array(closes, dtype=np.float64)
+    # Rounding to float never reverses an order, it can only turn it into an
+    # equality, so the non-strict comparisons flag every row that needs a fix
+    flagged = np.flatnonzero(
+        (np.array(highs, dtype=np.float64) <= np.maximum(open_f, close_f))
+        | (np.array(lows, dtype=np.float64) >= np.minimum(open_f, close_f))
+    )
+
+    normalized = 0
+    for index in flagged:
+        high_price = max(highs[index], opens[index], closes[index])
+        low_price = min(lows[index], opens[index], closes[index])
+        if high_price != highs[index] or low_price != lows[index]:
+            LOGGER.debug(
+                f"{bars[index].symbol} {bars[index].timestamp}: Normalized OHLC - "
+                f"high: {highs[index]} -> {high_price}, "
+                f"low: {lows[index]} -> {low_price}"
+            )
+            highs[index] = high_price
+            lows[index] = low_price
+            normalized += 1
+
     if normalized:
-        LOGGER.debug(
-            f"{bar.symbol} {bar.timestamp}: Normalized OHLC - "
-            f"high: {original_high} -> {high_price}, "
-            f"low: {original_low} -> {low_price}"
+        LOGGER.debug(f"Normalized OHLC of {normalized} of {len(bars)} bars")
+
+    return [
+        (
+            symbol_id,
+            bar.timestamp,
+            interval,
+            open_price,
+            high_price,
+            low_price,
+            close_price,
+            bar.volume,
+            None,
+            None,
         )
-    
-    # Create new IntervalData with normalized values
-    # Since IntervalData is frozen, we need to create a new instance
-    return IntervalData(
-        symbol=bar.symbol,
-        exchange=bar.exchange,
-        timestamp=bar.timestamp,
-        interval=bar.interval,
-        open=open_price,
-        high=high_price,
-        low=low_price,
-        close=close_price,
-        adjusted_close=bar.adjusted_close,
-        volume=bar.volume,
-    )
+        for bar, open_price, high_price, low_price, close_price in zip(
+            bars, opens, highs, lows, closes, strict=True
+        )
+    ]
 
 
 def ensure_market_symbol(
@@ -150,71 +193,131 @@ def ensure_market_symbol(
         return int(row[0])
 
 
-def bulk_upsert_market_data(
+def _upsert_executemany(cur: psycopg.Cursor, records: Sequence[tuple]) -> int:
+    """Upsert row by row; returns the number of inserted rows."""
+    placeholders = ", ".join(["%s"] * len(_MARKET_DATA_COLUMNS))
+    cur.executemany(
+        f"""
+        INSERT INTO market_data ({", ".join(_MARKET_DATA_COLUMNS)})
+        VALUES ({placeholders})
+        {_MARKET_DATA_UPSERT_CONFLICT}
+        """,
+        records,
+        returning=True,
+    )
+
+    inserted = 0
+    while True:
+        row = cur.fetchone()
+        if row is not None and row[0]:
+            inserted += 1
+        if not cur.nextset():
+            break
+    return inserted
+
+
+def _upsert_copy(cur: psycopg.Cursor, records: Sequence[tuple]) -> int:
+    """COPY into a staging table and merge it in one statement; returns the number of inserted rows."""
+    columns = ", ".join(_MARKET_DATA_COLUMNS)
+    # The staging table lives until the end of the transaction, so it is
+    # emptied first in case an earlier upsert in the same transaction used it
+    cur.execute(
+        f"""
+        CREATE TEMP TABLE IF NOT EXISTS _market_data_stage ON COMMIT DROP AS
+        SELECT {columns} FROM market_data WITH NO DATA
+        """
+    )
+    cur.execute("TRUNCATE _market_data_stage")
+    with cur.copy(f"COPY _market_data_stage ({columns}) FROM STDIN") as copy:
+        for record in records:
+            copy.write_row(record)
+
+    cur.execute(
+        f"""
+        WITH upserted AS (
+            INSERT INTO market_data ({columns})
+            SELECT {columns} FROM _market_data_stage
+            {_MARKET_DATA_UPSERT_CONFLICT}
+        )
+        SELECT COUNT(*) FILTER (WHERE inserted) FROM upserted
+        """
+    )
+    row = cur.fetchone()
+    return int(row[0]) if row else 0
+
+
+def upsert_market_data(
     conn: Connection,
     symbol_id: int,
     interval: str,
     data: Sequence[IntervalData],
-) -> int:
+    *,
+    copy_threshold: int | None = None,
+) -> UpsertResult:
     """
-    Insert or update OHLCV bars for a symbol.
-    
-    Automatically normalizes OHLC values to satisfy database constraints.
-    This is especially important for live/intraday data during market hours
-    where incomplete bars may violate OHLC relationships.
+    Insert or update OHLCV bars for a symbol and report what changed.
+
+    Batches of at least ``copy_threshold`` bars (default: the
+    ``DGAS_DB_COPY_THRESHOLD`` setting) are COPYed into a temporary table
+    and merged with a single ``INSERT ... SELECT ... ON CONFLICT``; smaller
+    ones are upserted row by row, which is cheaper for a handful of bars.
+
+    OHLC values are normalized to satisfy database constraints, which is
+    especially important for live/intraday data during market hours where
+    incomplete bars may violate OHLC relationships.
+
+    Every stored batch is announced as a
+    :class:`~dgas.data.events.MarketDataChange` once ``conn`` commits (see
+    :func:`~dgas.data.events.queue_market_data_change`), so caches can drop
+    results computed from the bars it replaced.
     """
 
     if not data:
-        return 0
+        return UpsertResult(inserted=0, updated=0, method="executemany")
 
-    # Normalize OHLC values to satisfy database constraints
-    normalized_data = [_normalize_ohlc(bar) for bar in data]
+    if copy_threshold is None:
+        copy_threshold = get_settings().db_copy_threshold
 
-    records = [
-        (
-            symbol_id,
-            row.timestamp,
-            interval,
-            row.open,
-            row.high,
-            row.low,
-            row.close,
-            row.volume,
-            None,
-            None,
-        )
-        for row in normalized_data
-    ]
+    records = _normalized_records(symbol_id, interval, data)
+    use_copy = len(records) >= copy_threshold
 
-    insert_sql = """
-        INSERT INTO market_data (
-            symbol_id,
-            timestamp,
-            interval_type,
-            open_price,
-            high_price,
-            low_price,
-            close_price,
-            volume,
-            vwap,
-            true_range
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (symbol_id, timestamp, interval_type) DO UPDATE SET
-            open_price = EXCLUDED.open_price,
-            high_price = EXCLUDED.high_price,
-            low_price = EXCLUDED.low_price,
-            close_price = EXCLUDED.close_price,
-            volume = EXCLUDED.volume,
-            vwap = EXCLUDED.vwap,
-            true_range = EXCLUDED.true_range;
+    # A transaction (a savepoint inside an open one) keeps the staging table
+    # alive on autocommit connections too
+    with conn.transaction():
+        with conn.cursor() as cur:
+            if use_copy:
+                inserted = _upsert_copy(cur, records)
+            else:
+                inserted = _upsert_executemany(cur, records)
+
+    queue_market_data_change(conn, MarketDataChange.from_bars(data[0].symbol, interval, data))
+
+    return UpsertResult(
+        inserted=inserted,
+        updated=len(records) - inserted,
+        method="copy" if use_copy else "executemany",
+    )
+
+
+def bulk_upsert_market_data(
+    conn: Connection,
+    symbol_id: int,
+    interval: str,
+    data: Sequence[IntervalData],
+) -> int:
     """
+    Insert or update OHLCV bars for a symbol.
 
-    with conn.cursor() as cur:
-        cur.executemany(insert_sql, records)
+    See :func:`upsert_market_data`; this returns only the number of bars stored.
+    """
 
-    return len(records)
+    result = upsert_market_data(conn, symbol_id, interval, data)
+    if result.stored:
+        LOGGER.debug(
+            f"symbol_id={symbol_id} {interval}: {result.inserted} inserted, "
+            f"{result.updated} updated ({result.method})"
+        )
+    return result.stored
 
 
 def get_latest_timestamp(
@@ -239,6 +342,40 @@ def get_latest_timestamp(
         return row[0] if row else None
 
 
+def get_latest_timestamps_bulk(
+    conn: Connection,
+    symbols: Sequence[str],
+    interval: str,
+) -> dict[str, tuple[int, datetime | None]]:
+    """Return ``(symbol_id, latest timestamp)`` for many symbols in one query.
+
+    Symbols missing from ``market_symbols`` are absent from the result; known
+    symbols without bars at ``interval`` map to ``(symbol_id, None)``.
+    """
+
+    if not symbols:
+        return {}
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT s.symbol, s.symbol_id, latest.timestamp
+            FROM market_symbols s
+            LEFT JOIN LATERAL (
+                SELECT md.timestamp
+                FROM market_data md
+                WHERE md.symbol_id = s.symbol_id AND md.interval_type = %s
+                ORDER BY md.timestamp DESC
+                LIMIT 1
+            ) latest ON TRUE
+            WHERE s.symbol = ANY(%s);
+            """,
+            (interval, list(dict.fromkeys(symbols))),
+        )
+        rows = cur.fetchall()
+    return {symbol: (int(symbol_id), latest) for symbol, symbol_id, latest in rows}
+
+
 def ensure_symbols_bulk(
     conn: Connection,
     symbols: Iterable[tuple[str, str]],
@@ -252,14 +389,25 @@ def ensure_symbols_bulk(
 
 
 __all__ = [
+    "UpsertResult",
     "ensure_market_symbol",
     "bulk_upsert_market_data",
+    "upsert_market_data",
     "get_latest_timestamp",
+    "get_latest_timestamps_bulk",
     "ensure_symbols_bulk",
     "get_symbol_id",
 ]
 
 
+# Smaller stored interval each interval can be aggregated from when it has no bars of its own
+AGGREGATION_SOURCE_INTERVALS = {
+    "30m": "5m",   # Aggregate 5m -> 30m (6:1 ratio)
+    "1h": "5m",    # Aggregate 5m -> 1h (12:1 ratio)
+    "4h": "1h",    # Aggregate 1h -> 4h (4:1 ratio)
+}
+
+
 def get_symbol_id(conn: Connection, symbol: str) -> int | None:
     """Return the symbol_id for a given ticker if it exists."""
 
@@ -269,38 +417,52 @@ def get_symbol_id(conn: Connection, symbol: str) -> int | None:
     return int(row[0]) if row else None
 
 
-def fetch_market_data(
-    conn: Connection,
+def _bar_select_list(alias: str, *, columnar: bool) -> list[str]:
+    """SELECT list of the OHLCV fetch queries for the ``alias`` market_data rows.
+
+    The row projection feeds :func:`_rows_to_intervals`; the columnar one casts
+    every column to a fixed-width binary type so :func:`_copy_bar_columns` can
+    decode the COPY stream with a single NumPy view.
+    """
+
+    if columnar:
+        return [
+            f"    {alias}.timestamp,",
+            f"    {alias}.open_price::float8,",
+            f"    {alias}.high_price::float8,",
+            f"    {alias}.low_price::float8,",
+            f"    {alias}.close_price::float8,",
+            f"    COALESCE({alias}.volume, 0)::int8",
+        ]
+    return [
+        f"    {alias}.timestamp,",
+        f"    {alias}.open_price,",
+        f"    {alias}.high_price,",
+        f"    {alias}.low_price,",
+        f"    {alias}.close_price,",
+        f"    {alias}.volume,",
+        "    s.exchange",
+    ]
+
+
+def _market_data_query(
     symbol: str,
     interval: str,
     *,
-    start: datetime | None = None,
-    end: datetime | None = None,
-    limit: int | None = None,
-) -> list[IntervalData]:
-    """Fetch chronological OHLCV bars for a symbol and interval.
-
-    Args:
-        conn: Active psycopg connection.
-        symbol: Market symbol (e.g., "AAPL").
-        interval: Stored interval string (e.g., "30min").
-        start: Optional starting timestamp (inclusive).
-        end: Optional ending timestamp (inclusive).
-        limit: Optional maximum number of rows to return (applied after filtering).
+    start: datetime | None,
+    end: datetime | None,
+    limit: int | None,
+    columnar: bool = False,
+) -> tuple[str, list[object]]:
+    """Build the chronological OHLCV query shared by the fetch helpers.
 
-    Returns:
-        List of IntervalData sorted in ascending timestamp order.
+    ``columnar`` selects the fixed-width projection read by
+    :func:`_copy_bar_columns` instead of the ``IntervalData`` row projection.
     """
 
     base_query = [
         "SELECT",
-        "    md.timestamp,",
-        "    md.open_price,",
-        "    md.high_price,",
-        "    md.low_price,",
-        "    md.close_price,",
-        "    md.volume,",
-        "    s.exchange",
+        *_bar_select_list("md", columnar=columnar),
         "FROM market_data md",
         "JOIN market_symbols s ON s.symbol_id = md.symbol_id",
         "WHERE s.symbol = %s AND md.interval_type = %s",
@@ -322,33 +484,355 @@ def fetch_market_data(
         base_query.append("LIMIT %s")
         params.append(limit)
 
-    sql = "\n".join(base_query)
+    return "\n".join(base_query), params
 
-    with conn.cursor() as cur:
-        cur.execute(sql, params)
-        rows = cur.fetchall()
 
+def _market_data_tail_query(
+    symbol: str,
+    interval: str,
+    limit: int,
+    *,
+    start: datetime | None,
+    end: datetime | None,
+    columnar: bool = False,
+) -> tuple[str, list[object]]:
+    """Build the "latest ``limit`` bars" query shared by the tail fetch helpers.
+
+    The inner query filters on a scalar ``symbol_id`` so PostgreSQL can walk
+    ``idx_market_data_symbol_timestamp`` backwards and stop after ``limit``
+    rows; the outer query restores chronological order.
+    """
+
+    inner_query = [
+        "SELECT",
+        "    md.symbol_id,",
+        "    md.timestamp,",
+        "    md.open_price,",
+        "    md.high_price,",
+        "    md.low_price,",
+        "    md.close_price,",
+        "    md.volume",
+        "FROM market_data md",
+        "WHERE md.symbol_id = (SELECT symbol_id FROM market_symbols WHERE symbol = %s)",
+        "AND md.interval_type = %s",
+    ]
+
+    params: list[object] = [symbol, interval]
+
+    if start is not None:
+        inner_query.append("AND md.timestamp >= %s")
+        params.append(start)
+
+    if end is not None:
+        inner_query.append("AND md.timestamp <= %s")
+        params.append(end)
+
+    inner_query.append("ORDER BY md.timestamp DESC")
+    inner_query.append("LIMIT %s")
+    params.append(limit)
+
+    query = [
+        "SELECT",
+        *_bar_select_list("latest", columnar=columnar),
+        "FROM (",
+        *("    " + line for line in inner_query),
+        ") latest",
+        "JOIN market_symbols s ON s.symbol_id = latest.symbol_id",
+        "ORDER BY latest.timestamp ASC",
+    ]
+
+    return "\n".join(query), params
+
+
+def _rows_to_intervals(rows: Sequence[Sequence[object]], symbol: str, interval: str) -> list[IntervalData]:
+    """Convert ``(timestamp, open, high, low, close, volume, exchange)`` rows."""
+
+    # Rows come from typed NUMERIC/TIMESTAMPTZ columns, so the validators of
+    # IntervalData would only repeat conversions psycopg already made
     results: list[IntervalData] = []
     for row in rows:
         timestamp, open_price, high_price, low_price, close_price, volume, exchange = row
+        close = _to_decimal(close_price)
         results.append(
-            IntervalData(
+            IntervalData.model_construct(
                 symbol=symbol,
                 exchange=exchange,
-                timestamp=timestamp,
+                timestamp=timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=timezone.utc),
                 interval=interval,
-                open=Decimal(str(open_price)),
-                high=Decimal(str(high_price)),
-                low=Decimal(str(low_price)),
-                close=Decimal(str(close_price)),
-                adjusted_close=Decimal(str(close_price)),
-                volume=int(volume),
+                open=_to_decimal(open_price),
+                high=_to_decimal(high_price),
+                low=_to_decimal(low_price),
+                close=close,
+                adjusted_close=close,
+                volume=int(volume or 0),
             )
         )
 
     return results
 
 
+def _to_decimal(value: object) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+# Binary COPY framing: 11-byte signature, int32 flags, int32 extension length
+_PGCOPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_PGCOPY_HEADER_SIZE = len(_PGCOPY_SIGNATURE) + 8
+_PGCOPY_TRAILER = b"\xff\xff"
+
+# Binary TIMESTAMPTZ values count microseconds from 2000-01-01 UTC
+_PG_EPOCH_OFFSET_US = 946_684_800_000_000
+
+# Columns of the columnar projection and their big-endian wire types
+_COPY_BAR_COLUMNS = (
+    ("timestamp", ">i8"),
+    ("open", ">f8"),
+    ("high", ">f8"),
+    ("low", ">f8"),
+    ("close", ">f8"),
+    ("volume", ">i8"),
+)
+
+
+def _copy_row_dtype(columns: Sequence[tuple[str, str]]) -> np.dtype:
+    """Structured dtype of one binary COPY tuple whose fields all have a fixed width."""
+
+    fields: list[tuple[str, str]] = [("field_count", ">i2")]
+    for name, wire_type in columns:
+        fields.append((f"{name}_length", ">i4"))
+        fields.append((name, wire_type))
+    return np.dtype(fields)
+
+
+def _copy_bar_columns(
+    conn: Connection,
+    sql: str,
+    params: Sequence[object],
+    columns: Sequence[tuple[str, str]] = _COPY_BAR_COLUMNS,
+) -> np.ndarray:
+    """Run ``sql`` through ``COPY ... TO STDOUT (FORMAT BINARY)`` into a structured array.
+
+    Every selected column must be a non-NULL fixed-width value, so all tuples
+    have the same size and the stream body is decoded by one ``frombuffer``
+    call instead of a Python object per value.
+
+    Raises:
+        ValueError: If the stream is not a binary COPY of ``columns``.
+    """
+
+    with conn.cursor() as cur:
+        with cur.copy(f"COPY ({sql}) TO STDOUT (FORMAT BINARY)", params) as copy:
+            data = b"".join(copy)
+
+    if not data.startswith(_PGCOPY_SIGNATURE) or not data.endswith(_PGCOPY_TRAILER):
+        raise ValueError("market data COPY returned a malformed binary stream")
+    extension_length = int.from_bytes(data[_PGCOPY_HEADER_SIZE - 4 : _PGCOPY_HEADER_SIZE], "big")
+    body = memoryview(data)[_PGCOPY_HEADER_SIZE + extension_length : -len(_PGCOPY_TRAILER)]
+
+    dtype = _copy_row_dtype(columns)
+    if len(body) % dtype.itemsize:
+        raise ValueError("market data COPY returned tuples of unexpected width")
+    rows = np.frombuffer(body, dtype=dtype)
+
+    if np.any(rows["field_count"] != len(columns)):
+        raise ValueError("market data COPY returned an unexpected number of columns")
+    for name, _ in columns:
+        if np.any(rows[f"{name}_length"] != dtype[name].itemsize):
+            raise ValueError(f"market data COPY returned NULL or non fixed-width values for '{name}'")
+    return rows
+
+
+def _copy_rows_to_bars(rows: np.ndarray, symbol: str, interval: str) -> BarArray:
+    """Wrap decoded :data:`_COPY_BAR_COLUMNS` tuples as a :class:`BarArray`."""
+
+    return BarArray(
+        symbol=symbol,
+        interval=interval,
+        timestamp=(rows["timestamp"].astype(np.int64) + _PG_EPOCH_OFFSET_US).view("datetime64[us]"),
+        open=rows["open"],
+        high=rows["high"],
+        low=rows["low"],
+        close=rows["close"],
+        volume=rows["volume"],
+    )
+
+
+def fetch_market_data(
+    conn: Connection,
+    symbol: str,
+    interval: str,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+) -> list[IntervalData]:
+    """Fetch chronological OHLCV bars for a symbol and interval.
+
+    Args:
+        conn: Active psycopg connection.
+        symbol: Market symbol (e.g., "AAPL").
+        interval: Stored interval string (e.g., "30min").
+        start: Optional starting timestamp (inclusive).
+        end: Optional ending timestamp (inclusive).
+        limit: Optional maximum number of rows to return (applied after filtering).
+            This keeps the *oldest* matching rows; use :func:`fetch_market_data_tail`
+            for the most recent ones.
+
+    Returns:
+        List of IntervalData sorted in ascending timestamp order.
+    """
+
+    sql, params = _market_data_query(symbol, interval, start=start, end=end, limit=limit)
+
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+
+    return _rows_to_intervals(rows, symbol, interval)
+
+
+def fetch_market_data_tail(
+    conn: Connection,
+    symbol: str,
+    interval: str,
+    limit: int,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[IntervalData]:
+    """Fetch the most recent ``limit`` bars for a symbol and interval.
+
+    Only the requested rows are read from the ``(symbol_id, timestamp DESC)``
+    index, however much history is stored.
+
+    Args:
+        conn: Active psycopg connection.
+        symbol: Market symbol (e.g., "AAPL").
+        interval: Stored interval string (e.g., "30m").
+        limit: Number of bars to return at most.
+        start: Optional starting timestamp (inclusive).
+        end: Optional ending timestamp (inclusive); the tail ends here.
+
+    Returns:
+        List of IntervalData sorted in ascending timestamp order.
+    """
+
+    sql, params = _market_data_tail_query(symbol, interval, limit, start=start, end=end)
+
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+
+    return _rows_to_intervals(rows, symbol, interval)
+
+
+def fetch_market_data_tail_columnar(
+    conn: Connection,
+    symbol: str,
+    interval: str,
+    limit: int,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> BarArray:
+    """Columnar counterpart of :func:`fetch_market_data_tail`.
+
+    Returns:
+        BarArray sorted in ascending timestamp order (empty when no rows match).
+    """
+
+    sql, params = _market_data_tail_query(symbol, interval, limit, start=start, end=end, columnar=True)
+    return _copy_rows_to_bars(_copy_bar_columns(conn, sql, params), symbol, interval)
+
+
+def fetch_market_data_columnar(
+    conn: Connection,
+    symbol: str,
+    interval: str,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+) -> BarArray:
+    """Fetch chronological OHLCV bars straight into a :class:`BarArray`.
+
+    Takes the same arguments as :func:`fetch_market_data` but streams the rows
+    with ``COPY ... TO STDOUT (FORMAT BINARY)`` and decodes them straight into
+    NumPy columns, so no Python object is built per bar. ``IntervalData`` views
+    are only materialized when a caller indexes or iterates the result.
+
+    Returns:
+        BarArray sorted in ascending timestamp order (empty when no rows match).
+    """
+
+    sql, params = _market_data_query(symbol, interval, start=start, end=end, limit=limit, columnar=True)
+    return _copy_rows_to_bars(_copy_bar_columns(conn, sql, params), symbol, interval)
+
+
+def fetch_market_data_bulk_columnar(
+    conn: Connection,
+    symbols: Sequence[str],
+    interval: str,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> dict[str, BarArray]:
+    """Fetch the bars of many symbols in one binary COPY.
+
+    Args:
+        conn: Active psycopg connection.
+        symbols: Market symbols to load (duplicates are ignored).
+        interval: Stored interval string (e.g., "5m").
+        start: Optional starting timestamp (inclusive).
+        end: Optional ending timestamp (inclusive).
+
+    Returns:
+        Mapping of symbol to a chronological :class:`BarArray`. Symbols that
+        are unknown or have no bars in the range are absent.
+    """
+
+    if not symbols:
+        return {}
+
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT symbol_id, symbol FROM market_symbols WHERE symbol = ANY(%s)",
+            (list(dict.fromkeys(symbols)),),
+        )
+        symbol_names = {int(symbol_id): symbol for symbol_id, symbol in cur.fetchall()}
+    if not symbol_names:
+        return {}
+
+    query = [
+        "SELECT",
+        "    md.symbol_id,",
+        *_bar_select_list("md", columnar=True),
+        "FROM market_data md",
+        "WHERE md.symbol_id = ANY(%s) AND md.interval_type = %s",
+    ]
+    params: list[object] = [sorted(symbol_names), interval]
+
+    if start is not None:
+        query.append("AND md.timestamp >= %s")
+        params.append(start)
+
+    if end is not None:
+        query.append("AND md.timestamp <= %s")
+        params.append(end)
+
+    query.append("ORDER BY md.symbol_id, md.timestamp ASC")
+
+    rows = _copy_bar_columns(conn, "\n".join(query), params, (("symbol_id", ">i4"), *_COPY_BAR_COLUMNS))
+
+    results: dict[str, BarArray] = {}
+    boundaries = np.flatnonzero(np.diff(rows["symbol_id"])) + 1
+    for chunk in np.split(rows, boundaries) if len(rows) else []:
+        symbol = symbol_names[int(chunk["symbol_id"][0])]
+        results[symbol] = _copy_rows_to_bars(chunk, symbol, interval)
+
+    return results
+
+
 def fetch_market_data_with_aggregation(
     conn: Connection,
     symbol: str,
@@ -369,6 +853,10 @@ def fetch_market_data_with_aggregation(
     
     This allows the system to store native 5m data from the API and
     aggregate to larger intervals on-demand, reducing API call waste.
+
+    With ``limit`` set, the most recent bars are returned (see
+    :func:`fetch_market_data_tail`) and only as many source bars as the
+    interval ratio requires are read.
     
     Args:
         conn: Active psycopg connection
@@ -376,30 +864,26 @@ def fetch_market_data_with_aggregation(
         interval: Requested interval (e.g., "30m")
         start: Optional starting timestamp (inclusive)
         end: Optional ending timestamp (inclusive)
-        limit: Optional maximum number of bars to return
+        limit: Optional maximum number of (most recent) bars to return
         
     Returns:
         List of IntervalData in chronological order, either direct from DB
         or aggregated from smaller interval
     """
     # Try direct fetch first
-    data = fetch_market_data(conn, symbol, interval, start=start, end=end, limit=limit)
+    if limit is not None:
+        data = fetch_market_data_tail(conn, symbol, interval, limit, start=start, end=end)
+    else:
+        data = fetch_market_data(conn, symbol, interval, start=start, end=end)
     
     if data:
         LOGGER.debug(f"{symbol}: Found {len(data)} bars at {interval} interval (direct)")
         return data
     
-    # Map intervals to their smaller source intervals for aggregation
     # Interval seconds for ratio calculation
     from .bar_aggregator import INTERVAL_SECONDS
     
-    AGGREGATION_MAP = {
-        "30m": "5m",   # Aggregate 5m -> 30m (6:1 ratio)
-        "1h": "5m",    # Aggregate 5m -> 1h (12:1 ratio)
-        "4h": "1h",    # Aggregate 1h -> 4h (4:1 ratio)
-    }
-    
-    source_interval = AGGREGATION_MAP.get(interval)
+    source_interval = AGGREGATION_SOURCE_INTERVALS.get(interval)
     if not source_interval:
         LOGGER.debug(f"{symbol}: No data at {interval} and no aggregation path available")
         return []  # No aggregation path available
@@ -415,11 +899,17 @@ def fetch_market_data_with_aggregation(
                 f"to aggregate {limit} {interval} bars (ratio: {ratio}:1)"
             )
     
-    # Fetch source data
-    source_data = fetch_market_data(
-        conn, symbol, source_interval,
-        start=start, end=end, limit=source_limit
-    )
+    # Fetch source data (only the tail needed for the requested bars)
+    if source_limit is not None:
+        source_data = fetch_market_data_tail(
+            conn, symbol, source_interval, source_limit,
+            start=start, end=end
+        )
+    else:
+        source_data = fetch_market_data(
+            conn, symbol, source_interval,
+            start=start, end=end
+        )
     
     if not source_data:
         LOGGER.debug(f"{symbol}: No {source_interval} data available for aggregation to {interval}")
@@ -441,5 +931,134 @@ def fetch_market_data_with_aggregation(
     return aggregated
 
 
+def fetch_latest_bars_bulk(
+    conn: Connection,
+    symbols: Sequence[str],
+    interval: str,
+    *,
+    limit: int,
+    end: datetime | None = None,
+) -> dict[str, BarArray]:
+    """Fetch the most recent ``limit`` bars of many symbols in one round trip.
+
+    A ``LATERAL`` join runs the per-symbol "latest N bars" lookup against the
+    ``(symbol_id, timestamp, interval_type)`` index for every symbol matching
+    ``symbol = ANY(%s)``, so the cost is one query regardless of batch size.
+
+    Args:
+        conn: Active psycopg connection.
+        symbols: Market symbols to load (duplicates are ignored).
+        interval: Stored interval string (e.g., "30m").
+        limit: Maximum number of bars per symbol.
+        end: Optional ending timestamp (inclusive).
+
+    Returns:
+        Mapping of symbol to a chronological :class:`BarArray`. Symbols missing
+        from ``market_symbols`` are absent; known symbols without bars map to
+        an empty array.
+    """
+
+    if not symbols:
+        return {}
+
+    params: list[object] = [interval]
+    end_clause = ""
+    if end is not None:
+        end_clause = "AND md.timestamp <= %s"
+        params.append(end)
+    params.extend([limit, list(dict.fromkeys(symbols))])
+
+    sql = f"""
+        SELECT
+            s.symbol,
+            latest.timestamp,
+            latest.open_price,
+            latest.high_price,
+            latest.low_price,
+            latest.close_price,
+            latest.volume
+        FROM market_symbols s
+        LEFT JOIN LATERAL (
+            SELECT
+                md.timestamp,
+                md.open_price,
+                md.high_price,
+                md.low_price,
+                md.close_price,
+                md.volume
+            FROM market_data md
+            WHERE md.symbol_id = s.symbol_id
+              AND md.interval_type = %s
+              {end_clause}
+            ORDER BY md.timestamp DESC
+            LIMIT %s
+        ) latest ON TRUE
+        WHERE s.symbol = ANY(%s)
+        ORDER BY s.symbol, latest.timestamp ASC
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+
+    results: dict[str, BarArray] = {}
+    for symbol, symbol_rows in groupby(rows, key=itemgetter(0)):
+        # The LEFT JOIN yields a single all-NULL row for a symbol without bars
+        bars = [row[1:] for row in symbol_rows if row[1] is not None]
+        results[symbol] = BarArray.from_rows(bars, symbol=symbol, interval=interval)
+
+    return results
+
+
+def fetch_latest_bars_bulk_with_aggregation(
+    conn: Connection,
+    symbols: Sequence[str],
+    interval: str,
+    *,
+    limit: int,
+    end: datetime | None = None,
+) -> dict[str, BarArray]:
+    """Bulk counterpart of :func:`fetch_market_data_with_aggregation`.
+
+    Symbols with no bars at ``interval`` are aggregated from the smaller
+    interval in :data:`AGGREGATION_SOURCE_INTERVALS`, which costs one more
+    bulk query for all of them together.
+
+    Returns:
+        Same mapping as :func:`fetch_latest_bars_bulk`.
+    """
+
+    results = fetch_latest_bars_bulk(conn, symbols, interval, limit=limit, end=end)
+
+    source_interval = AGGREGATION_SOURCE_INTERVALS.get(interval)
+    missing = [symbol for symbol, bars in results.items() if len(bars) == 0]
+    if not source_interval or not missing:
+        return results
+
+    from .bar_aggregator import INTERVAL_SECONDS, aggregate_bars
+
+    ratio = INTERVAL_SECONDS[interval] // INTERVAL_SECONDS[source_interval]
+    source = fetch_latest_bars_bulk(conn, missing, source_interval, limit=limit * ratio, end=end)
+
+    for symbol, source_bars in source.items():
+        if len(source_bars) == 0:
+            continue
+        aggregated = aggregate_bars(source_bars.to_intervals(), interval)[-limit:]
+        results[symbol] = BarArray.from_intervals(aggregated, symbol=symbol, interval=interval)
+        LOGGER.debug(
+            f"{symbol}: Aggregated {len(source_bars)} {source_interval} bars "
+            f"to {len(aggregated)} {interval} bars"
+        )
+
+    return results
+
+
 __all__.append("fetch_market_data")
+__all__.append("fetch_market_data_bulk_columnar")
+__all__.append("fetch_market_data_columnar")
+__all__.append("fetch_market_data_tail")
+__all__.append("fetch_market_data_tail_columnar")
 __all__.append("fetch_market_data_with_aggregation")
+__all__.append("fetch_latest_bars_bulk")
+__all__.append("fetch_latest_bars_bulk_with_aggregation")
+__all__.append("AGGREGATION_SOURCE_INTERVALS")
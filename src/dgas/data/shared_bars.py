@@ -0,0 +1,167 @@
+"""Share :class:`~dgas.data.bars.BarArray` columns between processes.
+
+The parent process packs the bars of a whole universe into one
+:mod:`multiprocessing.shared_memory` block with :meth:`SharedBarStore.create`
+and passes the small, picklable :attr:`SharedBarStore.handle` to its workers.
+Each worker calls :meth:`SharedBarStore.attach` once and reads ``BarArray``
+views straight out of the block, so no bars are copied, pickled or re-read
+from the database per worker.
+
+Block layout: six ``int64``/``float64`` columns (timestamp in epoch
+microseconds, open, high, low, close, volume) of ``rows`` entries each,
+stored one after the other. Every ``(symbol, interval)`` series owns the
+same ``[start, stop)`` row range in all six columns.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, Mapping, Tuple
+
+import numpy as np
+
+from .bars import BarArray
+
+LOGGER = logging.getLogger(__name__)
+
+_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+_DTYPES = {"timestamp": np.int64, "volume": np.int64}
+_ITEM_SIZE = 8
+
+SeriesKey = Tuple[str, str]
+"""``(symbol, interval)`` identifying one series in a store."""
+
+
+@dataclass(frozen=True)
+class SharedBarHandle:
+    """Everything a worker needs to attach to a store; cheap to pickle."""
+
+    name: str
+    rows: int
+    segments: Mapping[SeriesKey, Tuple[int, int]]
+
+
+class SharedBarStore:
+    """Read-only OHLCV series for many symbols in one shared memory block.
+
+    The creating process owns the block and must :meth:`unlink` it when the
+    workers are done (using the store as a context manager does this).
+    Attached stores only :meth:`close` their mapping.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: SharedBarHandle, *, owner: bool) -> None:
+        self._shm = shm
+        self._handle = handle
+        self._owner = owner
+        self._columns = {
+            name: np.ndarray(
+                (handle.rows,),
+                dtype=_DTYPES.get(name, np.float64),
+                buffer=shm.buf,
+                offset=index * handle.rows * _ITEM_SIZE,
+            )
+            for index, name in enumerate(_COLUMNS)
+        }
+        if not owner:
+            for column in self._columns.values():
+                column.flags.writeable = False
+
+    @classmethod
+    def create(cls, series: Iterable[BarArray]) -> "SharedBarStore":
+        """Copy ``series`` into a new shared memory block.
+
+        Each array must have a distinct ``(symbol, interval)``.
+        """
+        arrays = list(series)
+        segments: Dict[SeriesKey, Tuple[int, int]] = {}
+        rows = 0
+        for bars in arrays:
+            key = (bars.symbol, bars.interval)
+            if key in segments:
+                raise ValueError(f"duplicate series {key}")
+            segments[key] = (rows, rows + len(bars))
+            rows += len(bars)
+
+        # Zero-sized blocks are rejected by the OS
+        shm = shared_memory.SharedMemory(create=True, size=max(len(_COLUMNS) * rows * _ITEM_SIZE, 1))
+        store = cls(shm, SharedBarHandle(shm.name, rows, segments), owner=True)
+        try:
+            for bars in arrays:
+                start, stop = segments[(bars.symbol, bars.interval)]
+                store._columns["timestamp"][start:stop] = bars.timestamp.view(np.int64)
+                for name in _COLUMNS[1:]:
+                    store._columns[name][start:stop] = getattr(bars, name)
+        except BaseException:
+            store.close()
+            store.unlink()
+            raise
+
+        LOGGER.debug("Shared %s series (%s bars, %s bytes) as %s", len(segments), rows, shm.size, shm.name)
+        return store
+
+    @classmethod
+    def attach(cls, handle: SharedBarHandle) -> "SharedBarStore":
+        """Map a store created by another process."""
+        return cls(shared_memory.SharedMemory(name=handle.name), handle, owner=False)
+
+    @property
+    def handle(self) -> SharedBarHandle:
+        return self._handle
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of bar data held in the block."""
+        return len(_COLUMNS) * self._handle.rows * _ITEM_SIZE
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handle.segments
+
+    def __iter__(self) -> Iterator[SeriesKey]:
+        return iter(self._handle.segments)
+
+    def __len__(self) -> int:
+        return len(self._handle.segments)
+
+    def get(self, symbol: str, interval: str) -> BarArray:
+        """Return the series as a ``BarArray`` viewing the shared block.
+
+        Unknown series are returned empty. The arrays stay valid until the
+        store is closed, so drop them before calling :meth:`close`.
+        """
+        segment = self._handle.segments.get((symbol, interval))
+        if segment is None:
+            return BarArray.empty(symbol, interval)
+        start, stop = segment
+        columns = self._columns
+        return BarArray(
+            symbol=symbol,
+            interval=interval,
+            timestamp=columns["timestamp"][start:stop].view("datetime64[us]"),
+            open=columns["open"][start:stop],
+            high=columns["high"][start:stop],
+            low=columns["low"][start:stop],
+            close=columns["close"][start:stop],
+            volume=columns["volume"][start:stop],
+        )
+
+    def close(self) -> None:
+        """Release this process's mapping of the block."""
+        self._columns = {}
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the block once every process has closed it (owner only)."""
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedBarStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        self.unlink()
+
+
+__all__ = ["SeriesKey", "SharedBarHandle", "SharedBarStore"]
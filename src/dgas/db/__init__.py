@@ -8,17 +8,47 @@ from typing import Iterator
 import psycopg
 
 from ..settings import get_settings
+from .connection_pool import (
+    POOL_AVAILABLE,
+    configure_pool,
+    database_conninfo,
+    get_pool_manager,
+    get_pool_stats,
+)
 
 
 @contextmanager
 def get_connection() -> Iterator[psycopg.Connection]:
-    """Yield a psycopg connection using configured database URL."""
+    """Yield a connection from the shared pool.
 
-    settings = get_settings()
-    conninfo = settings.database_url
-    if "+psycopg" in conninfo:
-        conninfo = conninfo.replace("+psycopg", "", 1)
-    conn = psycopg.connect(conninfo)
+    The transaction is committed when the block exits normally and rolled back
+    otherwise. Market data changes queued on the connection are published
+    after the commit and dropped on rollback. Without ``psycopg_pool``
+    installed a dedicated connection is opened and closed instead.
+    """
+
+    # Imported here: dgas.data imports this module while initializing
+    from ..data.events import discard_market_data_changes, flush_market_data_changes
+
+    conn = None
+    try:
+        with _open_connection() as conn:
+            yield conn
+    except BaseException:
+        if conn is not None:
+            discard_market_data_changes(conn)
+        raise
+    flush_market_data_changes(conn)
+
+
+@contextmanager
+def _open_connection() -> Iterator[psycopg.Connection]:
+    if POOL_AVAILABLE:
+        with get_pool_manager().get_connection() as conn:
+            yield conn
+        return
+
+    conn = psycopg.connect(database_conninfo(get_settings()))
     try:
         yield conn
         conn.commit()
@@ -31,7 +61,7 @@ def get_connection() -> Iterator[psycopg.Connection]:
 
 try:
     from .persistence import DrummondPersistence
-    __all__ = ["get_connection", "DrummondPersistence"]
+    __all__ = ["get_connection", "configure_pool", "get_pool_stats", "DrummondPersistence"]
 except ImportError:
-    # psycopg2 not available, DrummondPersistence will be unavailable
-    __all__ = ["get_connection"]
+    # Calculation modules unavailable, DrummondPersistence will be unavailable
+    __all__ = ["get_connection", "configure_pool", "get_pool_stats"]
@@ -1,23 +1,48 @@
 """Database connection pooling for improved performance.
 
-This module provides connection pooling to reduce the overhead of creating
-new database connections for each query, improving prediction cycle performance.
+This module owns the single process-wide connection pool. Every database
+call in the package (``dgas.db.get_connection``, the persistence classes and
+the exchange calendar) borrows its connection from here instead of opening a
+new one, which removes the connect/authenticate round trips from hot paths
+such as the prediction cycle.
+
+Pool sizing comes from the ``DGAS_DB_POOL_*`` settings and can be overridden
+once at startup with :func:`configure_pool`. Connections are health-checked
+when they are handed out, so a connection dropped by the server is replaced
+transparently.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 
 import psycopg
-from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+try:
+    from psycopg_pool import ConnectionPool
+    POOL_AVAILABLE = True
+except ImportError:
+    # psycopg_pool not installed, callers fall back to direct connections
+    ConnectionPool = None  # type: ignore[assignment,misc]
+    POOL_AVAILABLE = False
 
 from ..settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def database_conninfo(settings: Settings) -> str:
+    """Return the libpq connection string for the configured database URL."""
+    conninfo = settings.database_url
+    if "+psycopg" in conninfo:
+        conninfo = conninfo.replace("+psycopg", "", 1)
+    return conninfo
+
+
 class PooledConnectionManager:
     """
     Manages a pool of PostgreSQL connections for improved performance.
@@ -25,6 +50,11 @@ class PooledConnectionManager:
     Uses psycopg3's connection pool to reuse connections across queries,
     reducing connection overhead especially important for prediction cycles
     processing multiple symbols.
+
+    The pool is opened lazily on first use, after a probe connection has
+    succeeded, so an unreachable database raises immediately instead of
+    after the pool timeout. A pool inherited through ``fork`` is never used
+    by the child: the child opens its own.
     """
 
     def __init__(self, settings: Optional[Settings] = None):
@@ -39,74 +69,96 @@ class PooledConnectionManager:
 
         self.settings = settings
         self._pool: Optional[ConnectionPool] = None
-        self._async_pool: Optional[AsyncConnectionPool] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
 
     def initialize_pool(
         self,
-        min_size: int = 5,
-        max_size: int = 20,
-        max_inactive_connection_lifetime: float = 300.0,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_idle: Optional[float] = None,
     ) -> None:
         """
         Initialize the connection pool.
 
+        Arguments left as None are taken from settings.
+
         Args:
-            min_size: Minimum number of connections in pool
+            min_size: Minimum number of connections kept open
             max_size: Maximum number of connections in pool
-            max_inactive_connection_lifetime: Maximum lifetime of inactive connections (seconds)
+            timeout: Seconds to wait for a free connection before failing
+            max_idle: Seconds an unused connection above min_size is kept open
         """
-        if self._pool is not None:
-            logger.warning("Connection pool already initialized")
-            return
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                logger.warning("Connection pool already initialized")
+                return
+            self._open_pool(min_size, max_size, timeout, max_idle)
 
-        conninfo = self.settings.database_url
-        if "+psycopg" in conninfo:
-            conninfo = conninfo.replace("+psycopg", "", 1)
-
-        try:
-            self._pool = ConnectionPool(
-                conninfo=conninfo,
-                min_size=min_size,
-                max_size=max_size,
-                max_inactive_connection_lifetime=max_inactive_connection_lifetime,
-                kwargs={
-                    "autocommit": False,
-                    "row_factory": psycopg.rows.dict_row,
-                },
-            )
-
-            # Open all connections in the pool
-            self._pool.wait()
-
-            logger.info(
-                f"Connection pool initialized: {min_size}-{max_size} connections"
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to initialize connection pool: {e}")
-            raise
+    def _open_pool(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_idle: Optional[float] = None,
+    ) -> ConnectionPool:
+        if not POOL_AVAILABLE:
+            raise RuntimeError("psycopg_pool is not installed")
+
+        settings = self.settings
+        max_size = max_size or settings.db_pool_max_size
+        min_size = min(min_size if min_size is not None else settings.db_pool_min_size, max_size)
+        conninfo = database_conninfo(settings)
+
+        # Fail fast like a direct connect when the database is unreachable,
+        # rather than letting every request wait out the pool timeout
+        psycopg.connect(conninfo).close()
+
+        self._pool = ConnectionPool(
+            conninfo=conninfo,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout or settings.db_pool_timeout,
+            max_idle=max_idle or settings.db_pool_max_idle,
+            check=ConnectionPool.check_connection,
+            name="dgas",
+            open=True,
+        )
+        self._pid = os.getpid()
+
+        logger.info(f"Connection pool initialized: {min_size}-{max_size} connections")
+        return self._pool
 
     def get_pool(self) -> ConnectionPool:
         """
-        Get the connection pool.
+        Get the connection pool, opening it on first use.
 
         Returns:
             The connection pool instance
 
         Raises:
-            RuntimeError: If pool not initialized
+            RuntimeError: If psycopg_pool is not installed
         """
-        if self._pool is None:
-            raise RuntimeError(
-                "Connection pool not initialized. Call initialize_pool() first."
-            )
-        return self._pool
+        pool = self._pool
+        if pool is not None and self._pid == os.getpid():
+            return pool
+
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                # A forked child must not share the parent's sockets
+                self._pool = None
+                self._open_pool()
+            return self._pool  # type: ignore[return-value]
 
     @contextmanager
     def get_connection(self) -> Generator[psycopg.Connection, None, None]:
         """
         Get a connection from the pool.
 
+        The transaction is committed when the block exits normally and rolled
+        back if it raises; the connection then goes back to the pool.
+
         Usage:
             with pool_manager.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -116,102 +168,57 @@ class PooledConnectionManager:
         Yields:
             A database connection from the pool
         """
-        if self._pool is None:
-            raise RuntimeError(
-                "Connection pool not initialized. Call initialize_pool() first."
-            )
-
-        with self._pool.connection() as conn:
+        with self.get_pool().connection() as conn:
             yield conn
 
-    async def get_async_pool(self) -> AsyncConnectionPool:
+    def health_check(self) -> bool:
         """
-        Get the async connection pool.
+        Verify the pool can serve a working connection.
 
-        Returns:
-            The async connection pool instance
+        Idle connections are checked and broken ones replaced first.
 
-        Raises:
-            RuntimeError: If pool not initialized
-        """
-        if self._async_pool is None:
-            raise RuntimeError("Async pool not initialized")
-        return self._async_pool
-
-    async def initialize_async_pool(
-        self,
-        min_size: int = 5,
-        max_size: int = 20,
-        max_inactive_connection_lifetime: float = 300.0,
-    ) -> None:
-        """
-        Initialize the async connection pool.
-
-        Args:
-            min_size: Minimum number of connections in pool
-            max_size: Maximum number of connections in pool
-            max_inactive_connection_lifetime: Maximum lifetime of inactive connections
+        Returns:
+            True if a ``SELECT 1`` round trip succeeded
         """
-        if self._async_pool is not None:
-            logger.warning("Async connection pool already initialized")
-            return
-
-        conninfo = self.settings.database_url
-        if "+psycopg" in conninfo:
-            conninfo = conninfo.replace("+psycopg", "", 1)
-
         try:
-            self._async_pool = AsyncConnectionPool(
-                conninfo=conninfo,
-                min_size=min_size,
-                max_size=max_size,
-                max_inactive_connection_lifetime=max_inactive_connection_lifetime,
-            )
-
-            await self._async_pool.wait()
-
-            logger.info(
-                f"Async connection pool initialized: {min_size}-{max_size} connections"
-            )
-
+            pool = self.get_pool()
+            pool.check()
+            with pool.connection() as conn:
+                conn.execute("SELECT 1")
+            return True
         except Exception as e:
-            logger.error(f"Failed to initialize async connection pool: {e}")
-            raise
+            logger.warning(f"Connection pool health check failed: {e}")
+            return False
 
     def close_pool(self) -> None:
         """Close the connection pool."""
-        if self._pool is not None:
-            self._pool.close()
-            logger.info("Connection pool closed")
-            self._pool = None
-
-    async def close_async_pool(self) -> None:
-        """Close the async connection pool."""
-        if self._async_pool is not None:
-            await self._async_pool.close()
-            logger.info("Async connection pool closed")
-            self._async_pool = None
-
-    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            if self._pool is not None:
+                if self._pid == os.getpid():
+                    self._pool.close()
+                    logger.info("Connection pool closed")
+                self._pool = None
+                self._pid = None
+
+    def get_stats(self) -> Dict[str, Any]:
         """
         Get connection pool statistics.
 
         Returns:
-            Dictionary with pool statistics
+            Dictionary with pool statistics (sizes, waiting requests and the
+            cumulative counters kept by psycopg_pool)
         """
-        if self._pool is None:
+        if self._pool is None or self._pid != os.getpid():
             return {"status": "not_initialized"}
 
-        return {
-            "pool_size": self._pool.get_pool_size(),
-            "checked_in": self._pool.get_checked_out(),
-            "checked_out": self._pool.get_checked_in(),
-            "max_capacity": self._pool.get_maxsize(),
-        }
+        stats: Dict[str, Any] = {"status": "open"}
+        stats.update(self._pool.get_stats())
+        return stats
 
 
 # Global connection pool manager instance
 _pool_manager: Optional[PooledConnectionManager] = None
+_pool_manager_lock = threading.Lock()
 
 
 def get_pool_manager() -> PooledConnectionManager:
@@ -223,10 +230,34 @@ def get_pool_manager() -> PooledConnectionManager:
     """
     global _pool_manager
     if _pool_manager is None:
-        _pool_manager = PooledConnectionManager()
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                _pool_manager = PooledConnectionManager()
     return _pool_manager
 
 
+def configure_pool(
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_idle: Optional[float] = None,
+) -> None:
+    """
+    (Re)open the global pool with explicit sizing.
+
+    Meant to be called once at startup, e.g. with ``database.pool_size``
+    from the config file. Arguments left as None are taken from settings.
+    """
+    manager = get_pool_manager()
+    manager.close_pool()
+    manager.initialize_pool(min_size=min_size, max_size=max_size, timeout=timeout, max_idle=max_idle)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Return statistics of the global connection pool."""
+    return get_pool_manager().get_stats()
+
+
 @contextmanager
 def get_db_connection() -> Generator[psycopg.Connection, None, None]:
     """
@@ -251,7 +282,11 @@ def get_db_connection() -> Generator[psycopg.Connection, None, None]:
 
 
 __all__ = [
+    "POOL_AVAILABLE",
     "PooledConnectionManager",
+    "configure_pool",
+    "database_conninfo",
     "get_pool_manager",
+    "get_pool_stats",
     "get_db_connection",
 ]
@@ -10,25 +10,14 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
-
-logger = logging.getLogger(__name__)
+from typing import Any, Dict, Optional
 
+from ..utils.lru_cache import LRUCache
 
-@dataclass(frozen=True)
-class CacheEntry:
-    """Represents a cached query result with metadata."""
-    result: Any
-    timestamp: float
-    ttl_seconds: int
-    hit_count: int = 0
+logger = logging.getLogger(__name__)
 
-    @property
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        return time.time() - self.timestamp > self.ttl_seconds
+# Memory budget of each query cache
+DEFAULT_QUERY_CACHE_BYTES = 64 * 1024 * 1024
 
 
 class QueryCache:
@@ -37,23 +26,23 @@ class QueryCache:
 
     Provides fast access to frequently-queried data with configurable TTL.
     Designed for read-heavy workloads like dashboard queries and signal lookups.
+    Entries are held in a thread-safe :class:`~dgas.utils.lru_cache.LRUCache`
+    bounded by entry count and memory budget.
 
     Note: This is an in-memory cache suitable for single-process deployments.
     For multi-process or distributed deployments, consider using Redis.
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, max_bytes: Optional[int] = DEFAULT_QUERY_CACHE_BYTES):
         """
         Initialize query cache.
 
         Args:
             max_size: Maximum number of cache entries before eviction
+            max_bytes: Memory budget for cached results in bytes (None for no limit)
         """
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache = LRUCache(max_entries=max_size, max_bytes=max_bytes)
         self._max_size = max_size
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
 
     def _make_key(self, query: str, params: tuple) -> str:
         """
@@ -85,29 +74,7 @@ class QueryCache:
         Returns:
             Cached result if available and not expired, None otherwise
         """
-        key = self._make_key(query, params)
-        entry = self._cache.get(key)
-
-        if entry is None:
-            self._misses += 1
-            return None
-
-        if entry.is_expired:
-            # Remove expired entry
-            del self._cache[key]
-            self._misses += 1
-            return None
-
-        # Update hit count
-        self._cache[key] = CacheEntry(
-            result=entry.result,
-            timestamp=entry.timestamp,
-            ttl_seconds=entry.ttl_seconds,
-            hit_count=entry.hit_count + 1,
-        )
-        self._hits += 1
-
-        return entry.result
+        return self._cache.get(self._make_key(query, params))
 
     def set(
         self,
@@ -125,31 +92,7 @@ class QueryCache:
             result: Query result to cache
             ttl_seconds: Time-to-live for this cache entry
         """
-        key = self._make_key(query, params)
-
-        # Evict oldest entries if cache is full
-        if len(self._cache) >= self._max_size and key not in self._cache:
-            self._evict_lru()
-
-        self._cache[key] = CacheEntry(
-            result=result,
-            timestamp=time.time(),
-            ttl_seconds=ttl_seconds,
-            hit_count=0,
-        )
-
-    def _evict_lru(self) -> None:
-        """Evict least recently used cache entry."""
-        if not self._cache:
-            return
-
-        # Find entry with minimum hit count and oldest timestamp
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: (self._cache[k].hit_count, self._cache[k].timestamp),
-        )
-        del self._cache[oldest_key]
-        self._evictions += 1
+        self._cache.set(self._make_key(query, params), result, ttl_seconds=ttl_seconds)
 
     def invalidate(self, pattern: Optional[str] = None) -> int:
         """
@@ -162,19 +105,8 @@ class QueryCache:
             Number of entries invalidated
         """
         if pattern is None:
-            count = len(self._cache)
-            self._cache.clear()
-            return count
-
-        # Invalidate entries matching pattern
-        keys_to_delete = [
-            key for key in self._cache.keys()
-            if pattern in key
-        ]
-        for key in keys_to_delete:
-            del self._cache[key]
-
-        return len(keys_to_delete)
+            return self._cache.discard_where(lambda key: True)
+        return self._cache.discard_where(lambda key: pattern in key)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -183,26 +115,14 @@ class QueryCache:
         Returns:
             Dictionary with cache statistics
         """
-        total_requests = self._hits + self._misses
-        hit_rate = (
-            (self._hits / total_requests * 100) if total_requests > 0 else 0
-        )
-
-        return {
-            "size": len(self._cache),
-            "max_size": self._max_size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate_percent": hit_rate,
-            "evictions": self._evictions,
-        }
+        return self._cache.stats().as_dict()
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
 
 
 class QueryCacheManager:
@@ -264,7 +184,7 @@ class QueryCacheManager:
         """
         results = {}
         for name, cache in self._caches.items():
-            results[name] = len(cache._cache)
+            results[name] = len(cache)
             cache.clear()
         return results
 
@@ -341,6 +261,7 @@ def cached_query(
 
 
 __all__ = [
+    "DEFAULT_QUERY_CACHE_BYTES",
     "QueryCache",
     "QueryCacheManager",
     "get_cache_manager",
@@ -0,0 +1,23 @@
+-- Indicator materialization tracking table
+-- Per-symbol high-water mark of the `dgas indicators materialize` batch job
+
+CREATE TABLE IF NOT EXISTS indicator_materialization (
+    symbol_id INTEGER NOT NULL REFERENCES market_symbols(symbol_id) ON DELETE CASCADE,
+    htf_interval VARCHAR(20) NOT NULL,
+    trading_interval VARCHAR(20) NOT NULL,
+    high_water_mark TIMESTAMPTZ NOT NULL,
+    analyses_written BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (symbol_id, htf_interval, trading_interval),
+
+    CONSTRAINT chk_analyses_written_positive CHECK (analyses_written >= 0)
+);
+
+-- Comments
+COMMENT ON TABLE indicator_materialization IS
+    'Progress of the batch job that fills multi_timeframe_analysis';
+
+COMMENT ON COLUMN indicator_materialization.high_water_mark IS
+    'Timestamp of the last trading bar processed; reruns resume after it';
@@ -0,0 +1,9 @@
+-- Backfill checkpoints
+-- Lets `dgas data backfill` resume a symbol's backfill after its last finished chunk
+
+ALTER TABLE backfill_status
+    ADD COLUMN IF NOT EXISTS completed_through DATE;
+
+-- Comments
+COMMENT ON COLUMN backfill_status.completed_through IS
+    'Every chunk of start_date..end_date ending on or before this date is stored; reruns skip them';
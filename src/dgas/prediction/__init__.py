@@ -19,6 +19,9 @@ __all__ = [
     "SignalAggregator",
     "PredictionEngine",
     "PredictionRunResult",
+    "SymbolCycleResult",
+    "ExecutionBackend",
+    "ExecutionConfig",
     "TradingSession",
     "SchedulerConfig",
     "MarketHoursManager",
@@ -37,7 +40,9 @@ from .engine import (
     SignalAggregator,
     PredictionEngine,
     PredictionRunResult,
+    SymbolCycleResult,
 )
+from .execution import ExecutionBackend, ExecutionConfig
 from .scheduler import (
     TradingSession,
     SchedulerConfig,
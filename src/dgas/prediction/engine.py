@@ -6,22 +6,27 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from ..calculations.multi_timeframe import (
     ConfluenceZone,
     MultiTimeframeAnalysis,
     MultiTimeframeCoordinator,
     TimeframeData,
+    TimeframeType,
 )
-from ..calculations import build_timeframe_data
+from ..calculations.cache import build_timeframe_data_cached
 from ..calculations.patterns import PatternEvent, PatternType
 from ..calculations.states import TrendDirection
+from ..data.bars import BarArray, BarSource
 from ..data.models import IntervalData
+from .execution import ExecutionBackend, ExecutionConfig, SymbolTimeoutError, run_bounded
 
 
 class SignalType(Enum):
@@ -1094,6 +1099,112 @@ class PredictionRunResult:
     signals: List[GeneratedSignal] = field(default_factory=list)
 
 
+@dataclass
+class SymbolCycleResult:
+    """Outcome of the prediction pipeline for one symbol within a cycle."""
+    symbol: str
+    signals: List[GeneratedSignal] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    processed: bool = False
+    # Wall-clock time (time.time()) at which signal generation started, if reached
+    signal_gen_started: Optional[float] = None
+
+
+def _analyze_symbol(
+    symbol: str,
+    interval: str,
+    htf_interval: str,
+    trading_interval: str,
+    load: Callable[[str, str], BarSource],
+    calculate: Callable[[BarSource, str, TimeframeType], TimeframeData],
+    signal_generator: SignalGenerator,
+) -> SymbolCycleResult:
+    """Run the per-symbol prediction pipeline with the given loader and calculator."""
+    outcome = SymbolCycleResult(symbol=symbol)
+    errors = outcome.errors
+    try:
+        # Load market data
+        intervals_data = load(symbol, interval)
+        if not intervals_data:
+            errors.append(f"{symbol}: No market data available")
+            return outcome
+
+        # Calculate indicators for all required timeframes
+        htf_data = None
+        trading_data = None
+
+        # Load HTF data if different from primary interval
+        if htf_interval != interval:
+            try:
+                htf_intervals = load(symbol, htf_interval)
+                if htf_intervals:
+                    htf_data = calculate(htf_intervals, htf_interval, TimeframeType.HIGHER)
+            except Exception as e:
+                errors.append(f"{symbol}: HTF data error - {str(e)}")
+
+        # Load trading TF data
+        if trading_interval == interval:
+            trading_data = calculate(intervals_data, trading_interval, TimeframeType.TRADING)
+        else:
+            try:
+                trading_intervals = load(symbol, trading_interval)
+                if trading_intervals:
+                    trading_data = calculate(trading_intervals, trading_interval, TimeframeType.TRADING)
+            except Exception as e:
+                errors.append(f"{symbol}: Trading TF data error - {str(e)}")
+
+        # Ensure we have both HTF and trading data
+        if htf_data is None or trading_data is None:
+            errors.append(f"{symbol}: Missing timeframe data")
+            return outcome
+
+        # Step 3: Generate signals
+        outcome.signal_gen_started = time.time()
+        outcome.signals = signal_generator.generate_signals(symbol, htf_data, trading_data)
+        outcome.processed = True
+
+    except Exception as e:
+        errors.append(f"{symbol}: {str(e)}")
+
+    return outcome
+
+
+# Signal generator installed in each worker of the process backend
+_worker_signal_generator: Optional[SignalGenerator] = None
+
+
+def _init_process_worker(signal_generator: SignalGenerator) -> None:
+    global _worker_signal_generator
+    _worker_signal_generator = signal_generator
+
+
+def _run_preloaded_symbol(
+    symbol: str,
+    interval: str,
+    htf_interval: str,
+    trading_interval: str,
+    bars: Dict[str, Any],
+) -> SymbolCycleResult:
+    """Process-pool entry point: analyze bars loaded by the parent process."""
+
+    def load(_symbol: str, wanted: str) -> BarSource:
+        loaded = bars[wanted]
+        if isinstance(loaded, Exception):
+            raise loaded
+        return loaded
+
+    assert _worker_signal_generator is not None, "worker initializer did not run"
+    return _analyze_symbol(
+        symbol,
+        interval,
+        htf_interval,
+        trading_interval,
+        load=load,
+        calculate=build_timeframe_data_cached,
+        signal_generator=_worker_signal_generator,
+    )
+
+
 class PredictionEngine:
     """
     Orchestrate the full prediction pipeline.
@@ -1119,6 +1230,7 @@ class PredictionEngine:
         persistence: Any = None,  # Will import PredictionPersistence type
         signal_generator: Optional[SignalGenerator] = None,
         lookback_bars: int = 200,
+        execution: Optional[ExecutionConfig] = None,
     ):
         """
         Initialize prediction engine.
@@ -1128,6 +1240,7 @@ class PredictionEngine:
             persistence: PredictionPersistence instance
             signal_generator: Optional SignalGenerator (will create default if None)
             lookback_bars: Number of bars to load for analysis
+            execution: How symbols are run within a cycle (default: serially)
         """
         if settings is None:
             from ..settings import get_settings
@@ -1140,6 +1253,7 @@ class PredictionEngine:
         self.settings = settings
         self.persistence = persistence
         self.lookback_bars = lookback_bars
+        self.execution = execution or ExecutionConfig()
 
         # Create default signal generator if not provided
         if signal_generator is None:
@@ -1202,6 +1316,9 @@ class PredictionEngine:
         # We only verify freshness here to warn if data is stale
         data_fetch_start = time.time()
         stale_symbols = self._check_data_freshness(symbols, interval, max_age_minutes=15)
+
+        # Load the bars of every symbol up front with a few bulk queries
+        preloaded = self._preload_market_data(symbols, (interval, htf_interval, trading_interval))
         data_fetch_ms = int((time.time() - data_fetch_start) * 1000)
         
         if stale_symbols:
@@ -1213,66 +1330,21 @@ class PredictionEngine:
             for symbol, age_minutes in stale_symbols[:10]:
                 errors.append(f"{symbol}: Data age {age_minutes:.1f} minutes (may be stale)")
 
-        # Step 2: Recalculate indicators and generate signals
+        # Step 2: Recalculate indicators and generate signals on the configured backend
         indicator_calc_start = time.time()
         signal_gen_start = None
         signal_gen_ms = 0
 
-        for symbol in symbols:
-            try:
-                # Load market data
-                intervals_data = self._load_market_data(symbol, interval)
-                if not intervals_data:
-                    errors.append(f"{symbol}: No market data available")
-                    continue
-
-                # Calculate indicators for all required timeframes
-                htf_data = None
-                trading_data = None
-
-                # Load HTF data if different from primary interval
-                if htf_interval != interval:
-                    try:
-                        htf_intervals = self._load_market_data(symbol, htf_interval)
-                        if htf_intervals:
-                            htf_data = self._calculate_timeframe_data(
-                                htf_intervals, htf_interval, TimeframeType.HIGHER
-                            )
-                    except Exception as e:
-                        errors.append(f"{symbol}: HTF data error - {str(e)}")
-
-                # Load trading TF data
-                if trading_interval == interval:
-                    trading_data = self._calculate_timeframe_data(
-                        intervals_data, trading_interval, TimeframeType.TRADING
-                    )
-                else:
-                    try:
-                        trading_intervals = self._load_market_data(symbol, trading_interval)
-                        if trading_intervals:
-                            trading_data = self._calculate_timeframe_data(
-                                trading_intervals, trading_interval, TimeframeType.TRADING
-                            )
-                    except Exception as e:
-                        errors.append(f"{symbol}: Trading TF data error - {str(e)}")
-
-                # Ensure we have both HTF and trading data
-                if htf_data is None or trading_data is None:
-                    errors.append(f"{symbol}: Missing timeframe data")
-                    continue
-
-                # Step 3: Generate signals
-                if signal_gen_start is None:
-                    signal_gen_start = time.time()
-
-                signals = self.signal_generator.generate_signals(
-                    symbol, htf_data, trading_data
-                )
-                all_signals.extend(signals)
+        for outcome in self._run_symbols(
+            symbols, interval, htf_interval, trading_interval, preloaded=preloaded
+        ):
+            errors.extend(outcome.errors)
+            all_signals.extend(outcome.signals)
+            if outcome.processed:
                 symbols_processed += 1
-
-            except Exception as e:
-                errors.append(f"{symbol}: {str(e)}")
+            if outcome.signal_gen_started is not None:
+                if signal_gen_start is None or outcome.signal_gen_started < signal_gen_start:
+                    signal_gen_start = outcome.signal_gen_started
 
         indicator_calc_ms = int((time.time() - indicator_calc_start) * 1000)
         if signal_gen_start:
@@ -1333,6 +1405,124 @@ class PredictionEngine:
             signals=all_signals,  # Include signal objects for notification
         )
 
+    def _run_symbols(
+        self,
+        symbols: List[str],
+        interval: str,
+        htf_interval: str,
+        trading_interval: str,
+        preloaded: Optional[Dict[str, Dict[str, BarArray]]] = None,
+    ) -> List[SymbolCycleResult]:
+        """
+        Run the per-symbol pipeline on the configured execution backend.
+
+        Args:
+            preloaded: Bars from :meth:`_preload_market_data`; intervals missing
+                from it are loaded per symbol
+
+        Returns:
+            One SymbolCycleResult per symbol, in the order of ``symbols``
+        """
+        config = self.execution
+        load = self._cycle_loader(preloaded or {})
+        if config.backend is ExecutionBackend.SERIAL or not symbols:
+            return [
+                self._run_symbol(symbol, interval, htf_interval, trading_interval, load=load)
+                for symbol in symbols
+            ]
+
+        workers = config.worker_count(len(symbols))
+        process_pool: Optional[ProcessPoolExecutor] = None
+        if config.backend is ExecutionBackend.PROCESS:
+            process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_process_worker,
+                initargs=(self.signal_generator,),
+            )
+
+            def task(index: int) -> SymbolCycleResult:
+                # Bars are loaded on this I/O thread; indicators and signals run in a worker process
+                symbol = symbols[index]
+                bars = self._load_symbol_bars(
+                    symbol, interval, htf_interval, trading_interval, load=load
+                )
+                return process_pool.submit(
+                    _run_preloaded_symbol, symbol, interval, htf_interval, trading_interval, bars
+                ).result()
+        else:
+
+            def task(index: int) -> SymbolCycleResult:
+                return self._run_symbol(
+                    symbols[index], interval, htf_interval, trading_interval, load=load
+                )
+
+        results: List[Optional[SymbolCycleResult]] = [None] * len(symbols)
+        timed_out = False
+        thread_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dgas-predict")
+        try:
+            for index, outcome, error in run_bounded(
+                thread_pool,
+                task,
+                range(len(symbols)),
+                max_in_flight=workers,
+                timeout=config.symbol_timeout_seconds,
+            ):
+                if error is not None:
+                    timed_out = timed_out or isinstance(error, SymbolTimeoutError)
+                    outcome = SymbolCycleResult(symbol=symbols[index], errors=[f"{symbols[index]}: {error}"])
+                results[index] = outcome
+        finally:
+            # Abandoned (timed-out) tasks must not block the cycle from returning
+            thread_pool.shutdown(wait=not timed_out, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=not timed_out, cancel_futures=True)
+
+        return [outcome for outcome in results if outcome is not None]
+
+    def _run_symbol(
+        self,
+        symbol: str,
+        interval: str,
+        htf_interval: str,
+        trading_interval: str,
+        load: Optional[Callable[[str, str], BarSource]] = None,
+    ) -> SymbolCycleResult:
+        """Load, analyze and generate signals for one symbol in the current thread."""
+        return _analyze_symbol(
+            symbol,
+            interval,
+            htf_interval,
+            trading_interval,
+            load=load or self._load_market_data,
+            calculate=self._calculate_timeframe_data,
+            signal_generator=self.signal_generator,
+        )
+
+    def _load_symbol_bars(
+        self,
+        symbol: str,
+        interval: str,
+        htf_interval: str,
+        trading_interval: str,
+        load: Optional[Callable[[str, str], BarSource]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load every interval a symbol needs, keeping load errors for the worker to report.
+
+        Returns:
+            Mapping of interval to its bars, or to the exception raised loading it
+        """
+        load = load or self._load_market_data
+        bars: Dict[str, Any] = {}
+        for wanted in dict.fromkeys((interval, htf_interval, trading_interval)):
+            try:
+                bars[wanted] = load(symbol, wanted)
+            except Exception as e:
+                bars[wanted] = e
+            if wanted == interval and (isinstance(bars[wanted], Exception) or not bars[wanted]):
+                break  # The other intervals are never used without the primary one
+        return bars
+
     def _refresh_market_data(
         self,
         symbols: List[str],
@@ -1406,32 +1596,97 @@ class PredictionEngine:
         Returns:
             List of (symbol, age_minutes) tuples for stale symbols
         """
-        from datetime import datetime, timezone
-        from ..data.repository import get_latest_timestamp, ensure_market_symbol
+        from ..data.repository import get_latest_timestamps_bulk
         from ..db import get_connection
-        
+
         stale_symbols: List[tuple[str, float]] = []
         now = datetime.now(timezone.utc)
-        
-        with get_connection() as conn:
-            for symbol in symbols:
-                try:
-                    symbol_id = ensure_market_symbol(conn, symbol, "US")
-                    latest_ts = get_latest_timestamp(conn, symbol_id, interval)
-                    
-                    if latest_ts:
-                        age_minutes = (now - latest_ts).total_seconds() / 60.0
-                        if age_minutes > max_age_minutes:
-                            stale_symbols.append((symbol, age_minutes))
-                    else:
-                        # No data - consider stale
-                        stale_symbols.append((symbol, float("inf")))
-                except Exception as e:
-                    logger.debug(f"Error checking freshness for {symbol}: {e}")
-                    # Don't add to stale list on error, just log
-        
+
+        try:
+            with get_connection() as conn:
+                latest = get_latest_timestamps_bulk(conn, symbols, interval)
+        except Exception as e:
+            # Don't report symbols as stale when the check itself failed, just log
+            logger.debug(f"Error checking data freshness: {e}")
+            return stale_symbols
+
+        for symbol in symbols:
+            _, latest_ts = latest.get(symbol, (None, None))
+            if latest_ts:
+                age_minutes = (now - latest_ts).total_seconds() / 60.0
+                if age_minutes > max_age_minutes:
+                    stale_symbols.append((symbol, age_minutes))
+            else:
+                # Unknown symbol or no data - consider stale
+                stale_symbols.append((symbol, float("inf")))
+
         return stale_symbols
 
+    def _preload_market_data(
+        self,
+        symbols: Sequence[str],
+        intervals: Sequence[str],
+    ) -> Dict[str, Dict[str, BarArray]]:
+        """
+        Bulk-load the latest bars of every symbol for each interval.
+
+        Symbols are fetched ``execution.load_batch_size`` at a time with one
+        query per batch and interval (plus one when bars must be aggregated
+        from a smaller interval), all on a single connection.
+
+        Args:
+            symbols: Symbols in the cycle
+            intervals: Intervals the cycle needs
+
+        Returns:
+            Mapping of interval to symbol to bars. An interval whose bulk load
+            failed is left out so its symbols fall back to per-symbol queries.
+        """
+        batch_size = self.execution.load_batch_size
+        if not batch_size or not symbols:
+            return {}
+
+        from ..db import get_connection
+        from ..data.repository import fetch_latest_bars_bulk_with_aggregation
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        preloaded: Dict[str, Dict[str, BarArray]] = {}
+        try:
+            with get_connection() as conn:
+                for wanted in dict.fromkeys(intervals):
+                    by_symbol: Dict[str, BarArray] = {}
+                    for start in range(0, len(unique_symbols), batch_size):
+                        by_symbol.update(
+                            fetch_latest_bars_bulk_with_aggregation(
+                                conn,
+                                unique_symbols[start:start + batch_size],
+                                wanted,
+                                limit=self.lookback_bars,
+                            )
+                        )
+                    preloaded[wanted] = by_symbol
+        except Exception as e:
+            logger.warning(f"Bulk market data load failed, falling back to per-symbol queries: {e}")
+
+        return preloaded
+
+    def _cycle_loader(
+        self,
+        preloaded: Dict[str, Dict[str, BarArray]],
+    ) -> Callable[[str, str], BarSource]:
+        """Return a loader that serves preloaded bars and queries anything else."""
+
+        def load(symbol: str, interval: str) -> BarSource:
+            by_symbol = preloaded.get(interval)
+            if by_symbol is None:
+                return self._load_market_data(symbol, interval)
+            bars = by_symbol.get(symbol)
+            if bars is None:
+                raise ValueError(f"Symbol {symbol} not found in database")
+            return bars
+
+        return load
+
     def _load_market_data(
         self,
         symbol: str,
@@ -1476,6 +1731,9 @@ class PredictionEngine:
         """
         Calculate all Drummond indicators for a timeframe.
 
+        Results are cached by bar content, in memory and on disk, so a
+        restarted scheduler reuses indicators for bars it has already seen.
+
         Args:
             intervals: Market data intervals
             timeframe: Timeframe label (e.g., "4h", "1h")
@@ -1484,7 +1742,7 @@ class PredictionEngine:
         Returns:
             TimeframeData with all indicators calculated
         """
-        return build_timeframe_data(intervals, timeframe, classification)
+        return build_timeframe_data_cached(intervals, timeframe, classification)
 
     def _signal_to_dict(self, signal: GeneratedSignal) -> Dict[str, Any]:
         """
@@ -1524,4 +1782,5 @@ __all__ = [
     "SignalAggregator",
     "PredictionEngine",
     "PredictionRunResult",
+    "SymbolCycleResult",
 ]
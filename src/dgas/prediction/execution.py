@@ -0,0 +1,175 @@
+"""Execution backends for running the prediction cycle across symbols.
+
+Each symbol in a cycle is independent: it loads its bars, builds the
+timeframe data and generates signals without looking at any other symbol.
+:class:`ExecutionConfig` selects how those per-symbol tasks are run:
+
+* ``serial`` runs them one after another in the calling thread.
+* ``thread`` runs the whole per-symbol pipeline in a thread pool, which
+  overlaps the database round trips.
+* ``process`` loads bars in a thread pool and hands the indicator and signal
+  work to a process pool, so the CPU-bound part uses more than one core.
+
+In both pooled modes at most ``max_workers`` symbols are in flight at once and
+a symbol that has not finished ``symbol_timeout_seconds`` after it started
+running is reported as timed out. Python cannot interrupt a running thread,
+so a timed-out task is abandoned rather than cancelled; it keeps its worker
+until it returns, and the cycle runs with that much less capacity meanwhile.
+
+Before any symbol runs, the engine loads the bars of the whole cycle with one
+bulk query per interval for every ``load_batch_size`` symbols; per-symbol
+queries are only used if that bulk load fails or is disabled.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# How often to look for newly started tasks while some have not started yet
+_START_POLL_SECONDS = 0.05
+
+
+class ExecutionBackend(Enum):
+    """How per-symbol prediction tasks are executed."""
+
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class ExecutionConfig:
+    """Backend, concurrency bound and per-symbol timeout for a prediction cycle."""
+
+    backend: ExecutionBackend = ExecutionBackend.SERIAL
+    max_workers: Optional[int] = None  # None = one per CPU core
+    symbol_timeout_seconds: Optional[float] = None  # None = wait indefinitely
+    load_batch_size: Optional[int] = 500  # Symbols per bulk bar query; None = query per symbol
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.backend, ExecutionBackend):
+            object.__setattr__(self, "backend", ExecutionBackend(self.backend))
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if self.symbol_timeout_seconds is not None and self.symbol_timeout_seconds <= 0:
+            raise ValueError("symbol_timeout_seconds must be positive")
+        if self.load_batch_size is not None and self.load_batch_size < 1:
+            raise ValueError("load_batch_size must be at least 1")
+
+    def worker_count(self, task_count: int) -> int:
+        """Workers to start for ``task_count`` tasks (never more workers than tasks)."""
+        workers = self.max_workers or os.cpu_count() or 4
+        return max(1, min(workers, task_count))
+
+
+class SymbolTimeoutError(TimeoutError):
+    """A per-symbol task did not finish within the configured timeout."""
+
+
+def run_bounded(
+    executor: Executor,
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    max_in_flight: int,
+    timeout: Optional[float] = None,
+) -> Iterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """Run ``fn`` over ``items`` with at most ``max_in_flight`` submitted at once.
+
+    Yields ``(item, result, error)`` in completion order; exactly one of
+    ``result`` and ``error`` is meaningful. An item still running ``timeout``
+    seconds after it started is yielded with a :class:`SymbolTimeoutError`.
+    Its thread cannot be stopped, so its slot stays taken until it returns;
+    if every slot is held that way for another ``timeout``, the remaining
+    items are yielded as timed out without running.
+    """
+    pending = deque(items)
+    # Each task records its start time in the list when a worker picks it up
+    in_flight: Dict[Future[R], Tuple[T, List[float]]] = {}
+    abandoned: Set[Future[R]] = set()
+
+    def run(item: T, started: List[float]) -> R:
+        started.append(time.monotonic())
+        return fn(item)
+
+    def fill() -> None:
+        abandoned.difference_update([future for future in abandoned if future.done()])
+        while pending and len(in_flight) + len(abandoned) < max_in_flight:
+            item = pending.popleft()
+            started: List[float] = []
+            in_flight[executor.submit(run, item, started)] = (item, started)
+
+    fill()
+
+    while in_flight or pending:
+        if not in_flight:
+            # Every slot is held by a timed-out task that is still running
+            wait(list(abandoned), timeout=timeout, return_when=FIRST_COMPLETED)
+            fill()
+            if not in_flight:
+                no_worker = SymbolTimeoutError(
+                    f"No free worker: {len(abandoned)} timed-out task(s) still running"
+                )
+                while pending:
+                    yield pending.popleft(), None, no_worker
+            continue
+
+        wait_for: Optional[float] = None
+        if timeout is not None:
+            starts = [started[0] for _, started in in_flight.values() if started]
+            if starts:
+                wait_for = max(0.0, min(starts) + timeout - time.monotonic())
+            if len(starts) < len(in_flight):
+                # Wake up in time to start the clock of tasks that begin meanwhile
+                if wait_for is None or wait_for > _START_POLL_SECONDS:
+                    wait_for = _START_POLL_SECONDS
+        done, _ = wait([*in_flight, *abandoned], timeout=wait_for, return_when=FIRST_COMPLETED)
+
+        finished: List[Tuple[T, Optional[R], Optional[BaseException]]] = []
+        for future in done:
+            if future not in in_flight:
+                continue
+            item, _ = in_flight.pop(future)
+            error: Optional[BaseException] = future.exception()
+            finished.append((item, None if error else future.result(), error))
+
+        if timeout is not None:
+            now = time.monotonic()
+            timed_out = [
+                future
+                for future, (_, started) in in_flight.items()
+                if started and now - started[0] >= timeout
+            ]
+            for future in timed_out:
+                item, _ = in_flight.pop(future)
+                abandoned.add(future)
+                finished.append((item, None, SymbolTimeoutError(f"Timed out after {timeout:g}s")))
+            if timed_out:
+                LOGGER.warning(
+                    "%d timed-out task(s) still hold workers; running with %d of %d slots",
+                    len(abandoned),
+                    max(0, max_in_flight - len(abandoned)),
+                    max_in_flight,
+                )
+
+        fill()
+        yield from finished
+
+
+__all__ = [
+    "ExecutionBackend",
+    "ExecutionConfig",
+    "SymbolTimeoutError",
+    "run_bounded",
+]
@@ -2,40 +2,45 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 import psycopg
 from psycopg.types.json import Json
 
-from ..settings import Settings
+from ..db import get_connection
+from ..db.connection_pool import database_conninfo
+from ..settings import Settings, get_settings
 
 
 class PredictionPersistence:
     """Handle database persistence for prediction system."""
 
     def __init__(self, settings: Optional[Settings] = None):
-        """Initialize persistence layer with database connection."""
+        """Initialize persistence layer; connections are checked out per operation."""
         if settings is None:
-            from ..settings import get_settings
             settings = get_settings()
         self.settings = settings
-        self._conn: Optional[psycopg.Connection] = None
 
-    def _get_connection(self) -> psycopg.Connection:
-        """Get or create database connection."""
-        if self._conn is None or self._conn.closed:
-            conninfo = self.settings.database_url
-            if "+psycopg" in conninfo:
-                conninfo = conninfo.replace("+psycopg", "", 1)
-            self._conn = psycopg.connect(conninfo)
-        return self._conn
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg.Connection]:
+        """Check out a connection for one operation.
+
+        The shared pool serves the configured database; settings that point
+        elsewhere get a dedicated connection for the operation instead.
+        """
+        conninfo = database_conninfo(self.settings)
+        if conninfo == database_conninfo(get_settings()):
+            with get_connection() as conn:
+                yield conn
+        else:
+            with psycopg.connect(conninfo) as conn:
+                yield conn
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn is not None and not self._conn.closed:
-            self._conn.close()
+        """Nothing to release: connections go back to the pool after each operation."""
 
     def __enter__(self):
         """Context manager entry."""
@@ -87,51 +92,51 @@ class PredictionPersistence:
         if run_timestamp is None:
             run_timestamp = datetime.now(timezone.utc)
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(
-                """
-                INSERT INTO prediction_runs (
-                    run_timestamp, interval_type, symbols_requested,
-                    symbols_processed, signals_generated, execution_time_ms,
-                    status, data_fetch_ms, indicator_calc_ms,
-                    signal_generation_ms, notification_ms, errors
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-                RETURNING run_id
-                """,
-                (
-                    run_timestamp,
-                    interval_type,
-                    symbols_requested,
-                    symbols_processed,
-                    signals_generated,
-                    execution_time_ms,
-                    status,
-                    data_fetch_ms,
-                    indicator_calc_ms,
-                    signal_generation_ms,
-                    notification_ms,
-                    errors if errors else [],
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO prediction_runs (
+                        run_timestamp, interval_type, symbols_requested,
+                        symbols_processed, signals_generated, execution_time_ms,
+                        status, data_fetch_ms, indicator_calc_ms,
+                        signal_generation_ms, notification_ms, errors
+                    ) VALUES (
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    )
+                    RETURNING run_id
+                    """,
+                    (
+                        run_timestamp,
+                        interval_type,
+                        symbols_requested,
+                        symbols_processed,
+                        signals_generated,
+                        execution_time_ms,
+                        status,
+                        data_fetch_ms,
+                        indicator_calc_ms,
+                        signal_generation_ms,
+                        notification_ms,
+                        errors if errors else [],
+                    )
                 )
-            )
 
-            result = cursor.fetchone()
-            if result is None:
-                raise ValueError("Failed to insert prediction run")
-            run_id = result[0]
+                result = cursor.fetchone()
+                if result is None:
+                    raise ValueError("Failed to insert prediction run")
+                run_id = result[0]
 
-            conn.commit()
-            return run_id
+                conn.commit()
+                return run_id
 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
     def get_recent_runs(
         self,
@@ -148,57 +153,57 @@ class PredictionPersistence:
         Returns:
             List of run dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            query = """
-                SELECT
-                    run_id, run_timestamp, interval_type, symbols_requested,
-                    symbols_processed, signals_generated, execution_time_ms,
-                    status, data_fetch_ms, indicator_calc_ms,
-                    signal_generation_ms, notification_ms, errors
-                FROM prediction_runs
-            """
-            params: List = []
-
-            if status is not None:
-                query += " WHERE status = %s"
-                params.append(status)
-
-            query += " ORDER BY run_timestamp DESC LIMIT %s"
-            params.append(limit)
-
-            cursor.execute(query, params)
-
-            runs = []
-            for row in cursor.fetchall():
-                (
-                    run_id, timestamp, interval_type, requested, processed,
-                    signals, exec_time, status, data_ms, calc_ms,
-                    signal_ms, notif_ms, errors
-                ) = row
-
-                runs.append({
-                    "run_id": run_id,
-                    "run_timestamp": timestamp,
-                    "interval_type": interval_type,
-                    "symbols_requested": requested,
-                    "symbols_processed": processed,
-                    "signals_generated": signals,
-                    "execution_time_ms": exec_time,
-                    "status": status,
-                    "data_fetch_ms": data_ms,
-                    "indicator_calc_ms": calc_ms,
-                    "signal_generation_ms": signal_ms,
-                    "notification_ms": notif_ms,
-                    "errors": errors,
-                })
-
-            return runs
-
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                query = """
+                    SELECT
+                        run_id, run_timestamp, interval_type, symbols_requested,
+                        symbols_processed, signals_generated, execution_time_ms,
+                        status, data_fetch_ms, indicator_calc_ms,
+                        signal_generation_ms, notification_ms, errors
+                    FROM prediction_runs
+                """
+                params: List = []
+
+                if status is not None:
+                    query += " WHERE status = %s"
+                    params.append(status)
+
+                query += " ORDER BY run_timestamp DESC LIMIT %s"
+                params.append(limit)
+
+                cursor.execute(query, params)
+
+                runs = []
+                for row in cursor.fetchall():
+                    (
+                        run_id, timestamp, interval_type, requested, processed,
+                        signals, exec_time, status, data_ms, calc_ms,
+                        signal_ms, notif_ms, errors
+                    ) = row
+
+                    runs.append({
+                        "run_id": run_id,
+                        "run_timestamp": timestamp,
+                        "interval_type": interval_type,
+                        "symbols_requested": requested,
+                        "symbols_processed": processed,
+                        "signals_generated": signals,
+                        "execution_time_ms": exec_time,
+                        "status": status,
+                        "data_fetch_ms": data_ms,
+                        "indicator_calc_ms": calc_ms,
+                        "signal_generation_ms": signal_ms,
+                        "notification_ms": notif_ms,
+                        "errors": errors,
+                    })
+
+                return runs
+
+            finally:
+                cursor.close()
 
     # ================================================================================
     # Generated Signal Persistence
@@ -239,67 +244,74 @@ class PredictionPersistence:
         if not signals:
             return 0
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            # Prepare values for bulk insert
-            values = []
-            for signal in signals:
-                # Get symbol_id
-                cursor.execute(
-                    "SELECT symbol_id FROM market_symbols WHERE symbol = %s",
-                    (signal["symbol"],)
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                # Prepare values for bulk insert
+                values = []
+                for signal in signals:
+                    # Get symbol_id
+                    cursor.execute(
+                        "SELECT symbol_id FROM market_symbols WHERE symbol = %s",
+                        (signal["symbol"],)
+                    )
+                    result = cursor.fetchone()
+                    if result is None:
+                        raise ValueError(f"Symbol {signal['symbol']} not found in database")
+                    symbol_id = result[0]
+
+                    values.append((
+                        run_id,
+                        symbol_id,
+                        signal["signal_timestamp"],
+                        signal["signal_type"],
+                        float(signal["entry_price"]),
+                        float(signal["stop_loss"]),
+                        float(signal["target_price"]),
+                        signal["confidence"],
+                        signal["signal_strength"],
+                        signal["timeframe_alignment"],
+                        signal.get("risk_reward_ratio"),
+                        signal.get("htf_trend"),
+                        signal.get("trading_tf_state"),
+                        signal.get("confluence_zones_count", 0),
+                        (
+                            Json(signal.get("pattern_context"))
+                            if signal.get("pattern_context")
+                            else None
+                        ),
+                        signal.get("notification_sent", False),
+                        signal.get("notification_channels"),
+                        signal.get("notification_timestamp"),
+                    ))
+
+                # Bulk insert using executemany (psycopg3)
+                cursor.executemany(
+                    """
+                    INSERT INTO generated_signals (
+                        run_id, symbol_id, signal_timestamp, signal_type,
+                        entry_price, stop_loss, target_price,
+                        confidence, signal_strength, timeframe_alignment,
+                        risk_reward_ratio, htf_trend, trading_tf_state,
+                        confluence_zones_count, pattern_context,
+                        notification_sent, notification_channels, notification_timestamp
+                    ) VALUES (
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    )
+                    """,
+                    values
                 )
-                result = cursor.fetchone()
-                if result is None:
-                    raise ValueError(f"Symbol {signal['symbol']} not found in database")
-                symbol_id = result[0]
-
-                values.append((
-                    run_id,
-                    symbol_id,
-                    signal["signal_timestamp"],
-                    signal["signal_type"],
-                    float(signal["entry_price"]),
-                    float(signal["stop_loss"]),
-                    float(signal["target_price"]),
-                    signal["confidence"],
-                    signal["signal_strength"],
-                    signal["timeframe_alignment"],
-                    signal.get("risk_reward_ratio"),
-                    signal.get("htf_trend"),
-                    signal.get("trading_tf_state"),
-                    signal.get("confluence_zones_count", 0),
-                    Json(signal.get("pattern_context")) if signal.get("pattern_context") else None,
-                    signal.get("notification_sent", False),
-                    signal.get("notification_channels"),
-                    signal.get("notification_timestamp"),
-                ))
-
-            # Bulk insert using executemany (psycopg3)
-            cursor.executemany(
-                """
-                INSERT INTO generated_signals (
-                    run_id, symbol_id, signal_timestamp, signal_type,
-                    entry_price, stop_loss, target_price,
-                    confidence, signal_strength, timeframe_alignment,
-                    risk_reward_ratio, htf_trend, trading_tf_state,
-                    confluence_zones_count, pattern_context,
-                    notification_sent, notification_channels, notification_timestamp
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                values
-            )
-
-            conn.commit()
-            return len(values)
-
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
+
+                conn.commit()
+                return len(values)
+
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
     def get_recent_signals(
         self,
@@ -320,75 +332,75 @@ class PredictionPersistence:
         Returns:
             List of signal dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            query = """
-                SELECT
-                    gs.signal_id, gs.run_id, ms.symbol, gs.signal_timestamp,
-                    gs.signal_type, gs.entry_price, gs.stop_loss, gs.target_price,
-                    gs.confidence, gs.signal_strength, gs.timeframe_alignment,
-                    gs.risk_reward_ratio, gs.htf_trend, gs.trading_tf_state,
-                    gs.confluence_zones_count, gs.pattern_context,
-                    gs.notification_sent, gs.notification_channels,
-                    gs.notification_timestamp, gs.outcome, gs.pnl_pct
-                FROM generated_signals gs
-                JOIN market_symbols ms ON gs.symbol_id = ms.symbol_id
-                WHERE gs.signal_timestamp >= NOW() - INTERVAL '%s hours'
-            """
-            params: List = [lookback_hours]
-
-            if symbol is not None:
-                query += " AND ms.symbol = %s"
-                params.append(symbol)
-
-            if min_confidence is not None:
-                query += " AND gs.confidence >= %s"
-                params.append(min_confidence)
-
-            query += " ORDER BY gs.signal_timestamp DESC LIMIT %s"
-            params.append(limit)
-
-            cursor.execute(query, params)
-
-            signals = []
-            for row in cursor.fetchall():
-                (
-                    signal_id, run_id, symbol, timestamp, signal_type,
-                    entry, stop, target, confidence, strength, alignment,
-                    rr_ratio, htf_trend, tf_state, zones_count, pattern_ctx,
-                    notif_sent, notif_channels, notif_ts, outcome, pnl
-                ) = row
-
-                signals.append({
-                    "signal_id": signal_id,
-                    "run_id": run_id,
-                    "symbol": symbol,
-                    "signal_timestamp": timestamp,
-                    "signal_type": signal_type,
-                    "entry_price": Decimal(str(entry)),
-                    "stop_loss": Decimal(str(stop)),
-                    "target_price": Decimal(str(target)),
-                    "confidence": float(confidence),
-                    "signal_strength": float(strength),
-                    "timeframe_alignment": float(alignment),
-                    "risk_reward_ratio": float(rr_ratio) if rr_ratio else None,
-                    "htf_trend": htf_trend,
-                    "trading_tf_state": tf_state,
-                    "confluence_zones_count": zones_count,
-                    "pattern_context": pattern_ctx,
-                    "notification_sent": notif_sent,
-                    "notification_channels": notif_channels,
-                    "notification_timestamp": notif_ts,
-                    "outcome": outcome,
-                    "pnl_pct": float(pnl) if pnl else None,
-                })
-
-            return signals
-
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                query = """
+                    SELECT
+                        gs.signal_id, gs.run_id, ms.symbol, gs.signal_timestamp,
+                        gs.signal_type, gs.entry_price, gs.stop_loss, gs.target_price,
+                        gs.confidence, gs.signal_strength, gs.timeframe_alignment,
+                        gs.risk_reward_ratio, gs.htf_trend, gs.trading_tf_state,
+                        gs.confluence_zones_count, gs.pattern_context,
+                        gs.notification_sent, gs.notification_channels,
+                        gs.notification_timestamp, gs.outcome, gs.pnl_pct
+                    FROM generated_signals gs
+                    JOIN market_symbols ms ON gs.symbol_id = ms.symbol_id
+                    WHERE gs.signal_timestamp >= NOW() - INTERVAL '%s hours'
+                """
+                params: List = [lookback_hours]
+
+                if symbol is not None:
+                    query += " AND ms.symbol = %s"
+                    params.append(symbol)
+
+                if min_confidence is not None:
+                    query += " AND gs.confidence >= %s"
+                    params.append(min_confidence)
+
+                query += " ORDER BY gs.signal_timestamp DESC LIMIT %s"
+                params.append(limit)
+
+                cursor.execute(query, params)
+
+                signals = []
+                for row in cursor.fetchall():
+                    (
+                        signal_id, run_id, symbol, timestamp, signal_type,
+                        entry, stop, target, confidence, strength, alignment,
+                        rr_ratio, htf_trend, tf_state, zones_count, pattern_ctx,
+                        notif_sent, notif_channels, notif_ts, outcome, pnl
+                    ) = row
+
+                    signals.append({
+                        "signal_id": signal_id,
+                        "run_id": run_id,
+                        "symbol": symbol,
+                        "signal_timestamp": timestamp,
+                        "signal_type": signal_type,
+                        "entry_price": Decimal(str(entry)),
+                        "stop_loss": Decimal(str(stop)),
+                        "target_price": Decimal(str(target)),
+                        "confidence": float(confidence),
+                        "signal_strength": float(strength),
+                        "timeframe_alignment": float(alignment),
+                        "risk_reward_ratio": float(rr_ratio) if rr_ratio else None,
+                        "htf_trend": htf_trend,
+                        "trading_tf_state": tf_state,
+                        "confluence_zones_count": zones_count,
+                        "pattern_context": pattern_ctx,
+                        "notification_sent": notif_sent,
+                        "notification_channels": notif_channels,
+                        "notification_timestamp": notif_ts,
+                        "outcome": outcome,
+                        "pnl_pct": float(pnl) if pnl else None,
+                    })
+
+                return signals
+
+            finally:
+                cursor.close()
 
     def update_signal_outcome(
         self,
@@ -410,40 +422,40 @@ class PredictionPersistence:
             actual_close: Closing price at evaluation end
             pnl_pct: Percentage P&L if signal was taken
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(
-                """
-                UPDATE generated_signals
-                SET
-                    outcome = %s,
-                    actual_high = %s,
-                    actual_low = %s,
-                    actual_close = %s,
-                    pnl_pct = %s,
-                    evaluated_at = %s
-                WHERE signal_id = %s
-                """,
-                (
-                    outcome,
-                    float(actual_high),
-                    float(actual_low),
-                    float(actual_close),
-                    pnl_pct,
-                    datetime.now(timezone.utc),
-                    signal_id,
+            try:
+                cursor.execute(
+                    """
+                    UPDATE generated_signals
+                    SET
+                        outcome = %s,
+                        actual_high = %s,
+                        actual_low = %s,
+                        actual_close = %s,
+                        pnl_pct = %s,
+                        evaluated_at = %s
+                    WHERE signal_id = %s
+                    """,
+                    (
+                        outcome,
+                        float(actual_high),
+                        float(actual_low),
+                        float(actual_close),
+                        pnl_pct,
+                        datetime.now(timezone.utc),
+                        signal_id,
+                    )
                 )
-            )
 
-            conn.commit()
+                conn.commit()
 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
     # ================================================================================
     # Metrics Persistence
@@ -473,42 +485,42 @@ class PredictionPersistence:
         if metric_timestamp is None:
             metric_timestamp = datetime.now(timezone.utc)
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(
-                """
-                INSERT INTO prediction_metrics (
-                    metric_timestamp, metric_type, metric_value,
-                    aggregation_period, metadata
-                ) VALUES (
-                    %s, %s, %s, %s, %s
-                )
-                RETURNING metric_id
-                """,
-                (
-                    metric_timestamp,
-                    metric_type,
-                    metric_value,
-                    aggregation_period,
-                    Json(metadata) if metadata else None,
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO prediction_metrics (
+                        metric_timestamp, metric_type, metric_value,
+                        aggregation_period, metadata
+                    ) VALUES (
+                        %s, %s, %s, %s, %s
+                    )
+                    RETURNING metric_id
+                    """,
+                    (
+                        metric_timestamp,
+                        metric_type,
+                        metric_value,
+                        aggregation_period,
+                        Json(metadata) if metadata else None,
+                    )
                 )
-            )
 
-            result = cursor.fetchone()
-            if result is None:
-                raise ValueError("Failed to insert metric")
-            metric_id = result[0]
+                result = cursor.fetchone()
+                if result is None:
+                    raise ValueError("Failed to insert metric")
+                metric_id = result[0]
 
-            conn.commit()
-            return metric_id
+                conn.commit()
+                return metric_id
 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
     def get_metrics(
         self,
@@ -529,49 +541,49 @@ class PredictionPersistence:
         Returns:
             List of metric dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        try:
-            query = """
-                SELECT
-                    metric_id, metric_timestamp, metric_type,
-                    metric_value, aggregation_period, metadata
-                FROM prediction_metrics
-                WHERE metric_timestamp >= NOW() - INTERVAL '%s hours'
-            """
-            params: List = [lookback_hours]
-
-            if metric_type is not None:
-                query += " AND metric_type = %s"
-                params.append(metric_type)
-
-            if aggregation_period is not None:
-                query += " AND aggregation_period = %s"
-                params.append(aggregation_period)
-
-            query += " ORDER BY metric_timestamp DESC LIMIT %s"
-            params.append(limit)
-
-            cursor.execute(query, params)
-
-            metrics = []
-            for row in cursor.fetchall():
-                (metric_id, timestamp, mtype, value, agg_period, metadata) = row
-
-                metrics.append({
-                    "metric_id": metric_id,
-                    "metric_timestamp": timestamp,
-                    "metric_type": mtype,
-                    "metric_value": float(value),
-                    "aggregation_period": agg_period,
-                    "metadata": metadata,
-                })
-
-            return metrics
-
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                query = """
+                    SELECT
+                        metric_id, metric_timestamp, metric_type,
+                        metric_value, aggregation_period, metadata
+                    FROM prediction_metrics
+                    WHERE metric_timestamp >= NOW() - INTERVAL '%s hours'
+                """
+                params: List = [lookback_hours]
+
+                if metric_type is not None:
+                    query += " AND metric_type = %s"
+                    params.append(metric_type)
+
+                if aggregation_period is not None:
+                    query += " AND aggregation_period = %s"
+                    params.append(aggregation_period)
+
+                query += " ORDER BY metric_timestamp DESC LIMIT %s"
+                params.append(limit)
+
+                cursor.execute(query, params)
+
+                metrics = []
+                for row in cursor.fetchall():
+                    (metric_id, timestamp, mtype, value, agg_period, metadata) = row
+
+                    metrics.append({
+                        "metric_id": metric_id,
+                        "metric_timestamp": timestamp,
+                        "metric_type": mtype,
+                        "metric_value": float(value),
+                        "aggregation_period": agg_period,
+                        "metadata": metadata,
+                    })
+
+                return metrics
+
+            finally:
+                cursor.close()
 
     # ================================================================================
     # Scheduler State Management
@@ -595,39 +607,39 @@ class PredictionPersistence:
             current_run_id: Optional current run ID
             error_message: Optional error message
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(
-                """
-                UPDATE scheduler_state
-                SET
-                    status = %s,
-                    last_run_timestamp = COALESCE(%s, last_run_timestamp),
-                    next_scheduled_run = %s,
-                    current_run_id = %s,
-                    error_message = %s,
-                    updated_at = %s
-                WHERE state_id = 1
-                """,
-                (
-                    status,
-                    last_run_timestamp,
-                    next_scheduled_run,
-                    current_run_id,
-                    error_message,
-                    datetime.now(timezone.utc),
+            try:
+                cursor.execute(
+                    """
+                    UPDATE scheduler_state
+                    SET
+                        status = %s,
+                        last_run_timestamp = COALESCE(%s, last_run_timestamp),
+                        next_scheduled_run = %s,
+                        current_run_id = %s,
+                        error_message = %s,
+                        updated_at = %s
+                    WHERE state_id = 1
+                    """,
+                    (
+                        status,
+                        last_run_timestamp,
+                        next_scheduled_run,
+                        current_run_id,
+                        error_message,
+                        datetime.now(timezone.utc),
+                    )
                 )
-            )
 
-            conn.commit()
+                conn.commit()
 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
 
     def get_scheduler_state(self) -> Dict[str, Any]:
         """
@@ -636,44 +648,44 @@ class PredictionPersistence:
         Returns:
             Dictionary with scheduler state
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(
-                """
-                SELECT
-                    last_run_timestamp, next_scheduled_run, status,
-                    current_run_id, error_message, updated_at
-                FROM scheduler_state
-                WHERE state_id = 1
-                """
-            )
+            try:
+                cursor.execute(
+                    """
+                    SELECT
+                        last_run_timestamp, next_scheduled_run, status,
+                        current_run_id, error_message, updated_at
+                    FROM scheduler_state
+                    WHERE state_id = 1
+                    """
+                )
 
-            row = cursor.fetchone()
-            if row is None:
-                return {
-                    "status": "IDLE",
-                    "last_run_timestamp": None,
-                    "next_scheduled_run": None,
-                    "current_run_id": None,
-                    "error_message": None,
-                    "updated_at": None,
-                }
+                row = cursor.fetchone()
+                if row is None:
+                    return {
+                        "status": "IDLE",
+                        "last_run_timestamp": None,
+                        "next_scheduled_run": None,
+                        "current_run_id": None,
+                        "error_message": None,
+                        "updated_at": None,
+                    }
 
-            (last_run, next_run, status, current_run, error, updated) = row
+                (last_run, next_run, status, current_run, error, updated) = row
 
-            return {
-                "last_run_timestamp": last_run,
-                "next_scheduled_run": next_run,
-                "status": status,
-                "current_run_id": current_run,
-                "error_message": error,
-                "updated_at": updated,
-            }
+                return {
+                    "last_run_timestamp": last_run,
+                    "next_scheduled_run": next_run,
+                    "status": status,
+                    "current_run_id": current_run,
+                    "error_message": error,
+                    "updated_at": updated,
+                }
 
-        finally:
-            cursor.close()
+            finally:
+                cursor.close()
 
 
 __all__ = ["PredictionPersistence"]
@@ -31,6 +31,48 @@ class Settings(BaseSettings):
         ge=1,
         description="Maximum API requests per minute before throttling.",
     )
+    db_pool_min_size: int = Field(
+        default=1,
+        alias="DGAS_DB_POOL_MIN_SIZE",
+        ge=0,
+        description="Connections the shared pool keeps open when idle.",
+    )
+    db_pool_max_size: int = Field(
+        default=10,
+        alias="DGAS_DB_POOL_MAX_SIZE",
+        ge=1,
+        description="Maximum connections in the shared pool.",
+    )
+    db_pool_timeout: float = Field(
+        default=30.0,
+        alias="DGAS_DB_POOL_TIMEOUT",
+        gt=0,
+        description="Seconds to wait for a pooled connection before failing.",
+    )
+    db_pool_max_idle: float = Field(
+        default=300.0,
+        alias="DGAS_DB_POOL_MAX_IDLE",
+        gt=0,
+        description="Seconds an idle connection above the minimum is kept open.",
+    )
+    db_copy_threshold: int = Field(
+        default=500,
+        alias="DGAS_DB_COPY_THRESHOLD",
+        ge=0,
+        description="Bars per market data upsert from which COPY replaces row-by-row inserts.",
+    )
+    calc_cache_disk_mb: int = Field(
+        default=512,
+        alias="DGAS_CALC_CACHE_DISK_MB",
+        ge=0,
+        description="Disk budget of the persistent calculation cache under data_dir; 0 disables it.",
+    )
+    calc_cache_disk_ttl_hours: float = Field(
+        default=168.0,
+        alias="DGAS_CALC_CACHE_DISK_TTL_HOURS",
+        gt=0,
+        description="Hours a persisted calculation result is kept.",
+    )
 
 
 @lru_cache(maxsize=1)
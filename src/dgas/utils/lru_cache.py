@@ -0,0 +1,417 @@
+"""Thread-safe LRU cache with a memory budget.
+
+Shared core of :class:`dgas.calculations.cache.CalculationCache` and
+:class:`dgas.db.query_cache.QueryCache`.
+
+* Lookups, inserts and evictions are O(1): each segment keeps its entries in
+  an ``OrderedDict`` in recency order, so the least recently used entry is
+  always at the front.
+* Keys are spread over lock-striped segments, so threads working on different
+  keys rarely wait on each other. Each segment is a true LRU over its share
+  of the limits; caches too small to split keep a single segment, which makes
+  the eviction order exact.
+* Every entry is charged its estimated size (:func:`estimate_size`) against
+  an optional byte budget as well as the entry limit.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STRIPES = 8
+
+# Segments are only split off once each can hold this many entries and bytes
+_MIN_SEGMENT_ENTRIES = 64
+_MIN_SEGMENT_BYTES = 1024 * 1024
+
+_SIZE_SAMPLE = 16
+_SIZE_DEPTH = 4
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory held by ``value`` in bytes.
+
+    NumPy arrays and pandas objects report their buffers. Containers and
+    objects are walked a few levels deep. Long containers are sampled and
+    extrapolated, so the cost stays bounded for large results.
+    """
+    return _estimate(value, _SIZE_DEPTH, set())
+
+
+def _estimate(value: Any, depth: int, seen: Set[int]) -> int:
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return sys.getsizeof(value)
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes + 112
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(index=True)
+            return int(getattr(usage, "sum", lambda: usage)())
+        except TypeError:
+            pass
+
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+
+    if isinstance(value, dict):
+        items: Sequence[Any] = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value if isinstance(value, (list, tuple)) else list(value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        items = [getattr(value, f.name, None) for f in fields(value)]
+    elif hasattr(value, "__dict__"):
+        items = list(vars(value).values())
+    else:
+        return size
+
+    count = len(items)
+    if count > _SIZE_SAMPLE:
+        step = count / _SIZE_SAMPLE
+        sampled = [items[int(i * step)] for i in range(_SIZE_SAMPLE)]
+        sampled_size = sum(_estimate(item, depth - 1, seen) for item in sampled)
+        return size + sampled_size * count // _SIZE_SAMPLE
+    return size + sum(_estimate(item, depth - 1, seen) for item in items)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a cache since creation or the last :meth:`LRUCache.clear`."""
+
+    entries: int
+    bytes: int
+    max_entries: Optional[int]
+    max_bytes: Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    saved_ms: float
+
+    @property
+    def hit_rate_percent(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total * 100 if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "size": self.entries,
+            "max_size": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_percent": self.hit_rate_percent,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "total_time_saved_ms": self.saved_ms,
+        }
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at", "hits", "cost_ms")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float], cost_ms: float) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.hits = 0
+        self.cost_ms = cost_ms
+
+
+class _Segment:
+    __slots__ = (
+        "lock",
+        "entries",
+        "bytes",
+        "max_entries",
+        "max_bytes",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "saved_ms",
+    )
+
+    def __init__(self, max_entries: Optional[int], max_bytes: Optional[int]) -> None:
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.bytes = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.saved_ms = 0.0
+
+    def remove(self, key: Hashable) -> _Entry:
+        entry = self.entries.pop(key)
+        self.bytes -= entry.size
+        return entry
+
+    def shrink(self) -> None:
+        """Evict from the least recently used end until within the limits."""
+        entries = self.entries
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, entry = entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+
+
+def _split(limit: Optional[int], parts: int, index: int) -> Optional[int]:
+    if limit is None:
+        return None
+    return limit // parts + (1 if index < limit % parts else 0)
+
+
+class LRUCache:
+    """Least-recently-used cache bounded by entry count and estimated bytes.
+
+    Args:
+        max_entries: Maximum number of entries (``None`` for no limit)
+        max_bytes: Memory budget in bytes (``None`` for no limit)
+        default_ttl_seconds: Lifetime of entries stored without a TTL (``None`` never expires)
+        stripes: Upper bound on the number of lock-striped segments
+        sizeof: Size estimator used for entries stored without an explicit size
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        *,
+        default_ttl_seconds: Optional[float] = None,
+        stripes: int = DEFAULT_STRIPES,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        if max_entries is not None:
+            stripes = min(stripes, max_entries // _MIN_SEGMENT_ENTRIES)
+        if max_bytes is not None:
+            stripes = min(stripes, max_bytes // _MIN_SEGMENT_BYTES)
+        stripes = max(stripes, 1)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self._sizeof = sizeof
+        self._segments = tuple(
+            _Segment(_split(max_entries, stripes, index), _split(max_bytes, stripes, index))
+            for index in range(stripes)
+        )
+
+    def _segment(self, key: Hashable) -> _Segment:
+        segments = self._segments
+        return segments[hash(key) % len(segments)] if len(segments) > 1 else segments[0]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it most recently used."""
+        segment = self._segment(key)
+        with segment.lock:
+            entry = segment.entries.get(key)
+            if entry is None:
+                segment.misses += 1
+                return default
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                segment.remove(key)
+                segment.expirations += 1
+                segment.misses += 1
+                return default
+            segment.entries.move_to_end(key)
+            entry.hits += 1
+            segment.hits += 1
+            segment.saved_ms += entry.cost_ms
+            return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        ttl_seconds: Optional[float] = None,
+        size: Optional[int] = None,
+        cost_ms: float = 0.0,
+    ) -> bool:
+        """Store ``value`` as the most recently used entry.
+
+        Args:
+            key: Hashable key
+            value: Value to cache
+            ttl_seconds: Lifetime (default: ``default_ttl_seconds``)
+            size: Size in bytes (default: estimated from ``value``)
+            cost_ms: Time it took to produce the value, reported as time saved on hits
+
+        Returns:
+            False if the value alone exceeds its segment's byte budget and was not stored
+        """
+        if size is None:
+            size = self._sizeof(value)
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        segment = self._segment(key)
+        with segment.lock:
+            if key in segment.entries:
+                segment.remove(key)
+            if segment.max_bytes is not None and size > segment.max_bytes:
+                LOGGER.debug(
+                    "Not caching %s: %s bytes exceeds the %s byte budget",
+                    key,
+                    size,
+                    segment.max_bytes,
+                )
+                return False
+            segment.entries[key] = _Entry(value, size, expires_at, cost_ms)
+            segment.bytes += size
+            segment.shrink()
+        return True
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove ``key``; returns whether it was present."""
+        segment = self._segment(key)
+        with segment.lock:
+            if key not in segment.entries:
+                return False
+            segment.remove(key)
+            return True
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches ``predicate``; returns how many."""
+        removed = 0
+        for segment in self._segments:
+            with segment.lock:
+                for key in [key for key in segment.entries if predicate(key)]:
+                    segment.remove(key)
+                    removed += 1
+        return removed
+
+    def clear_expired(self) -> int:
+        """Remove expired entries; returns how many."""
+        now = time.monotonic()
+        removed = 0
+        for segment in self._segments:
+            with segment.lock:
+                expired = [
+                    key
+                    for key, entry in segment.entries.items()
+                    if entry.expires_at is not None and entry.expires_at <= now
+                ]
+                for key in expired:
+                    segment.remove(key)
+                segment.expirations += len(expired)
+                removed += len(expired)
+        return removed
+
+    def count_expired(self) -> int:
+        """Number of entries that have expired but not been removed yet."""
+        now = time.monotonic()
+        count = 0
+        for segment in self._segments:
+            with segment.lock:
+                count += sum(
+                    1
+                    for entry in segment.entries.values()
+                    if entry.expires_at is not None and entry.expires_at <= now
+                )
+        return count
+
+    def clear(self) -> int:
+        """Remove every entry and reset the counters; returns how many entries were removed."""
+        removed = 0
+        for segment in self._segments:
+            with segment.lock:
+                removed += len(segment.entries)
+                segment.entries.clear()
+                segment.bytes = 0
+                segment.reset_counters()
+        return removed
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of the keys, least recently used first within each segment."""
+        keys: List[Hashable] = []
+        for segment in self._segments:
+            with segment.lock:
+                keys.extend(segment.entries)
+        return keys
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate over a snapshot of ``(key, value)`` pairs without touching recency."""
+        snapshot: List[Tuple[Hashable, Any]] = []
+        for segment in self._segments:
+            with segment.lock:
+                snapshot.extend((key, entry.value) for key, entry in segment.entries.items())
+        return iter(snapshot)
+
+    def stats(self) -> CacheStats:
+        totals = [0, 0, 0, 0, 0, 0]
+        saved_ms = 0.0
+        for segment in self._segments:
+            with segment.lock:
+                for index, value in enumerate(
+                    (
+                        len(segment.entries),
+                        segment.bytes,
+                        segment.hits,
+                        segment.misses,
+                        segment.evictions,
+                        segment.expirations,
+                    )
+                ):
+                    totals[index] += value
+                saved_ms += segment.saved_ms
+        entries, size, hits, misses, evictions, expirations = totals
+        return CacheStats(
+            entries=entries,
+            bytes=size,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            hits=hits,
+            misses=misses,
+            evictions=evictions,
+            expirations=expirations,
+            saved_ms=saved_ms,
+        )
+
+    def __len__(self) -> int:
+        return sum(len(segment.entries) for segment in self._segments)
+
+    def __contains__(self, key: object) -> bool:
+        segment = self._segment(key)
+        with segment.lock:
+            entry = segment.entries.get(key)
+            if entry is None:
+                return False
+            return entry.expires_at is None or entry.expires_at > time.monotonic()
+
+
+__all__ = [
+    "DEFAULT_STRIPES",
+    "CacheStats",
+    "LRUCache",
+    "estimate_size",
+]
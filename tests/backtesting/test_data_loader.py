@@ -3,7 +3,15 @@ from decimal import Decimal
 
 import pytest
 
-from dgas.backtesting.data_loader import load_dataset
+from dgas.backtesting import data_loader
+from dgas.backtesting.data_loader import (
+    cached_replay_multi_timeframe_analysis,
+    load_dataset,
+    replay_multi_timeframe_analysis,
+)
+from dgas.calculations import MultiTimeframeCoordinator, TimeframeType, build_timeframe_data
+from dgas.calculations.cache import CalculationCache
+from dgas.calculations.disk_cache import DiskCache
 from dgas.calculations.multi_timeframe import MultiTimeframeAnalysis
 from dgas.data.models import IntervalData
 
@@ -63,3 +71,68 @@ def test_load_dataset_includes_multi_timeframe_analysis(monkeypatch, synthetic_d
     indicators = dataset.bars[-1].indicators
     assert "analysis" in indicators
     assert isinstance(indicators["analysis"], MultiTimeframeAnalysis)
+
+
+def _walk(count: int, step: timedelta, interval: str) -> list[IntervalData]:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    closes = [Decimal("100") + Decimal(idx % 7) - Decimal(idx % 3) / 2 for idx in range(count)]
+    return [_make_interval(start + step * idx, close, interval) for idx, close in enumerate(closes)]
+
+
+def test_replay_matches_prefix_rebuild():
+    trading_bars = _walk(40, timedelta(hours=1), "1h")
+    htf_bars = _walk(10, timedelta(hours=4), "4h")
+    coordinator = MultiTimeframeCoordinator("4h", "1h")
+
+    replayed = dict(replay_multi_timeframe_analysis(trading_bars, htf_bars, "1h", "4h", max_bars=None))
+
+    expected = {}
+    for idx, bar in enumerate(trading_bars):
+        htf_prefix = [htf for htf in htf_bars if htf.timestamp <= bar.timestamp]
+        if idx < 2 or len(htf_prefix) < 3:
+            continue
+        expected[bar.timestamp] = coordinator.analyze(
+            build_timeframe_data(htf_prefix, "4h", TimeframeType.HIGHER),
+            build_timeframe_data(trading_bars[: idx + 1], "1h", TimeframeType.TRADING),
+            target_timestamp=bar.timestamp,
+        )
+
+    assert expected
+    assert list(replayed) == list(expected)
+    assert [repr(item) for item in replayed.values()] == [repr(item) for item in expected.values()]
+
+
+def test_replay_window_yields_one_analysis_per_bar():
+    trading_bars = _walk(60, timedelta(hours=1), "1h")
+    htf_bars = _walk(16, timedelta(hours=4), "4h")
+
+    replayed = list(replay_multi_timeframe_analysis(trading_bars, htf_bars, "1h", "4h", max_bars=10))
+
+    # Three HTF bars exist from the ninth trading bar on
+    assert [timestamp for timestamp, _ in replayed] == [bar.timestamp for bar in trading_bars[8:]]
+    assert all(isinstance(analysis, MultiTimeframeAnalysis) for _, analysis in replayed)
+
+
+def test_cached_replay_is_reused_after_a_restart(monkeypatch, tmp_path):
+    trading_bars = _walk(30, timedelta(hours=1), "1h")
+    htf_bars = _walk(10, timedelta(hours=4), "4h")
+    path = tmp_path / "cache.sqlite3"
+
+    monkeypatch.setattr(data_loader, "get_calculation_cache", lambda: CalculationCache(disk_cache=DiskCache(path)))
+    first = cached_replay_multi_timeframe_analysis(trading_bars, htf_bars, "1h", "4h", max_bars=10)
+    expected = list(replay_multi_timeframe_analysis(trading_bars, htf_bars, "1h", "4h", max_bars=10))
+    assert [repr(item) for item in first] == [repr(item) for item in expected]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("indicators were recomputed")
+
+    # Fresh in-memory tier, same disk: nothing is recomputed
+    monkeypatch.setattr(data_loader, "replay_multi_timeframe_analysis", fail)
+    again = cached_replay_multi_timeframe_analysis(trading_bars, htf_bars, "1h", "4h", max_bars=10)
+    assert [repr(item) for item in again] == [repr(item) for item in expected]
+
+    # A corrected HTF bar is a different key
+    corrected = list(htf_bars)
+    corrected[5] = corrected[5].model_copy(update={"close": corrected[5].close + Decimal("1")})
+    with pytest.raises(AssertionError, match="recomputed"):
+        cached_replay_multi_timeframe_analysis(trading_bars, corrected, "1h", "4h", max_bars=10)
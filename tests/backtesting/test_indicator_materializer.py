@@ -0,0 +1,130 @@
+"""Tests for the indicator materialization batch job."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from tests.helpers import make_bars
+
+from dgas.backtesting import indicator_materializer as materializer
+from dgas.backtesting.data_loader import replay_multi_timeframe_analysis
+
+TRADING_START = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+TRADING_BARS = make_bars("AAA", TRADING_START, timedelta(minutes=30), 60, "30m", 1)
+HTF_BARS = make_bars("AAA", TRADING_START - timedelta(days=20), timedelta(days=1), 22, "1d", 2)
+
+
+def install_fakes(monkeypatch, high_water_mark):
+    bars = {"30m": TRADING_BARS, "1d": HTF_BARS}
+    writes = []
+
+    @contextmanager
+    def fake_connection():
+        yield Mock()
+
+    def fake_fetch(conn, symbol, interval, *, start=None, end=None, limit=None):
+        return [
+            bar
+            for bar in bars[interval]
+            if (start is None or bar.timestamp >= start) and (end is None or bar.timestamp <= end)
+        ]
+
+    def fake_tail(conn, symbol, interval, limit, *, start=None, end=None):
+        return fake_fetch(conn, symbol, interval, start=start, end=end)[-limit:]
+
+    def fake_write(conn, symbol_id, htf_interval, trading_interval, analyses, hwm):
+        writes.append((analyses, hwm))
+        return len(analyses)
+
+    monkeypatch.setattr(materializer, "get_connection", fake_connection)
+    monkeypatch.setattr(materializer, "get_symbol_id", lambda conn, symbol: 7)
+    monkeypatch.setattr(materializer, "get_high_water_mark", lambda *args: high_water_mark)
+    monkeypatch.setattr(materializer, "fetch_market_data", fake_fetch)
+    monkeypatch.setattr(materializer, "fetch_market_data_tail", fake_tail)
+    monkeypatch.setattr(materializer, "write_analyses", fake_write)
+    return writes
+
+
+def test_materialize_symbol_resumes_after_high_water_mark(monkeypatch):
+    high_water_mark = TRADING_BARS[39].timestamp
+    writes = install_fakes(monkeypatch, high_water_mark)
+
+    result = materializer.materialize_symbol("AAA", "1d", "30m", warmup_bars=100)
+
+    # With the warm-up covering all earlier bars, the resumed run matches a full replay
+    expected = {
+        timestamp: analysis
+        for timestamp, analysis in replay_multi_timeframe_analysis(TRADING_BARS, HTF_BARS, "30m", "1d", max_bars=100)
+        if timestamp > high_water_mark
+    }
+    (analyses, written_mark), = writes
+    assert [analysis.timestamp for analysis in analyses] == list(expected)
+    assert analyses == list(expected.values())
+    assert written_mark == TRADING_BARS[-1].timestamp
+    assert result.bars_processed == 20
+    assert result.analyses_written == len(expected)
+    assert result.high_water_mark == TRADING_BARS[-1].timestamp
+
+
+def test_materialize_symbol_fills_gap_before_a_later_start(monkeypatch):
+    writes = install_fakes(monkeypatch, None)
+    marks = []
+    monkeypatch.setattr(materializer, "get_high_water_mark", lambda *args: marks[-1] if marks else None)
+
+    def fake_write(conn, symbol_id, htf_interval, trading_interval, analyses, hwm):
+        writes.append((analyses, hwm))
+        marks.append(max([hwm, *marks]))
+        return len(analyses)
+
+    monkeypatch.setattr(materializer, "write_analyses", fake_write)
+
+    materializer.materialize_symbol("AAA", "1d", "30m", end=TRADING_BARS[19].timestamp, warmup_bars=100)
+    result = materializer.materialize_symbol("AAA", "1d", "30m", start=TRADING_BARS[40].timestamp, warmup_bars=100)
+
+    written = [analysis.timestamp for analyses, _ in writes for analysis in analyses]
+    expected = [
+        timestamp
+        for timestamp, _ in replay_multi_timeframe_analysis(TRADING_BARS, HTF_BARS, "30m", "1d", max_bars=100)
+    ]
+    assert written == expected
+    assert result.bars_processed == 40
+    assert marks[-1] == TRADING_BARS[-1].timestamp
+
+
+def test_materialize_symbol_is_noop_when_up_to_date(monkeypatch):
+    writes = install_fakes(monkeypatch, TRADING_BARS[-1].timestamp)
+
+    result = materializer.materialize_symbol("AAA", "1d", "30m")
+
+    assert writes == []
+    assert result.ok
+    assert result.analyses_written == 0
+
+
+def test_analysis_rows_follow_copy_columns():
+    (timestamp, analysis), *_ = replay_multi_timeframe_analysis(TRADING_BARS, HTF_BARS, "30m", "1d")
+
+    row = materializer.analysis_row(7, "1d", "30m", analysis)
+
+    assert len(row) == len(materializer.ANALYSIS_COLUMNS)
+    assert dict(zip(materializer.ANALYSIS_COLUMNS, row, strict=True))["timestamp"] == timestamp
+    for zone_row in materializer.zone_rows(analysis):
+        assert len(zone_row) == len(materializer.ZONE_COLUMNS)
+        assert zone_row[0] == timestamp
+
+
+def test_materialize_indicators_reports_failures_per_symbol(monkeypatch):
+    def fake_materialize(symbol, *args, **kwargs):
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return materializer.MaterializationResult(symbol=symbol, analyses_written=3)
+
+    monkeypatch.setattr(materializer, "materialize_symbol", fake_materialize)
+
+    results = materializer.materialize_indicators(["AAA", "BAD", "CCC"], "1d", "30m", processes=1)
+
+    assert [result.symbol for result in results] == ["AAA", "BAD", "CCC"]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "boom"
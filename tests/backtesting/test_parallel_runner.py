@@ -0,0 +1,91 @@
+"""Tests for the shared-memory multi-process backtest runner."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from dgas.backtesting import BacktestRequest, BacktestRunner, SharedMemoryBacktestRunner
+from dgas.data.models import IntervalData
+
+TRADING_INTERVAL = "1h"
+HTF_INTERVAL = "4h"
+
+
+def _walk(symbol: str, count: int, step: timedelta, interval: str, phase: int) -> list[IntervalData]:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    bars = []
+    for idx in range(count):
+        close = Decimal("100") + Decimal((idx + phase) % 11) - Decimal(idx % 4) / 2 + Decimal(idx) / 10
+        bars.append(
+            IntervalData(
+                symbol=symbol,
+                exchange="US",
+                timestamp=(start + step * idx).isoformat(),
+                interval=interval,
+                open=close - Decimal("0.25"),
+                high=close + Decimal("1"),
+                low=close - Decimal("1"),
+                close=close,
+                adjusted_close=close,
+                volume=1000 + idx,
+            )
+        )
+    return bars
+
+
+MARKET = {
+    (symbol, interval): _walk(symbol, count, step, interval, phase)
+    for phase, symbol in enumerate(["AAA", "BBB", "CCC"])
+    for interval, count, step in ((TRADING_INTERVAL, 120, timedelta(hours=1)), (HTF_INTERVAL, 30, timedelta(hours=4)))
+}
+
+
+def fake_load_ohlcv(symbol, interval, *, start=None, end=None, limit=None, conn=None):
+    return MARKET.get((symbol, interval), [])
+
+
+@contextmanager
+def fake_connection():
+    yield MagicMock()
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    monkeypatch.setattr("dgas.backtesting.parallel_runner.get_connection", fake_connection)
+    monkeypatch.setattr("dgas.backtesting.parallel_runner.load_ohlcv", fake_load_ohlcv)
+    monkeypatch.setattr("dgas.backtesting.data_loader.get_connection", fake_connection)
+    monkeypatch.setattr("dgas.backtesting.data_loader.load_ohlcv", fake_load_ohlcv)
+    monkeypatch.setattr("dgas.backtesting.data_loader.load_indicators_batch", lambda *args, **kwargs: {})
+
+
+def _request(symbols: list[str]) -> BacktestRequest:
+    return BacktestRequest(
+        symbols=symbols,
+        interval=TRADING_INTERVAL,
+        htf_interval=HTF_INTERVAL,
+        persist_results=False,
+    )
+
+
+def test_parallel_runner_matches_sequential_runner(offline):
+    request = _request(["AAA", "BBB", "CCC"])
+
+    sequential = BacktestRunner().run(request)
+    parallel = SharedMemoryBacktestRunner(max_workers=2).run(request)
+
+    assert [run.symbol for run in parallel] == ["AAA", "BBB", "CCC"]
+    for expected, actual in zip(sequential, parallel, strict=True):
+        assert actual.result.trades == expected.result.trades
+        assert actual.result.ending_equity == expected.result.ending_equity
+        assert actual.performance == expected.performance
+        assert actual.persisted_id is None
+
+
+def test_parallel_runner_rejects_symbols_without_data(offline):
+    with pytest.raises(ValueError, match="No market data found for ZZZ"):
+        SharedMemoryBacktestRunner(max_workers=2).run(_request(["AAA", "ZZZ"]))
@@ -111,3 +111,40 @@ def test_timeline_synchronization_single_symbol():
     assert len(timeline) == 2
     assert timeline[0].timestamp == timestamp1
     assert timeline[1].timestamp == timestamp2
+
+
+def test_load_portfolio_data_keeps_columnar_bars(monkeypatch):
+    """Test batch loading hands BarArrays through and reports missing symbols."""
+    from contextlib import contextmanager
+
+    from dgas.backtesting import portfolio_data_loader
+    from dgas.data.bars import BarArray
+
+    timestamp1 = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    timestamp2 = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+    calls = []
+
+    @contextmanager
+    def fake_connection():
+        yield object()
+
+    def fake_fetch(conn, symbols, interval, *, start=None, end=None):
+        calls.append((list(symbols), interval, start, end))
+        bars = [make_bar("AAPL", timestamp1, "100"), make_bar("AAPL", timestamp2, "101")]
+        return {"AAPL": BarArray.from_intervals(bars)}
+
+    monkeypatch.setattr(portfolio_data_loader, "get_connection", fake_connection)
+    monkeypatch.setattr(portfolio_data_loader, "fetch_market_data_bulk_columnar", fake_fetch)
+    loader = PortfolioDataLoader(regular_hours_only=False)
+
+    bundles = loader.load_portfolio_data(["AAPL"], "30m", start=datetime(2025, 1, 1))
+
+    assert calls[0][2] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert isinstance(bundles["AAPL"].bars, BarArray)
+    assert bundles["AAPL"].bar_count == 2
+    assert bundles["AAPL"].last_timestamp == timestamp2
+    timeline = loader.create_synchronized_timeline(bundles)
+    assert timeline[1].get_bar("AAPL").close == Decimal("101.0")
+
+    with pytest.raises(ValueError, match="MSFT"):
+        loader.load_portfolio_data(["AAPL", "MSFT"], "30m")
@@ -0,0 +1,136 @@
+"""Tests for the portfolio backtest engine's multi-process indicator modes."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from tests.helpers import make_bars
+
+from dgas.backtesting.entities import Signal, SignalAction
+from dgas.backtesting.portfolio_data_loader import SymbolDataBundle
+from dgas.backtesting.portfolio_engine import PortfolioBacktestConfig, PortfolioBacktestEngine
+from dgas.backtesting.portfolio_indicator_calculator import (
+    HTFDataCache,
+    PortfolioIndicatorCalculator,
+)
+from dgas.backtesting.portfolio_sharding import assign_shards
+from dgas.backtesting.strategies.base import BaseStrategy, StrategyConfig
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+
+
+class AlwaysLongConfig(StrategyConfig):
+    name: str = "always_long"
+    min_history: int = 5
+
+
+class AlwaysLong(BaseStrategy):
+    """Enters long on every eligible bar so positions open and close often."""
+
+    config_model = AlwaysLongConfig
+    indicator_keys = ("analysis",)
+
+    def on_bar(self, context):
+        close = context.bar.close
+        # The stop depends on the analysis so any indicator mismatch shows up in the trades
+        stop = close - Decimal("0.4") - context.get_indicator("analysis").signal_strength / 5
+        return [
+            Signal(
+                SignalAction.ENTER_LONG,
+                metadata={"stop_loss": str(stop), "take_profit": str(close + Decimal("1.2"))},
+            )
+        ]
+
+
+def run_engine(monkeypatch, **config_overrides):
+    trading_start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    htf_start = trading_start - timedelta(days=30)
+    bundles = {}
+    htf_cache = {}
+    for seed, symbol in enumerate(SYMBOLS):
+        # Uneven lengths so symbols drop out of the timeline at different points
+        bars = make_bars(symbol, trading_start, timedelta(minutes=30), 60 + 5 * seed, "30m", seed)
+        bundles[symbol] = SymbolDataBundle(symbol=symbol, bars=bars, bar_count=len(bars))
+        htf_bars = make_bars(symbol, htf_start, timedelta(days=1), 33, "1d", 100 + seed)
+        htf_cache[symbol] = HTFDataCache(
+            symbol=symbol,
+            interval="1d",
+            bars=htf_bars,
+            start_date=htf_bars[0].timestamp,
+            end_date=htf_bars[-1].timestamp,
+        )
+
+    config = PortfolioBacktestConfig(
+        regular_hours_only=False,
+        min_signal_confidence=Decimal("0"),
+        confidence_scaling_enabled=False,
+        max_positions=2,
+        **config_overrides,
+    )
+    engine = PortfolioBacktestEngine(config=config, strategy=AlwaysLong())
+    # A short history window makes skipped bars leave it again within the run
+    engine.max_history_bars = 12
+
+    monkeypatch.setattr(engine.data_loader, "load_portfolio_data", lambda *args, **kwargs: bundles)
+    monkeypatch.setattr(
+        engine.indicator_calculator,
+        "preload_htf_data_for_portfolio",
+        lambda *args, **kwargs: engine.indicator_calculator.htf_cache.update(htf_cache),
+    )
+    monkeypatch.setattr(engine.signal_ranker, "_get_symbol_sector", lambda symbol: "other")
+
+    result = engine.run(SYMBOLS, "30m", start=trading_start)
+    trades = [repr(trade) for trade in result.trades]
+    equity = [(snapshot.timestamp, snapshot.equity, snapshot.cash) for snapshot in result.equity_curve]
+    return trades, equity
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_sharded_indicators_match_in_process_run(monkeypatch, incremental):
+    expected_trades, expected_equity = run_engine(monkeypatch, incremental_indicators=incremental)
+    trades, equity = run_engine(
+        monkeypatch,
+        incremental_indicators=incremental,
+        indicator_processes=2,
+        indicator_block_size=7,
+    )
+
+    assert len(expected_trades) > 3
+    assert trades == expected_trades
+    assert equity == expected_equity
+
+
+def test_sharded_incremental_fallback_only_replays_the_prefix_once(monkeypatch):
+    calls = {}
+    calculate = PortfolioIndicatorCalculator.calculate_indicators
+
+    def recording_calculate(self, symbol, current_bar, historical_bars):
+        calls.setdefault(symbol, []).append(len(historical_bars))
+        return calculate(self, symbol, current_bar, historical_bars)
+
+    monkeypatch.setattr(PortfolioIndicatorCalculator, "calculate_indicators", recording_calculate)
+    run_engine(monkeypatch, incremental_indicators=True, indicator_processes=2, indicator_block_size=7)
+
+    # Recorded calls are the in-process fallbacks; only the seeding call may exceed the window
+    assert calls
+    for lengths in calls.values():
+        assert all(length <= 12 for length in lengths[1:])
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_worker_pool_matches_in_process_run(monkeypatch, incremental):
+    expected_trades, expected_equity = run_engine(monkeypatch, incremental_indicators=incremental)
+    trades, equity = run_engine(monkeypatch, incremental_indicators=incremental, indicator_workers=2)
+
+    assert len(expected_trades) > 3
+    assert trades == expected_trades
+    assert equity == expected_equity
+
+
+def test_assign_shards_balances_bar_counts():
+    shards = assign_shards({"A": 100, "B": 60, "C": 50, "D": 10}, 2)
+
+    assert shards == [["A", "D"], ["B", "C"]]
+    assert assign_shards({"A": 1}, 4) == [["A"]]
@@ -0,0 +1,71 @@
+"""Tests for on-the-fly portfolio indicator calculation."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from dgas.backtesting.portfolio_indicator_calculator import HTFDataCache, PortfolioIndicatorCalculator
+from dgas.calculations.incremental import IncrementalTimeframeBuilder
+from dgas.calculations.multi_timeframe import TimeframeType
+from dgas.data.models import IntervalData
+
+
+def make_bar(timestamp: datetime, close: float, interval: str) -> IntervalData:
+    price = Decimal(str(close))
+    return IntervalData(
+        symbol="AAPL",
+        timestamp=timestamp,
+        interval=interval,
+        open=price,
+        high=price + Decimal("1"),
+        low=price - Decimal("1"),
+        close=price,
+        volume=1000,
+    )
+
+
+def make_calculator(incremental: bool, max_bars: int = 200) -> PortfolioIndicatorCalculator:
+    calculator = PortfolioIndicatorCalculator(incremental=incremental, max_bars=max_bars)
+    start = datetime(2024, 12, 1, tzinfo=timezone.utc)
+    htf_bars = [make_bar(start + timedelta(days=i), 100 + (i % 5), "1d") for i in range(40)]
+    calculator.htf_cache["AAPL"] = HTFDataCache(
+        symbol="AAPL",
+        interval="1d",
+        bars=htf_bars,
+        start_date=htf_bars[0].timestamp,
+        end_date=htf_bars[-1].timestamp,
+    )
+    return calculator
+
+
+def test_incremental_mode_streams_only_new_bars():
+    calculator = make_calculator(incremental=True, max_bars=30)
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    bars = [make_bar(start + timedelta(minutes=30 * i), 100 + (i % 7) * 0.5, "30m") for i in range(60)]
+
+    history: deque[IntervalData] = deque(maxlen=30)
+    for bar in bars:
+        history.append(bar)
+        if len(history) < 3:
+            continue
+        result = calculator.calculate_indicators("AAPL", bar, list(history))
+
+    reference = IncrementalTimeframeBuilder("30m", TimeframeType.TRADING, max_bars=30)
+    reference.extend(bars)
+
+    trading_data = result["trading_tf_data"]
+    assert list(trading_data.state_series) == list(reference.snapshot().state_series)
+    assert calculator._trading_builders["AAPL"].bar_count == len(bars)
+
+
+def test_incremental_and_window_modes_share_pldot_tail():
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    bars = [make_bar(start + timedelta(minutes=30 * i), 100 + (i % 4), "30m") for i in range(20)]
+
+    window = make_calculator(incremental=False).calculate_indicators("AAPL", bars[-1], bars)
+    streaming = make_calculator(incremental=True).calculate_indicators("AAPL", bars[-1], bars)
+
+    assert list(streaming["trading_tf_data"].pldot_series) == list(window["trading_tf_data"].pldot_series)
+    assert list(streaming["htf_data"].pldot_series) == list(window["htf_data"].pldot_series)
@@ -0,0 +1,140 @@
+"""Tests for the calculation result cache."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from dgas.calculations import TimeframeType, build_timeframe_data
+from dgas.calculations.cache import CacheKey, CachedCalculator, CalculationCache, compute_data_hash
+from dgas.calculations.optimized_coordinator import OptimizedMultiTimeframeCoordinator
+from dgas.data.events import MarketDataChange
+from dgas.data.models import IntervalData
+from dgas.db.query_cache import QueryCache
+
+
+def _key(symbol: str, data_hash: str = "abc") -> CacheKey:
+    return CacheKey(
+        calculation_type="pldot",
+        symbol=symbol,
+        timeframe="1h",
+        parameters={"displacement": 1},
+        data_hash=data_hash,
+    )
+
+
+def test_calculation_cache_evicts_by_recency_and_reports_memory():
+    cache = CalculationCache(max_size=2)
+    cache.set(_key("AAA"), [1.0] * 100, computation_time_ms=5.0)
+    cache.set(_key("BBB"), [2.0])
+
+    assert cache.get(_key("AAA")) == [1.0] * 100
+    # Hit counts no longer protect entries: BBB was used least recently
+    cache.set(_key("CCC"), [3.0])
+
+    assert cache.get(_key("BBB")) is None
+    stats = cache.get_stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1, 1)
+    assert stats["total_time_saved_ms"] == 5.0
+    assert stats["bytes"] > 0
+    assert cache.clear() == 2
+
+
+def test_query_cache_shares_lru_core():
+    cache = QueryCache(max_size=10)
+    cache.set("SELECT 1", (), [(1,)], ttl_seconds=30)
+
+    assert cache.get("SELECT 1", ()) == [(1,)]
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert cache.get_stats()["hits"] == 1
+
+
+def _intervals(count: int, interval: str = "1h", step: timedelta = timedelta(hours=1)) -> list[IntervalData]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    bars = []
+    for idx in range(count):
+        close = Decimal("100") + Decimal(idx % 7) - Decimal(idx % 3) / 2
+        bars.append(
+            IntervalData(
+                symbol="AAA",
+                timestamp=start + step * idx,
+                interval=interval,
+                open=close - Decimal("0.5"),
+                high=close + Decimal("1"),
+                low=close - Decimal("1"),
+                close=close,
+                volume=100 + idx,
+            )
+        )
+    return bars
+
+
+def test_corrected_middle_bar_misses_the_cache():
+    bars = _intervals(30)
+    corrected = list(bars)
+    corrected[15] = corrected[15].model_copy(update={"high": corrected[15].high + Decimal("2")})
+    assert compute_data_hash(corrected) != compute_data_hash(bars)
+
+    calculator = CachedCalculator(CalculationCache(max_size=10))
+    calls = []
+
+    def compute(data):
+        calls.append(len(data))
+        return max(bar.high for bar in data)
+
+    for data in (bars, bars, corrected):
+        calculator.get_or_compute("max_high", "AAA", "1h", {}, data, compute)
+    assert calls == [30, 30]
+
+
+def test_coordinator_caches_by_content_fingerprint():
+    htf_bars, trading_bars = _intervals(20, "4h", timedelta(hours=4)), _intervals(80)
+    coordinator = OptimizedMultiTimeframeCoordinator("4h", "1h", cache_size=4)
+
+    first = coordinator.analyze(
+        build_timeframe_data(htf_bars, "4h", TimeframeType.HIGHER),
+        build_timeframe_data(trading_bars, "1h", TimeframeType.TRADING),
+    )
+    # Rebuilt from identical bars: new objects, same key
+    rebuilt = coordinator.analyze(
+        build_timeframe_data(list(htf_bars), "4h", TimeframeType.HIGHER),
+        build_timeframe_data(list(trading_bars), "1h", TimeframeType.TRADING),
+    )
+    assert rebuilt is first
+    assert len(coordinator._cache) == 1
+
+    unknown = dataclasses.replace(
+        build_timeframe_data(trading_bars, "1h", TimeframeType.TRADING), source_fingerprint=None
+    )
+    coordinator.analyze(build_timeframe_data(htf_bars, "4h", TimeframeType.HIGHER), unknown)
+    assert len(coordinator._cache) == 1
+
+
+def test_market_data_changes_drop_only_overlapping_results():
+    cache = CalculationCache(max_size=50)
+    day = timedelta(days=1)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    early = (start, start + day)
+    late = (start + 2 * day, start + 3 * day)
+
+    cache.set(_key("AAA", "early"), "early", dependencies=[("AAA", "1h", early)])
+    cache.set(_key("AAA", "late"), "late", dependencies=[("AAA", "1h", late)])
+    cache.set(_key("AAA", "replay"), "replay", dependencies=[("AAA", "1h", early), ("AAA", "4h", late)])
+    cache.set(_key("AAA", "unknown"), "unknown")  # indexed under AAA/1h with no window
+    cache.set(_key("BBB", "late"), "other symbol", dependencies=[("BBB", "1h", late)])
+
+    # A corrected bar in the late window of AAA 1h
+    change = MarketDataChange(symbol="AAA", interval="1h", start=start + 2 * day, end=start + 2 * day, bars=1)
+    assert cache.on_market_data_change(change) == 2
+    assert cache.get(_key("AAA", "early")) == "early"
+    assert cache.get(_key("AAA", "late")) is None
+    assert cache.get(_key("AAA", "unknown")) is None
+    assert cache.get(_key("BBB", "late")) == "other symbol"
+
+    # The replay also depends on the 4h series
+    assert cache.invalidate("AAA", "4h", start=start + 3 * day) == 1
+    assert cache.get(_key("AAA", "replay")) is None
+    assert cache.invalidate("BBB", calculation_type="envelope") == 0
+    assert cache.invalidate("BBB", calculation_type="pldot") == 1
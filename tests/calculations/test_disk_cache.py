@@ -0,0 +1,91 @@
+"""Tests for the persistent calculation cache tier."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dgas.calculations.cache import CacheKey, CalculationCache
+from dgas.calculations.disk_cache import DiskCache
+
+
+def _key(symbol: str, data_hash: str = "abc") -> CacheKey:
+    return CacheKey(
+        calculation_type="pldot",
+        symbol=symbol,
+        timeframe="1h",
+        parameters={"displacement": 1},
+        data_hash=data_hash,
+    )
+
+
+def _read_in_child(path: str, key: str):
+    return DiskCache(path).get(key)
+
+
+def test_values_survive_reopening_and_are_shared_with_other_processes(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    store = DiskCache(path)
+    assert store.set("series", {"values": [1.5, 2.5]})
+    store.close()
+
+    reopened = DiskCache(path)
+    assert reopened.get("series") == {"values": [1.5, 2.5]}
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        child_value = executor.submit(_read_in_child, str(path), "series").result()
+    assert child_value == {"values": [1.5, 2.5]}
+
+    # Another code version does not see these entries
+    assert DiskCache(path, namespace="other").get("series") is None
+    assert reopened.stats()["hits"] == 1
+
+
+def test_expired_and_least_recently_used_entries_are_dropped(tmp_path):
+    store = DiskCache(tmp_path / "cache.sqlite3", max_bytes=None)
+    store.set("short", "value", ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert store.get("short") is None
+
+    payload = os.urandom(10_000)  # does not compress
+    bounded = DiskCache(tmp_path / "bounded.sqlite3", max_bytes=25_000)
+    for name in ("a", "b", "c"):
+        assert bounded.set(name, payload)
+    assert bounded.get("a") is None
+    assert bounded.get("c") == payload
+    stats = bounded.stats()
+    assert stats["bytes"] <= 25_000 and stats["evictions"] >= 1
+    assert not bounded.set("huge", os.urandom(30_000))
+
+
+def test_running_byte_total_follows_every_change(tmp_path):
+    store = DiskCache(tmp_path / "cache.sqlite3", max_bytes=None)
+
+    def totals():
+        conn = store._connection()
+        (summed,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return store._total_bytes(conn), summed
+
+    store.set("a", os.urandom(1_000))
+    store.set("b", os.urandom(2_000))
+    store.set("a", os.urandom(3_000))  # replaces a
+    tracked, summed = totals()
+    assert tracked == summed > 5_000
+
+    store.delete("b")
+    assert totals()[0] == totals()[1]
+    store.clear()
+    assert totals() == (0, 0)
+
+
+def test_calculation_cache_reads_through_to_disk(tmp_path):
+    disk = DiskCache(tmp_path / "cache.sqlite3")
+    CalculationCache(max_size=10, disk_cache=disk).set(_key("AAA"), [1.0, 2.0])
+
+    # A fresh process-local cache (e.g. after a restart) is warmed from disk
+    restarted = CalculationCache(max_size=10, disk_cache=DiskCache(tmp_path / "cache.sqlite3"))
+    assert restarted.get(_key("AAA")) == [1.0, 2.0]
+    assert restarted.get(_key("AAA", data_hash="other")) is None
+    stats = restarted.get_stats()
+    assert stats["size"] == 1
+    assert (stats["disk"]["hits"], stats["disk"]["misses"]) == (1, 1)
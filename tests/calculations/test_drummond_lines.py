@@ -1,7 +1,11 @@
+import random
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from dgas.calculations.drummond_lines import (
     DrummondLineCalculator,
+    DrummondLineWindow,
     aggregate_zones,
 )
 from dgas.data.models import IntervalData
@@ -49,3 +53,41 @@ def test_zone_aggregation():
     assert zones
     total_strength = sum(zone.strength for zone in zones)
     assert total_strength == len(lines)
+
+
+def _random_intervals(count: int, seed: int):
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    intervals = []
+    price = 100.0
+    for i in range(count):
+        # Coarse prices so projected prices tie and zones merge
+        price = max(1.0, price + rnd.choice([-0.5, 0.0, 0.5]))
+        high = price + rnd.choice([0.0, 0.5, 1.0])
+        low = price - rnd.choice([0.0, 0.5, 1.0])
+        intervals.append(_make_interval(base + timedelta(minutes=30 * i), high, low, price))
+    return intervals
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("lookback,projection_gap", [(None, 1), (2, 1), (12, 1), (12, 3)])
+def test_line_window_matches_full_rebuild(seed, lookback, projection_gap):
+    intervals = _random_intervals(60, seed)
+    calc = DrummondLineCalculator(projection_gap=projection_gap)
+    window = DrummondLineWindow(lookback=lookback, projection_gap=projection_gap)
+
+    for end in range(1, len(intervals) + 1):
+        bar = intervals[end - 1]
+        window.append(bar.timestamp, bar.high, bar.low)
+        retained = intervals[max(0, end - lookback) if lookback else 0 : end]
+        expected = calc.from_intervals(retained)
+
+        assert window.lines() == expected
+        assert len(window) == len(expected)
+        for tolerance in (0.0, 0.5, 2.0):
+            assert window.zones(tolerance) == aggregate_zones(expected, tolerance=tolerance)
+
+
+def test_line_window_rejects_short_lookback():
+    with pytest.raises(ValueError):
+        DrummondLineWindow(lookback=1)
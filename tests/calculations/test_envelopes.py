@@ -98,3 +98,21 @@ def test_envelope_default_method():
     assert calc.method == "pldot_range"
     assert calc.period == 3  # Default period
     assert calc.multiplier == 1.5  # Default multiplier
+
+
+def test_envelope_compute_arrays_accepts_pldot_arrays():
+    intervals, pldot = _sample_data()
+    pldot_arrays = PLDotCalculator().compute_arrays(intervals)
+
+    for method in ("pldot_range", "hlc_range", "atr", "percentage"):
+        calc = EnvelopeCalculator(method=method)
+        arrays = calc.compute_arrays(intervals, pldot_arrays)
+        # repr() keeps the Decimal('NaN') warm-up rows comparable
+        assert [repr(row) for row in arrays] == [repr(row) for row in calc.from_intervals(intervals, pldot)]
+
+
+def test_envelope_compute_arrays_empty_inputs():
+    intervals, _ = _sample_data()
+    arrays = EnvelopeCalculator().compute_arrays(intervals, [])
+    assert len(arrays) == 0
+    assert list(arrays) == []
@@ -0,0 +1,316 @@
+"""Tests for the shared pattern input bundle and the array kernels."""
+
+import statistics
+
+import numpy as np
+import pytest
+
+from dgas.calculations.envelopes import EnvelopeCalculator
+from dgas.calculations.patterns import (
+    CWaveConfig,
+    ExhaustConfig,
+    PatternEvent,
+    PatternInputs,
+    PatternType,
+    PLDotRefreshConfig,
+    detect_c_wave,
+    detect_congestion_oscillation,
+    detect_exhaust,
+    detect_patterns,
+    detect_pldot_push,
+    detect_pldot_refresh,
+)
+from dgas.calculations.pldot import PLDotCalculator
+from dgas.data.bars import BarArray
+from tests.helpers import random_walk
+
+# Frozen copies of the per-row detector loops the kernels replaced, run with
+# the default configs. They are the parity reference for the kernels.
+
+
+def _sign(value) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _event(pattern_type: PatternType, streak: list, direction: int) -> PatternEvent:
+    start, end = streak[0].timestamp, streak[-1].timestamp
+    return PatternEvent(pattern_type, direction, start, end, len(streak))
+
+
+def _reference_pldot_push(intervals, pldot) -> list[PatternEvent]:
+    close_map = {bar.timestamp: bar.close for bar in intervals}
+    events: list[PatternEvent] = []
+    streak: list = []
+    direction = 0
+    for series in sorted(pldot, key=lambda s: s.timestamp):
+        close_price = close_map.get(series.timestamp)
+        if close_price is None:
+            continue
+        side = _sign(close_price - series.value)
+        if side != 0 and side == _sign(series.slope):
+            if direction in (0, side):
+                streak.append(series)
+            else:
+                if len(streak) >= 3:
+                    events.append(_event(PatternType.PLDOT_PUSH, streak, direction))
+                streak = [series]
+            direction = side
+        else:
+            if len(streak) >= 3:
+                events.append(_event(PatternType.PLDOT_PUSH, streak, direction))
+            streak = []
+            direction = 0
+    if len(streak) >= 3:
+        events.append(_event(PatternType.PLDOT_PUSH, streak, direction))
+    return events
+
+
+def _reference_pldot_refresh(intervals, pldot) -> list[PatternEvent]:
+    cfg = PLDotRefreshConfig()
+    close_map = {bar.timestamp: bar.close for bar in intervals}
+    ordered = sorted(pldot, key=lambda s: s.timestamp)
+    max_return_bars = max(cfg.max_return_bars, cfg.min_far_bars)
+    far_sequence: list = []
+    direction = 0
+    max_diff = 0.0
+    events: list[PatternEvent] = []
+    for idx, series in enumerate(ordered):
+        close_price = close_map.get(series.timestamp)
+        if close_price is None:
+            continue
+        tolerance = cfg.base_tolerance
+        window_start = max(0, idx - cfg.volatility_lookback + 1)
+        window = [float(entry.value) for entry in ordered[window_start : idx + 1]]
+        if len(window) >= cfg.volatility_lookback:
+            volatility = statistics.pstdev(window[-cfg.volatility_lookback :])
+            tolerance += volatility * cfg.volatility_multiplier
+        diff = abs(float(close_price - series.value))
+        side = _sign(close_price - series.value)
+        if diff > tolerance and side != 0:
+            if far_sequence and side != direction:
+                far_sequence = []
+                max_diff = 0.0
+            far_sequence.append(series)
+            direction = side
+            max_diff = max(max_diff, diff)
+            continue
+        if (
+            far_sequence
+            and direction != 0
+            and cfg.min_far_bars <= len(far_sequence) <= max_return_bars
+            and max_diff >= cfg.min_extension
+        ):
+            events.append(_event(PatternType.PLDOT_REFRESH, [*far_sequence, series], -direction))
+        far_sequence = []
+        direction = 0
+        max_diff = 0.0
+    return events
+
+
+def _reference_exhaust(intervals, pldot, envelopes) -> list[PatternEvent]:
+    cfg = ExhaustConfig()
+    close_map = {bar.timestamp: bar.close for bar in intervals}
+    slope_map = {p.timestamp: p.slope for p in pldot}
+    events: list[PatternEvent] = []
+    extension: list = []
+    direction = 0
+    recovery = 0
+    for envelope in sorted(envelopes, key=lambda e: e.timestamp):
+        close_price = close_map.get(envelope.timestamp)
+        if close_price is None:
+            continue
+        width = float(envelope.width)
+        if width <= 0:
+            extension, direction, recovery = [], 0, 0
+            continue
+        upper, lower, close_f = float(envelope.upper), float(envelope.lower), float(close_price)
+        side, ratio = 0, 0.0
+        if close_f > upper:
+            side, ratio = 1, (close_f - upper) / width
+        elif close_f < lower:
+            side, ratio = -1, (lower - close_f) / width
+        if side != 0 and ratio >= cfg.extension_threshold:
+            if direction not in (0, side):
+                extension = []
+            extension.append((envelope.timestamp, close_f, slope_map.get(envelope.timestamp)))
+            direction, recovery = side, 0
+            continue
+        if direction == 0:
+            extension, recovery = [], 0
+            continue
+        recovery += 1
+        inside = (direction == 1 and close_f <= upper) or (direction == -1 and close_f >= lower)
+        if (
+            inside
+            and len(extension) >= cfg.min_extension_bars
+            and recovery <= cfg.max_recovery_bars
+        ):
+            closes = [close for _, close, _ in extension]
+            extreme = max(closes) if direction == 1 else min(closes)
+            reversion = (extreme - close_f) * direction / width
+            last_slope = extension[-1][2]
+            reentry_slope = slope_map.get(envelope.timestamp)
+            limit = cfg.slope_reversal_limit
+            if (
+                reversion >= cfg.min_reversion_ratio
+                and (last_slope is None or float(last_slope) * direction > limit)
+                and (reentry_slope is None or float(reentry_slope) * direction <= limit)
+            ):
+                start = extension[0][0]
+                events.append(
+                    PatternEvent(
+                        PatternType.EXHAUST, -direction, start, envelope.timestamp, len(extension)
+                    )
+                )
+                extension, direction, recovery = [], 0, 0
+                continue
+        if recovery > cfg.max_recovery_bars:
+            extension, direction, recovery = [], 0, 0
+    return events
+
+
+def _reference_c_wave(envelopes, pldot) -> list[PatternEvent]:
+    cfg = CWaveConfig()
+    slope_map = {series.timestamp: float(series.slope) for series in pldot}
+
+    def qualifies(streak: list, direction: int) -> bool:
+        if not streak or direction == 0 or len(streak) < cfg.min_bars:
+            return False
+        slopes = [slope_map[entry.timestamp] for entry in streak if entry.timestamp in slope_map]
+        if slopes:
+            if sum(slopes) / len(slopes) * direction < cfg.min_slope:
+                return False
+            if (slopes[-1] - slopes[0]) * direction < cfg.min_slope_acceleration:
+                return False
+        first, last = float(streak[0].width), float(streak[-1].width)
+        expansion = (last - first) / first if first > 0 else 0.0
+        return expansion >= cfg.min_envelope_expansion
+
+    events: list[PatternEvent] = []
+    streak: list = []
+    direction = 0
+    for entry in sorted(envelopes, key=lambda e: e.timestamp):
+        position = float(entry.position)
+        if position >= cfg.upper_position_threshold:
+            current = 1
+        elif position <= cfg.lower_position_threshold:
+            current = -1
+        else:
+            current = 0
+        if current != 0 and direction in (0, current):
+            streak.append(entry)
+            direction = current
+            continue
+        if qualifies(streak, direction):
+            events.append(_event(PatternType.C_WAVE, streak, direction))
+        streak = [entry] if current != 0 else []
+        direction = current
+    if qualifies(streak, direction):
+        events.append(_event(PatternType.C_WAVE, streak, direction))
+    return events
+
+
+def _reference_congestion_oscillation(envelopes) -> list[PatternEvent]:
+    events: list[PatternEvent] = []
+    streak: list = []
+    last_position = None
+    for entry in sorted(envelopes, key=lambda e: e.timestamp):
+        position = float(entry.position)
+        if 0.2 <= position <= 0.8:
+            prev_entry_position = float(streak[-1].position) if streak else 0.5
+            turn = None if last_position is None else position - last_position
+            if turn is None or turn * (prev_entry_position - 0.5) <= 0:
+                streak.append(entry)
+            else:
+                if len(streak) >= 4:
+                    events.append(_event(PatternType.CONGESTION_OSCILLATION, streak, 0))
+                streak = [entry]
+        else:
+            if len(streak) >= 4:
+                events.append(_event(PatternType.CONGESTION_OSCILLATION, streak, 0))
+            streak = []
+        last_position = position
+    if len(streak) >= 4:
+        events.append(_event(PatternType.CONGESTION_OSCILLATION, streak, 0))
+    return events
+
+
+def test_bundle_aligns_missing_bars():
+    bars = random_walk(30, seed=0)
+    pldot = PLDotCalculator().from_intervals(bars)
+    envelopes = EnvelopeCalculator(method="atr").from_intervals(bars, pldot)
+
+    # Drop every other bar so half of the PLdot/envelope rows have no close
+    inputs = PatternInputs.build(bars[::2], pldot=pldot, envelopes=envelopes)
+
+    assert inputs.bar_timestamps == [bar.timestamp for bar in bars[::2]]
+    assert inputs.pldot_timestamps == [series.timestamp for series in pldot]
+    closes = {bar.timestamp: bar.close for bar in bars[::2]}
+    for series, diff in zip(pldot, inputs.pldot_close_diff.tolist(), strict=True):
+        if series.timestamp in closes:
+            assert diff == float(closes[series.timestamp] - series.value)
+        else:
+            assert np.isnan(diff)
+    missing = inputs.envelope_bar_index < 0
+    assert missing.any() and np.isnan(inputs.envelope_close[missing]).all()
+
+
+def test_bundle_without_pldot_or_bars():
+    bars = random_walk(30, seed=1)
+    envelopes = EnvelopeCalculator().from_intervals(bars, PLDotCalculator().from_intervals(bars))
+
+    inputs = PatternInputs.build(envelopes=envelopes)
+
+    assert not inputs.has_bars and not inputs.has_pldot
+    assert np.isnan(inputs.envelope_slope).all()
+    assert (inputs.envelope_bar_index == -1).all()
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("step", [0.02, 0.5, 3.0])
+# Narrow envelopes produce exhausts, wide ones congestion oscillations
+@pytest.mark.parametrize("multiplier", [0.3, 1.5, 5.0])
+def test_array_inputs_match_list_inputs(seed, step, multiplier):
+    bars = random_walk(200, seed, step)
+    pldot_arrays = PLDotCalculator().compute_arrays(bars)
+    envelope_arrays = EnvelopeCalculator(
+        method="pldot_range", period=3, multiplier=multiplier
+    ).compute_arrays(bars, pldot_arrays)
+    pldot = pldot_arrays.to_list()
+    envelopes = envelope_arrays.to_list()
+
+    from_lists = PatternInputs.build(bars, pldot=pldot, envelopes=envelopes)
+    from_arrays = PatternInputs.build(
+        BarArray.from_intervals(bars), pldot=pldot_arrays, envelopes=envelope_arrays
+    )
+
+    columns = (
+        "pldot_value", "pldot_slope", "pldot_close_diff", "envelope_width", "envelope_position"
+    )
+    for name in columns:
+        np.testing.assert_array_equal(
+            getattr(from_arrays, name), getattr(from_lists, name), err_msg=name
+        )
+
+    per_detector = {
+        "push": (detect_pldot_push(bars, pldot), _reference_pldot_push(bars, pldot)),
+        "refresh": (detect_pldot_refresh(bars, pldot), _reference_pldot_refresh(bars, pldot)),
+        "exhaust": (
+            detect_exhaust(bars, pldot, envelopes),
+            _reference_exhaust(bars, pldot, envelopes),
+        ),
+        "c_wave": (
+            detect_c_wave(envelopes, pldot=pldot, intervals=bars),
+            _reference_c_wave(envelopes, pldot),
+        ),
+        "congestion": (
+            detect_congestion_oscillation(envelopes),
+            _reference_congestion_oscillation(envelopes),
+        ),
+    }
+    for name, (events, reference) in per_detector.items():
+        assert events == reference, name
+
+    expected = [event for _, reference in per_detector.values() for event in reference]
+    assert detect_patterns(from_lists) == expected
+    assert detect_patterns(from_arrays) == expected
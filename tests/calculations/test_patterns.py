@@ -626,3 +626,30 @@ def test_detect_termination_strength_from_zone():
     touch_events = [e for e in events if e.pattern_type == PatternType.TERMINATION_TOUCH]
     if touch_events:
         assert touch_events[0].strength == 5  # Should match resistance zone strength
+
+
+def test_detect_termination_approach_fires_once_per_excursion():
+    """Test that an approach is reported once until price leaves or touches the zone."""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    # Two zones at the same level share one approach tracker
+    zones = [
+        _make_drummond_zone(center=110.0, width=0.5, line_type="resistance", strength=3),
+        _make_drummond_zone(center=110.0, width=0.5, line_type="resistance", strength=4),
+    ]
+
+    # Approach band is 108.75-109.5 below the zone; 109.5 and above touches
+    highs = [109.0, 109.2, 107.0, 109.0, 110.0]
+    intervals = [
+        _make_interval(base + timedelta(minutes=30 * idx), close=high - 0.5, high=high, low=high - 1.0)
+        for idx, high in enumerate(highs)
+    ]
+
+    events = detect_termination_events(intervals, zones)
+
+    assert [(e.pattern_type, e.start_timestamp, e.strength) for e in events] == [
+        (PatternType.TERMINATION_APPROACH, intervals[0].timestamp, 3),
+        (PatternType.TERMINATION_APPROACH, intervals[3].timestamp, 3),
+        (PatternType.TERMINATION_TOUCH, intervals[4].timestamp, 3),
+        (PatternType.TERMINATION_TOUCH, intervals[4].timestamp, 4),
+    ]
@@ -59,3 +59,21 @@ def test_pldot_calculator_displacement_two():
     results = calc.from_intervals(intervals)
     assert len(results) == 1
     assert results[0].projected_timestamp == intervals[4].timestamp
+
+
+def test_pldot_compute_arrays_materializes_lazily():
+    calc = PLDotCalculator(displacement=1)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    intervals = [_make_interval(base.replace(hour=i), 10 + i, 8 + i, 9 + i * 0.5) for i in range(8)]
+
+    arrays = calc.compute_arrays(intervals)
+    assert len(arrays) == 5
+    assert arrays.value.tolist() == pytest.approx([float(row.value) for row in calc.from_intervals(intervals)])
+    assert arrays._rows == [None] * 5
+
+    last = arrays[-1]
+    assert last.projected_timestamp == intervals[-1].timestamp
+    assert arrays._rows[:4] == [None] * 4
+    assert arrays[-1] is last
+    assert arrays[0].slope == 0
+    assert arrays == calc.from_intervals(intervals)
@@ -0,0 +1,108 @@
+"""Parity tests for the batch market state classifier."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from dgas.calculations.pldot import PLDotCalculator, PLDotSeries
+from dgas.calculations.states import MarketStateClassifier, StateTracker
+from dgas.data.bars import BarArray
+from dgas.data.models import IntervalData
+from tests.helpers import random_walk
+
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bar(i: int, close: float, spread: float = 0.5) -> IntervalData:
+    return IntervalData(
+        symbol="AAPL",
+        timestamp=BASE + timedelta(minutes=30 * i),
+        interval="30m",
+        open=round(close, 2),
+        high=round(close + spread, 2),
+        low=round(close - spread, 2),
+        close=round(close, 2),
+        volume=100,
+    )
+
+
+
+def _reference(classifier: MarketStateClassifier, intervals, pldot) -> list:
+    """Per-bar classification through ``advance`` (the original loop)."""
+    closes = {bar.timestamp: bar.close for bar in intervals}
+    tracker = StateTracker()
+    return [
+        classifier.advance(tracker, series.timestamp, closes[series.timestamp], series.value, series.slope)
+        for series in sorted(pldot, key=lambda s: s.timestamp)
+        if series.timestamp in closes
+    ]
+
+
+def _oscillating(count: int) -> list[IntervalData]:
+    # Trend up, chop around PLdot, then trend down: exercises entrance/exit/reversal
+    closes = [100 + i for i in range(12)]
+    closes += [111 + (3 if i % 2 else -3) for i in range(10)]
+    closes += [111 - 2 * i for i in range(12)]
+    closes += [87 + (2 if i % 3 else -2) for i in range(count - len(closes))]
+    return [_bar(i, close) for i, close in enumerate(closes)]
+
+
+SYNTHETIC = {
+    "flat": lambda: [_bar(i, 50.0) for i in range(40)],
+    "oscillating": lambda: _oscillating(60),
+    "tiny_steps": lambda: random_walk(300, seed=11, step=0.01),
+    **{f"walk_{seed}_{step}": (lambda seed=seed, step=step: random_walk(400, seed, step))
+       for seed in range(3) for step in (0.05, 0.5, 4.0)},
+}
+
+
+@pytest.mark.parametrize("name", sorted(SYNTHETIC))
+@pytest.mark.parametrize("threshold", [0.0001, 0.05])
+def test_batch_classifier_matches_per_bar_loop(name, threshold):
+    intervals = SYNTHETIC[name]()
+    pldot = PLDotCalculator().from_intervals(intervals)
+    classifier = MarketStateClassifier(slope_threshold=threshold)
+
+    expected = _reference(classifier, intervals, pldot)
+
+    assert classifier.classify(intervals, pldot) == expected
+    arrays = classifier.classify_arrays(
+        BarArray.from_intervals(intervals), PLDotCalculator().compute_arrays(intervals)
+    )
+    assert list(arrays) == expected
+    assert arrays.bars_in_state.tolist() == [point.bars_in_state for point in expected]
+
+
+def test_ties_are_resolved_in_decimal():
+    # Closes exactly on the PLdot count as position 0, not above/below
+    intervals = [_bar(i, 10.0 + (i % 2) * 0.1) for i in range(8)]
+    pldot = [
+        PLDotSeries(
+            timestamp=bar.timestamp,
+            value=bar.close if i % 3 == 0 else Decimal("10.05"),
+            projected_timestamp=bar.timestamp,
+            projected_value=bar.close,
+            slope=Decimal("0"),
+            displacement=1,
+        )
+        for i, bar in enumerate(intervals)
+    ]
+    classifier = MarketStateClassifier()
+    assert classifier.classify(intervals, pldot) == _reference(classifier, intervals, pldot)
+
+
+def test_unordered_pldot_and_missing_closes():
+    intervals = random_walk(80, seed=4, step=1.0)
+    pldot = PLDotCalculator().from_intervals(intervals)
+    shuffled = list(reversed(pldot))
+    partial = intervals[::2]
+
+    classifier = MarketStateClassifier()
+    assert classifier.classify(partial, shuffled) == _reference(classifier, partial, shuffled)
+
+
+def test_classify_arrays_empty_inputs():
+    classifier = MarketStateClassifier()
+    assert len(classifier.classify_arrays([], [])) == 0
+    assert classifier.classify([], []) == []
@@ -0,0 +1,7 @@
+"""Suite-wide test configuration."""
+
+import os
+
+# Keep calculation results out of the working tree's data directory; the disk
+# cache tests use their own temporary stores.
+os.environ.setdefault("DGAS_CALC_CACHE_DISK_MB", "0")
@@ -0,0 +1,222 @@
+"""Tests for the asyncio EODHD client against a local stub HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from dgas.data.async_client import AsyncEODHDClient
+from dgas.data.client import EODHDConfig
+from dgas.data.errors import EODHDAuthError, EODHDRequestError
+from dgas.data.models import IntervalData
+
+INTRADAY_PAYLOAD = [
+    {"timestamp": 1704205800, "open": 10.5, "high": 11.0, "low": 10.0, "close": 10.75, "volume": 1200},
+    {"timestamp": 1704206100, "open": 10.75, "high": 11.25, "low": 10.5, "close": 11.0, "volume": None},
+    {"timestamp": 1704206400, "open": None, "high": 11.25, "low": 10.5, "close": 11.0, "volume": 5},
+    {"timestamp": 1704206700000, "open": "11", "high": "11.5", "low": "10.9", "close": "11.2", "volume": "7"},
+]
+
+
+class StubServer:
+    """HTTP/1.1 keep-alive server answering each request from a queue of canned responses."""
+
+    def __init__(self) -> None:
+        self.responses: Deque[Tuple[int, Dict[str, str], bytes]] = deque()
+        self.requests: List[Tuple[str, Dict[str, List[str]]]] = []
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+        # Close the connection after each response without announcing it, like an idle timeout
+        self.drop_connections = False
+        self._server: asyncio.AbstractServer | None = None
+
+    def add(self, status: int, payload: Any = None, headers: Dict[str, str] | None = None, body: bytes | None = None) -> None:
+        self.responses.append((status, headers or {}, body if body is not None else json.dumps(payload).encode()))
+
+    async def __aenter__(self) -> "StubServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while await reader.readline() not in (b"\r\n", b""):
+                    pass
+                target = urlsplit(request_line.split()[1].decode())
+                self.requests.append((target.path, parse_qs(target.query)))
+
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(self.delay)
+                self.in_flight -= 1
+
+                status, headers, body = self.responses.popleft() if self.responses else (200, {}, b"[]")
+                if headers.get("Transfer-Encoding") == "chunked":
+                    middle = len(body) // 2
+                    chunks = [body[:middle], body[middle:]]
+                    encoded = b"".join(b"%x\r\n%s\r\n" % (len(chunk), chunk) for chunk in chunks) + b"0\r\n\r\n"
+                else:
+                    headers = {**headers, "Content-Length": str(len(body))}
+                    encoded = body
+                head = f"HTTP/1.1 {status} X\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+                writer.write(head.encode() + encoded)
+                await writer.drain()
+                if self.drop_connections:
+                    break
+        finally:
+            writer.close()
+
+
+def make_client(server: StubServer, **kwargs: Any) -> AsyncEODHDClient:
+    config = EODHDConfig(api_token="token", base_url=server.base_url, max_retries=3, timeout=5.0)
+    return AsyncEODHDClient(config, **kwargs)
+
+
+def test_fetch_intraday_parses_columns_and_reuses_connection():
+    async def scenario():
+        async with StubServer() as server:
+            for _ in range(3):
+                server.add(200, INTRADAY_PAYLOAD)
+            async with make_client(server) as client:
+                results = [await client.fetch_intraday("AAPL", start="2024-01-02", interval="5m") for _ in range(3)]
+            return server, results
+
+    server, results = asyncio.run(scenario())
+
+    expected = IntervalData.from_api_list(INTRADAY_PAYLOAD, "5m", symbol_override="AAPL")
+    bars = results[0]
+    assert len(bars) == len(expected) == 3
+    assert bars.datetimes() == [bar.timestamp for bar in expected]
+    assert bars.decimals("close") == [bar.close for bar in expected]
+    assert bars.volume.tolist() == [bar.volume for bar in expected]
+
+    assert server.connections == 1
+    path, query = server.requests[0]
+    assert path == "/api/intraday/AAPL.US"
+    assert query["interval"] == ["5m"] and query["api_token"] == ["token"]
+
+
+def test_chunked_gzip_response_is_decoded():
+    async def scenario():
+        async with StubServer() as server:
+            server.add(
+                200,
+                headers={"Transfer-Encoding": "chunked", "Content-Encoding": "gzip"},
+                body=gzip.compress(json.dumps({"timestamp": 1704205800, "open": 1, "high": 2, "low": 0.5, "close": 1.5}).encode()),
+            )
+            async with make_client(server) as client:
+                return await client.fetch_live_ohlcv("MSFT", interval="1m")
+
+    bars = asyncio.run(scenario())
+
+    assert len(bars) == 1
+    assert bars.close.tolist() == [1.5]
+
+
+def test_retries_rate_limit_and_reports_errors(monkeypatch):
+    async def no_sleep(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr("dgas.data.async_client.asyncio.sleep", no_sleep)
+
+    async def scenario():
+        async with StubServer() as server:
+            server.add(429, [], headers={"Retry-After": "0"})
+            server.add(500, [])
+            server.add(200, INTRADAY_PAYLOAD[:1])
+            server.add(404, {"error": "Ticker Not Found"})
+            server.add(401, {})
+            async with make_client(server) as client:
+                bars = await client.fetch_intraday("AAPL")
+                with pytest.raises(EODHDRequestError, match="404"):
+                    await client.fetch_intraday("NOPE")
+                with pytest.raises(EODHDAuthError):
+                    await client.fetch_eod("AAPL")
+                return bars
+
+    assert len(asyncio.run(scenario())) == 1
+
+
+def test_fetch_many_bounds_requests_in_flight():
+    symbols = [f"S{i}" for i in range(10)]
+
+    async def scenario():
+        async with StubServer() as server:
+            server.delay = 0.02
+            server.add(404, {})
+            for _ in symbols[1:]:
+                server.add(200, INTRADAY_PAYLOAD[:1])
+            async with make_client(server, max_in_flight=3) as client:
+                results = await client.fetch_intraday_many(symbols)
+            return server, results
+
+    server, results = asyncio.run(scenario())
+
+    assert list(results) == symbols
+    assert sum(isinstance(result, EODHDRequestError) for result in results.values()) == 1
+    assert server.max_in_flight == 3
+    assert server.connections == 3
+
+
+def test_dropped_idle_connection_is_replaced():
+    async def scenario():
+        async with StubServer() as server:
+            server.drop_connections = True
+            server.add(200, INTRADAY_PAYLOAD[:1])
+            server.add(200, INTRADAY_PAYLOAD[:2])
+            async with make_client(server) as client:
+                first = await client.fetch_intraday("AAPL")
+                await asyncio.sleep(0)
+                second = await client.fetch_intraday("AAPL")
+            return server, first, second
+
+    server, first, second = asyncio.run(scenario())
+
+    assert (len(first), len(second)) == (1, 2)
+    assert server.connections == 2
+    assert len(server.requests) == 2
+
+
+def test_follows_redirects_and_caps_the_response_size():
+    async def scenario():
+        async with StubServer() as server:
+            server.add(302, body=b"", headers={"Location": f"{server.base_url}/moved/AAPL.US"})
+            server.add(200, INTRADAY_PAYLOAD[:1])
+            server.add(200, INTRADAY_PAYLOAD)
+            async with make_client(server, max_response_bytes=200) as client:
+                bars = await client.fetch_intraday("AAPL")
+                with pytest.raises(EODHDRequestError, match="200 byte limit"):
+                    await client.fetch_intraday("AAPL")
+            return server, bars
+
+    server, bars = asyncio.run(scenario())
+
+    assert len(bars) == 1
+    assert [path for path, _ in server.requests] == [
+        "/api/intraday/AAPL.US",
+        "/api/moved/AAPL.US",
+        "/api/intraday/AAPL.US",
+    ]
@@ -0,0 +1,153 @@
+"""Tests for the parallel, resumable backfill orchestrator."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from dgas.data import backfill as backfill_module
+from dgas.data.backfill import BackfillCheckpoint, backfill_universe, plan_chunks
+from dgas.data.errors import EODHDRequestError
+
+START = date(2024, 1, 1)
+END = date(2024, 1, 10)
+
+
+def install_fakes(monkeypatch, checkpoints=None, failures=None):
+    """Replace database and API access.
+
+    ``failures`` maps ``(symbol, chunk_start)`` to the exception that chunk raises.
+    """
+    calls = {"chunks": [], "saved": []}
+    lock = threading.Lock()
+
+    @contextmanager
+    def fake_connection():
+        yield MagicMock()
+
+    def fake_chunk(api, symbol, symbol_id, exchange, interval, start, end):
+        with lock:
+            calls["chunks"].append((symbol, start, end))
+        error = (failures or {}).get((symbol, start))
+        if error is not None:
+            raise error
+        return 10, 8
+
+    def fake_save(conn, symbol, interval, checkpoint, *, error_message=None):
+        calls["saved"].append((symbol, checkpoint, error_message))
+
+    monkeypatch.setattr(backfill_module, "get_connection", fake_connection)
+    monkeypatch.setattr(
+        backfill_module,
+        "load_backfill_checkpoints",
+        lambda conn, symbols, interval: checkpoints or {},
+    )
+    monkeypatch.setattr(backfill_module, "save_backfill_checkpoint", fake_save)
+    monkeypatch.setattr(
+        backfill_module,
+        "ensure_symbols_bulk",
+        lambda conn, pairs: {symbol: index for index, (symbol, _) in enumerate(pairs, start=1)},
+    )
+    monkeypatch.setattr(backfill_module, "_backfill_chunk", fake_chunk)
+    return calls
+
+
+def last_checkpoint(calls, symbol):
+    return [checkpoint for saved, checkpoint, _ in calls["saved"] if saved == symbol][-1]
+
+
+def test_plan_chunks_covers_range_without_overlap():
+    chunks = plan_chunks(START, END, 4)
+
+    assert chunks == [
+        (date(2024, 1, 1), date(2024, 1, 4)),
+        (date(2024, 1, 5), date(2024, 1, 8)),
+        (date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+    assert plan_chunks(START, START, 600) == [(START, START)]
+    with pytest.raises(ValueError):
+        plan_chunks(START, END, 0)
+
+
+def test_fresh_run_backfills_every_chunk_and_skips_invalid_tickers(monkeypatch):
+    calls = install_fakes(
+        monkeypatch, failures={("GONE", START): EODHDRequestError("404 Ticker Not Found")}
+    )
+
+    results = backfill_universe(
+        [("AAA", "US"), ("BBB", "US"), ("GONE", "US")],
+        start_date="2024-01-01",
+        end_date="2024-01-10",
+        workers=1,
+        chunk_days=4,
+        client=MagicMock(),
+    )
+
+    by_symbol = {result.symbol: result for result in results}
+    assert [result.symbol for result in results] == ["AAA", "BBB", "GONE"]
+    for symbol in ("AAA", "BBB"):
+        assert by_symbol[symbol].status == "completed"
+        result = by_symbol[symbol]
+        assert (result.chunks_done, result.bars_fetched, result.bars_stored) == (3, 30, 24)
+        assert last_checkpoint(calls, symbol).completed_through == END
+    # The first 404 marks the symbol skipped; its other chunks are cancelled or ignored
+    assert by_symbol["GONE"].status == "skipped"
+    assert by_symbol["GONE"].ok
+    assert (by_symbol["GONE"].chunks_done, by_symbol["GONE"].bars_stored) == (0, 0)
+    assert last_checkpoint(calls, "GONE").status == "skipped"
+
+
+def test_resume_skips_checkpointed_chunks_and_finished_symbols(monkeypatch):
+    checkpoints = {
+        "AAA": BackfillCheckpoint("in_progress", START, END, date(2024, 1, 8), 20, 16),
+        "DONE": BackfillCheckpoint("completed", START, END, END, 30, 24),
+        # A checkpoint for another range does not count
+        "OTHER": BackfillCheckpoint("in_progress", date(2023, 1, 1), END, date(2024, 1, 8), 20, 16),
+    }
+    calls = install_fakes(monkeypatch, checkpoints=checkpoints)
+
+    results = backfill_universe(
+        [("AAA", "US"), ("DONE", "US"), ("OTHER", "US")],
+        start_date="2024-01-01",
+        end_date="2024-01-10",
+        workers=2,
+        chunk_days=4,
+        client=MagicMock(),
+    )
+
+    by_symbol = {result.symbol: result for result in results}
+    assert sorted(calls["chunks"]) == [("AAA", date(2024, 1, 9), END)] + [
+        ("OTHER", start, end) for start, end in plan_chunks(START, END, 4)
+    ]
+    aaa = by_symbol["AAA"]
+    assert (aaa.status, aaa.chunks_skipped, aaa.bars_stored) == ("completed", 2, 24)
+    assert (by_symbol["DONE"].status, by_symbol["DONE"].chunks_skipped) == ("completed", 3)
+    assert by_symbol["OTHER"].chunks_skipped == 0
+    assert all(saved != "DONE" for saved, _, _ in calls["saved"])
+
+
+def test_failed_chunk_keeps_checkpoint_before_the_gap(monkeypatch):
+    failures = {("AAA", date(2024, 1, 5)): EODHDRequestError("500 Server Error")}
+    calls = install_fakes(monkeypatch, failures=failures)
+
+    [result] = backfill_universe(
+        [("AAA", "US")],
+        start_date="2024-01-01",
+        end_date="2024-01-10",
+        workers=1,
+        chunk_days=4,
+        client=MagicMock(),
+    )
+
+    assert result.status == "failed"
+    assert not result.ok
+    assert result.error == "500 Server Error"
+    # The chunk after the failure is cancelled, or ignored if it already ran
+    assert (result.chunks_done, result.bars_stored) == (1, 8)
+    checkpoint = last_checkpoint(calls, "AAA")
+    assert checkpoint.status == "failed"
+    assert checkpoint.completed_through == date(2024, 1, 4)
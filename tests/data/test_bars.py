@@ -0,0 +1,163 @@
+"""Tests for the columnar BarArray container."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from dgas.calculations import TimeframeType, build_timeframe_data
+from dgas.data.bars import BarArray, BarFingerprint, close_map, fingerprint_bars
+from dgas.data.models import IntervalData
+
+
+def _bars(count: int, seed: int = 0, step: float = 0.5) -> list[IntervalData]:
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    price = 100.0
+    bars = []
+    for i in range(count):
+        price = max(1.0, price + rnd.uniform(-step, step))
+        high = price + rnd.uniform(0, step)
+        low = price - rnd.uniform(0, step)
+        bars.append(
+            IntervalData(
+                symbol="AAPL",
+                timestamp=base + timedelta(minutes=30 * i),
+                interval="30m",
+                open=round(price, 2),
+                high=round(high, 2),
+                low=round(low, 2),
+                close=round(rnd.uniform(low, high), 2),
+                volume=rnd.randint(1, 1000),
+            )
+        )
+    return bars
+
+
+def test_from_intervals_builds_contiguous_columns():
+    intervals = _bars(5)
+    bars = BarArray.from_intervals(intervals)
+
+    assert len(bars) == 5
+    assert bars.symbol == "AAPL"
+    assert bars.interval == "30m"
+    assert bars.timestamp.dtype == np.dtype("datetime64[us]")
+    assert bars.close.dtype == np.float64 and bars.close.flags["C_CONTIGUOUS"]
+    assert bars.volume.dtype == np.int64
+    assert bars.datetimes() == [bar.timestamp for bar in intervals]
+    assert bars.decimals("close") == [bar.close for bar in intervals]
+
+
+def test_round_trips_to_interval_data():
+    intervals = _bars(4)
+    bars = BarArray.from_intervals(intervals)
+
+    restored = bars.to_intervals()
+    for original, row in zip(intervals, restored, strict=True):
+        assert row.timestamp == original.timestamp
+        assert (row.open, row.high, row.low, row.close) == (original.open, original.high, original.low, original.close)
+        assert row.volume == original.volume
+    assert bars[1] == restored[1]
+    assert list(bars) == restored
+
+
+def test_slicing_and_sorting():
+    intervals = _bars(6)
+    bars = BarArray.from_intervals(list(reversed(intervals)))
+    assert not bars.is_sorted
+
+    ordered = bars.sorted()
+    assert ordered.datetimes() == [bar.timestamp for bar in intervals]
+    assert ordered.sorted() is ordered
+
+    tail = ordered[-3:]
+    assert isinstance(tail, BarArray)
+    assert tail.datetimes() == [bar.timestamp for bar in intervals[-3:]]
+
+
+def test_from_rows_accepts_database_values():
+    ts = datetime(2024, 1, 2, 15, 30, tzinfo=timezone(timedelta(hours=-5)))
+    bars = BarArray.from_rows(
+        [(ts, Decimal("10.5"), Decimal("11"), Decimal("10"), Decimal("10.75"), None)],
+        symbol="MSFT",
+        interval="1h",
+    )
+
+    assert bars.datetimes() == [ts]
+    assert bars.close.tolist() == [10.75]
+    assert bars.volume.tolist() == [0]
+    assert close_map(bars) == {ts: Decimal("10.75")}
+
+
+def test_rejects_mismatched_columns():
+    with pytest.raises(ValueError):
+        BarArray(
+            symbol="AAPL",
+            interval="30m",
+            timestamp=np.zeros(2, dtype="datetime64[us]"),
+            open=np.zeros(2),
+            high=np.zeros(2),
+            low=np.zeros(2),
+            close=np.zeros(3),
+            volume=np.zeros(2, dtype=np.int64),
+        )
+
+
+def test_empty_array_yields_empty_timeframe():
+    data = build_timeframe_data(BarArray.empty("AAPL", "30m"), "30m", TimeframeType.TRADING)
+    assert list(data.pldot_series) == []
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_calculators_accept_bar_array(seed):
+    intervals = _bars(150, seed=seed)
+    expected = build_timeframe_data(intervals, "30m", TimeframeType.TRADING)
+    actual = build_timeframe_data(BarArray.from_intervals(intervals), "30m", TimeframeType.TRADING)
+
+    for field in ("pldot_series", "envelope_series", "state_series", "pattern_events", "drummond_zones"):
+        assert [repr(item) for item in getattr(actual, field)] == [
+            repr(item) for item in getattr(expected, field)
+        ], field
+
+
+def test_from_api_records_matches_model_parsing():
+    records = [
+        {"date": "2024-01-02", "open": 10, "high": 11, "low": 9, "close": 10.5, "volume": 100},
+        {"date": "2024-01-03", "open": 10.5, "high": None, "low": 9, "close": 10.0, "volume": 100},
+        {"date": "2024-01-04", "open": "NA", "high": 11, "low": 9, "close": 10.0, "volume": 100},
+        {"datetime": "2024-01-05 15:30:00", "open": 10, "high": 12, "low": 9.5, "close": 11.25},
+    ]
+
+    bars = BarArray.from_api_records(records, symbol="AAPL", interval="1d")
+
+    expected = IntervalData.from_api_list([records[0], records[3]], "1d", symbol_override="AAPL")
+    assert bars.datetimes() == [bar.timestamp for bar in expected]
+    assert bars.decimals("close") == [bar.close for bar in expected]
+    assert bars.volume.tolist() == [100, 0]
+
+
+def test_fingerprint_covers_every_bar_and_extends_incrementally():
+    intervals = _bars(40)
+    bars = BarArray.from_intervals(intervals)
+
+    # Same digest for columns and row-by-row input
+    assert bars.fingerprint == fingerprint_bars(intervals)
+    assert BarArray.from_intervals(intervals).fingerprint == bars.fingerprint
+
+    corrected = list(intervals)
+    corrected[20] = corrected[20].model_copy(update={"close": corrected[20].close + Decimal("0.01")})
+    assert fingerprint_bars(corrected) != bars.fingerprint
+
+    head = BarArray.from_intervals(intervals[:25])
+    assert head.fingerprint == fingerprint_bars(intervals[:25])
+    extended = head.concat(BarArray.from_intervals(intervals[25:]))
+    assert "fingerprint" in extended._cache
+    assert extended.fingerprint == bars.fingerprint
+    assert extended.close.tolist() == bars.close.tolist()
+
+    rolling = BarFingerprint()
+    for bar in intervals:
+        rolling.update_bar(bar)
+    assert (rolling.hexdigest(), rolling.count) == (bars.fingerprint, 40)
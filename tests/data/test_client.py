@@ -1,8 +1,9 @@
+from decimal import Decimal
 from unittest.mock import Mock
 
 import pytest
 
-from dgas.data.client import EODHDClient, EODHDConfig
+from dgas.data.client import LIVE_BULK_MAX_SYMBOLS, EODHDClient, EODHDConfig
 from dgas.data.errors import EODHDAuthError, EODHDRateLimitError
 
 
@@ -75,3 +76,32 @@ def test_fetch_intraday_rate_limit_exhausts_retries(monkeypatch) -> None:
         client.fetch_intraday("AAPL")
 
     assert session.get.call_count == 2
+
+
+def test_fetch_live_ohlcv_bulk_fans_out_by_code(monkeypatch) -> None:
+    session = Mock()
+    quote = {"timestamp": 1_700_000_000, "open": 100, "high": 101, "low": 99, "close": 100.5, "volume": 10}
+    payload = [
+        {"code": "AAPL.US", **quote},
+        {"code": "MSFT.US", **quote, "close": 200},
+        {"code": "NOPE.US", "timestamp": "NA", "open": "NA", "high": "NA", "low": "NA", "close": "NA"},
+    ]
+    session.get.return_value = _make_response(200, payload)
+
+    config = EODHDConfig(api_token="token", session=session, requests_per_minute=1000)
+    client = EODHDClient(config)
+    monkeypatch.setattr(client._rate_limiter, "acquire", lambda: None)
+
+    bars = client.fetch_live_ohlcv_bulk(["AAPL", "MSFT", "NOPE"])
+
+    assert {symbol: [bar.close for bar in symbol_bars] for symbol, symbol_bars in bars.items()} == {
+        "AAPL": [Decimal("100.5")],
+        "MSFT": [Decimal("200")],
+        "NOPE": [],
+    }
+    url = session.get.call_args.args[0]
+    assert url.endswith("/real-time/AAPL.US")
+    assert session.get.call_args.kwargs["params"]["s"] == "MSFT.US,NOPE.US"
+
+    with pytest.raises(ValueError):
+        client.fetch_live_ohlcv_bulk([f"S{i}" for i in range(LIVE_BULK_MAX_SYMBOLS + 1)])
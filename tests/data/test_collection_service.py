@@ -0,0 +1,165 @@
+"""Tests for the concurrent fetch/write path of the data collection service."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from dgas.config.schema import DataCollectionConfig
+from dgas.data import collection_service as service_module
+from dgas.data.client import LIVE_BULK_MAX_SYMBOLS
+from dgas.data.collection_service import DataCollectionService
+from dgas.data.errors import EODHDRequestError
+from dgas.data.models import IntervalData
+
+LATEST = datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+
+def _bars(symbol: str, count: int) -> list[IntervalData]:
+    return [
+        IntervalData(
+            symbol=symbol,
+            timestamp=LATEST + timedelta(minutes=5 * (i + 1)),
+            interval="5m",
+            open=Decimal("10"),
+            high=Decimal("11"),
+            low=Decimal("9"),
+            close=Decimal("10.5"),
+            volume=100,
+        )
+        for i in range(count)
+    ]
+
+
+def install_fakes(monkeypatch):
+    calls = {"prefetch": 0, "ensured": [], "backfill": [], "update": [], "live": {}, "stored": {}}
+
+    @contextmanager
+    def fake_connection():
+        yield MagicMock()
+
+    def fake_prefetch(conn, symbols, interval):
+        calls["prefetch"] += 1
+        return {"AAA": (1, LATEST), "BAD": (2, LATEST), "GONE": (3, LATEST)}
+
+    def fake_ensure(conn, symbol, exchange):
+        calls["ensured"].append(symbol)
+        return 9
+
+    def fake_backfill(symbol, **kwargs):
+        calls["backfill"].append(symbol)
+        return _bars(symbol, 3)
+
+    def fake_update(symbol, latest_ts, **kwargs):
+        calls["update"].append((symbol, latest_ts))
+        calls["live"][symbol] = kwargs["live_bars"]
+        if symbol == "GONE":
+            raise EODHDRequestError("404 Ticker Not Found")
+        if symbol == "BAD":
+            raise EODHDRequestError("500 Server Error")
+        return _bars(symbol, 2), 4
+
+    def fake_store(conn, symbol_id, interval, bars):
+        calls["stored"][symbol_id] = len(bars)
+        return len(bars)
+
+    monkeypatch.setattr(service_module, "get_connection", fake_connection)
+    monkeypatch.setattr(service_module, "get_latest_timestamps_bulk", fake_prefetch)
+    monkeypatch.setattr(service_module, "ensure_market_symbol", fake_ensure)
+    monkeypatch.setattr(service_module, "fetch_intraday_backfill", fake_backfill)
+    monkeypatch.setattr(service_module, "fetch_intraday_update", fake_update)
+    monkeypatch.setattr(service_module, "bulk_upsert_market_data", fake_store)
+    return calls
+
+
+def live_client() -> MagicMock:
+    client = MagicMock()
+    client.fetch_live_ohlcv_bulk.side_effect = lambda symbols, **kwargs: {
+        symbol: _bars(symbol, 1) for symbol in symbols if symbol != "BAD"
+    }
+    return client
+
+
+def test_collect_concurrent_prefetches_once_and_stores_each_fetch(monkeypatch):
+    calls = install_fakes(monkeypatch)
+    config = DataCollectionConfig(use_websocket=False, fetch_workers=3)
+    client = live_client()
+    service = DataCollectionService(config, client=client)
+
+    summaries = service.collect_concurrent(["AAA", "NEW", "BAD", "GONE"], "5m")
+
+    assert calls["prefetch"] == 1
+    assert calls["ensured"] == ["NEW"]
+    assert calls["backfill"] == ["NEW"]
+    assert sorted(calls["update"]) == [("AAA", LATEST), ("BAD", LATEST), ("GONE", LATEST)]
+    assert calls["stored"] == {1: 2, 9: 3}
+    # Live bars for symbols with stored data come from one multi-ticker request
+    client.fetch_live_ohlcv_bulk.assert_called_once()
+    assert sorted(client.fetch_live_ohlcv_bulk.call_args.args[0]) == ["AAA", "BAD", "GONE"]
+    assert calls["live"]["AAA"] == _bars("AAA", 1)
+    assert calls["live"]["BAD"] is None
+
+    by_symbol = {summary.symbol: summary for summary in summaries}
+    # Invalid tickers are skipped, other API errors are reported as empty summaries
+    assert set(by_symbol) == {"AAA", "NEW", "BAD"}
+    assert (by_symbol["AAA"].fetched, by_symbol["AAA"].stored) == (4, 2)
+    assert (by_symbol["NEW"].fetched, by_symbol["NEW"].stored) == (3, 3)
+    assert by_symbol["BAD"].stored == 0
+    assert by_symbol["BAD"].quality.notes == ["500 Server Error"]
+
+
+def test_collect_all_symbols_uses_concurrent_path(monkeypatch):
+    install_fakes(monkeypatch)
+    config = DataCollectionConfig(use_websocket=False, fetch_workers=2)
+    service = DataCollectionService(config, client=live_client())
+    monkeypatch.setattr(service, "collect_batch", MagicMock(side_effect=AssertionError("batched")))
+
+    result = service.collect_all_symbols(["AAA", "NEW", "SP500_EVAL"], "5m")
+
+    assert result.symbols_requested == 2
+    assert result.symbols_updated == 2
+    assert result.bars_stored == 5
+
+
+def test_owned_client_shares_service_rate_limiter(monkeypatch):
+    settings = MagicMock(eodhd_api_token="token", eodhd_requests_per_minute=80)
+    monkeypatch.setattr("dgas.data.client.get_settings", lambda: settings)
+    config = DataCollectionConfig(use_websocket=False, requests_per_minute=100, rate_limit_buffer=0.2)
+    service = DataCollectionService(config)
+
+    client = service._get_client()
+
+    assert service._get_client() is client
+    assert client._rate_limiter is service._rate_limiter
+    assert service._rate_limiter._max_calls == 80
+    service.close()
+
+
+def test_closing_the_service_closes_its_pooled_session(monkeypatch):
+    settings = MagicMock(eodhd_api_token="token", eodhd_requests_per_minute=80)
+    monkeypatch.setattr("dgas.data.client.get_settings", lambda: settings)
+    config = DataCollectionConfig(use_websocket=False)
+
+    with DataCollectionService(config) as service:
+        session = service._get_client()._session
+        close_session = MagicMock(wraps=session.close)
+        session.close = close_session
+
+    close_session.assert_called_once()
+    assert service._owned_client is None
+
+
+def test_live_bars_are_fetched_in_maximum_size_batches():
+    client = live_client()
+    symbols = [f"S{i:02d}" for i in range(2 * LIVE_BULK_MAX_SYMBOLS + 5)]
+
+    live = DataCollectionService._fetch_live_bulk(client, symbols, "5m", "US")
+
+    assert [len(call.args[0]) for call in client.fetch_live_ohlcv_bulk.call_args_list] == [
+        LIVE_BULK_MAX_SYMBOLS,
+        LIVE_BULK_MAX_SYMBOLS,
+        5,
+    ]
+    assert list(live) == symbols
@@ -1,4 +1,6 @@
-from dgas.data.rate_limiter import RateLimiter
+import asyncio
+
+from dgas.data.rate_limiter import AsyncRateLimiter, RateLimiter
 
 
 def test_rate_limiter_blocks_until_slot_available() -> None:
@@ -22,3 +24,23 @@ def test_rate_limiter_blocks_until_slot_available() -> None:
 
     assert sleep_calls == [1.0]
     assert state["time"] == 1.0
+
+
+def test_async_rate_limiter_waits_for_window():
+    state = {"time": 0.0}
+    sleeps: list[float] = []
+
+    async def sleep(duration: float) -> None:
+        sleeps.append(duration)
+        state["time"] += duration
+
+    limiter = AsyncRateLimiter(max_calls=2, period=1.0, now_func=lambda: state["time"], sleep_func=sleep)
+
+    async def scenario():
+        for _ in range(3):
+            await limiter.acquire()
+
+    asyncio.run(scenario())
+
+    assert sleeps == [1.0]
+    assert state["time"] == 1.0
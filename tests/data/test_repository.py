@@ -0,0 +1,356 @@
+"""Tests for the market data fetch and upsert helpers in the repository module."""
+
+import struct
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List
+
+import pytest
+
+from dgas.data.events import MarketDataChange, subscribe_market_data_changes
+from dgas.data.models import IntervalData
+from dgas.data.repository import (
+    fetch_latest_bars_bulk,
+    fetch_latest_bars_bulk_with_aggregation,
+    fetch_market_data_bulk_columnar,
+    fetch_market_data_columnar,
+    fetch_market_data_tail,
+    fetch_market_data_with_aggregation,
+    upsert_market_data,
+)
+
+BASE = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def _rows(symbol: str, count: int, minutes: int) -> List[tuple]:
+    return [
+        (symbol, BASE + timedelta(minutes=minutes * i), 10.0 + i, 11.0 + i, 9.0 + i, 10.5 + i, 100 + i)
+        for i in range(count)
+    ]
+
+
+class BulkConn:
+    """Fake connection answering the LATERAL query from per-interval rows."""
+
+    def __init__(self, rows_by_interval: Dict[str, List[tuple]], known: List[str]):
+        self.rows_by_interval = rows_by_interval
+        self.known = known
+        self.queries: List[tuple] = []
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def execute(self, query, params=None):
+        interval, limit, symbols = params[0], params[-2], params[-1]
+        self.queries.append((interval, limit, symbols))
+        rows = []
+        for symbol in sorted(s for s in symbols if s in self.known):
+            matching = [row for row in self.rows_by_interval.get(interval, []) if row[0] == symbol]
+            rows.extend(matching[-limit:] or [(symbol, None, None, None, None, None, None)])
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+def test_bulk_fetch_groups_rows_per_symbol():
+    conn = BulkConn({"30m": _rows("AAPL", 5, 30) + _rows("MSFT", 2, 30)}, known=["AAPL", "MSFT", "IDLE"])
+
+    result = fetch_latest_bars_bulk(conn, ["MSFT", "AAPL", "IDLE", "NOPE", "AAPL"], "30m", limit=3)
+
+    assert len(conn.queries) == 1
+    assert conn.queries[0][2] == ["MSFT", "AAPL", "IDLE", "NOPE"]
+    assert set(result) == {"AAPL", "MSFT", "IDLE"}
+    assert result["AAPL"].close.tolist() == [12.5, 13.5, 14.5]
+    assert result["AAPL"].symbol == "AAPL" and result["AAPL"].interval == "30m"
+    assert len(result["MSFT"]) == 2
+    assert len(result["IDLE"]) == 0
+
+
+def test_bulk_fetch_aggregates_symbols_without_native_bars():
+    conn = BulkConn({"30m": _rows("AAPL", 4, 30), "5m": _rows("MSFT", 12, 5)}, known=["AAPL", "MSFT"])
+
+    result = fetch_latest_bars_bulk_with_aggregation(conn, ["AAPL", "MSFT"], "30m", limit=4)
+
+    assert [query[:2] for query in conn.queries] == [("30m", 4), ("5m", 24)]
+    assert conn.queries[1][2] == ["MSFT"]
+    assert len(result["AAPL"]) == 4
+    assert len(result["MSFT"]) == 2
+    assert result["MSFT"].interval == "30m"
+    assert result["MSFT"].high.tolist() == [16.0, 22.0]
+    assert result["MSFT"].volume.tolist() == [sum(range(100, 106)), sum(range(106, 112))]
+
+
+class RecordingConn:
+    """Fake connection that returns canned rows per interval and records queries."""
+
+    def __init__(self, rows_by_interval: Dict[str, List[tuple]]):
+        self.rows_by_interval = rows_by_interval
+        self.queries: List[tuple] = []
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+        self._rows = [row[1:] + ("US",) for row in self.rows_by_interval.get(params[1], [])]
+
+    def fetchall(self):
+        return self._rows
+
+
+def test_tail_fetch_reads_latest_rows_in_chronological_order():
+    conn = RecordingConn({"30m": _rows("AAPL", 3, 30)})
+
+    bars = fetch_market_data_tail(conn, "AAPL", "30m", 3, end=BASE + timedelta(days=1))
+
+    query, params = conn.queries[0]
+    assert "ORDER BY md.timestamp DESC\n    LIMIT %s" in query
+    assert query.rstrip().endswith("ORDER BY latest.timestamp ASC")
+    assert params == ["AAPL", "30m", BASE + timedelta(days=1), 3]
+    assert [bar.timestamp for bar in bars] == sorted(bar.timestamp for bar in bars)
+    assert bars[0].exchange == "US"
+
+
+def test_aggregation_reads_only_the_source_tail():
+    conn = RecordingConn({"5m": _rows("MSFT", 12, 5)})
+
+    bars = fetch_market_data_with_aggregation(conn, "MSFT", "30m", limit=2)
+
+    assert [(params[1], params[-1]) for _, params in conn.queries] == [("30m", 2), ("5m", 12)]
+    assert all("DESC" in query for query, _ in conn.queries)
+    assert [bar.interval for bar in bars] == ["30m", "30m"]
+
+
+class UpsertConn:
+    """Fake connection that upserts into an in-memory market_data table."""
+
+    def __init__(self, existing: List[datetime]):
+        self.table = {timestamp: None for timestamp in existing}
+        self.stage: List[tuple] = []
+        self.statements: List[str] = []
+        self._results: List[tuple] = []
+
+    @contextmanager
+    def transaction(self):
+        yield
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def _upsert(self, record) -> bool:
+        inserted = record[1] not in self.table
+        self.table[record[1]] = record
+        return inserted
+
+    def execute(self, query, params=None):
+        self.statements.append(" ".join(query.split())[:30])
+        if "FROM upserted" in query:
+            self._results = [(sum(self._upsert(record) for record in self.stage),)]
+
+    def executemany(self, query, records, returning=False):
+        self.statements.append("executemany")
+        self._results = [(self._upsert(record),) for record in records]
+
+    def fetchone(self):
+        return self._results.pop(0) if self._results else None
+
+    def nextset(self):
+        return True if self._results else None
+
+    @contextmanager
+    def copy(self, statement):
+        self.statements.append("copy")
+        yield self
+
+    def write_row(self, row):
+        self.stage.append(row)
+
+
+def _bar(minute: int, open_: str, high: str, low: str, close: str) -> IntervalData:
+    return IntervalData(
+        symbol="AAPL",
+        timestamp=BASE + timedelta(minutes=minute),
+        interval="5m",
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+        volume=10,
+    )
+
+
+def test_upsert_normalizes_ohlc_exactly_and_keeps_last_duplicate():
+    bars = [
+        _bar(0, "10.10", "10.20", "10.00", "10.15"),
+        _bar(5, "10.10", "10.20", "10.00", "10.35"),  # close above high
+        _bar(10, "10.10", "10.20", "10.05", "10.01"),  # close below low
+        _bar(5, "10.10", "10.40", "10.00", "10.30"),  # replaces the bar at minute 5
+    ]
+    conn = UpsertConn(existing=[])
+
+    result = upsert_market_data(conn, 1, "5m", bars, copy_threshold=100)
+
+    records = {record[1]: record[3:7] for record in conn.table.values()}
+    assert records[BASE] == (Decimal("10.10"), Decimal("10.20"), Decimal("10.00"), Decimal("10.15"))
+    assert records[BASE + timedelta(minutes=5)] == (
+        Decimal("10.10"), Decimal("10.40"), Decimal("10.00"), Decimal("10.30")
+    )
+    assert records[BASE + timedelta(minutes=10)] == (
+        Decimal("10.10"), Decimal("10.20"), Decimal("10.01"), Decimal("10.01")
+    )
+    assert (result.inserted, result.updated) == (3, 0)
+
+
+def test_upsert_switches_to_copy_at_threshold_and_counts_updates():
+    bars = [_bar(5 * i, "10", "11", "9", "10") for i in range(4)]
+
+    small = UpsertConn(existing=[BASE])
+    result = upsert_market_data(small, 1, "5m", bars, copy_threshold=5)
+    assert result.method == "executemany"
+    assert "copy" not in small.statements
+    assert (result.inserted, result.updated, result.stored) == (3, 1, 4)
+
+    large = UpsertConn(existing=[BASE, BASE + timedelta(minutes=5)])
+    result = upsert_market_data(large, 1, "5m", bars, copy_threshold=4)
+    assert result.method == "copy"
+    assert "executemany" not in large.statements
+    assert len(large.stage) == 4
+    assert (result.inserted, result.updated) == (2, 2)
+
+
+def test_upsert_publishes_the_changed_range_after_commit(monkeypatch):
+    import dgas.db
+
+    @contextmanager
+    def fake_open_connection():
+        yield UpsertConn(existing=[])
+
+    monkeypatch.setattr(dgas.db, "_open_connection", fake_open_connection)
+    changes = []
+    unsubscribe = subscribe_market_data_changes(changes.append)
+    try:
+        with dgas.db.get_connection() as conn:
+            bars = [_bar(10, "10", "11", "9", "10"), _bar(0, "10", "11", "9", "10")]
+            upsert_market_data(conn, 1, "5m", bars, copy_threshold=100)
+            upsert_market_data(conn, 1, "5m", [], copy_threshold=100)
+            assert changes == []  # not committed yet
+
+        with pytest.raises(RuntimeError):
+            with dgas.db.get_connection() as conn:
+                upsert_market_data(conn, 1, "5m", [_bar(20, "10", "11", "9", "10")], copy_threshold=100)
+                raise RuntimeError("rolled back")
+    finally:
+        unsubscribe()
+
+    assert changes == [
+        MarketDataChange(symbol="AAPL", interval="5m", start=BASE, end=BASE + timedelta(minutes=10), bars=2)
+    ]
+
+
+PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _pgcopy(rows: List[tuple], symbol_ids: bool = False) -> bytes:
+    """Encode ``(symbol_id?, timestamp, open, high, low, close, volume)`` rows as a binary COPY."""
+
+    out = [b"PGCOPY\n\xff\r\n\x00", struct.pack(">ii", 0, 0)]
+    for row in rows:
+        fields = []
+        if symbol_ids:
+            fields.append(struct.pack(">ii", 4, row[0]))
+            row = row[1:]
+        timestamp, *prices, volume = row
+        fields.append(struct.pack(">iq", 8, (timestamp - PG_EPOCH) // timedelta(microseconds=1)))
+        fields.extend(struct.pack(">id", 8, price) if price is not None else struct.pack(">i", -1) for price in prices)
+        fields.append(struct.pack(">iq", 8, volume))
+        out.append(struct.pack(">h", len(fields)) + b"".join(fields))
+    out.append(b"\xff\xff")
+    return b"".join(out)
+
+
+class CopyConn:
+    """Fake connection streaming a canned binary COPY in small chunks."""
+
+    def __init__(self, payload: bytes, symbol_ids: List[tuple] = ()):
+        self.payload = payload
+        self.symbol_ids = list(symbol_ids)
+        self.queries: List[tuple] = []
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+
+    def fetchall(self):
+        return self.symbol_ids
+
+    @contextmanager
+    def copy(self, statement, params=None):
+        self.queries.append((statement, params))
+        yield (self.payload[i : i + 7] for i in range(0, len(self.payload), 7))
+
+
+def test_columnar_fetch_decodes_binary_copy():
+    rows = [row[1:] for row in _rows("AAPL", 3, 30)]
+    conn = CopyConn(_pgcopy(rows))
+
+    bars = fetch_market_data_columnar(conn, "AAPL", "30m", start=BASE)
+
+    statement, params = conn.queries[0]
+    assert statement.startswith("COPY (SELECT")
+    assert statement.endswith(") TO STDOUT (FORMAT BINARY)")
+    assert "md.close_price::float8" in statement
+    assert params == ["AAPL", "30m", BASE]
+    assert bars.datetimes() == [row[0] for row in rows]
+    assert bars.close.tolist() == [10.5, 11.5, 12.5]
+    assert bars.volume.tolist() == [100, 101, 102]
+    assert bars[1].high == Decimal("12.0") and bars[1].symbol == "AAPL"
+
+
+def test_columnar_fetch_handles_empty_results_and_rejects_nulls():
+    assert len(fetch_market_data_columnar(CopyConn(_pgcopy([])), "AAPL", "30m")) == 0
+
+    conn = CopyConn(_pgcopy([(BASE, 10.0, None, 9.0, 10.5, 100)]))
+    with pytest.raises(ValueError, match="malformed|width|NULL"):
+        fetch_market_data_columnar(conn, "AAPL", "30m")
+
+
+def test_bulk_columnar_fetch_splits_symbols():
+    aapl = [(1, *row[1:]) for row in _rows("AAPL", 3, 5)]
+    msft = [(2, *row[1:]) for row in _rows("MSFT", 2, 5)]
+    conn = CopyConn(_pgcopy(aapl + msft, symbol_ids=True), symbol_ids=[(1, "AAPL"), (2, "MSFT"), (3, "IDLE")])
+
+    result = fetch_market_data_bulk_columnar(conn, ["MSFT", "AAPL", "IDLE", "NOPE", "AAPL"], "5m")
+
+    assert conn.queries[0][1] == (["MSFT", "AAPL", "IDLE", "NOPE"],)
+    assert conn.queries[1][1] == [[1, 2, 3], "5m"]
+    assert set(result) == {"AAPL", "MSFT"}
+    assert result["AAPL"].close.tolist() == [10.5, 11.5, 12.5]
+    assert result["MSFT"].symbol == "MSFT" and len(result["MSFT"]) == 2
@@ -0,0 +1,67 @@
+"""Tests for sharing bar columns between processes."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from dgas.data.bars import BarArray
+from dgas.data.shared_bars import SharedBarHandle, SharedBarStore
+
+START = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def _bars(symbol: str, interval: str, count: int, base: float) -> BarArray:
+    rows = [
+        (START + timedelta(minutes=5 * i), base + i, base + i + 1, base + i - 1, base + i + 0.5, 100 * i)
+        for i in range(count)
+    ]
+    return BarArray.from_rows(rows, symbol=symbol, interval=interval)
+
+
+def _closes_in_child(handle: SharedBarHandle, symbol: str, interval: str) -> list[float]:
+    store = SharedBarStore.attach(handle)
+    return store.get(symbol, interval).close.tolist()
+
+
+def test_store_round_trips_series_without_copying():
+    series = [_bars("AAA", "5m", 4, 10.0), _bars("AAA", "1d", 2, 50.0), _bars("BBB", "5m", 3, 20.0)]
+
+    with SharedBarStore.create(series) as store:
+        assert set(store) == {("AAA", "5m"), ("AAA", "1d"), ("BBB", "5m")}
+        assert store.nbytes == 6 * 9 * 8
+        for original in series:
+            shared = store.get(original.symbol, original.interval)
+            assert shared.datetimes() == original.datetimes()
+            for name in ("open", "high", "low", "close", "volume"):
+                assert getattr(shared, name).tolist() == getattr(original, name).tolist()
+
+        attached = SharedBarStore.attach(store.handle)
+        bars = attached.get("BBB", "5m")
+        assert np.shares_memory(bars.close, attached.get("BBB", "5m").close)
+        with pytest.raises(ValueError):
+            bars.close[0] = 0.0
+        assert len(attached.get("CCC", "5m")) == 0
+        del bars
+        attached.close()
+
+
+def test_workers_read_series_from_handle():
+    series = [_bars(f"S{i}", "5m", 5 + i, float(i)) for i in range(3)]
+
+    with SharedBarStore.create(series) as store:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            closes = list(executor.map(_closes_in_child, [store.handle] * 3, ["S0", "S1", "S2"], ["5m"] * 3))
+
+    assert closes == [bars.close.tolist() for bars in series]
+
+
+def test_create_rejects_duplicate_series_and_accepts_empty():
+    with pytest.raises(ValueError):
+        SharedBarStore.create([_bars("AAA", "5m", 2, 1.0), _bars("AAA", "5m", 3, 1.0)])
+
+    with SharedBarStore.create([BarArray.empty("AAA", "5m")]) as store:
+        assert len(store.get("AAA", "5m")) == 0
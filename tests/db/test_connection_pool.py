@@ -0,0 +1,167 @@
+"""Tests for the shared database connection pool."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dgas.db as db
+from dgas.db import connection_pool
+from dgas.db.connection_pool import PooledConnectionManager
+from dgas.prediction import persistence as prediction_persistence
+from dgas.prediction.persistence import PredictionPersistence
+from dgas.settings import Settings
+
+
+class FakePool:
+    """Stand-in for psycopg_pool.ConnectionPool that records how it was built."""
+
+    instances: list = []
+
+    check_connection = staticmethod(lambda conn: None)
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.conn = MagicMock(name="conn")
+        self.closed = False
+        self.checkouts = 0
+        self.in_use = 0
+        FakePool.instances.append(self)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        self.checkouts += 1
+        self.in_use += 1
+        try:
+            yield self.conn
+        finally:
+            self.in_use -= 1
+
+    def check(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def get_stats(self):
+        return {"pool_min": self.kwargs["min_size"], "pool_max": self.kwargs["max_size"], "pool_size": 1}
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    FakePool.instances = []
+    monkeypatch.setattr(connection_pool, "ConnectionPool", FakePool)
+    monkeypatch.setattr(connection_pool, "POOL_AVAILABLE", True)
+    monkeypatch.setattr(connection_pool.psycopg, "connect", MagicMock(name="probe"))
+    return FakePool
+
+
+@pytest.fixture
+def settings():
+    return Settings(
+        DGAS_DATABASE_URL="postgresql+psycopg://user:pw@db:5432/dgas",
+        DGAS_DB_POOL_MIN_SIZE=2,
+        DGAS_DB_POOL_MAX_SIZE=4,
+    )
+
+
+def test_pool_opens_lazily_with_configured_sizing(fake_pool, settings):
+    manager = PooledConnectionManager(settings)
+    assert manager.get_stats() == {"status": "not_initialized"}
+
+    with manager.get_connection() as first, manager.get_connection() as second:
+        assert first is second is fake_pool.instances[0].conn
+
+    assert len(fake_pool.instances) == 1
+    kwargs = fake_pool.instances[0].kwargs
+    assert kwargs["conninfo"] == "postgresql://user:pw@db:5432/dgas"
+    assert (kwargs["min_size"], kwargs["max_size"]) == (2, 4)
+    assert kwargs["check"] is FakePool.check_connection
+    assert manager.get_stats() == {"status": "open", "pool_min": 2, "pool_max": 4, "pool_size": 1}
+
+
+def test_explicit_sizing_overrides_settings(fake_pool, settings):
+    manager = PooledConnectionManager(settings)
+    manager.initialize_pool(max_size=1)
+
+    assert (fake_pool.instances[0].kwargs["min_size"], fake_pool.instances[0].kwargs["max_size"]) == (1, 1)
+
+
+def test_forked_child_opens_its_own_pool(fake_pool, settings):
+    manager = PooledConnectionManager(settings)
+    parent = manager.get_pool()
+
+    with patch("dgas.db.connection_pool.os.getpid", return_value=-1):
+        child = manager.get_pool()
+
+    assert child is not parent
+    assert not parent.closed
+
+
+def test_persistence_borrows_a_pooled_connection_per_operation(fake_pool, settings, monkeypatch):
+    manager = PooledConnectionManager(settings)
+    monkeypatch.setattr(connection_pool, "_pool_manager", manager)
+    monkeypatch.setattr(db, "POOL_AVAILABLE", True)
+    monkeypatch.setattr(prediction_persistence, "get_settings", lambda: settings)
+    persistence = PredictionPersistence(settings)
+
+    for _ in range(2):
+        with persistence._connection() as conn:
+            assert conn is manager.get_pool().conn
+            assert manager.get_pool().in_use == 1
+
+    pool = fake_pool.instances[0]
+    assert (pool.checkouts, pool.in_use) == (2, 0)
+
+
+def test_persistence_for_another_database_connects_directly(fake_pool, settings, monkeypatch):
+    monkeypatch.setattr(prediction_persistence, "get_settings", lambda: settings)
+    other = Settings(DGAS_DATABASE_URL="postgresql://user:pw@replica:5432/dgas")
+
+    with PredictionPersistence(other)._connection():
+        pass
+
+    connection_pool.psycopg.connect.assert_called_once_with("postgresql://user:pw@replica:5432/dgas")
+    assert fake_pool.instances == []
+
+
+def test_health_check_reports_failure(fake_pool, settings):
+    manager = PooledConnectionManager(settings)
+    assert manager.health_check()
+
+    fake_pool.instances[0].conn.execute.side_effect = RuntimeError("server closed the connection")
+    assert not manager.health_check()
+
+
+def test_get_connection_uses_shared_pool(fake_pool, settings, monkeypatch):
+    manager = PooledConnectionManager(settings)
+    monkeypatch.setattr(connection_pool, "_pool_manager", manager)
+    monkeypatch.setattr(db, "POOL_AVAILABLE", True)
+
+    with db.get_connection() as conn:
+        assert conn is manager.get_pool().conn
+
+
+def test_get_connection_without_pool_connects_directly(monkeypatch):
+    conn = MagicMock(name="direct")
+    monkeypatch.setattr(db, "POOL_AVAILABLE", False)
+    monkeypatch.setattr(db.psycopg, "connect", lambda conninfo: conn)
+
+    with db.get_connection() as yielded:
+        assert yielded is conn
+
+    conn.commit.assert_called_once()
+    conn.close.assert_called_once()
+
+
+def test_unreachable_database_fails_without_opening_pool(fake_pool, settings, monkeypatch):
+    monkeypatch.setattr(
+        connection_pool.psycopg, "connect", MagicMock(side_effect=OSError("connection refused"))
+    )
+    manager = PooledConnectionManager(settings)
+
+    with pytest.raises(OSError):
+        manager.get_pool()
+
+    assert fake_pool.instances == []
+    assert manager.get_stats() == {"status": "not_initialized"}
@@ -0,0 +1,58 @@
+"""Bar generators shared by the test modules."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from dgas.data.models import IntervalData
+
+
+def random_walk(count: int, seed: int, step: float = 0.5) -> list[IntervalData]:
+    """Seeded 30-minute AAPL bars whose price moves up to ``step`` per bar."""
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    price = 100.0
+    bars = []
+    for i in range(count):
+        price = max(1.0, price + rnd.uniform(-step, step))
+        high = price + rnd.uniform(0, step)
+        low = price - rnd.uniform(0, step)
+        close = rnd.uniform(low, high)
+        bars.append(
+            IntervalData(
+                symbol="AAPL",
+                timestamp=base + timedelta(minutes=30 * i),
+                interval="30m",
+                open=round(price, 2),
+                high=round(high, 2),
+                low=round(low, 2),
+                close=round(close, 2),
+                volume=rnd.randint(1, 1000),
+            )
+        )
+    return bars
+
+
+def make_bars(
+    symbol: str, start: datetime, step: timedelta, count: int, interval: str, seed: int
+) -> list[IntervalData]:
+    """Seeded bars with a close-centred 0.6 range, every ``step`` from ``start``."""
+    rnd = random.Random(seed)
+    price = 100.0
+    bars = []
+    for i in range(count):
+        price = max(1.0, price + rnd.uniform(-0.6, 0.6))
+        close = Decimal(str(round(price, 2)))
+        bars.append(
+            IntervalData(
+                symbol=symbol,
+                timestamp=start + step * i,
+                interval=interval,
+                open=close,
+                high=close + Decimal("0.3"),
+                low=close - Decimal("0.3"),
+                close=close,
+                volume=1000,
+            )
+        )
+    return bars
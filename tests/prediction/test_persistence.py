@@ -398,33 +398,33 @@ def test_persistence(test_db):
 @pytest.fixture
 def test_symbol_id(test_persistence):
     """Ensure test symbol exists in database."""
-    conn = test_persistence._get_connection()
-    cursor = conn.cursor()
-
-    try:
-        # Insert test symbol if not exists
-        cursor.execute(
-            """
-            INSERT INTO market_symbols (symbol, exchange)
-            VALUES ('AAPL', 'NASDAQ')
-            ON CONFLICT (symbol) DO NOTHING
-            RETURNING symbol_id
-            """
-        )
-        result = cursor.fetchone()
+    with test_persistence._connection() as conn:
+        cursor = conn.cursor()
 
-        if result is None:
-            # Symbol already exists, fetch it
+        try:
+            # Insert test symbol if not exists
             cursor.execute(
-                "SELECT symbol_id FROM market_symbols WHERE symbol = 'AAPL'"
+                """
+                INSERT INTO market_symbols (symbol, exchange)
+                VALUES ('AAPL', 'NASDAQ')
+                ON CONFLICT (symbol) DO NOTHING
+                RETURNING symbol_id
+                """
             )
             result = cursor.fetchone()
 
-        conn.commit()
-        symbol_id = result[0]
+            if result is None:
+                # Symbol already exists, fetch it
+                cursor.execute(
+                    "SELECT symbol_id FROM market_symbols WHERE symbol = 'AAPL'"
+                )
+                result = cursor.fetchone()
+
+            conn.commit()
+            symbol_id = result[0]
 
-    finally:
-        cursor.close()
+        finally:
+            cursor.close()
 
     return symbol_id
 
@@ -12,7 +12,10 @@ Tests the complete prediction cycle including:
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, Mock, patch, PropertyMock
@@ -20,6 +23,7 @@ from unittest.mock import MagicMock, Mock, patch, PropertyMock
 import pytest
 
 from dgas.calculations.multi_timeframe import TimeframeType
+from dgas.data.bars import BarArray
 from dgas.data.models import IntervalData
 from dgas.prediction.engine import (
     GeneratedSignal,
@@ -28,6 +32,12 @@ from dgas.prediction.engine import (
     SignalGenerator,
     SignalType,
 )
+from dgas.prediction.execution import (
+    ExecutionBackend,
+    ExecutionConfig,
+    SymbolTimeoutError,
+    run_bounded,
+)
 from dgas.calculations.states import TrendDirection
 
 
@@ -433,3 +443,253 @@ class TestPredictionCycleIntegration:
         assert result.symbols_processed == 0
         assert result.signals_generated == 0
         assert len(result.errors) > 0
+
+
+# ============================================================================
+# Execution Backend Tests
+# ============================================================================
+
+
+def _cycle_engine(mock_settings, mock_persistence, sample_interval_data, execution=None):
+    engine = PredictionEngine(
+        settings=mock_settings, persistence=mock_persistence, execution=execution
+    )
+    engine._check_data_freshness = Mock(return_value=[])
+    engine._preload_market_data = Mock(return_value={})
+
+    def load(symbol: str, interval: str) -> List[IntervalData]:
+        if symbol == "MISSING":
+            raise ValueError(f"Symbol {symbol} not found in database")
+        if symbol == "EMPTY":
+            return []
+        return sample_interval_data
+
+    engine._load_market_data = load
+    return engine
+
+
+class TestExecutionBackends:
+    """Test running the per-symbol pipeline on pooled backends."""
+
+    SYMBOLS = ["AAPL", "MISSING", "MSFT", "EMPTY", "GOOGL", "AAPL"]
+
+    def _run(self, engine):
+        return engine.execute_prediction_cycle(
+            symbols=self.SYMBOLS,
+            interval="5m",
+            timeframes=["1h", "5m"],
+            htf_interval="1h",
+            trading_interval="5m",
+            persist_results=False,
+        )
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_pooled_backend_matches_serial(
+        self, backend, mock_settings, mock_persistence, sample_interval_data
+    ):
+        serial = self._run(_cycle_engine(mock_settings, mock_persistence, sample_interval_data))
+        pooled = self._run(
+            _cycle_engine(
+                mock_settings,
+                mock_persistence,
+                sample_interval_data,
+                ExecutionConfig(backend=backend, max_workers=3),
+            )
+        )
+
+        assert pooled.symbols_processed == serial.symbols_processed == 4
+        assert pooled.errors == serial.errors
+        assert pooled.signals == serial.signals
+        assert pooled.status == serial.status == "PARTIAL"
+        assert pooled.indicator_calc_ms is not None
+        assert pooled.signal_generation_ms is not None
+
+    def test_symbol_timeout_is_reported(
+        self, mock_settings, mock_persistence, sample_interval_data
+    ):
+        engine = _cycle_engine(
+            mock_settings,
+            mock_persistence,
+            sample_interval_data,
+            ExecutionConfig(backend="thread", max_workers=2, symbol_timeout_seconds=0.2),
+        )
+        release = threading.Event()
+        fast_load = engine._load_market_data
+
+        def load(symbol: str, interval: str) -> List[IntervalData]:
+            if symbol == "SLOW":
+                release.wait(5)
+            return fast_load(symbol, interval)
+
+        engine._load_market_data = load
+        try:
+            result = engine.execute_prediction_cycle(
+                symbols=["SLOW", "AAPL"],
+                interval="5m",
+                timeframes=["5m"],
+                htf_interval="1h",
+                trading_interval="5m",
+                persist_results=False,
+            )
+        finally:
+            release.set()
+
+        assert result.symbols_processed == 1
+        assert result.errors == ["SLOW: Timed out after 0.2s"]
+        assert result.execution_time_ms < 5000
+
+
+class TestBulkLoading:
+    """Test loading a cycle's bars with bulk queries."""
+
+    @patch("dgas.data.repository.fetch_latest_bars_bulk_with_aggregation")
+    @patch("dgas.db.get_connection")
+    def test_preload_batches_symbols_per_interval(
+        self, mock_get_conn, mock_fetch, mock_settings, mock_persistence, sample_interval_data
+    ):
+        mock_get_conn.return_value.__enter__.return_value = Mock()
+        bars = BarArray.from_intervals(sample_interval_data)
+        mock_fetch.side_effect = lambda conn, symbols, interval, limit: {s: bars for s in symbols}
+
+        engine = PredictionEngine(
+            settings=mock_settings,
+            persistence=mock_persistence,
+            lookback_bars=50,
+            execution=ExecutionConfig(load_batch_size=2),
+        )
+        preloaded = engine._preload_market_data(
+            ["AAPL", "MSFT", "AAPL", "GOOGL"], ["5m", "1h", "5m"]
+        )
+
+        assert sorted(preloaded) == ["1h", "5m"]
+        assert set(preloaded["5m"]) == {"AAPL", "MSFT", "GOOGL"}
+        batches = [(call.args[1], call.args[2]) for call in mock_fetch.call_args_list]
+        assert batches == [
+            (["AAPL", "MSFT"], "5m"),
+            (["GOOGL"], "5m"),
+            (["AAPL", "MSFT"], "1h"),
+            (["GOOGL"], "1h"),
+        ]
+        assert all(call.kwargs["limit"] == 50 for call in mock_fetch.call_args_list)
+        mock_get_conn.assert_called_once()
+
+    @patch("dgas.db.get_connection")
+    def test_preload_failure_falls_back_to_per_symbol_loads(
+        self, mock_get_conn, mock_settings, mock_persistence
+    ):
+        mock_get_conn.side_effect = RuntimeError("connection refused")
+        engine = PredictionEngine(settings=mock_settings, persistence=mock_persistence)
+
+        assert engine._preload_market_data(["AAPL"], ["5m"]) == {}
+
+    @patch("dgas.data.repository.get_latest_timestamps_bulk")
+    @patch("dgas.db.get_connection")
+    def test_freshness_check_uses_one_bulk_query(
+        self, mock_get_conn, mock_latest, mock_settings, mock_persistence
+    ):
+        conn = Mock()
+        mock_get_conn.return_value.__enter__.return_value = conn
+        now = datetime.now(timezone.utc)
+        mock_latest.return_value = {
+            "AAPL": (1, now),
+            "MSFT": (2, now - timedelta(hours=1)),
+            "EMPTY": (3, None),
+        }
+        engine = PredictionEngine(settings=mock_settings, persistence=mock_persistence)
+
+        stale = engine._check_data_freshness(["AAPL", "MSFT", "EMPTY", "NEW"], "5m")
+
+        mock_latest.assert_called_once_with(conn, ["AAPL", "MSFT", "EMPTY", "NEW"], "5m")
+        assert [symbol for symbol, _ in stale] == ["MSFT", "EMPTY", "NEW"]
+        assert 59 < stale[0][1] < 61
+        assert stale[1][1] == stale[2][1] == float("inf")
+
+    def test_cycle_uses_preloaded_bars(self, mock_settings, mock_persistence, sample_interval_data):
+        baseline = _cycle_engine(mock_settings, mock_persistence, sample_interval_data)
+        engine = PredictionEngine(settings=mock_settings, persistence=mock_persistence)
+        engine._check_data_freshness = Mock(return_value=[])
+        engine._load_market_data = Mock(side_effect=AssertionError("per-symbol load"))
+        bars = BarArray.from_intervals(sample_interval_data)
+        empty = BarArray.empty("EMPTY", "5m")
+        by_symbol = {"AAPL": bars, "MSFT": bars, "GOOGL": bars, "EMPTY": empty}
+        engine._preload_market_data = Mock(return_value={"5m": by_symbol, "1h": by_symbol})
+
+        result = TestExecutionBackends()._run(engine)
+        expected = TestExecutionBackends()._run(baseline)
+
+        assert result.symbols_processed == expected.symbols_processed == 4
+        assert result.errors == expected.errors
+        assert result.signals == expected.signals
+        engine._load_market_data.assert_not_called()
+
+
+class TestRunBounded:
+    """Test the bounded submission helper."""
+
+    def test_limits_tasks_in_flight(self):
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def task(item: int) -> int:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return item * 2
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(run_bounded(executor, task, range(20), max_in_flight=3))
+
+        assert peak <= 3
+        assert sorted(result for _, result, _ in results) == [i * 2 for i in range(20)]
+        assert all(error is None for _, _, error in results)
+
+    def test_hung_task_does_not_time_out_the_tasks_behind_it(self):
+        release = threading.Event()
+
+        def task(item: int) -> int:
+            if item == 0:
+                release.wait()  # blocks until the test ends
+            else:
+                time.sleep(0.2)
+            return item
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            results = list(run_bounded(executor, task, range(6), max_in_flight=2, timeout=0.35))
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+        errors = {item: error for item, _, error in results}
+        assert sorted(errors) == list(range(6))
+        assert isinstance(errors[0], SymbolTimeoutError)
+        assert all(errors[item] is None for item in range(1, 6))
+
+    def test_fails_remaining_items_when_every_worker_is_hung(self):
+        release = threading.Event()
+
+        def task(item: int) -> bool:
+            return release.wait()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            results = list(run_bounded(executor, task, range(3), max_in_flight=1, timeout=0.1))
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+        assert [item for item, _, _ in results] == [0, 1, 2]
+        assert all(isinstance(error, SymbolTimeoutError) for _, _, error in results)
+        assert "No free worker" in str(results[1][2])
+
+    def test_rejects_invalid_config(self):
+        with pytest.raises(ValueError):
+            ExecutionConfig(max_workers=0)
+        with pytest.raises(ValueError):
+            ExecutionConfig(symbol_timeout_seconds=0)
+        assert ExecutionConfig(backend="process").backend is ExecutionBackend.PROCESS
@@ -0,0 +1,88 @@
+"""Tests for the shared LRU cache core."""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from dgas.utils.lru_cache import LRUCache, estimate_size
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache(max_entries=3)
+    for key in "abc":
+        cache.set(key, key.upper(), size=1)
+
+    assert cache.get("a") == "A"
+    cache.set("d", "D", size=1)
+
+    assert cache.keys() == ["c", "a", "d"]
+    assert "b" not in cache
+    stats = cache.stats()
+    assert (stats.hits, stats.evictions, stats.entries) == (1, 1, 3)
+
+
+def test_byte_budget_evicts_and_rejects_oversized_values():
+    cache = LRUCache(max_entries=None, max_bytes=100)
+    cache.set("a", "x", size=40)
+    cache.set("b", "y", size=40)
+    cache.set("c", "z", size=40)
+
+    assert cache.keys() == ["b", "c"]
+    assert cache.stats().bytes == 80
+
+    assert cache.set("huge", "w", size=101) is False
+    assert "huge" not in cache
+    assert cache.stats().bytes == 80
+
+
+def test_ttl_expiry_counts_as_miss(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("dgas.utils.lru_cache.time.monotonic", lambda: now[0])
+    cache = LRUCache(max_entries=10, default_ttl_seconds=5)
+    cache.set("a", 1, size=1)
+    cache.set("b", 2, size=1, ttl_seconds=60)
+
+    now[0] += 10
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.clear_expired() == 0
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.entries) == (1, 1, 1, 1)
+
+
+def test_striped_cache_stays_within_limits_under_concurrency():
+    cache = LRUCache(max_entries=1024, stripes=8)
+
+    def worker(offset: int) -> None:
+        for i in range(2000):
+            key = (offset, i % 700)
+            if cache.get(key) is None:
+                cache.set(key, i, size=8)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert len(cache._segments) == 8
+    assert stats.entries == len(cache) <= 1024
+    assert stats.bytes == stats.entries * 8
+    assert stats.hits + stats.misses == 8000
+
+
+def test_estimate_size_counts_buffers_and_samples_containers():
+    array = np.zeros(1000)
+    assert estimate_size(array) >= array.nbytes
+
+    small = estimate_size([1.5] * 10)
+    large = estimate_size([1.5] * 10_000)
+    assert large > 100 * small / 2
+
+    with pytest.raises(ValueError):
+        LRUCache(max_entries=0)